@@ -1,23 +1,40 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from src.api.routes import router
-from src.api.system_routes import system_router
+from src.api.system_routes import metrics_router, system_router
+from src.api.batch_routes import batch_router
+from src.api.job_routes import job_router
+from src.api.admin_routes import admin_router
+from src.api.metrics_middleware import MetricsMiddleware
+from src.api.request_context_middleware import RequestContextMiddleware
+from src.api.tracing_middleware import TracingMiddleware
 from src.api.exception_handlers import (
     validation_exception_handler,
     openai_client_exception_handler,
     chat_service_exception_handler,
     configuration_exception_handler,
+    job_not_found_exception_handler,
+    rate_limit_exception_handler,
+    overloaded_exception_handler,
+    authorization_exception_handler,
     generic_exception_handler
 )
 from src.exceptions.chat_exceptions import (
     ChatServiceException,
     OpenAIClientException,
     ValidationException,
-    ConfigurationException
+    ConfigurationException,
+    JobNotFoundException,
+    RateLimitException,
+    OverloadedException,
+    AuthorizationException
 )
-from src.utils.logger import setup_logging, get_logger, get_uvicorn_custom_log
+from src.utils.logger import setup_logging, shutdown_logging, get_logger
+from src.utils import tracing
+from src.utils.system_sampler import system_sampler
+from src.utils.loop_monitor import loop_monitor
 from src.config.config import SERVER_PORT, SERVER_HOST, settings
-import uvicorn
 
 # 로깅 설정
 setup_logging()
@@ -26,7 +43,9 @@ setup_logging()
 app = FastAPI(
     title="LLM Server API",
     description="OpenAI API를 사용한 채팅 서버",
-    version="1.0.0"
+    version="1.0.0",
+    # 응답 모델을 반환하지 않는 엔드포인트(상태/통계)도 orjson으로 직렬화
+    default_response_class=ORJSONResponse
 )
 
 # CORS 미들웨어 추가
@@ -38,27 +57,62 @@ app.add_middleware(
     allow_headers=settings.CORS_HEADERS,
 )
 
+# 요청 메트릭 미들웨어 추가 (공유 메모리, 워커 합산)
+app.add_middleware(MetricsMiddleware)
+
+# 분산 추적 미들웨어 추가 (traceparent 이어받기, 서버 스팬)
+app.add_middleware(TracingMiddleware)
+
+# 요청 컨텍스트 미들웨어 추가 (request_id/테넌트를 contextvars로 전파, 가장 바깥에서 설정)
+app.add_middleware(RequestContextMiddleware)
+
 # 예외 핸들러 등록
 app.add_exception_handler(ValidationException, validation_exception_handler)
 app.add_exception_handler(OpenAIClientException, openai_client_exception_handler)
 app.add_exception_handler(ChatServiceException, chat_service_exception_handler)
 app.add_exception_handler(ConfigurationException, configuration_exception_handler)
+app.add_exception_handler(JobNotFoundException, job_not_found_exception_handler)
+app.add_exception_handler(RateLimitException, rate_limit_exception_handler)
+app.add_exception_handler(OverloadedException, overloaded_exception_handler)
+app.add_exception_handler(AuthorizationException, authorization_exception_handler)
 app.add_exception_handler(Exception, generic_exception_handler)
 
+# 시스템 지표 샘플러는 워커마다 시작 (fork 후 앱 시작 이벤트에서)
+app.add_event_handler("startup", system_sampler.start)
+app.add_event_handler("shutdown", system_sampler.stop)
+# 이벤트 루프 지연 측정 (readiness 판단)
+app.add_event_handler("startup", loop_monitor.start)
+app.add_event_handler("shutdown", loop_monitor.stop)
+
+# 종료 시 남은 스팬 내보내기 (워커는 os._exit으로 끝나므로 atexit 대신 앱 종료 이벤트 사용)
+app.add_event_handler("shutdown", tracing.shutdown)
+# 로그 큐에 남은 레코드 기록 (가장 마지막에 실행)
+app.add_event_handler("shutdown", shutdown_logging)
+
 # 라우터 등록
 app.include_router(router)
 app.include_router(system_router)
+app.include_router(metrics_router)
+app.include_router(batch_router)
+app.include_router(job_router)
+app.include_router(admin_router)
 
 logger = get_logger(__name__)
 
 
 if __name__ == "__main__":
-    logger.info(f"서버 시작 중... (Host: {SERVER_HOST}, Port: {SERVER_PORT})")
-
-    uvicorn.run(
-        app,
-        host=SERVER_HOST,
-        port=SERVER_PORT,
-        log_config=get_uvicorn_custom_log(),
-        access_log=True
-    ) 
\ No newline at end of file
+    logger.info(f"서버 시작 중... (Host: {SERVER_HOST}, Port: {SERVER_PORT}, 워커: {settings.SERVER_WORKERS}, HTTP/2: {settings.SERVER_HTTP2})")
+
+    if settings.SERVER_WORKERS > 1:
+        # 앱은 이미 import(preload)된 상태로 fork
+        from src.server import Supervisor
+
+        Supervisor(app, host=SERVER_HOST, port=SERVER_PORT, workers=settings.SERVER_WORKERS).run()
+    else:
+        from src.server import bind_sockets, close_sockets, serve
+
+        sockets = bind_sockets(SERVER_HOST, SERVER_PORT)
+        try:
+            serve(app, SERVER_HOST, SERVER_PORT, sockets)
+        finally:
+            close_sockets(sockets)
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+리슨 방식별 요청당 전송 오버헤드 벤치마크
+- TCP HTTP/1.1 (keep-alive 연결 풀 = 기준 / 요청마다 새 연결)
+- Unix 도메인 소켓 HTTP/1.1
+- TCP HTTP/2 h2c (연결 하나로 동시 요청 다중화)
+
+업스트림 호출 없이 전송 계층 비용만 보기 위해 GET /api/v1/health를 사용하며,
+모드마다 app.py를 별도 프로세스로 띄워 측정함 (HTTP/2는 hypercorn, h2 패키지 필요)
+클라이언트와 서버가 같은 호스트의 CPU를 나눠 쓰므로 코어 수가 적으면 동시 수를 낮춰 측정할 것
+
+사용법: python benchmarks/bench_listeners.py [--requests 2000] [--concurrency 8]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import httpx
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEALTH_PATH = "/api/v1/health"
+
+
+def start_server(port: int, uds_path: str = "", http2: bool = False) -> subprocess.Popen:
+    env = dict(
+        os.environ,
+        SERVER_HOST="127.0.0.1",
+        SERVER_PORT=str(port),
+        SERVER_WORKERS="1",
+        SERVER_UDS=uds_path,
+        SERVER_HTTP2=str(http2).lower(),
+        LOG_LEVEL="WARNING"
+    )
+    process = subprocess.Popen(
+        [sys.executable, "app.py"], cwd=PROJECT_ROOT, env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+
+    deadline = time.monotonic() + 20
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(f"http://127.0.0.1:{port}{HEALTH_PATH}", timeout=1.0)
+            return process
+        except httpx.TransportError:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError("서버가 시작되지 않았습니다.")
+
+
+def stop_server(process: subprocess.Popen) -> None:
+    process.terminate()
+    try:
+        process.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+
+async def run_load(client_factory, url: str, requests: int, concurrency: int) -> dict:
+    """concurrency개 작업이 requests개 요청을 나눠 보내고 요청별 지연을 수집"""
+    latencies = []
+    remaining = requests
+
+    async def worker(client: httpx.AsyncClient):
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            response = await client.get(url)
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    async with client_factory() as client:
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "mean_ms": statistics.mean(latencies) * 1000,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "rps": len(latencies) / elapsed
+    }
+
+
+def scenarios(port: int, uds_path: str, concurrency: int):
+    base = f"http://127.0.0.1:{port}"
+    no_keepalive = httpx.Limits(max_connections=concurrency, max_keepalive_connections=0)
+    pooled = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    # 첫 항목(현재 구성: 루프백 TCP HTTP/1.1 keep-alive)이 비교 기준
+    return [
+        ("tcp http/1.1 (keep-alive)", False, lambda: httpx.AsyncClient(base_url=base, limits=pooled)),
+        ("tcp http/1.1 (연결/요청)", False, lambda: httpx.AsyncClient(base_url=base, limits=no_keepalive)),
+        ("uds http/1.1 (keep-alive)", False, lambda: httpx.AsyncClient(
+            base_url=base, transport=httpx.AsyncHTTPTransport(uds=uds_path, limits=pooled)
+        )),
+        ("tcp h2c (연결 1개)", True, lambda: httpx.AsyncClient(base_url=base, http1=False, http2=True)),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="리슨 방식별 요청당 오버헤드 벤치마크")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--port", type=int, default=18080)
+    args = parser.parse_args()
+
+    uds_path = os.path.join(tempfile.mkdtemp(), "llm-server.sock")
+    print(f"요청 {args.requests}개, 동시 {args.concurrency}개")
+    print(f"{'모드':<28}{'평균(ms)':>10}{'p50(ms)':>10}{'p99(ms)':>10}{'RPS':>10}")
+
+    baseline = None
+    for http2 in (False, True):
+        process = start_server(args.port, uds_path, http2)
+        try:
+            for name, needs_http2, factory in scenarios(args.port, uds_path, args.concurrency):
+                if needs_http2 != http2:
+                    continue
+                # 예열 후 측정
+                asyncio.run(run_load(factory, HEALTH_PATH, args.concurrency * 2, args.concurrency))
+                result = asyncio.run(run_load(factory, HEALTH_PATH, args.requests, args.concurrency))
+                baseline = baseline or result
+                saved = baseline["mean_ms"] - result["mean_ms"]
+                print(
+                    f"{name:<28}{result['mean_ms']:>10.2f}{result['p50_ms']:>10.2f}"
+                    f"{result['p99_ms']:>10.2f}{result['rps']:>10.0f}  (요청당 절감 {saved:+.2f}ms)"
+                )
+        finally:
+            stop_server(process)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+로그 호출 비용 벤치마크 (요청 스레드 기준)
+- 동기 파일 핸들러 vs 큐 핸들러 (포맷/쓰기는 리스너 스레드)
+- 느린 출력(쓰기마다 지연) 상황의 동기 핸들러 vs 큐 핸들러
+- 텍스트 포맷터 / JSON 포맷터 포맷 1회
+- 레벨이 꺼진 debug 호출 (f-string vs %-인자)
+
+사용법: python benchmarks/bench_logging.py [--iterations 20000] [--slow-write-ms 1.0]
+"""
+
+import argparse
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.logger import ContextQueueHandler, JsonFormatter  # noqa: E402
+from src.utils.request_context import RequestContextFilter, reset_request_context, start_request_context  # noqa: E402
+
+TEXT_FORMAT = "%(asctime)s [%(levelname)s] (%(name)s) [%(request_id)s] : %(message)s"
+
+
+class SlowStream:
+    """쓰기마다 지연되는 출력 (stdout/디스크 역압 흉내)"""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    def write(self, text):
+        time.sleep(self.delay)
+
+    def flush(self):
+        pass
+
+
+def measure(func, iterations: int) -> float:
+    """호출당 평균 시간 (마이크로초)"""
+    func()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def make_logger(name: str, handler: logging.Handler) -> logging.Logger:
+    handler.addFilter(RequestContextFilter())
+    logger = logging.getLogger(name)
+    logger.handlers = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    return logger
+
+
+def queued(name: str, target: logging.Handler):
+    handler = ContextQueueHandler(queue.Queue(-1))
+    listener = logging.handlers.QueueListener(handler.queue, target)
+    listener.start()
+    return make_logger(name, handler), listener
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로그 호출 비용 벤치마크")
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--slow-write-ms", type=float, default=1.0)
+    args = parser.parse_args()
+
+    token = start_request_context("req-bench", "tenant-a")
+    directory = tempfile.mkdtemp()
+    text_formatter = logging.Formatter(TEXT_FORMAT)
+
+    file_handler = logging.FileHandler(os.path.join(directory, "sync.log"))
+    file_handler.setFormatter(text_formatter)
+    sync_logger = make_logger("bench.sync", file_handler)
+
+    queued_file = logging.FileHandler(os.path.join(directory, "queued.log"))
+    queued_file.setFormatter(JsonFormatter())
+    queue_logger, listener = queued("bench.queue", queued_file)
+
+    slow_sync = logging.StreamHandler(SlowStream(args.slow_write_ms / 1000))
+    slow_sync.setFormatter(text_formatter)
+    slow_sync_logger = make_logger("bench.slow_sync", slow_sync)
+    slow_queued = logging.StreamHandler(SlowStream(args.slow_write_ms / 1000))
+    slow_queued.setFormatter(text_formatter)
+    slow_queue_logger, slow_listener = queued("bench.slow_queue", slow_queued)
+
+    record = sync_logger.makeRecord("bench", logging.INFO, __file__, 0, "채팅 응답 처리 완료: %.2fs (대기: %.2fs)", (0.85, 0.01), None)
+    RequestContextFilter().filter(record)
+    json_formatter = JsonFormatter()
+    response_time, queue_wait = 0.85, 0.01
+
+    slow_iterations = max(1, min(args.iterations, int(200 / max(args.slow_write_ms, 0.001))))
+    cases = [
+        ("동기 파일 핸들러", lambda: sync_logger.info("채팅 응답 처리 완료: %.2fs (대기: %.2fs)", response_time, queue_wait), args.iterations),
+        ("큐 핸들러 (JSON)", lambda: queue_logger.info("채팅 응답 처리 완료: %.2fs (대기: %.2fs)", response_time, queue_wait), args.iterations),
+        ("느린 출력 + 동기", lambda: slow_sync_logger.info("채팅 응답 처리 완료: %.2fs", response_time), slow_iterations),
+        ("느린 출력 + 큐", lambda: slow_queue_logger.info("채팅 응답 처리 완료: %.2fs", response_time), slow_iterations),
+        ("텍스트 포맷", lambda: text_formatter.format(record), args.iterations),
+        ("JSON 포맷", lambda: json_formatter.format(record), args.iterations),
+        ("꺼진 debug (f-string)", lambda: sync_logger.debug(f"레이트 리밋 대기: {response_time:.3f}s (model: {queue_wait})"), args.iterations),
+        ("꺼진 debug (%-인자)", lambda: sync_logger.debug("레이트 리밋 대기: %.3fs (model: %s)", response_time, queue_wait), args.iterations),
+    ]
+    print(f"반복 {args.iterations}회 (느린 출력: 쓰기당 {args.slow_write_ms}ms, {slow_iterations}회)")
+    for name, func, iterations in cases:
+        print(f"{name:<24}{measure(func, iterations):>10.2f}us")
+
+    listener.stop()
+    slow_listener.stop()
+    reset_request_context(token)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+메트릭 기록 비용 벤치마크
+- 카운터 증가 / 히스토그램 관측 1회
+- 채팅 요청 1건이 기록하는 전체 메트릭 (결과 수, 종단 간/업스트림/대기 히스토그램, 토큰, 비용)
+- /metrics 렌더링 1회
+- 모델별 지연 표본 기록(TTFT/생성 속도/전체 지연) 1회, 백분위수 스냅샷 1회 (링 버퍼가 찬 상태)
+
+사용법: python benchmarks/bench_metrics.py [--iterations 50000]
+"""
+
+import argparse
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.models.request_dto import ChatRequest  # noqa: E402
+from src.models.response_dto import TokenUsage  # noqa: E402
+from src.services.chat_service import ChatService  # noqa: E402
+from src.utils.latency_tracker import LatencyTracker  # noqa: E402
+from src.utils import prometheus  # noqa: E402
+from src.utils.shared_metrics import metrics  # noqa: E402
+
+
+def measure(func, iterations: int) -> float:
+    """호출당 평균 시간 (마이크로초)"""
+    func()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="메트릭 기록 비용 벤치마크")
+    parser.add_argument("--iterations", type=int, default=50000)
+    args = parser.parse_args()
+
+    chat_service = ChatService()
+    request = ChatRequest(user_prompt="안녕", model="gpt-4o-mini")
+    ticket = SimpleNamespace(queue_wait=0.01, priority="interactive")
+    usage = TokenUsage(1000, 300, 1300, 200, 0)
+
+    def record_request():
+        chat_service._record_metrics(request.model, ticket, 0.8, usage, 42, False, False)
+        chat_service._record_request(request, 0.85)
+
+    latency = LatencyTracker()
+    for _ in range(latency.sample_size):
+        latency.record("gpt-4o-mini", 1.2, ttft=0.3, output_tokens=300, generation_time=0.9)
+
+    cases = [
+        ("counter inc", lambda: metrics.inc("bench_total", labels={"model": "gpt-4o-mini", "type": "input"})),
+        ("histogram observe", lambda: metrics.observe("bench_seconds", 0.8, labels={"model": "gpt-4o-mini"})),
+        ("요청 1건 전체 기록", record_request),
+        ("지연 표본 기록", lambda: latency.record("gpt-4o-mini", 1.2, ttft=0.3, output_tokens=300, generation_time=0.9)),
+    ]
+    print(f"반복 {args.iterations}회")
+    for name, func in cases:
+        print(f"{name:<24}{measure(func, args.iterations):>10.2f}us")
+    print(f"{'/metrics 렌더링':<24}{measure(lambda: prometheus.render(metrics), 200):>10.2f}us")
+    print(f"{'지연 백분위수 스냅샷':<24}{measure(latency.snapshot, 200):>10.2f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+응답 생성 + 직렬화 경로 벤치마크 (업스트림 응답 1건 → HTTP 본문 바이트)
+- 기존 경로: hasattr/getattr 탐색 + 필드 검증 생성 → FastAPI response_model 재검증/jsonable_encoder → JSONResponse
+- 빠른 경로: TokenUsage 한 번 추출 + model_construct → ModelJSONResponse(orjson)
+
+응답당 시간(마이크로초)과 응답 한 건을 만드는 동안의 할당 최대 바이트(tracemalloc peak)를 측정함
+(CPython은 해제를 포함한 누적 할당 횟수를 제공하지 않으므로 할당량은 peak로 비교)
+
+사용법: python benchmarks/bench_response_path.py [--iterations 20000]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+import tracemalloc
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from openai.types.responses import Response
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.api.content_negotiation import ModelJSONResponse  # noqa: E402
+from src.models.response_dto import ChatResponse, TokenUsage  # noqa: E402
+
+RESPONSE_FIELD = create_response_field(name="Response_chat", type_=ChatResponse)
+
+OPENAI_RESPONSE = Response.model_validate({
+    "id": "resp_bench",
+    "object": "response",
+    "created_at": 1741476542.0,
+    "status": "completed",
+    "model": "gpt-4o-mini",
+    "output": [{
+        "type": "message", "id": "msg_1", "status": "completed", "role": "assistant",
+        "content": [{"type": "output_text", "text": "요약 결과입니다. " * 5, "annotations": []}]
+    }],
+    "parallel_tool_calls": True,
+    "tool_choice": "auto",
+    "tools": [],
+    "text": {"format": {"type": "text"}},
+    "usage": {
+        "input_tokens": 1000,
+        "input_tokens_details": {"cached_tokens": 200, "cache_write_tokens": 0},
+        "output_tokens": 300,
+        "output_tokens_details": {"reasoning_tokens": 0},
+        "total_tokens": 1300
+    }
+})
+
+
+def legacy_build(openai_response) -> ChatResponse:
+    """변경 전 from_openai_response (단계마다 usage 탐색 + 필드 검증)"""
+    usage = openai_response.usage
+    cached_tokens = 0
+    if hasattr(usage, 'input_tokens_details'):
+        details = usage.input_tokens_details
+        if details and hasattr(details, 'cached_tokens'):
+            cached_tokens = getattr(details, 'cached_tokens', 0)
+    reasoning_tokens = 0
+    if hasattr(usage, 'output_tokens_details'):
+        details = usage.output_tokens_details
+        if details and hasattr(details, 'reasoning_tokens'):
+            reasoning_tokens = getattr(details, 'reasoning_tokens', 0)
+    return ChatResponse(
+        id=openai_response.id,
+        request_id="bench",
+        object=openai_response.object,
+        created_at=openai_response.created_at,
+        status=openai_response.status,
+        model=openai_response.model,
+        output_text=openai_response.output_text,
+        input_tokens=usage.input_tokens,
+        output_tokens=usage.output_tokens,
+        total_tokens=usage.total_tokens,
+        cached_tokens=cached_tokens,
+        reasoning_tokens=reasoning_tokens,
+        text_format_type=openai_response.text.format.type,
+        cost=42,
+        response_time=1.2,
+        queue_time=0.0,
+        success=True,
+        use_user_api_key=False
+    )
+
+
+async def legacy_path() -> bytes:
+    response = legacy_build(OPENAI_RESPONSE)
+    content = await serialize_response(field=RESPONSE_FIELD, response_content=response, is_coroutine=True)
+    return JSONResponse(content).body
+
+
+async def fast_path() -> bytes:
+    usage = TokenUsage.from_openai_usage(OPENAI_RESPONSE.usage)
+    response = ChatResponse.from_openai_response(
+        OPENAI_RESPONSE, request_id="bench", response_time=1.2, cost=42, queue_time=0.0, usage=usage
+    )
+    return ModelJSONResponse(response).body
+
+
+async def measure(path, iterations: int) -> dict:
+    await path()
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await path()
+    elapsed_us = (time.perf_counter() - started) / iterations * 1_000_000
+
+    # 호출 한 번의 할당 최대치
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    await path()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {"us": elapsed_us, "peak_bytes": peak - baseline}
+
+
+async def run(iterations: int) -> None:
+    legacy_body, fast_body = await legacy_path(), await fast_path()
+    assert json.loads(legacy_body) == json.loads(fast_body), "두 경로의 응답 본문이 다릅니다."
+
+    print(f"반복 {iterations}회")
+    print(f"{'경로':<12}{'응답당(us)':>12}{'할당 peak(B)':>16}")
+    baseline = None
+    for name, path in (("기존", legacy_path), ("빠른 경로", fast_path)):
+        result = await measure(path, iterations)
+        baseline = baseline or result
+        print(
+            f"{name:<12}{result['us']:>12.1f}{result['peak_bytes']:>16,}"
+            f"  (x{baseline['us'] / result['us']:.2f})"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="응답 생성/직렬화 경로 벤치마크")
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+    asyncio.run(run(args.iterations))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+요청/응답 본문 직렬화 벤치마크 (JSON vs MessagePack)
+- 긴 conversation_history를 가진 ChatRequest의 본문 크기 및 디코딩+검증 시간
+- ChatResponse 인코딩 시간 (FastAPI 기본 JSON 경로 / model_dump_json / msgpack)
+
+네트워크 없이 프로세스 안에서 직렬화 비용만 측정함
+
+사용법: python benchmarks/bench_serialization.py [--history 200] [--iterations 2000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import msgpack
+from fastapi.encoders import jsonable_encoder
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.api.content_negotiation import pack  # noqa: E402
+from src.models.request_dto import ChatRequest  # noqa: E402
+from src.models.response_dto import ChatResponse  # noqa: E402
+
+
+def build_request(history: int) -> dict:
+    turns = [
+        {"role": "user" if i % 2 == 0 else "assistant", "content": f"{i}번째 메시지입니다. " * 20}
+        for i in range(history)
+    ]
+    return {"request_id": "bench", "user_prompt": "다음 내용을 요약해 주세요.", "conversation_history": turns}
+
+
+def build_response() -> ChatResponse:
+    return ChatResponse(
+        id="resp_bench",
+        request_id="bench",
+        output_text="요약 결과입니다. " * 200,
+        response_time=1.23,
+        model="gpt-4o-mini",
+        input_tokens=1000,
+        output_tokens=500,
+        total_tokens=1500
+    )
+
+
+def measure(func, iterations: int) -> float:
+    """호출당 평균 시간 (마이크로초)"""
+    func()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JSON/MessagePack 직렬화 벤치마크")
+    parser.add_argument("--history", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    body = build_request(args.history)
+    json_body = json.dumps(body, ensure_ascii=False).encode()
+    msgpack_body = msgpack.packb(body, use_bin_type=True)
+    response = build_response()
+
+    print(f"대화 기록 {args.history}개, 반복 {args.iterations}회")
+    print(f"요청 본문 크기: json {len(json_body):,}B / msgpack {len(msgpack_body):,}B ({len(msgpack_body) / len(json_body):.0%})")
+
+    # 첫 항목이 비교 기준 (현재 FastAPI 경로)
+    cases = [
+        ("요청 디코딩", [
+            ("json.loads + 검증", lambda: ChatRequest.model_validate(json.loads(json_body))),
+            ("model_validate_json", lambda: ChatRequest.model_validate_json(json_body)),
+            ("msgpack.unpackb + 검증", lambda: ChatRequest.model_validate(msgpack.unpackb(msgpack_body, raw=False))),
+        ]),
+        ("응답 인코딩", [
+            ("jsonable_encoder + json.dumps", lambda: json.dumps(jsonable_encoder(response), ensure_ascii=False).encode()),
+            ("model_dump_json", lambda: response.model_dump_json().encode()),
+            ("msgpack pack", lambda: pack(response)),
+        ]),
+    ]
+
+    for title, variants in cases:
+        print(f"\n[{title}]")
+        baseline = None
+        for name, func in variants:
+            elapsed = measure(func, args.iterations)
+            baseline = baseline or elapsed
+            print(f"{name:<32}{elapsed:>10.1f}us  (x{baseline / elapsed:.2f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+import hmac
+import os
+from typing import Optional
+import orjson
+from fastapi import APIRouter, Depends, Header, Query, Response
+from starlette.concurrency import run_in_threadpool
+from src.exceptions.chat_exceptions import AuthorizationException, ValidationException
+from src.models.request_dto import LogPolicyUpdate
+from src.utils.logger import get_logger
+from src.utils.cpu_profiler import cpu_profiler
+from src.utils.log_policy import log_policy
+from src.utils.memory_profiler import allocation_sampler, memory_profiler
+from src.utils.loop_monitor import loop_monitor
+from src.config.config import settings
+
+logger = get_logger(__name__)
+
+
+async def require_admin_token(authorization: Optional[str] = Header(default=None)) -> None:
+    """관리 API 인증 (Authorization: Bearer <ADMIN_TOKEN>, ADMIN_TOKEN이 비어 있으면 모두 거부)"""
+    if not settings.ADMIN_TOKEN:
+        raise AuthorizationException("관리 API가 비활성화되어 있습니다 (ADMIN_TOKEN 미설정)")
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(token.strip().encode("utf-8"), settings.ADMIN_TOKEN.encode("utf-8")):
+        raise AuthorizationException("관리 API 토큰이 올바르지 않습니다")
+
+
+admin_router = APIRouter(prefix="/api/v1/admin", tags=["admin"], dependencies=[Depends(require_admin_token)])
+
+
+@admin_router.get("/log-policy")
+async def get_log_policy():
+    """현재 로그 정책 (요청 샘플링 비율 / 로거별 한도 / 프롬프트 기록 글자 수)"""
+    return log_policy.snapshot()
+
+
+@admin_router.put("/log-policy")
+async def update_log_policy(update: LogPolicyUpdate):
+    """로그 정책 변경 - 재시작 없이 모든 워커에 적용됨 (주어진 값만 변경)"""
+    policy = log_policy.update(**update.model_dump(exclude_none=True))
+    logger.warning(f"로그 정책 변경: {policy}")
+    return policy
+
+
+@admin_router.get("/stalls")
+async def get_stalls():
+    """이 워커에서 감지한 이벤트 루프 멈춤 - 블로킹 코드 호출 위치별 횟수/멈춘 시간/마지막 스택"""
+    return {
+        "pid": os.getpid(),
+        "stall_threshold": loop_monitor.stall_threshold,
+        "dropped_sites": loop_monitor.dropped_sites,
+        "stalls": loop_monitor.stalls()
+    }
+
+
+@admin_router.delete("/stalls")
+async def reset_stalls():
+    """이벤트 루프 멈춤 집계 초기화 (이 워커)"""
+    loop_monitor.reset_stalls()
+    return {"reset": True, "pid": os.getpid()}
+
+
+@admin_router.get("/profile/cpu")
+async def profile_cpu(seconds: float = None, rate: float = None, format: str = "collapsed", include_idle: bool = False):
+    """
+    이 워커의 모든 스레드를 seconds초 동안 초당 rate번 샘플링한 CPU 프로파일
+
+    format=collapsed는 flamegraph.pl 입력용 텍스트, format=speedscope는 speedscope JSON 파일
+    """
+    seconds = settings.PROFILER_DEFAULT_SECONDS if seconds is None else seconds
+    rate = settings.PROFILER_DEFAULT_RATE if rate is None else rate
+    if not 0 < seconds <= settings.PROFILER_MAX_SECONDS:
+        raise ValidationException(f"seconds는 0보다 크고 {settings.PROFILER_MAX_SECONDS} 이하여야 합니다", "seconds", str(seconds))
+    if not 1 <= rate <= settings.PROFILER_MAX_RATE:
+        raise ValidationException(f"rate는 1 이상 {settings.PROFILER_MAX_RATE} 이하여야 합니다", "rate", str(rate))
+    if format not in ("collapsed", "speedscope"):
+        raise ValidationException("format은 collapsed 또는 speedscope여야 합니다", "format", format)
+
+    # 샘플링은 스레드에서 실행 (이벤트 루프 스레드도 샘플링 대상이므로 막지 않음)
+    result = await run_in_threadpool(cpu_profiler.profile, seconds, rate, include_idle)
+    headers = {"X-Profile-Pid": str(result.pid), "X-Profile-Samples": str(result.sample_count)}
+    if format == "speedscope":
+        headers["Content-Disposition"] = f'attachment; filename="cpu-{result.pid}.speedscope.json"'
+        return Response(orjson.dumps(result.speedscope()), media_type="application/json", headers=headers)
+    return Response(result.collapsed(), media_type="text/plain; charset=utf-8", headers=headers)
+
+
+@admin_router.get("/memory")
+async def get_memory_status():
+    """
+    이 워커의 메모리 할당 추적 상태 (추적 중인 메모리 / 최고점 / tracemalloc 자체 사용량)
+
+    peak_bytes는 추적 시작 이후 최고점 (추적 중에는 요청별 할당 표본을 뽑지 않아 초기화되지 않음)
+    """
+    return memory_profiler.status()
+
+
+@admin_router.post("/memory/start")
+async def start_memory_tracing(frames: Optional[int] = Query(default=None, ge=1, le=100)):
+    """tracemalloc 시작 및 기준점 스냅샷 (frames: 할당 위치마다 저장할 traceback 프레임 수, MEMORY_TRACE_MAX_SECONDS 뒤 자동 중지)"""
+    return await run_in_threadpool(memory_profiler.start, frames)
+
+
+@admin_router.post("/memory/stop")
+async def stop_memory_tracing():
+    """tracemalloc 중지"""
+    return await run_in_threadpool(memory_profiler.stop)
+
+
+@admin_router.get("/memory/top")
+async def get_memory_top(
+    limit: Optional[int] = Query(default=None, ge=1, le=1000),
+    group_by: str = "lineno",
+    compare: bool = True,
+    rebase: bool = False
+):
+    """
+    할당 위치 상위 limit개 (limit: 1-1000, group_by: lineno, filename, traceback)
+
+    compare면 기준점 대비 늘어난 크기 순, rebase면 이번 스냅샷을 다음 비교의 기준점으로 삼음
+    """
+    return await run_in_threadpool(memory_profiler.snapshot, limit, group_by, compare, rebase)
+
+
+@admin_router.get("/memory/requests")
+async def get_request_allocations():
+    """요청별 할당 표본 요약 (MEMORY_REQUEST_SAMPLE_RATE > 0일 때 수집)"""
+    return allocation_sampler.summary()
@@ -0,0 +1,49 @@
+from fastapi import APIRouter, Request
+from starlette.concurrency import run_in_threadpool
+from src.api.routes import chat_service
+from src.api.content_negotiation import MsgpackRequest, NegotiatedRoute, negotiate
+from src.models.batch_dto import BatchJob, BatchJobResults
+from src.services.batch_service import BatchService
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+batch_router = APIRouter(prefix="/api/v1", tags=["batch"], route_class=NegotiatedRoute)
+
+batch_service = BatchService(chat_service=chat_service)
+
+
+@batch_router.post("/batch", response_model=BatchJob)
+async def create_batch_job(request: Request):
+    """
+    배치 작업 생성 엔드포인트
+
+    요청 본문은 한 줄에 ChatRequest 하나씩인 JSONL(또는 Content-Type: application/msgpack이면 ChatRequest 맵 스트림)이며,
+    OpenAI Batch API로 제출됨 (동기 채팅 대비 절반 가격, 24시간 내 완료)
+    """
+    payload = await request.body()
+    if isinstance(request, MsgpackRequest):
+        requests = batch_service.parse_msgpack(payload)
+    else:
+        requests = batch_service.parse_jsonl(payload)
+
+    # 파일 업로드/배치 생성은 블로킹 호출이므로 스레드풀에서 실행
+    return negotiate(request, await run_in_threadpool(batch_service.create_job, requests))
+
+
+@batch_router.get("/batch/{job_id}", response_model=BatchJob)
+async def get_batch_job(job_id: str, request: Request):
+    """배치 작업 상태 조회 엔드포인트"""
+    return negotiate(request, await run_in_threadpool(batch_service.get_job, job_id))
+
+
+@batch_router.get("/batch/{job_id}/results", response_model=BatchJobResults)
+async def get_batch_results(job_id: str, request: Request):
+    """배치 작업 결과 조회 엔드포인트 (완료 전에는 results가 비어 있음)"""
+    return negotiate(request, await run_in_threadpool(batch_service.get_results, job_id))
+
+
+@batch_router.post("/batch/{job_id}/cancel", response_model=BatchJob)
+async def cancel_batch_job(job_id: str, request: Request):
+    """배치 작업 취소 엔드포인트"""
+    return negotiate(request, await run_in_threadpool(batch_service.cancel_job, job_id))
@@ -0,0 +1,251 @@
+"""
+WebSocket 채팅 채널 - 연결 하나로 여러 턴을 주고받는 프레임 프로토콜
+
+클라이언트 → 서버
+    {"type": "chat", "id": "<턴 ID>", ...ChatRequest 필드}   턴 시작 (연결당 동시에 하나)
+    {"type": "cancel", "id": "<턴 ID>"}                       진행 중인 생성 취소
+    {"type": "reset"}                                         세션 대화 기록 초기화
+    {"type": "ping", "ts": ...} / {"type": "pong", "ts": ...}
+
+서버 → 클라이언트
+    {"type": "session", "session_id": ..., "history_length": ...}
+    {"type": "delta", "id": ..., "text": ...}                 출력 텍스트 조각
+    {"type": "done" | "cancelled", "id": ..., "response": ChatResponse}
+    {"type": "error", "id": ..., "error_code": ..., "message": ..., "retry_after": ...}
+    {"type": "ping", "ts": ...} / {"type": "pong", "ts": ...}
+
+프레임은 JSON(텍스트 프레임) 또는 msgpack(바이너리 프레임)으로 인코딩하며, 받은 프레임은 프레임 종류로 판별함
+"""
+
+import asyncio
+import json
+import threading
+import time
+from typing import Optional
+import msgpack
+from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
+from src.models.request_dto import ChatRequest
+from src.models.response_dto import ChatResponse
+from src.services.chat_service import ChatService
+from src.services.session_service import ChatSession, SessionService
+from src.utils.logger import get_logger
+from src.utils.request_context import bind_request
+from src.utils.shared_metrics import metrics
+from src.config.config import settings
+from src.exceptions.chat_exceptions import (
+    ChatServiceException,
+    OpenAIClientException,
+    ValidationException,
+    ConfigurationException,
+    RateLimitException,
+    OverloadedException
+)
+
+logger = get_logger(__name__)
+
+FRAME_ENCODINGS = ("json", "msgpack")
+
+# 유휴 연결 종료 코드 (RFC 6455 Going Away)
+CLOSE_GOING_AWAY = 1001
+
+# 스트림 종료 표시
+_END = object()
+
+
+def error_frame(turn_id: Optional[str], error: Exception) -> dict:
+    """예외를 error 프레임으로 변환 (HTTP 예외 핸들러와 같은 분류)"""
+    frame = {"type": "error", "id": turn_id, "message": getattr(error, "message", str(error))}
+    if isinstance(error, RateLimitException):
+        frame.update(error_code="RATE_LIMITED", retry_after=error.retry_after)
+    elif isinstance(error, OverloadedException):
+        frame.update(error_code="OVERLOADED", retry_after=error.retry_after)
+    elif isinstance(error, (ValidationException, ValidationError)):
+        frame.update(error_code="VALIDATION_ERROR", message=str(error) if isinstance(error, ValidationError) else error.message)
+    elif isinstance(error, (OpenAIClientException, ChatServiceException)):
+        frame.update(error_code=error.error_code)
+    elif isinstance(error, ConfigurationException):
+        frame.update(error_code="CONFIGURATION_ERROR")
+    else:
+        frame.update(error_code="INTERNAL_ERROR")
+    return frame
+
+
+class ChatSocketConnection:
+    """
+    WebSocket 연결 하나의 프레임 처리
+
+    - 수신 루프는 턴 실행 중에도 계속 돌아 cancel/ping 프레임을 즉시 처리함
+    - 턴은 스레드풀에서 ChatService.stream_chat_request를 실행하고, 출력 조각을 이벤트 루프 큐로 넘겨 전송함
+    - ping_interval마다 ping을 보내고 idle_timeout 동안 아무 프레임도 받지 못하면 연결을 닫음
+    """
+
+    def __init__(
+        self,
+        websocket,
+        chat_service: ChatService,
+        session_service: SessionService,
+        session: ChatSession,
+        encoding: str = "json",
+        tenant_id: str = None,
+        ping_interval: float = None,
+        idle_timeout: float = None
+    ):
+        self.websocket = websocket
+        self.chat_service = chat_service
+        self.session_service = session_service
+        self.session = session
+        self.encoding = encoding
+        self.tenant_id = tenant_id
+        self.ping_interval = settings.WS_PING_INTERVAL if ping_interval is None else ping_interval
+        self.idle_timeout = settings.WS_IDLE_TIMEOUT if idle_timeout is None else idle_timeout
+        self.last_seen = time.monotonic()
+        self.turn_id: Optional[str] = None
+        self.turn_task: Optional[asyncio.Task] = None
+        self.cancel_event: Optional[threading.Event] = None
+
+    async def send(self, frame: dict) -> None:
+        if self.encoding == "msgpack":
+            await self.websocket.send_bytes(msgpack.packb(frame, use_bin_type=True))
+        else:
+            await self.websocket.send_text(json.dumps(frame, ensure_ascii=False))
+
+    @staticmethod
+    def decode(message: dict) -> dict:
+        """수신 메시지 디코딩 (텍스트 = JSON, 바이너리 = msgpack)"""
+        try:
+            if message.get("bytes") is not None:
+                frame = msgpack.unpackb(message["bytes"], raw=False)
+            else:
+                frame = json.loads(message.get("text") or "")
+        except (ValueError, msgpack.UnpackException) as e:
+            raise ValueError(f"프레임을 해석할 수 없습니다: {str(e)}")
+        if not isinstance(frame, dict) or not isinstance(frame.get("type"), str):
+            raise ValueError("프레임은 type 필드를 가진 객체여야 합니다.")
+        return frame
+
+    async def run(self) -> None:
+        """연결이 끊길 때까지 프레임 처리"""
+        metrics.gauge_add("ws_connections", 1)
+        pinger = asyncio.create_task(self._ping_loop())
+        try:
+            await self.send({
+                "type": "session",
+                "session_id": self.session.session_id,
+                "history_length": len(self.session.history)
+            })
+            while True:
+                message = await self.websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    break
+                self.last_seen = time.monotonic()
+                try:
+                    frame = self.decode(message)
+                except ValueError as e:
+                    await self.send({"type": "error", "id": None, "error_code": "INVALID_FRAME", "message": str(e)})
+                    continue
+                await self._dispatch(frame)
+        finally:
+            pinger.cancel()
+            # 연결이 끊기면 진행 중인 생성도 중단 (정산은 턴 작업이 마무리)
+            if self.cancel_event:
+                self.cancel_event.set()
+            metrics.gauge_add("ws_connections", -1)
+            logger.debug("WebSocket 연결 종료: %s", self.session.session_id)
+
+    async def _dispatch(self, frame: dict) -> None:
+        frame_type = frame["type"]
+        if frame_type == "chat":
+            await self._start_turn(frame)
+        elif frame_type == "cancel":
+            if self.cancel_event and frame.get("id") in (None, self.turn_id):
+                self.cancel_event.set()
+        elif frame_type == "ping":
+            await self.send({"type": "pong", "ts": frame.get("ts")})
+        elif frame_type == "pong":
+            pass
+        elif frame_type == "reset":
+            self.session_service.reset(self.session)
+            await self.send({"type": "session", "session_id": self.session.session_id, "history_length": 0})
+        else:
+            await self.send({"type": "error", "id": frame.get("id"), "error_code": "INVALID_FRAME", "message": f"알 수 없는 프레임 종류입니다: {frame_type}"})
+
+    async def _start_turn(self, frame: dict) -> None:
+        turn_id = frame.get("id")
+        if self.turn_task is not None:
+            await self.send({"type": "error", "id": turn_id, "error_code": "TURN_IN_PROGRESS", "message": "이전 턴이 아직 진행 중입니다."})
+            return
+
+        fields = {key: value for key, value in frame.items() if key not in ("type", "id")}
+        try:
+            request = ChatRequest(**fields)
+        except ValidationError as e:
+            await self.send(error_frame(turn_id, e))
+            return
+        if not request.request_id:
+            request.request_id = turn_id or ""
+        # 연결당 한 턴씩만 실행하므로 연결의 요청 컨텍스트를 현재 턴으로 갱신
+        bind_request(request, self.tenant_id)
+
+        self.turn_id = turn_id
+        self.cancel_event = threading.Event()
+        self.turn_task = asyncio.create_task(self._run_turn(turn_id, request, self.cancel_event))
+
+    async def _run_turn(self, turn_id: Optional[str], request: ChatRequest, cancel_event: threading.Event) -> None:
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        user_prompt = request.user_prompt
+        self.session_service.prepare(self.session, request)
+
+        def publish(item) -> None:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+            except RuntimeError:
+                # 이벤트 루프가 이미 종료됨 (서버 종료 중)
+                pass
+
+        def produce() -> None:
+            stream = self.chat_service.stream_chat_request(request, tenant_id=self.tenant_id, cancel_event=cancel_event)
+            try:
+                for item in stream:
+                    publish(item)
+            except Exception as e:
+                publish(e)
+            finally:
+                stream.close()
+                publish(_END)
+
+        producer = asyncio.ensure_future(run_in_threadpool(produce))
+        try:
+            while True:
+                item = await queue.get()
+                if item is _END:
+                    break
+                if isinstance(item, Exception):
+                    await self.send(error_frame(turn_id, item))
+                elif isinstance(item, ChatResponse):
+                    if item.status != "cancelled":
+                        self.session_service.record_turn(self.session, user_prompt, item.output_text)
+                    frame_type = "cancelled" if item.status == "cancelled" else "done"
+                    await self.send({"type": frame_type, "id": turn_id, "response": item.to_dict()})
+                else:
+                    await self.send({"type": "delta", "id": turn_id, "text": item})
+        except Exception as e:
+            # 전송 실패(연결 끊김)면 생성을 중단
+            cancel_event.set()
+            logger.debug("WebSocket 턴 전송 중단: %s", e)
+        finally:
+            await producer
+            self.turn_task = self.cancel_event = self.turn_id = None
+
+    async def _ping_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.ping_interval)
+            if time.monotonic() - self.last_seen > self.idle_timeout:
+                logger.info("WebSocket 유휴 연결 종료: %s", self.session.session_id)
+                await self.websocket.close(code=CLOSE_GOING_AWAY)
+                return
+            try:
+                await self.send({"type": "ping", "ts": time.time()})
+            except Exception:
+                return
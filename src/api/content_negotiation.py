@@ -0,0 +1,120 @@
+"""
+MessagePack 요청/응답 본문 협상
+
+- 요청: Content-Type이 msgpack이면 본문을 msgpack으로 해석해 FastAPI 본문 검증(ChatRequest 등)에 그대로 넘김
+- 응답: Accept가 JSON보다 msgpack을 선호하면 msgpack, 아니면 orjson으로 응답 모델을 바로 인코딩
+  (엔드포인트가 Response를 반환하므로 FastAPI의 response_model 재검증/jsonable_encoder 변환을 거치지 않음)
+"""
+
+import msgpack
+import orjson
+from typing import Any
+from fastapi import Request
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse, Response
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+MSGPACK_MEDIA_TYPES = frozenset({MSGPACK_MEDIA_TYPE, "application/x-msgpack", "application/vnd.msgpack"})
+
+
+def is_msgpack(content_type: str) -> bool:
+    """Content-Type이 msgpack인지 확인"""
+    return (content_type or "").split(";", 1)[0].strip().lower() in MSGPACK_MEDIA_TYPES
+
+
+def _quality(params: str) -> float:
+    for param in params.split(";"):
+        name, _, value = param.strip().partition("=")
+        if name.lower() == "q":
+            try:
+                return float(value)
+            except ValueError:
+                return 0.0
+    return 1.0
+
+
+def accepts_msgpack(request: Request) -> bool:
+    """Accept 헤더에서 msgpack 선호도가 0보다 크고 application/json 이상인지 확인"""
+    msgpack_quality = json_quality = 0.0
+    for item in request.headers.get("accept", "").split(","):
+        media_type, _, params = item.partition(";")
+        media_type = media_type.strip().lower()
+        if media_type in MSGPACK_MEDIA_TYPES:
+            msgpack_quality = max(msgpack_quality, _quality(params))
+        elif media_type == "application/json":
+            json_quality = max(json_quality, _quality(params))
+    return msgpack_quality > 0 and msgpack_quality >= json_quality
+
+
+def _model_default(value: Any) -> Any:
+    # pydantic 모델의 __dict__는 필드 값을 그대로 담고 있으므로 새 dict를 만들지 않고 인코딩
+    if isinstance(value, BaseModel):
+        return value.__dict__
+    raise TypeError(f"인코딩할 수 없는 타입입니다: {type(value).__name__}")
+
+
+def pack(content: Any) -> bytes:
+    """응답 모델(중첩 모델/리스트 포함)을 msgpack으로 인코딩"""
+    return msgpack.packb(content, default=_model_default, use_bin_type=True)
+
+
+def dump_json(content: Any) -> bytes:
+    """응답 모델(중첩 모델/리스트 포함)을 orjson으로 인코딩"""
+    return orjson.dumps(content, default=_model_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class ModelJSONResponse(JSONResponse):
+    """orjson JSON 응답 (pydantic 모델을 중간 dict 변환 없이 인코딩)"""
+
+    def render(self, content: Any) -> bytes:
+        return dump_json(content)
+
+
+class MsgpackResponse(Response):
+    """msgpack 응답 (pydantic 모델을 중간 dict 변환 없이 인코딩)"""
+
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        return pack(content)
+
+
+def negotiate(request: Request, content: Any, status_code: int = 200) -> Response:
+    """Accept가 msgpack을 선호하면 MsgpackResponse, 아니면 ModelJSONResponse"""
+    response_class = MsgpackResponse if accepts_msgpack(request) else ModelJSONResponse
+    return response_class(content, status_code=status_code, headers={"Vary": "Accept"})
+
+
+class MsgpackRequest(Request):
+    """msgpack 본문을 JSON 본문과 같은 경로로 FastAPI 본문 검증에 넘기는 요청"""
+
+    def __init__(self, scope, receive):
+        super().__init__(scope, receive)
+        # FastAPI는 Content-Type이 JSON일 때만 request.json()으로 본문을 읽으므로 검증용 헤더만 바꿔 보여줌
+        raw_headers = [(key, value) for key, value in scope["headers"] if key != b"content-type"]
+        self._headers = Headers(raw=raw_headers + [(b"content-type", b"application/json")])
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            try:
+                self._json = msgpack.unpackb(await self.body(), raw=False)
+            except (ValueError, msgpack.UnpackException) as e:
+                # FastAPI가 JSON 해석 오류와 같은 400 응답으로 처리
+                raise ValueError(f"msgpack 본문을 해석할 수 없습니다: {str(e)}")
+        return self._json
+
+
+class NegotiatedRoute(APIRoute):
+    """Content-Type이 msgpack인 요청을 MsgpackRequest로 바꿔 처리하는 라우트"""
+
+    def get_route_handler(self):
+        route_handler = super().get_route_handler()
+
+        async def negotiated_route_handler(request: Request) -> Response:
+            if is_msgpack(request.headers.get("content-type")):
+                request = MsgpackRequest(request.scope, request.receive)
+            return await route_handler(request)
+
+        return negotiated_route_handler
@@ -1,29 +1,27 @@
+import math
 from fastapi import Request
-from fastapi.responses import JSONResponse
+from src.api.content_negotiation import ModelJSONResponse
 from src.models.response_dto import ChatResponse
 from src.exceptions.chat_exceptions import (
     ChatServiceException,
     OpenAIClientException,
     ValidationException,
-    ConfigurationException
+    ConfigurationException,
+    JobNotFoundException,
+    RateLimitException,
+    OverloadedException,
+    AuthorizationException
 )
 from src.utils.logger import get_logger
+from src.utils.request_context import current_request_id, get_request_context
 
 logger = get_logger(__name__)
 
 
-def _extract_request_id(request: Request) -> str:
-    """요청에서 request_id를 추출"""
-    try:
-        body = request.json()
-        return body.get("request_id", "")
-    except:
-        return ""
-
-
 async def validation_exception_handler(request: Request, exc: ValidationException):
     """검증 예외 핸들러"""
-    request_id = _extract_request_id(request)
+    # 본문을 다시 파싱하지 않고 미들웨어/라우트가 채운 요청 컨텍스트에서 읽음
+    request_id = current_request_id()
     logger.warning(f"검증 에러: {exc.message} (필드: {exc.field}, 값: {exc.value})")
     
     error_response = ChatResponse.create_error_response(
@@ -31,15 +29,15 @@ async def validation_exception_handler(request: Request, exc: ValidationExceptio
         error_message=f"입력 데이터 오류: {exc.message}"
     )
     
-    return JSONResponse(
+    return ModelJSONResponse(
         status_code=400,
-        content=error_response.to_dict()
+        content=error_response
     )
 
 
 async def openai_client_exception_handler(request: Request, exc: OpenAIClientException):
     """OpenAI 클라이언트 예외 핸들러"""
-    request_id = _extract_request_id(request)
+    request_id = current_request_id()
     logger.error(f"OpenAI 클라이언트 에러: {exc.message} (코드: {exc.error_code})")
     
     error_response = ChatResponse.create_error_response(
@@ -47,15 +45,15 @@ async def openai_client_exception_handler(request: Request, exc: OpenAIClientExc
         error_message=f"AI 서비스 연결 오류: {exc.message}"
     )
     
-    return JSONResponse(
+    return ModelJSONResponse(
         status_code=503,
-        content=error_response.to_dict()
+        content=error_response
     )
 
 
 async def chat_service_exception_handler(request: Request, exc: ChatServiceException):
     """채팅 서비스 예외 핸들러"""
-    request_id = _extract_request_id(request)
+    request_id = current_request_id()
     logger.error(f"채팅 서비스 에러: {exc.message} (코드: {exc.error_code})")
     
     error_response = ChatResponse.create_error_response(
@@ -63,15 +61,15 @@ async def chat_service_exception_handler(request: Request, exc: ChatServiceExcep
         error_message=f"채팅 서비스 오류: {exc.message}"
     )
     
-    return JSONResponse(
+    return ModelJSONResponse(
         status_code=503,
-        content=error_response.to_dict()
+        content=error_response
     )
 
 
 async def configuration_exception_handler(request: Request, exc: ConfigurationException):
     """설정 예외 핸들러"""
-    request_id = _extract_request_id(request)
+    request_id = current_request_id()
     logger.error(f"설정 에러: {exc.message} (키: {exc.config_key})")
     
     error_response = ChatResponse.create_error_response(
@@ -79,23 +77,91 @@ async def configuration_exception_handler(request: Request, exc: ConfigurationEx
         error_message=f"시스템 설정 오류: {exc.message}"
     )
     
-    return JSONResponse(
+    return ModelJSONResponse(
         status_code=500,
-        content=error_response.to_dict()
+        content=error_response
+    )
+
+
+async def job_not_found_exception_handler(request: Request, exc: JobNotFoundException):
+    """작업 조회 실패 예외 핸들러"""
+    request_id = current_request_id()
+    logger.warning(f"작업 조회 실패: {exc.message} (작업 ID: {exc.job_id})")
+    
+    error_response = ChatResponse.create_error_response(
+        request_id=request_id,
+        error_message=exc.message
+    )
+    
+    return ModelJSONResponse(
+        status_code=404,
+        content=error_response
+    )
+
+
+async def rate_limit_exception_handler(request: Request, exc: RateLimitException):
+    """요청 한도 초과 예외 핸들러"""
+    request_id = current_request_id()
+    logger.warning(f"요청 한도 초과: {exc.message} (재시도 대기: {exc.retry_after:.2f}s)")
+    
+    error_response = ChatResponse.create_error_response(
+        request_id=request_id,
+        error_message=f"요청 한도 초과: {exc.message}"
+    )
+    
+    return ModelJSONResponse(
+        status_code=429,
+        content=error_response,
+        headers={"Retry-After": str(max(1, math.ceil(exc.retry_after)))}
+    )
+
+
+async def overloaded_exception_handler(request: Request, exc: OverloadedException):
+    """과부하 예외 핸들러 (부하 차단)"""
+    request_id = current_request_id()
+    logger.warning(f"과부하로 요청 차단: {exc.message} (모델: {exc.model}, 재시도 대기: {exc.retry_after:.2f}s)")
+    
+    error_response = ChatResponse.create_error_response(
+        request_id=request_id,
+        error_message=f"서버 과부하: {exc.message}"
+    )
+    
+    return ModelJSONResponse(
+        status_code=503,
+        content=error_response,
+        headers={"Retry-After": str(max(1, math.ceil(exc.retry_after)))}
+    )
+
+
+async def authorization_exception_handler(request: Request, exc: AuthorizationException):
+    """관리 API 인증 실패 예외 핸들러"""
+    request_id = current_request_id()
+    logger.warning(f"관리 API 인증 실패: {exc.message} (경로: {request.url.path})")
+    
+    error_response = ChatResponse.create_error_response(
+        request_id=request_id,
+        error_message=exc.message
+    )
+    
+    return ModelJSONResponse(
+        status_code=401,
+        content=error_response,
+        headers={"WWW-Authenticate": "Bearer"}
     )
 
 
 async def generic_exception_handler(request: Request, exc: Exception):
     """일반 예외 핸들러"""
-    request_id = _extract_request_id(request)
-    logger.error(f"예상치 못한 에러: {str(exc)}")
+    request_id = current_request_id()
+    context = get_request_context()
+    logger.error(f"예상치 못한 에러: {str(exc)} (모델: {context.model if context else '-'}, 경과: {context.elapsed() if context else 0.0:.2f}s)")
     
     error_response = ChatResponse.create_error_response(
         request_id=request_id,
         error_message=f"시스템 오류가 발생했습니다: {str(exc)}"
     )
     
-    return JSONResponse(
+    return ModelJSONResponse(
         status_code=500,
-        content=error_response.to_dict()
+        content=error_response
     ) 
\ No newline at end of file
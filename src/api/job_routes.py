@@ -0,0 +1,34 @@
+from typing import Optional
+from fastapi import APIRouter, Header, Request
+from starlette.concurrency import run_in_threadpool
+from src.api.routes import chat_service
+from src.api.content_negotiation import NegotiatedRoute, negotiate
+from src.models.job_dto import Job, JobRequest
+from src.services.job_service import JobService
+from src.utils.logger import get_logger
+from src.utils.request_context import bind_request
+
+logger = get_logger(__name__)
+
+job_router = APIRouter(prefix="/api/v1", tags=["jobs"], route_class=NegotiatedRoute)
+
+job_service = JobService(chat_service=chat_service)
+
+
+@job_router.post("/jobs", response_model=Job, status_code=202)
+async def create_job(request: JobRequest, http_request: Request, x_tenant_id: Optional[str] = Header(default=None)):
+    """
+    비동기 작업 생성 엔드포인트
+
+    o1/o3 계열처럼 수 분이 걸리는 요청을 위한 엔드포인트로, 작업 ID를 즉시 반환함.
+    결과는 GET /api/v1/jobs/{job_id} 폴링 또는 webhook_url로 전달받음
+    """
+    bind_request(request, x_tenant_id)
+    job = await run_in_threadpool(job_service.submit, request, tenant_id=x_tenant_id)
+    return negotiate(http_request, job, status_code=202)
+
+
+@job_router.get("/jobs/{job_id}", response_model=Job)
+async def get_job(job_id: str, request: Request):
+    """비동기 작업 상태/결과 조회 엔드포인트"""
+    return negotiate(request, await run_in_threadpool(job_service.get_job, job_id))
@@ -0,0 +1,37 @@
+import time
+from src.utils.shared_metrics import metrics
+
+
+class MetricsMiddleware:
+    """
+    HTTP 요청 수/지연 시간/진행 중 요청 수를 공유 메모리 메트릭에 기록하는 ASGI 미들웨어
+
+    경로 라벨은 실제 URL 대신 라우트 템플릿(/api/v1/jobs/{job_id})을 사용하여 시리즈 수를 제한함
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        metrics.gauge_add("http_requests_in_flight", 1)
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            metrics.gauge_add("http_requests_in_flight", -1)
+            route = scope.get("route")
+            labels = {"method": scope["method"], "path": route.path if route else "unmatched"}
+            metrics.inc("http_requests_total", labels={**labels, "status": str(status_code)})
+            metrics.observe("http_request_duration_seconds", time.perf_counter() - start_time, labels=labels)
@@ -0,0 +1,52 @@
+from src.config.config import settings
+from src.utils.request_context import get_request_context, reset_request_context, start_request_context
+
+
+class RequestContextMiddleware:
+    """
+    요청마다 RequestContext를 설정하는 ASGI 미들웨어 (HTTP/WebSocket)
+
+    - X-Request-ID, X-Tenant-ID 헤더로 초기값을 채우고, 본문 검증 후 라우트가 bind_request로 나머지를 채움
+    - 응답 시작 시 request_id가 정해져 있으면 X-Request-ID 응답 헤더로 돌려줌
+    - SERVER_TIMING_ENABLED면 라우트가 기록한 단계별 시간과 total을 Server-Timing 응답 헤더로 돌려줌
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        request_id = tenant_id = ""
+        for key, value in scope["headers"]:
+            if key == b"x-request-id":
+                request_id = value.decode("latin-1")
+            elif key == b"x-tenant-id":
+                tenant_id = value.decode("latin-1")
+
+        async def send_with_request_id(message):
+            if message["type"] == "http.response.start":
+                context = get_request_context()
+                if context is not None:
+                    headers = list(message.get("headers", []))
+                    if context.request_id:
+                        headers.append((b"x-request-id", context.request_id.encode("latin-1", "replace")))
+                    if settings.SERVER_TIMING_ENABLED:
+                        headers.append((b"server-timing", self._server_timing(context).encode("latin-1")))
+                    message["headers"] = headers
+            await send(message)
+
+        token = start_request_context(request_id, tenant_id)
+        await self.app(scope, receive, send_with_request_id if scope["type"] == "http" else send)
+        # 처리되지 않은 예외는 바깥(ServerErrorMiddleware)의 일반 예외 핸들러가 컨텍스트를 읽을 수 있도록
+        # 정상 종료 시에만 복원함 (요청마다 별도 태스크이므로 다음 요청으로 새지 않음)
+        reset_request_context(token)
+
+    @staticmethod
+    def _server_timing(context) -> str:
+        """단계별 시간(있으면) + 요청 시작부터 응답 시작까지의 total"""
+        if context.stages is None:
+            return f"total;dur={context.elapsed() * 1000:.3f}"
+        return context.stages.header_value(total=context.elapsed())
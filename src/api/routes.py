@@ -1,33 +1,114 @@
-from fastapi import APIRouter
+from typing import Optional
+from fastapi import APIRouter, Header, Request, WebSocket
+from starlette.concurrency import run_in_threadpool
 from src.models.request_dto import ChatRequest
 from src.models.response_dto import ChatResponse
 from src.services.chat_service import ChatService
+from src.services.session_service import SessionService
+from src.api.chat_socket import FRAME_ENCODINGS, ChatSocketConnection
+from src.api.content_negotiation import NegotiatedRoute, negotiate
+from src.exceptions.chat_exceptions import ValidationException
 from src.utils.logger import get_logger
+from src.utils.log_policy import log_policy
+from src.utils.memory_profiler import allocation_sampler
+from src.utils.request_context import bind_request
+from src.utils.stage_timer import start_stage_timer
+from src.utils.tracing import trace_span
 
 logger = get_logger(__name__)
 
-router = APIRouter(prefix="/api/v1", tags=["chat"])
+router = APIRouter(prefix="/api/v1", tags=["chat"], route_class=NegotiatedRoute)
 
 chat_service = ChatService()
+session_service = SessionService()
 
 
 @router.post("/chat", response_model=ChatResponse)
-async def chat_with_ai(request: ChatRequest):
+async def chat_with_ai(
+    request: ChatRequest,
+    http_request: Request,
+    x_tenant_id: Optional[str] = Header(default=None),
+    x_priority: Optional[str] = Header(default=None)
+):
     """
     AI와 채팅하는 엔드포인트 (최소 기능)
     
+    요청/응답 본문은 JSON 또는 msgpack (Content-Type / Accept: application/msgpack)
+    
     Args:
         request: 채팅 요청 데이터
+        x_tenant_id: 요청 한도를 적용할 테넌트 ID (X-Tenant-ID 헤더)
+        x_priority: 스케줄러 우선순위 클래스 (X-Priority 헤더, 요청 본문의 priority보다 우선)
     
     Returns:
         ChatResponse: AI 응답 데이터
     """
-    logger.info(f"채팅 요청 받음: {request.user_prompt[:50]}...")
+    bind_request(request, x_tenant_id)
+    stage_timer = start_stage_timer()
+    # 프롬프트 내용은 LOG_PROMPT_CHARS(관리 API로 변경 가능)만큼만, 마스킹된 뒤 기록됨
+    if log_policy.prompt_chars:
+        logger.info("채팅 요청 받음: %.*s", log_policy.prompt_chars, request.user_prompt)
+    else:
+        logger.info("채팅 요청 받음 (%d자)", len(request.user_prompt or ""))
+    
+    # 업스트림 호출과 한도 대기는 블로킹이므로 이벤트 루프 대신 스레드풀에서 실행
+    if x_priority:
+        request.priority = x_priority
+    # MEMORY_REQUEST_SAMPLE_RATE 비율의 요청만 처리/직렬화 중 할당량을 요청 크기와 함께 기록
+    with allocation_sampler.measure(int(http_request.headers.get("content-length") or 0), len(request.conversation_history or [])):
+        response = await run_in_threadpool(chat_service.process_chat_request, request, tenant_id=x_tenant_id, stage_timer=stage_timer)
+        
+        logger.info("채팅 응답 완료: %.2fs", response.response_time)
+        with trace_span("chat.serialize"):
+            http_response = negotiate(http_request, response)
+    stage_timer.mark("serialize")
+    stage_timer.record("serialize")
+    return http_response
+
+
+@router.websocket("/chat/ws")
+async def chat_websocket(
+    websocket: WebSocket,
+    session_id: Optional[str] = None,
+    encoding: Optional[str] = None,
+    tenant_id: Optional[str] = None,
+    x_tenant_id: Optional[str] = Header(default=None)
+):
+    """
+    멀티턴 WebSocket 채팅 엔드포인트
+    
+    연결 하나로 여러 턴을 처리하며, 출력은 delta 프레임으로 스트리밍됨 (프레임 형식은 src/api/chat_socket.py 참고)
+    
+    Args:
+        session_id: 이어서 사용할 세션 ID (서버가 발급한 값만 허용, 없거나 만료되었으면 새 ID로 새 세션)
+        encoding: 서버 프레임 인코딩 (json, msgpack) - 없으면 서브프로토콜(json, msgpack), 그것도 없으면 json
+        tenant_id: 요청 한도를 적용할 테넌트 ID (X-Tenant-ID 헤더를 보낼 수 없는 브라우저용)
+    """
+    subprotocol = next((item for item in websocket.scope.get("subprotocols", []) if item in FRAME_ENCODINGS), None)
+    encoding = encoding or subprotocol or "json"
+    if encoding not in FRAME_ENCODINGS:
+        await websocket.close(code=1003, reason=f"지원하지 않는 인코딩입니다: {encoding}")
+        return
+    
+    tenant_id = x_tenant_id or tenant_id
+    try:
+        session = session_service.open(session_id, tenant_id)
+    except ValidationException as e:
+        await websocket.close(code=1008, reason=e.message)
+        return
     
-    response = chat_service.process_chat_request(request)
+    await websocket.accept(subprotocol=subprotocol)
+    logger.info("WebSocket 채팅 연결: %s (인코딩: %s)", session.session_id, encoding)
     
-    logger.info(f"채팅 응답 완료: {response.response_time:.2f}s")
-    return response
+    connection = ChatSocketConnection(
+        websocket,
+        chat_service=chat_service,
+        session_service=session_service,
+        session=session,
+        encoding=encoding,
+        tenant_id=tenant_id
+    )
+    await connection.run()
 
 
 
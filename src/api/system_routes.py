@@ -1,17 +1,141 @@
+import os
 from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse, Response
 from datetime import datetime
+from src.api.routes import chat_service
 from src.utils.logger import get_logger
+from src.utils.shared_metrics import metrics
+from src.utils.system_sampler import system_sampler
+from src.services.health_service import HealthService
+from src.utils import prometheus
+from src.config.config import settings
 
 logger = get_logger(__name__)
 
 system_router = APIRouter(prefix="/api/v1", tags=["system"])
 
+health_service = HealthService(chat_service)
+
+# Prometheus 스크레이프 경로는 관례상 /metrics (API 버전 접두사 없음)
+metrics_router = APIRouter(tags=["system"])
+
 @system_router.get("/health")
 async def health_check():
-    """간단한 헬스체크 엔드포인트"""
-    logger.info("헬스체크 요청 받음")
+    """간단한 헬스체크 엔드포인트 (liveness와 같음, 의존성은 /health/ready)"""
     return {
         "status": "healthy",
         "service": "LLM Server",
         "timestamp": datetime.now().isoformat()
-    } 
\ No newline at end of file
+    }
+
+
+@system_router.get("/health/live")
+async def liveness():
+    """liveness - 프로세스와 이벤트 루프가 응답하면 200 (의존성은 확인하지 않음)"""
+    return health_service.liveness()
+
+
+@system_router.get("/health/ready")
+async def readiness():
+    """readiness - API Key/키 회로/이벤트 루프 지연/대기열/업스트림 확인 결과, 준비되지 않았으면 503"""
+    status_code, body = health_service.readiness()
+    return Response(body, status_code=status_code, media_type="application/json")
+
+
+@system_router.get("/system/info")
+async def system_info():
+    """CPU/메모리/디스크/프로세스/컨테이너 지표 (백그라운드 샘플러의 최신 스냅샷, 이 워커 기준)"""
+    # 스냅샷을 만들 때 인코딩해 둔 본문을 그대로 반환 (수집/직렬화 없음)
+    return Response(system_sampler.snapshot().info_body, media_type="application/json")
+
+
+@system_router.get("/system/status")
+async def system_status():
+    """CPU/메모리 사용률 요약 (최신 스냅샷)"""
+    return Response(system_sampler.snapshot().status_body, media_type="application/json")
+
+
+@system_router.get("/system/history")
+async def system_history():
+    """최근 샘플의 CPU/메모리/프로세스 지표 추이 (오래된 순)"""
+    return {
+        "served_by": os.getpid(),
+        "interval": system_sampler.interval,
+        "points": system_sampler.history_points()
+    }
+
+
+@system_router.get("/upstream/capacity")
+async def upstream_capacity():
+    """API Key·모델별로 관측된 업스트림 레이트 리밋 잔여 용량 (x-ratelimit-* 헤더 기반)"""
+    return {
+        "pacing_threshold": chat_service.openai_client.pacer.threshold,
+        "capacities": chat_service.openai_client.pacer.snapshot(),
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+@system_router.get("/upstream/latency")
+async def upstream_latency():
+    """모델별 TTFT / 출력 토큰 생성 속도 / 전체 지연의 p50/p90/p99 (최근 창별, 이 워커 기준)"""
+    return {
+        "served_by": os.getpid(),
+        "models": chat_service.openai_client.latency.snapshot(),
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+@system_router.get("/upstream/keys")
+async def upstream_keys():
+    """서버 API Key 풀의 키별 헬스 상태와 사용량/비용 (원본 키는 노출하지 않음)"""
+    return {
+        "keys": chat_service.key_pool.stats(),
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+@system_router.get("/scheduler")
+async def scheduler_stats():
+    """요청 스케줄러 상태 - 우선순위 클래스별 대기열 대기 시간과 업스트림 처리 시간을 분리해서 제공"""
+    return {
+        "scheduler": chat_service.scheduler.stats(),
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+@system_router.get("/concurrency")
+async def concurrency_stats():
+    """모델별 적응형 동시 실행 한도, 진행 중 요청 수, 차단 수 (오토스케일링 지표)"""
+    return {
+        "concurrency": chat_service.concurrency_limiter.stats(),
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+@system_router.get("/tenants/{tenant_id}/spend")
+async def tenant_spend(tenant_id: str):
+    """테넌트의 오늘(UTC) 사용액과 일일 예산 (밀리센트, 레플리카 합계)"""
+    return {
+        **chat_service.spend_tracker.stats(tenant_id),
+        "backend": settings.COORDINATION_BACKEND,
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+@system_router.get("/stats")
+async def aggregate_stats():
+    """모든 워커 프로세스의 합산 메트릭 (공유 메모리) 및 워커 정보"""
+    return {
+        "served_by": os.getpid(),
+        "workers": metrics.workers(),
+        "metrics": metrics.snapshot(),
+        "dropped_series": metrics.dropped,
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+@metrics_router.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    """모든 워커 프로세스의 합산 메트릭 (Prometheus 텍스트 형식)"""
+    # media_type으로 넘기면 charset이 한 번 더 붙으므로 헤더로 지정
+    return PlainTextResponse(prometheus.render(metrics), headers={"Content-Type": prometheus.CONTENT_TYPE})
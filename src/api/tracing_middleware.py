@@ -0,0 +1,59 @@
+from src.utils.request_context import get_request_context
+from src.utils.tracing import SPAN_KIND_SERVER, trace_span
+
+
+class TracingMiddleware:
+    """
+    요청마다 서버 스팬을 여는 ASGI 미들웨어 (HTTP)
+
+    - traceparent 헤더가 있으면 호출자(백엔드)의 트레이스를 이어받고 그 샘플링 결정을 따름
+    - 응답 시작 시 traceresponse 헤더로 이 서버 스팬의 trace_id/span_id를 돌려줌
+    - 스팬 이름은 라우트 템플릿("POST /api/v1/chat")을 사용하여 이름 수를 제한함
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        traceparent = None
+        for key, value in scope["headers"]:
+            if key == b"traceparent":
+                traceparent = value.decode("latin-1")
+                break
+
+        with trace_span(f"{scope['method']} unmatched", kind=SPAN_KIND_SERVER, traceparent=traceparent) as span:
+            status_code = 500
+
+            async def send_with_trace(message):
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    if span.sampled:
+                        message["headers"] = [*message.get("headers", []), (b"traceresponse", span.traceparent.encode("latin-1"))]
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_trace)
+            finally:
+                if span.sampled:
+                    self._annotate(span, scope, status_code)
+
+    @staticmethod
+    def _annotate(span, scope, status_code: int) -> None:
+        """라우팅/응답이 끝난 뒤 알 수 있는 속성 기록"""
+        route = scope.get("route")
+        if route is not None:
+            span.name = f"{scope['method']} {route.path}"
+            span.set_attribute("http.route", route.path)
+        span.set_attribute("http.method", scope["method"])
+        span.set_attribute("http.status_code", status_code)
+        context = get_request_context()
+        if context is not None:
+            span.set_attribute("request_id", context.request_id or None)
+            span.set_attribute("tenant_id", context.tenant_id or None)
+        if status_code >= 500:
+            span.status = "error"
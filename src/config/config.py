@@ -16,6 +16,13 @@ class Settings(BaseSettings):
     SERVER_HOST: str = Field(default="0.0.0.0", env="SERVER_HOST")
     SERVER_PORT: int = Field(default=8080, env="SERVER_PORT")
     DEBUG: bool = Field(default=True, env="DEBUG")
+    SERVER_WORKERS: int = Field(default=1, env="SERVER_WORKERS")
+    WORKER_RESTART_MAX_BACKOFF: float = Field(default=30.0, env="WORKER_RESTART_MAX_BACKOFF")
+    WORKER_SHUTDOWN_TIMEOUT: float = Field(default=30.0, env="WORKER_SHUTDOWN_TIMEOUT")
+    METRICS_SLOTS_PER_WORKER: int = Field(default=4096, env="METRICS_SLOTS_PER_WORKER")
+    SERVER_HTTP2: bool = Field(default=False, env="SERVER_HTTP2")
+    SERVER_HTTP2_MAX_STREAMS: int = Field(default=100, env="SERVER_HTTP2_MAX_STREAMS")
+    SERVER_UDS: str = Field(default="", env="SERVER_UDS")
 
     # OpenAI API Settings
     OPENAI_API_KEY: str = Field(default="", env="OPENAI_API_KEY")
@@ -26,6 +33,145 @@ class Settings(BaseSettings):
     # Logging Settings
     LOG_LEVEL: str = Field(default="INFO", env="LOG_LEVEL")
     LOG_FILE: str = Field(default="logs/app.log", env="LOG_FILE")
+    LOG_FORMAT: str = Field(default="text", env="LOG_FORMAT")  # text | json
+    LOG_QUEUE_SIZE: int = Field(default=10000, env="LOG_QUEUE_SIZE")  # 가득 차면 로그를 버림 (요청 스레드를 막지 않음)
+    LOG_ROTATE_MAX_BYTES: int = Field(default=52428800, env="LOG_ROTATE_MAX_BYTES")  # 0이면 크기 기준 교체 안 함
+    LOG_ROTATE_INTERVAL: int = Field(default=86400, env="LOG_ROTATE_INTERVAL")  # 초 (UTC 경계 기준), 0이면 시간 기준 교체 안 함
+    LOG_BACKUP_COUNT: int = Field(default=7, env="LOG_BACKUP_COUNT")
+    LOG_COMPRESS: bool = Field(default=True, env="LOG_COMPRESS")
+    LOG_SAMPLE_RATE: float = Field(default=1.0, env="LOG_SAMPLE_RATE")  # INFO 이하 로그를 남길 요청 비율
+    LOG_RATE_PER_LOGGER: float = Field(default=50.0, env="LOG_RATE_PER_LOGGER")  # 로거별 초당 INFO 이하 줄 수, 0이면 제한 없음
+    LOG_BURST: float = Field(default=200.0, env="LOG_BURST")
+    LOG_PROMPT_CHARS: int = Field(default=0, env="LOG_PROMPT_CHARS")  # 0이면 프롬프트 내용 대신 길이만 기록
+    LOG_REDACT: bool = Field(default=True, env="LOG_REDACT")
+    LOG_REDACT_PATTERNS: list = Field(default=[], env="LOG_REDACT_PATTERNS")  # 기본 패턴(이메일/전화/카드/주민번호/API Key/IP)에 추가할 정규식
+    LOG_SUPPRESSION_SUMMARY_INTERVAL: float = Field(default=60.0, env="LOG_SUPPRESSION_SUMMARY_INTERVAL")
+
+    # Batch Job Settings
+    BATCH_UPSTREAM: str = Field(default="openai", env="BATCH_UPSTREAM")
+    BATCH_CACHE_DIR: str = Field(default="cache/batch", env="BATCH_CACHE_DIR")
+    BATCH_POLL_INTERVAL: float = Field(default=30.0, env="BATCH_POLL_INTERVAL")
+    BATCH_MAX_REQUESTS: int = Field(default=50000, env="BATCH_MAX_REQUESTS")
+
+    # Async Job Settings
+    JOB_WORKERS: int = Field(default=4, env="JOB_WORKERS")
+    JOB_MAX_PENDING: int = Field(default=100, env="JOB_MAX_PENDING")
+    JOB_MAX_ENTRIES: int = Field(default=10000, env="JOB_MAX_ENTRIES")
+    JOB_TTL: float = Field(default=3600.0, env="JOB_TTL")
+    # 멀티 프로세스 모드(SERVER_WORKERS > 1)에서 워커 간에 공유하는 작업 상태 저장 경로
+    JOB_STORE_DIR: str = Field(default="cache/jobs", env="JOB_STORE_DIR")
+    JOB_BACKGROUND_MODELS: list = Field(default=["o1", "o1-pro", "o3", "o3-pro"], env="JOB_BACKGROUND_MODELS")
+    JOB_POLL_INTERVAL: float = Field(default=2.0, env="JOB_POLL_INTERVAL")
+    JOB_TIMEOUT: float = Field(default=1800.0, env="JOB_TIMEOUT")
+    JOB_WEBHOOK_SECRET: str = Field(default="", env="JOB_WEBHOOK_SECRET")
+    JOB_WEBHOOK_TIMEOUT: float = Field(default=10.0, env="JOB_WEBHOOK_TIMEOUT")
+    JOB_WEBHOOK_MAX_RETRIES: int = Field(default=3, env="JOB_WEBHOOK_MAX_RETRIES")
+    # 웹훅을 보낼 수 있는 호스트 목록 (비어 있으면 공인 주소로 해석되는 모든 호스트)
+    JOB_WEBHOOK_ALLOWED_HOSTS: list = Field(default=[], env="JOB_WEBHOOK_ALLOWED_HOSTS")
+
+    # Rate Limit Settings (분당 한도, 0은 무제한 / 모델명 키로 기본값 덮어쓰기)
+    RATE_LIMITS: dict = Field(
+        default={"default": {"key_rpm": 0, "key_tpm": 0, "tenant_rpm": 0, "tenant_tpm": 0}},
+        env="RATE_LIMITS"
+    )
+    RATE_LIMIT_MAX_WAIT: float = Field(default=5.0, env="RATE_LIMIT_MAX_WAIT")
+    RATE_LIMIT_MAX_QUEUE: int = Field(default=100, env="RATE_LIMIT_MAX_QUEUE")
+    DEFAULT_TENANT: str = Field(default="default", env="DEFAULT_TENANT")
+
+    # Upstream Pacing Settings (x-ratelimit-* 헤더 기반)
+    UPSTREAM_PACING_THRESHOLD: float = Field(default=0.2, env="UPSTREAM_PACING_THRESHOLD")
+    UPSTREAM_PACING_MAX_DELAY: float = Field(default=10.0, env="UPSTREAM_PACING_MAX_DELAY")
+
+    # Upstream Key Pool Settings (문자열 또는 {api_key, organization, project, base_url, weight}, 비어 있으면 OPENAI_API_KEY 사용)
+    OPENAI_API_KEYS: list = Field(default=[], env="OPENAI_API_KEYS")
+    KEY_POOL_EJECT_FAILURES: int = Field(default=3, env="KEY_POOL_EJECT_FAILURES")
+    KEY_POOL_EJECT_BASE_SECONDS: float = Field(default=30.0, env="KEY_POOL_EJECT_BASE_SECONDS")
+    KEY_POOL_EJECT_MAX_SECONDS: float = Field(default=300.0, env="KEY_POOL_EJECT_MAX_SECONDS")
+
+    # Request Scheduler Settings (업스트림 동시 실행 수, 0은 스케줄링 비활성화)
+    SCHEDULER_MAX_CONCURRENCY: int = Field(default=32, env="SCHEDULER_MAX_CONCURRENCY")
+    SCHEDULER_MAX_QUEUE: int = Field(default=1000, env="SCHEDULER_MAX_QUEUE")
+    SCHEDULER_TENANT_WEIGHTS: dict = Field(default={}, env="SCHEDULER_TENANT_WEIGHTS")
+    SCHEDULER_DEADLINES: dict = Field(default={"interactive": 30.0, "background": 600.0}, env="SCHEDULER_DEADLINES")
+
+    # Adaptive Concurrency Settings (모델별 AIMD 동시 실행 한도 + 부하 차단)
+    CONCURRENCY_ADAPTIVE: bool = Field(default=True, env="CONCURRENCY_ADAPTIVE")
+    CONCURRENCY_INITIAL_LIMIT: int = Field(default=20, env="CONCURRENCY_INITIAL_LIMIT")
+    CONCURRENCY_MIN_LIMIT: int = Field(default=2, env="CONCURRENCY_MIN_LIMIT")
+    CONCURRENCY_MAX_LIMIT: int = Field(default=200, env="CONCURRENCY_MAX_LIMIT")
+    CONCURRENCY_LATENCY_TOLERANCE: float = Field(default=2.0, env="CONCURRENCY_LATENCY_TOLERANCE")
+    CONCURRENCY_BACKOFF_RATIO: float = Field(default=0.9, env="CONCURRENCY_BACKOFF_RATIO")
+    CONCURRENCY_QUEUE_TARGET: float = Field(default=1.0, env="CONCURRENCY_QUEUE_TARGET")
+
+    # Cluster Coordination Settings (none | local | memory | redis)
+    COORDINATION_BACKEND: str = Field(default="none", env="COORDINATION_BACKEND")
+    COORDINATION_URL: str = Field(default="", env="COORDINATION_URL")
+    COORDINATION_FILE: str = Field(default="cache/coordination.json", env="COORDINATION_FILE")
+    COORDINATION_KEY_PREFIX: str = Field(default="llm-server:", env="COORDINATION_KEY_PREFIX")
+    COORDINATION_LEASE_FRACTION: float = Field(default=0.05, env="COORDINATION_LEASE_FRACTION")
+    COORDINATION_FLUSH_INTERVAL: float = Field(default=1.0, env="COORDINATION_FLUSH_INTERVAL")
+    TENANT_DAILY_BUDGETS: dict = Field(default={}, env="TENANT_DAILY_BUDGETS")
+
+    # WebSocket Chat Settings (세션 기록은 워커 메모리에 보관)
+    WS_MAX_SESSIONS: int = Field(default=10000, env="WS_MAX_SESSIONS")
+    WS_SESSION_TTL: float = Field(default=1800.0, env="WS_SESSION_TTL")
+    WS_MAX_HISTORY: int = Field(default=40, env="WS_MAX_HISTORY")
+    WS_PING_INTERVAL: float = Field(default=20.0, env="WS_PING_INTERVAL")
+    WS_IDLE_TIMEOUT: float = Field(default=60.0, env="WS_IDLE_TIMEOUT")
+
+    # Stage Timing Settings (Server-Timing 응답 헤더 / ChatResponse.timings)
+    SERVER_TIMING_ENABLED: bool = Field(default=True, env="SERVER_TIMING_ENABLED")
+    STAGE_TIMINGS_IN_RESPONSE: bool = Field(default=False, env="STAGE_TIMINGS_IN_RESPONSE")
+
+    # Tracing Settings (W3C traceparent, 헤드 샘플링, OTLP/HTTP 수집기가 없으면 JSONL 파일로 배치 내보내기)
+    TRACING_ENABLED: bool = Field(default=True, env="TRACING_ENABLED")
+    TRACE_SAMPLE_RATIO: float = Field(default=0.1, env="TRACE_SAMPLE_RATIO")
+    TRACE_OTLP_ENDPOINT: str = Field(default="", env="TRACE_OTLP_ENDPOINT")
+    TRACE_FILE: str = Field(default="logs/traces.jsonl", env="TRACE_FILE")
+    TRACE_SERVICE_NAME: str = Field(default="llm-server", env="TRACE_SERVICE_NAME")
+    TRACE_BATCH_SIZE: int = Field(default=256, env="TRACE_BATCH_SIZE")
+    TRACE_EXPORT_INTERVAL: float = Field(default=5.0, env="TRACE_EXPORT_INTERVAL")
+    TRACE_MAX_QUEUE: int = Field(default=8192, env="TRACE_MAX_QUEUE")
+
+    # Upstream Latency Percentile Settings (모델·지표별 링 버퍼 크기, 백분위수 창(초))
+    LATENCY_SAMPLE_SIZE: int = Field(default=2048, env="LATENCY_SAMPLE_SIZE")
+    LATENCY_WINDOWS: list = Field(default=[60, 300, 900], env="LATENCY_WINDOWS")
+
+    # System Metrics Sampler Settings (수집 주기(초) / 추이 보관 개수 / 소켓 연결 수 집계 여부)
+    SYSTEM_SAMPLE_INTERVAL: float = Field(default=5.0, env="SYSTEM_SAMPLE_INTERVAL")
+    SYSTEM_HISTORY_SIZE: int = Field(default=120, env="SYSTEM_HISTORY_SIZE")
+    SYSTEM_SAMPLE_CONNECTIONS: bool = Field(default=False, env="SYSTEM_SAMPLE_CONNECTIONS")
+
+    # Health Check Settings (readiness 캐시(초) / 준비 상태 기준 / 업스트림 확인 주기·타임아웃(초))
+    HEALTH_CACHE_TTL: float = Field(default=1.0, env="HEALTH_CACHE_TTL")
+    HEALTH_REQUIRE_SERVER_KEY: bool = Field(default=True, env="HEALTH_REQUIRE_SERVER_KEY")
+    HEALTH_MAX_LOOP_LAG: float = Field(default=0.5, env="HEALTH_MAX_LOOP_LAG")
+    HEALTH_MAX_QUEUE_RATIO: float = Field(default=0.9, env="HEALTH_MAX_QUEUE_RATIO")
+    HEALTH_PROBE_ENABLED: bool = Field(default=True, env="HEALTH_PROBE_ENABLED")
+    HEALTH_PROBE_INTERVAL: float = Field(default=30.0, env="HEALTH_PROBE_INTERVAL")
+    HEALTH_PROBE_TIMEOUT: float = Field(default=3.0, env="HEALTH_PROBE_TIMEOUT")
+    EVENT_LOOP_MONITOR_INTERVAL: float = Field(default=0.25, env="EVENT_LOOP_MONITOR_INTERVAL")
+
+    # Event Loop Stall Detector Settings (이 시간(초) 넘게 루프가 멈추면 스택 기록, 0이면 끄기 / 집계할 최대 호출 위치 수)
+    STALL_THRESHOLD: float = Field(default=0.2, env="STALL_THRESHOLD")
+    STALL_MAX_SITES: int = Field(default=200, env="STALL_MAX_SITES")
+
+    # CPU Profiler Settings (관리 API로 요청 시에만 실행 / 동시 세션 수 / 기본·최대 시간(초)과 샘플링 빈도(Hz))
+    PROFILER_MAX_SESSIONS: int = Field(default=1, env="PROFILER_MAX_SESSIONS")
+    PROFILER_DEFAULT_SECONDS: float = Field(default=10.0, env="PROFILER_DEFAULT_SECONDS")
+    PROFILER_MAX_SECONDS: float = Field(default=60.0, env="PROFILER_MAX_SECONDS")
+    PROFILER_DEFAULT_RATE: float = Field(default=100.0, env="PROFILER_DEFAULT_RATE")
+    PROFILER_MAX_RATE: float = Field(default=1000.0, env="PROFILER_MAX_RATE")
+
+    # Memory Profiler Settings (tracemalloc traceback 프레임 수 / 상위 할당 위치 수 / 요청별 할당 표본 비율(0이면 끄기)과 보관 개수)
+    MEMORY_TRACE_FRAMES: int = Field(default=1, env="MEMORY_TRACE_FRAMES")
+    MEMORY_TRACE_MAX_SECONDS: float = Field(default=600.0, env="MEMORY_TRACE_MAX_SECONDS")  # 관리 API로 켠 추적의 자동 중지 시간
+    MEMORY_TOP_LIMIT: int = Field(default=20, env="MEMORY_TOP_LIMIT")
+    MEMORY_REQUEST_SAMPLE_RATE: float = Field(default=0.0, env="MEMORY_REQUEST_SAMPLE_RATE")
+    MEMORY_REQUEST_HISTORY: int = Field(default=500, env="MEMORY_REQUEST_HISTORY")
+
+    # Admin API Settings (비어 있으면 /api/v1/admin/* 사용 불가)
+    ADMIN_TOKEN: str = Field(default="", env="ADMIN_TOKEN")
 
     # CORS Settings
     CORS_ORIGINS: list = Field(default=["*"], env="CORS_ORIGINS")
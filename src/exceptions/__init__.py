@@ -3,12 +3,20 @@ from .chat_exceptions import (
     ChatServiceException,
     OpenAIClientException,
     ValidationException,
-    ConfigurationException
+    ConfigurationException,
+    JobNotFoundException,
+    RateLimitException,
+    OverloadedException,
+    AuthorizationException
 )
 
 __all__ = [
     "ChatServiceException",
     "OpenAIClientException", 
     "ValidationException",
-    "ConfigurationException"
+    "ConfigurationException",
+    "JobNotFoundException",
+    "RateLimitException",
+    "OverloadedException",
+    "AuthorizationException"
 ] 
\ No newline at end of file
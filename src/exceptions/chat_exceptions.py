@@ -34,4 +34,40 @@ class ConfigurationException(Exception):
     def __init__(self, message: str, config_key: str = None):
         super().__init__(message)
         self.message = message
-        self.config_key = config_key 
\ No newline at end of file
+        self.config_key = config_key 
+
+class JobNotFoundException(Exception):
+    """작업 조회 실패 예외"""
+    
+    def __init__(self, message: str, job_id: str = None):
+        super().__init__(message)
+        self.message = message
+        self.job_id = job_id
+
+
+class RateLimitException(Exception):
+    """요청 한도 초과 예외"""
+    
+    def __init__(self, message: str, retry_after: float = 1.0, scope: str = None):
+        super().__init__(message)
+        self.message = message
+        self.retry_after = retry_after
+        self.scope = scope
+
+
+class OverloadedException(Exception):
+    """서버 과부하 예외 (동시 실행 한도 초과로 요청을 조기 거부)"""
+    
+    def __init__(self, message: str, retry_after: float = 1.0, model: str = None):
+        super().__init__(message)
+        self.message = message
+        self.retry_after = retry_after
+        self.model = model
+
+
+class AuthorizationException(Exception):
+    """관리 API 인증 실패 예외"""
+    
+    def __init__(self, message: str):
+        super().__init__(message)
+        self.message = message
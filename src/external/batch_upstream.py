@@ -0,0 +1,215 @@
+import json
+import time
+import uuid
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Optional
+from openai import OpenAI
+from src.models.batch_dto import UpstreamBatch
+from src.utils.logger import get_logger
+from src.exceptions.chat_exceptions import OpenAIClientException, ConfigurationException
+
+logger = get_logger(__name__)
+
+
+class BatchUpstream(ABC):
+    """Batch API 업스트림 인터페이스 (OpenAI 또는 로컬 대체 구현)"""
+
+    ENDPOINT = "/v1/responses"
+
+    @abstractmethod
+    def submit(self, input_jsonl: bytes, metadata: Dict[str, str] = None) -> UpstreamBatch:
+        """입력 JSONL 파일을 업로드하고 배치를 생성"""
+
+    @abstractmethod
+    def retrieve(self, batch_id: str) -> UpstreamBatch:
+        """배치 상태 조회"""
+
+    @abstractmethod
+    def download(self, file_id: str) -> bytes:
+        """결과/에러 파일 내용 다운로드"""
+
+    @abstractmethod
+    def cancel(self, batch_id: str) -> UpstreamBatch:
+        """배치 취소"""
+
+
+class OpenAIBatchUpstream(BatchUpstream):
+    """OpenAI Batch API 업스트림"""
+
+    COMPLETION_WINDOW = "24h"
+
+    def __init__(self, api_key: str):
+        if not api_key:
+            raise ConfigurationException("배치 작업에 사용할 API Key가 없습니다.", config_key="OPENAI_API_KEY")
+        self.client = OpenAI(api_key=api_key)
+
+    @staticmethod
+    def _to_upstream_batch(batch) -> UpstreamBatch:
+        return UpstreamBatch(
+            batch_id=batch.id,
+            status=batch.status,
+            input_file_id=batch.input_file_id,
+            output_file_id=batch.output_file_id,
+            error_file_id=batch.error_file_id
+        )
+
+    def submit(self, input_jsonl: bytes, metadata: Dict[str, str] = None) -> UpstreamBatch:
+        try:
+            input_file = self.client.files.create(
+                file=("batch_input.jsonl", input_jsonl),
+                purpose="batch"
+            )
+            batch = self.client.batches.create(
+                input_file_id=input_file.id,
+                endpoint=self.ENDPOINT,
+                completion_window=self.COMPLETION_WINDOW,
+                metadata=metadata or {}
+            )
+            logger.debug(f"Batch API 배치 생성 완료 (ID: {batch.id}, 입력 파일: {input_file.id})")
+            return self._to_upstream_batch(batch)
+        except Exception as e:
+            error_msg = f"Batch API 배치 생성 중 오류 발생: {str(e)}"
+            logger.error(error_msg)
+            raise OpenAIClientException(message=error_msg, error_code="BATCH_SUBMIT_ERROR")
+
+    def retrieve(self, batch_id: str) -> UpstreamBatch:
+        try:
+            return self._to_upstream_batch(self.client.batches.retrieve(batch_id))
+        except Exception as e:
+            error_msg = f"Batch API 배치 조회 중 오류 발생: {str(e)}"
+            logger.error(error_msg)
+            raise OpenAIClientException(message=error_msg, error_code="BATCH_RETRIEVE_ERROR", details={"batch_id": batch_id})
+
+    def download(self, file_id: str) -> bytes:
+        try:
+            return self.client.files.content(file_id).content
+        except Exception as e:
+            error_msg = f"Batch API 결과 파일 다운로드 중 오류 발생: {str(e)}"
+            logger.error(error_msg)
+            raise OpenAIClientException(message=error_msg, error_code="BATCH_DOWNLOAD_ERROR", details={"file_id": file_id})
+
+    def cancel(self, batch_id: str) -> UpstreamBatch:
+        try:
+            return self._to_upstream_batch(self.client.batches.cancel(batch_id))
+        except Exception as e:
+            error_msg = f"Batch API 배치 취소 중 오류 발생: {str(e)}"
+            logger.error(error_msg)
+            raise OpenAIClientException(message=error_msg, error_code="BATCH_CANCEL_ERROR", details={"batch_id": batch_id})
+
+
+def _echo_responder(body: dict) -> dict:
+    """로컬 업스트림 기본 응답기 - 마지막 입력 메시지를 그대로 돌려줌"""
+    messages = body.get("input") or []
+    last_content = messages[-1].get("content", "") if messages else ""
+    input_tokens = sum(len(str(message.get("content", ""))) // 4 + 1 for message in messages)
+    output_tokens = len(last_content) // 4 + 1
+
+    return {
+        "id": f"resp_local_{uuid.uuid4().hex[:16]}",
+        "object": "response",
+        "created_at": int(time.time()),
+        "status": "completed",
+        "model": body.get("model", ""),
+        "output": [{
+            "type": "message",
+            "role": "assistant",
+            "content": [{"type": "output_text", "text": last_content}]
+        }],
+        "text": {"format": {"type": "text"}},
+        "usage": {
+            "input_tokens": input_tokens,
+            "input_tokens_details": {"cached_tokens": 0},
+            "output_tokens": output_tokens,
+            "output_tokens_details": {"reasoning_tokens": 0},
+            "total_tokens": input_tokens + output_tokens
+        }
+    }
+
+
+class LocalBatchUpstream(BatchUpstream):
+    """
+    로컬 Batch API 대체 구현 (테스트/개발용)
+
+    제출된 배치는 첫 조회 시점에 responder로 동기 처리되며,
+    결과 파일은 OpenAI Batch API 결과 형식과 동일한 JSONL로 생성됨
+    """
+
+    def __init__(self, responder: Optional[Callable[[dict], dict]] = None):
+        self.responder = responder or _echo_responder
+        self._batches: Dict[str, UpstreamBatch] = {}
+        self._files: Dict[str, bytes] = {}
+
+    def submit(self, input_jsonl: bytes, metadata: Dict[str, str] = None) -> UpstreamBatch:
+        input_file_id = f"file-local-{uuid.uuid4().hex[:16]}"
+        self._files[input_file_id] = input_jsonl
+
+        batch = UpstreamBatch(
+            batch_id=f"batch_local_{uuid.uuid4().hex[:16]}",
+            status="validating",
+            input_file_id=input_file_id
+        )
+        self._batches[batch.batch_id] = batch
+        return batch
+
+    def retrieve(self, batch_id: str) -> UpstreamBatch:
+        batch = self._batches.get(batch_id)
+        if batch is None:
+            raise OpenAIClientException(message=f"존재하지 않는 배치입니다: {batch_id}", error_code="BATCH_RETRIEVE_ERROR")
+
+        if batch.status == "validating":
+            self._run(batch)
+        return batch
+
+    def download(self, file_id: str) -> bytes:
+        if file_id not in self._files:
+            raise OpenAIClientException(message=f"존재하지 않는 파일입니다: {file_id}", error_code="BATCH_DOWNLOAD_ERROR")
+        return self._files[file_id]
+
+    def cancel(self, batch_id: str) -> UpstreamBatch:
+        batch = self.retrieve(batch_id)
+        if batch.status not in ("completed", "failed", "expired"):
+            batch.status = "cancelled"
+        return batch
+
+    def _run(self, batch: UpstreamBatch) -> None:
+        """배치 입력 파일을 responder로 처리하여 결과/에러 파일 생성"""
+        output_lines = []
+        error_lines = []
+
+        for line in self._files[batch.input_file_id].decode("utf-8").splitlines():
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            try:
+                response_body = self.responder(item["body"])
+                output_lines.append(json.dumps({
+                    "id": f"batch_req_{uuid.uuid4().hex[:16]}",
+                    "custom_id": item["custom_id"],
+                    "response": {"status_code": 200, "request_id": uuid.uuid4().hex, "body": response_body},
+                    "error": None
+                }, ensure_ascii=False))
+            except Exception as e:
+                error_lines.append(json.dumps({
+                    "id": f"batch_req_{uuid.uuid4().hex[:16]}",
+                    "custom_id": item["custom_id"],
+                    "response": None,
+                    "error": {"code": "local_responder_error", "message": str(e)}
+                }, ensure_ascii=False))
+
+        if output_lines:
+            batch.output_file_id = f"file-local-{uuid.uuid4().hex[:16]}"
+            self._files[batch.output_file_id] = "\n".join(output_lines).encode("utf-8")
+        if error_lines:
+            batch.error_file_id = f"file-local-{uuid.uuid4().hex[:16]}"
+            self._files[batch.error_file_id] = "\n".join(error_lines).encode("utf-8")
+
+        batch.status = "completed"
+
+
+def create_batch_upstream(upstream_type: str, api_key: str = None) -> BatchUpstream:
+    """설정값에 따라 Batch API 업스트림 생성 (openai | local)"""
+    if upstream_type == "openai":
+        return OpenAIBatchUpstream(api_key)
+    if upstream_type == "local":
+        return LocalBatchUpstream()
+    raise ConfigurationException(f"지원하지 않는 배치 업스트림입니다: {upstream_type}", config_key="BATCH_UPSTREAM")
@@ -0,0 +1,207 @@
+"""
+레플리카 간 한도/사용량 공유를 위한 조정(coordination) 저장소
+
+- RedisCoordinationStore: 운영 환경용 (Redis 프로토콜, Lua 스크립트로 원자적 처리)
+- LocalCoordinationStore: 단일 호스트/테스트용 (파일 + fcntl 잠금, 경로가 없으면 프로세스 메모리)
+"""
+
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Dict, Optional, Tuple
+from src.utils.logger import get_logger
+from src.exceptions.chat_exceptions import ConfigurationException
+
+logger = get_logger(__name__)
+
+
+class CoordinationStore(ABC):
+    """분산 토큰 버킷 / 카운터 저장소 인터페이스"""
+
+    @abstractmethod
+    def reserve(self, key: str, amount: float, capacity: float, refill_rate: float, max_wait: float) -> Tuple[bool, float]:
+        """
+        공유 토큰 버킷에서 amount를 예약
+
+        잔량이 부족해도 대기 시간이 max_wait 이하이면 차감(음수 허용)하고 필요한 대기 시간을 반환.
+        max_wait를 넘으면 차감하지 않음
+
+        Returns:
+            (예약 성공 여부, 필요한 대기 시간(초))
+        """
+
+    @abstractmethod
+    def refund(self, key: str, amount: float, capacity: float) -> None:
+        """사용하지 않은 토큰 반환"""
+
+    @abstractmethod
+    def incr(self, key: str, amount: int, ttl: float) -> int:
+        """카운터 증가 후 합계 반환 (ttl 초 후 만료)"""
+
+    @abstractmethod
+    def get(self, key: str) -> int:
+        """카운터 조회 (없으면 0)"""
+
+
+def _reserve_bucket(state: Optional[list], amount: float, capacity: float, refill_rate: float, max_wait: float, now: float) -> Tuple[list, bool, float]:
+    """[tokens, updated_at] 상태에 대한 예약 계산 (로컬 저장소 공용)"""
+    tokens, updated_at = state if state else (capacity, now)
+    tokens = min(capacity, tokens + max(0.0, now - updated_at) * refill_rate)
+    deficit = amount - tokens
+    wait = deficit / refill_rate if deficit > 0 else 0.0
+    if wait > max_wait:
+        return [tokens, now], False, wait
+    return [tokens - amount, now], True, wait
+
+
+class LocalCoordinationStore(CoordinationStore):
+    """
+    단일 호스트용 저장소
+
+    path가 주어지면 JSON 파일을 fcntl 배타 잠금으로 읽고/쓰므로 같은 호스트의 여러 워커 프로세스가 공유 가능.
+    path가 없으면 프로세스 메모리만 사용 (테스트용)
+    """
+
+    def __init__(self, path: str = None):
+        self.path = path
+        self._memory: Dict[str, Dict[str, list]] = {"buckets": {}, "counters": {}}
+        self._lock = threading.Lock()
+        if path:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    @contextmanager
+    def _state(self):
+        """잠금 상태에서 전체 상태(dict)를 읽고, 블록 종료 시 저장"""
+        with self._lock:
+            if not self.path:
+                yield self._memory
+                return
+
+            import fcntl
+
+            with open(self.path, "a+", encoding="utf-8") as file:
+                fcntl.flock(file, fcntl.LOCK_EX)
+                try:
+                    file.seek(0)
+                    content = file.read()
+                    state = json.loads(content) if content else {"buckets": {}, "counters": {}}
+                    yield state
+                    file.seek(0)
+                    file.truncate()
+                    file.write(json.dumps(state))
+                    file.flush()
+                finally:
+                    fcntl.flock(file, fcntl.LOCK_UN)
+
+    def reserve(self, key: str, amount: float, capacity: float, refill_rate: float, max_wait: float) -> Tuple[bool, float]:
+        with self._state() as state:
+            bucket, reserved, wait = _reserve_bucket(state["buckets"].get(key), amount, capacity, refill_rate, max_wait, time.time())
+            state["buckets"][key] = bucket
+            return reserved, wait
+
+    def refund(self, key: str, amount: float, capacity: float) -> None:
+        with self._state() as state:
+            bucket = state["buckets"].get(key)
+            if bucket:
+                bucket[0] = min(capacity, bucket[0] + amount)
+
+    def incr(self, key: str, amount: int, ttl: float) -> int:
+        now = time.time()
+        with self._state() as state:
+            counters = state["counters"]
+            # 만료된 카운터 정리
+            for expired in [name for name, (_, expires_at) in counters.items() if expires_at <= now]:
+                del counters[expired]
+            value, expires_at = counters.get(key, (0, now + ttl))
+            counters[key] = [value + amount, expires_at]
+            return value + amount
+
+    def get(self, key: str) -> int:
+        with self._state() as state:
+            value, expires_at = state["counters"].get(key, (0, 0.0))
+            return value if expires_at > time.time() else 0
+
+
+class RedisCoordinationStore(CoordinationStore):
+    """Redis 프로토콜 저장소 (redis 패키지 필요, 서버 시간 기준으로 계산하여 레플리카 간 시계 차이 영향 없음)"""
+
+    RESERVE_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+local amount = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local rate = tonumber(ARGV[3])
+local max_wait = tonumber(ARGV[4])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local updated_at = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated_at) * rate)
+local wait = 0
+if amount > tokens then wait = (amount - tokens) / rate end
+local reserved = 0
+if wait <= max_wait then
+    tokens = tokens - amount
+    reserved = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 60)
+return {reserved, tostring(wait)}
+"""
+
+    REFUND_SCRIPT = """
+local tokens = tonumber(redis.call('HGET', KEYS[1], 'tokens'))
+if tokens then
+    redis.call('HSET', KEYS[1], 'tokens', tostring(math.min(tonumber(ARGV[2]), tokens + tonumber(ARGV[1]))))
+end
+return 1
+"""
+
+    def __init__(self, url: str, key_prefix: str = ""):
+        try:
+            import redis
+        except ImportError:
+            raise ConfigurationException(
+                "COORDINATION_BACKEND=redis를 사용하려면 redis 패키지가 필요합니다 (pip install redis).",
+                config_key="COORDINATION_BACKEND"
+            )
+        if not url:
+            raise ConfigurationException("Redis 조정 저장소 URL이 설정되지 않았습니다.", config_key="COORDINATION_URL")
+
+        self.client = redis.Redis.from_url(url, socket_timeout=1.0, socket_connect_timeout=1.0)
+        self.key_prefix = key_prefix
+        self._reserve = self.client.register_script(self.RESERVE_SCRIPT)
+        self._refund = self.client.register_script(self.REFUND_SCRIPT)
+
+    def reserve(self, key: str, amount: float, capacity: float, refill_rate: float, max_wait: float) -> Tuple[bool, float]:
+        reserved, wait = self._reserve(keys=[self.key_prefix + key], args=[amount, capacity, refill_rate, max_wait])
+        return bool(int(reserved)), float(wait)
+
+    def refund(self, key: str, amount: float, capacity: float) -> None:
+        self._refund(keys=[self.key_prefix + key], args=[amount, capacity])
+
+    def incr(self, key: str, amount: int, ttl: float) -> int:
+        value = int(self.client.incrby(self.key_prefix + key, amount))
+        if value == amount:
+            # 첫 증가 시에만 만료 시간 설정 (기간 단위 카운터)
+            self.client.expire(self.key_prefix + key, int(ttl))
+        return value
+
+    def get(self, key: str) -> int:
+        value = self.client.get(self.key_prefix + key)
+        return int(value) if value is not None else 0
+
+
+def create_coordination_store(backend: str, url: str = None, path: str = None, key_prefix: str = "") -> Optional[CoordinationStore]:
+    """설정값에 따라 조정 저장소 생성 (none | local | memory | redis)"""
+    if backend == "none":
+        return None
+    if backend == "local":
+        return LocalCoordinationStore(path)
+    if backend == "memory":
+        return LocalCoordinationStore()
+    if backend == "redis":
+        return RedisCoordinationStore(url, key_prefix)
+    raise ConfigurationException(f"지원하지 않는 조정 저장소입니다: {backend}", config_key="COORDINATION_BACKEND")
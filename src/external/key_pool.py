@@ -0,0 +1,211 @@
+"""
+서버 API Key 풀 - 잔여 용량·지연·에러율 기반 가중 부하 분산
+"""
+
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from src.utils.logger import get_logger
+from src.utils.rate_limiter import key_fingerprint
+from src.utils.upstream_pacer import UpstreamPacer
+from src.config.config import settings
+
+logger = get_logger(__name__)
+
+
+class UpstreamKey:
+    """풀에 속한 업스트림 API Key 하나와 그 상태(헬스/사용량)"""
+
+    __slots__ = (
+        "key_id", "api_key", "organization", "project", "base_url", "weight",
+        "latency_ewma", "error_ewma", "consecutive_failures", "ejected_until", "ejection_count", "in_flight",
+        "requests", "errors", "input_tokens", "output_tokens", "cost"
+    )
+
+    def __init__(
+        self,
+        api_key: str,
+        organization: Optional[str] = None,
+        project: Optional[str] = None,
+        base_url: Optional[str] = None,
+        weight: float = 1.0
+    ):
+        self.key_id = key_fingerprint(api_key)
+        self.api_key = api_key
+        self.organization = organization
+        self.project = project
+        self.base_url = base_url
+        self.weight = weight
+
+        # 헬스 상태
+        self.latency_ewma = 0.0
+        self.error_ewma = 0.0
+        self.consecutive_failures = 0
+        self.ejected_until = 0.0
+        self.ejection_count = 0
+        self.in_flight = 0
+
+        # 키별 사용량/비용 집계
+        self.requests = 0
+        self.errors = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.cost = 0
+
+    @classmethod
+    def from_config(cls, config) -> "UpstreamKey":
+        """설정 항목(문자열 또는 dict)에서 생성"""
+        if isinstance(config, str):
+            return cls(api_key=config)
+        return cls(
+            api_key=config["api_key"],
+            organization=config.get("organization"),
+            project=config.get("project"),
+            base_url=config.get("base_url"),
+            weight=float(config.get("weight", 1.0))
+        )
+
+    def is_ejected(self, now: float) -> bool:
+        return now < self.ejected_until
+
+    def to_dict(self, now: float) -> Dict[str, Any]:
+        """상태 정보 (원본 키는 포함하지 않음)"""
+        return {
+            "key_id": self.key_id,
+            "organization": self.organization,
+            "project": self.project,
+            "base_url": self.base_url,
+            "weight": self.weight,
+            "healthy": not self.is_ejected(now),
+            "ejected_for": round(max(0.0, self.ejected_until - now), 3),
+            "latency_ewma": round(self.latency_ewma, 4),
+            "error_rate": round(self.error_ewma, 4),
+            "in_flight": self.in_flight,
+            "requests": self.requests,
+            "errors": self.errors,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "cost": self.cost
+        }
+
+
+class KeyPool:
+    """
+    서버 API Key 풀
+
+    - 선택: weight × 잔여 용량(레이트 리밋 헤더) × (1 - 에러율) / (1 + 지연/기준 지연) / (1 + 진행 중 요청)
+      점수에 비례한 가중 랜덤 (동시 요청이 한 키로 몰리지 않도록)
+    - 연속 실패가 KEY_POOL_EJECT_FAILURES에 도달하면 지수 백오프로 일정 시간 제외, 시간이 지나면 자동 재투입
+    - 모든 키가 제외된 경우에는 가장 먼저 재투입될 키를 사용 (fail-open)
+    """
+
+    EWMA_ALPHA = 0.2
+    LATENCY_REFERENCE = 2.0
+
+    def __init__(
+        self,
+        keys: List[UpstreamKey],
+        pacer: UpstreamPacer = None,
+        eject_failures: int = None,
+        eject_base_seconds: float = None,
+        eject_max_seconds: float = None
+    ):
+        self.keys = keys
+        self.pacer = pacer
+        self.eject_failures = settings.KEY_POOL_EJECT_FAILURES if eject_failures is None else eject_failures
+        self.eject_base_seconds = settings.KEY_POOL_EJECT_BASE_SECONDS if eject_base_seconds is None else eject_base_seconds
+        self.eject_max_seconds = settings.KEY_POOL_EJECT_MAX_SECONDS if eject_max_seconds is None else eject_max_seconds
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, pacer: UpstreamPacer = None) -> "KeyPool":
+        """OPENAI_API_KEYS (없으면 OPENAI_API_KEY)로 풀 구성"""
+        configs = settings.OPENAI_API_KEYS or ([settings.OPENAI_API_KEY] if settings.OPENAI_API_KEY else [])
+        keys = [UpstreamKey.from_config(config) for config in configs]
+        if len(keys) > 1:
+            logger.info(f"API Key 풀 구성 완료: {len(keys)}개 키")
+        return cls(keys, pacer=pacer)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _score(self, key: UpstreamKey, model: str) -> float:
+        headroom = self.pacer.headroom(key.api_key, model) if self.pacer else 1.0
+        return (
+            key.weight
+            * max(headroom, 0.01)
+            * max(1.0 - key.error_ewma, 0.05)
+            / (1.0 + key.latency_ewma / self.LATENCY_REFERENCE)
+            / (1.0 + key.in_flight)
+        )
+
+    def acquire(self, model: str) -> Optional[UpstreamKey]:
+        """
+        요청에 사용할 키 선택 (진행 중 요청 수 증가)
+
+        Returns:
+            UpstreamKey | None: 풀이 비어 있으면 None
+        """
+        if not self.keys:
+            return None
+
+        now = time.monotonic()
+        with self._lock:
+            candidates = [key for key in self.keys if not key.is_ejected(now)]
+            if not candidates:
+                candidates = [min(self.keys, key=lambda key: key.ejected_until)]
+
+            if len(candidates) == 1:
+                selected = candidates[0]
+            else:
+                scores = [self._score(key, model) for key in candidates]
+                # 모듈 전역 난수 생성기는 fork 후 자식 프로세스에서 자동으로 재시드됨
+                selected = random.choices(candidates, weights=scores, k=1)[0]
+
+            selected.in_flight += 1
+            return selected
+
+    def release(
+        self,
+        key: UpstreamKey,
+        latency: float,
+        success: bool,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        cost: int = 0
+    ) -> None:
+        """요청 결과 반영 - 헬스 상태 갱신 및 키별 사용량/비용 집계"""
+        with self._lock:
+            key.in_flight -= 1
+            key.requests += 1
+            key.input_tokens += input_tokens
+            key.output_tokens += output_tokens
+            key.cost += cost
+            key.error_ewma += self.EWMA_ALPHA * ((0.0 if success else 1.0) - key.error_ewma)
+
+            if success:
+                key.latency_ewma += self.EWMA_ALPHA * (latency - key.latency_ewma)
+                key.consecutive_failures = 0
+                key.ejection_count = 0
+                return
+
+            key.errors += 1
+            key.consecutive_failures += 1
+            if key.consecutive_failures >= self.eject_failures:
+                eject_seconds = min(self.eject_base_seconds * (2 ** key.ejection_count), self.eject_max_seconds)
+                key.ejected_until = time.monotonic() + eject_seconds
+                key.ejection_count += 1
+                key.consecutive_failures = 0
+                logger.warning(f"API Key 일시 제외: {key.key_id} ({eject_seconds:.0f}s, 누적 {key.ejection_count}회)")
+
+    def available_count(self) -> int:
+        """지금 일시 제외되지 않은 키 수"""
+        now = time.monotonic()
+        return sum(1 for key in self.keys if not key.is_ejected(now))
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """키별 상태/사용량 정보"""
+        now = time.monotonic()
+        with self._lock:
+            return [key.to_dict(now) for key in self.keys]
@@ -1,18 +1,139 @@
-from openai import OpenAI
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+import httpx
+from openai import DefaultHttpxClient, OpenAI
 from openai.types.responses import Response
 from typing import Iterator, Optional, Union, Dict, Any, List
 from src.utils.logger import get_logger
+from src.utils.latency_tracker import LatencyTracker
+from src.utils.rate_limiter import estimate_tokens, key_fingerprint
+from src.utils.tracing import SPAN_KIND_CLIENT, open_span
+from src.utils.upstream_pacer import UpstreamPacer
 from src.exceptions.chat_exceptions import OpenAIClientException
 
 logger = get_logger(__name__)
 
 
+class _CachedClient:
+    """캐시된 SDK 클라이언트와 사용 중인 호출 수 (캐시에서 밀려나도 사용이 끝난 뒤 닫음)"""
+
+    __slots__ = ("client", "users", "evicted")
+
+    def __init__(self, client: OpenAI):
+        self.client = client
+        self.users = 0
+        self.evicted = False
+
+
 class OpenAIClient:
     """OpenAI API와의 통신을 담당하는 클래스"""
 
     DEFAULT_MODEL = "gpt-4o-mini"
     DEFAULT_TEMPERATURE = 0.7
     DEFAULT_MAX_TOKENS = 1000
+    DEFAULT_POLL_INTERVAL = 2.0
+
+    # background 모드에서 아직 처리 중인 응답 상태
+    PENDING_STATUSES = frozenset({"queued", "in_progress"})
+
+    # 서버 키·엔드포인트별로 재사용할 SDK 클라이언트 수 (커넥션 풀 재사용)
+    MAX_CACHED_CLIENTS = 256
+
+    def __init__(self):
+        self.pacer = UpstreamPacer()
+        # 모델별 TTFT/생성 속도/전체 지연 백분위수 (페이싱 대기는 제외하고 업스트림 호출만 측정)
+        self.latency = LatencyTracker()
+        self._clients: "OrderedDict[tuple, _CachedClient]" = OrderedDict()
+        self._clients_lock = threading.Lock()
+
+    def _new_client(self, api_key: str, organization: Optional[str], project: Optional[str], base_url: Optional[str]) -> OpenAI:
+        return OpenAI(
+            api_key=api_key,
+            organization=organization,
+            project=project,
+            base_url=base_url,
+            http_client=DefaultHttpxClient(event_hooks={"request": [self._on_request], "response": [self._on_response]})
+        )
+
+    @contextmanager
+    def _client(
+        self,
+        api_key: str,
+        organization: Optional[str] = None,
+        project: Optional[str] = None,
+        base_url: Optional[str] = None,
+        cache: bool = True
+    ) -> Iterator[OpenAI]:
+        """
+        SDK 클라이언트 사용 (요청마다 새 커넥션 풀을 만들지 않도록 서버 키 클라이언트는 LRU 캐시)
+
+        - 캐시 키는 원본 키가 아닌 key_fingerprint
+        - cache=False(사용자 키)면 캐시에 넣지 않고 호출이 끝나면 닫음
+          → 사용자 키를 프로세스에 보관하지 않고, 서버 키 클라이언트를 밀어내지도 않음
+        - 캐시에서 밀려난 클라이언트는 사용 중인 호출이 모두 끝난 뒤 닫아 커넥션 풀을 반환함
+        """
+        if not cache:
+            client = self._new_client(api_key, organization, project, base_url)
+            try:
+                yield client
+            finally:
+                client.close()
+            return
+
+        cache_key = (key_fingerprint(api_key), organization, project, base_url)
+        evicted = []
+        with self._clients_lock:
+            entry = self._clients.get(cache_key)
+            if entry is not None:
+                self._clients.move_to_end(cache_key)
+            else:
+                entry = self._clients[cache_key] = _CachedClient(self._new_client(api_key, organization, project, base_url))
+                while len(self._clients) > self.MAX_CACHED_CLIENTS:
+                    _, old = self._clients.popitem(last=False)
+                    old.evicted = True
+                    if old.users == 0:
+                        evicted.append(old)
+            entry.users += 1
+        for old in evicted:
+            old.client.close()
+
+        try:
+            yield entry.client
+        finally:
+            with self._clients_lock:
+                entry.users -= 1
+                close = entry.evicted and entry.users == 0
+            if close:
+                entry.client.close()
+
+    @staticmethod
+    def _on_request(request: httpx.Request) -> None:
+        """
+        SDK의 HTTP 시도(재시도 포함)마다 현재 업스트림 스팬 아래에 자식 스팬 시작
+
+        연결 실패로 응답 훅이 호출되지 않은 시도는 내보내지 않음 (오류는 상위 스팬에 기록됨)
+        """
+        span = open_span(f"HTTP {request.method}", kind=SPAN_KIND_CLIENT, parent_required=True, attributes={
+            "http.method": request.method,
+            "url.path": request.url.path,
+            "http.resend_count": int(request.headers.get("x-stainless-retry-count", 0))
+        })
+        if span is not None:
+            request.extensions["llm_trace_span"] = span
+
+    @staticmethod
+    def _on_response(response: httpx.Response) -> None:
+        """응답 헤더 수신 시 HTTP 시도 스팬 종료"""
+        span = response.request.extensions.get("llm_trace_span")
+        if span is None:
+            return
+        span.set_attribute("http.status_code", response.status_code)
+        span.set_attribute("openai.request_id", response.headers.get("x-request-id"))
+        if response.status_code >= 400:
+            span.status = "error"
+        span.end()
 
     def generate_response(
         self,
@@ -21,7 +142,14 @@ class OpenAIClient:
         model: str = DEFAULT_MODEL,
         instructions: str = "",
         max_tokens: int = DEFAULT_MAX_TOKENS,
-        temperature: float = DEFAULT_TEMPERATURE
+        temperature: float = DEFAULT_TEMPERATURE,
+        background: bool = False,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        timeout: Optional[float] = None,
+        organization: Optional[str] = None,
+        project: Optional[str] = None,
+        base_url: Optional[str] = None,
+        cache_client: bool = True
     ) -> Response:
         """
         OpenAI API에 메시지 전송하여 응답 생성
@@ -33,6 +161,13 @@ class OpenAIClient:
             instructions: 추가 지시사항
             max_tokens: 최대 토큰 수
             temperature: 온도
+            background: Responses API background 모드 사용 여부 (장시간 실행 모델용)
+            poll_interval: background 모드 폴링 주기 (초)
+            timeout: background 모드 최대 대기 시간 (초, None이면 무제한)
+            organization: OpenAI 조직 ID (키 풀 설정)
+            project: OpenAI 프로젝트 ID (키 풀 설정)
+            base_url: API 엔드포인트 (키 풀 설정, None이면 기본값)
+            cache_client: SDK 클라이언트 캐시 사용 여부 (사용자 키는 False)
 
         Returns:
             Response: OpenAI 응답
@@ -41,31 +176,181 @@ class OpenAIClient:
             OpenAIClientException: OpenAI API 호출 중 오류 발생 시
         """
         try:
-            # API Key로 클라이언트 생성
-            client = OpenAI(api_key=api_key)
+            logger.debug("OpenAI API 요청 시작 (model: %s, temperature: %s, background: %s)", model, temperature, background)
 
-            logger.debug(f"OpenAI API 요청 시작 (model: {model}, temperature: {temperature})")
+            # 업스트림 잔여 용량이 임계치 아래면 리셋 시점까지 요청을 분산
+            self.pacer.pace(api_key, model, estimate_tokens(messages, instructions) + (max_tokens or 0))
 
-            response = client.responses.create(
-                model=model,
-                input=messages,
-                instructions=instructions,
-                temperature=temperature,
-                max_output_tokens=max_tokens
-            )
+            # background 모드는 응답 저장(store)이 필요
+            background_kwargs = {"background": True, "store": True} if background else {}
+
+            # API Key로 클라이언트 조회 (사용자 키 클라이언트는 호출이 끝나면 닫음)
+            with self._client(api_key, organization, project, base_url, cache=cache_client) as client:
+                # 레이트 리밋 헤더를 얻기 위해 raw response로 호출
+                started_at = time.perf_counter()
+                raw_response = client.responses.with_raw_response.create(
+                    model=model,
+                    input=messages,
+                    instructions=instructions,
+                    temperature=temperature,
+                    max_output_tokens=max_tokens,
+                    **background_kwargs
+                )
+                self.pacer.observe(api_key, model, raw_response.headers, export_metrics=cache_client)
+                response = raw_response.parse()
+
+                if background:
+                    response = self._wait_for_response(client, response, poll_interval, timeout)
+                else:
+                    # 스트리밍이 아니면 첫 토큰 시점을 알 수 없으므로 전체 지연만 기록 (background는 폴링 시간이 섞이므로 제외)
+                    self.latency.record(model, time.perf_counter() - started_at)
 
-            logger.debug(f"OpenAI API 응답 완료 (ID: {response.id})")
+            logger.debug("OpenAI API 응답 완료 (ID: %s)", response.id)
             return response
             
+        except OpenAIClientException:
+            raise
         except Exception as e:
+            # 429 등 에러 응답에도 레이트 리밋 헤더가 포함됨
+            error_response = getattr(e, "response", None)
+            if error_response is not None:
+                self.pacer.observe(api_key, model, error_response.headers, export_metrics=cache_client)
+
             error_msg = f"OpenAI API 호출 중 오류 발생: {str(e)}"
             logger.error(error_msg)
             raise OpenAIClientException(
                 message=error_msg,
                 error_code="OPENAI_API_ERROR",
-                details={"model": model, "temperature": temperature}
+                details={"model": model, "temperature": temperature, "status_code": getattr(e, "status_code", None)}
             )
 
+    def stream_response(
+        self,
+        messages: list[dict],
+        api_key: str,
+        model: str = DEFAULT_MODEL,
+        instructions: str = "",
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        temperature: float = DEFAULT_TEMPERATURE,
+        organization: Optional[str] = None,
+        project: Optional[str] = None,
+        base_url: Optional[str] = None,
+        cache_client: bool = True
+    ) -> Iterator[Any]:
+        """
+        OpenAI Responses API 스트리밍 호출 - 스트림 이벤트를 순서대로 반환하는 제너레이터
+
+        제너레이터를 중간에 닫으면(close) 업스트림 HTTP 스트림도 닫혀 생성이 중단됨
+
+        Raises:
+            OpenAIClientException: 호출 실패, 스트림 중 오류 이벤트 또는 응답 실패 시
+        """
+        try:
+            logger.debug("OpenAI API 스트리밍 요청 시작 (model: %s, temperature: %s)", model, temperature)
+
+            self.pacer.pace(api_key, model, estimate_tokens(messages, instructions) + (max_tokens or 0))
+
+            # 제너레이터가 닫히면 with 블록도 끝나므로 사용자 키 클라이언트는 스트림과 함께 닫힘
+            with self._client(api_key, organization, project, base_url, cache=cache_client) as client:
+                started_at = time.perf_counter()
+                first_token_at = None
+                raw_response = client.responses.with_raw_response.create(
+                    model=model,
+                    input=messages,
+                    instructions=instructions,
+                    temperature=temperature,
+                    max_output_tokens=max_tokens,
+                    stream=True
+                )
+                self.pacer.observe(api_key, model, raw_response.headers, export_metrics=cache_client)
+
+                with raw_response.parse() as stream:
+                    for event in stream:
+                        if first_token_at is None and event.type == "response.output_text.delta":
+                            first_token_at = time.perf_counter()
+                        elif event.type == "response.completed":
+                            self._record_stream_latency(model, event.response, started_at, first_token_at, time.perf_counter())
+                        if event.type == "error":
+                            raise OpenAIClientException(
+                                message=f"OpenAI 스트림 오류: {event.message}",
+                                error_code="OPENAI_API_ERROR",
+                                details={"model": model, "status_code": None, "code": event.code}
+                            )
+                        if event.type == "response.failed":
+                            reason = event.response.error.message if event.response.error else event.response.status
+                            raise OpenAIClientException(
+                                message=f"OpenAI 스트림 응답 실패: {reason}",
+                                error_code="OPENAI_API_ERROR",
+                                details={"model": model, "status_code": None, "response_id": event.response.id}
+                            )
+                        yield event
+
+            logger.debug("OpenAI API 스트리밍 응답 완료")
+
+        except OpenAIClientException:
+            raise
+        except Exception as e:
+            error_response = getattr(e, "response", None)
+            if error_response is not None:
+                self.pacer.observe(api_key, model, error_response.headers, export_metrics=cache_client)
+
+            error_msg = f"OpenAI API 스트리밍 호출 중 오류 발생: {str(e)}"
+            logger.error(error_msg)
+            raise OpenAIClientException(
+                message=error_msg,
+                error_code="OPENAI_API_ERROR",
+                details={"model": model, "temperature": temperature, "status_code": getattr(e, "status_code", None)}
+            )
+
+    def _record_stream_latency(self, model: str, response: Response, started_at: float, first_token_at: Optional[float], completed_at: float) -> None:
+        """완료된 스트림의 TTFT / 생성 속도(첫 토큰 이후 출력 토큰/초) / 전체 지연 기록"""
+        output_tokens = response.usage.output_tokens if response.usage else 0
+        if first_token_at is None:
+            self.latency.record(model, completed_at - started_at)
+            return
+        self.latency.record(
+            model,
+            completed_at - started_at,
+            ttft=first_token_at - started_at,
+            output_tokens=output_tokens,
+            generation_time=completed_at - first_token_at
+        )
+
+    def _wait_for_response(
+        self,
+        client: OpenAI,
+        response: Response,
+        poll_interval: float,
+        timeout: Optional[float]
+    ) -> Response:
+        """
+        background 모드 응답이 끝날 때까지 폴링
+
+        Raises:
+            OpenAIClientException: 시간 초과 또는 응답 실패/취소 시
+        """
+        deadline = time.monotonic() + timeout if timeout else None
+
+        while response.status in self.PENDING_STATUSES:
+            if deadline is not None and time.monotonic() >= deadline:
+                client.responses.cancel(response.id)
+                raise OpenAIClientException(
+                    message=f"background 응답 대기 시간 초과 ({timeout:.0f}s)",
+                    error_code="OPENAI_BACKGROUND_TIMEOUT",
+                    details={"response_id": response.id}
+                )
+            time.sleep(poll_interval)
+            response = client.responses.retrieve(response.id)
+
+        if response.status in ("failed", "cancelled"):
+            reason = response.error.message if response.error else response.status
+            raise OpenAIClientException(
+                message=f"background 응답 실패: {reason}",
+                error_code="OPENAI_BACKGROUND_FAILED",
+                details={"response_id": response.id, "status": response.status}
+            )
+        return response
+
     def create_chat_completion(
         self,
         messages: List[Dict],
@@ -73,7 +358,8 @@ class OpenAIClient:
         model: str = DEFAULT_MODEL,
         temperature: float = DEFAULT_TEMPERATURE,
         max_tokens: int = DEFAULT_MAX_TOKENS,
-        stream: bool = False
+        stream: bool = False,
+        cache_client: bool = True
     ) -> Union[Response, Iterator[Response]]:
         """
         Chat Completions API를 사용한 채팅 완성 생성
@@ -85,32 +371,31 @@ class OpenAIClient:
             temperature: 온도 설정
             max_tokens: 최대 토큰 수
             stream: 스트리밍 응답 여부
+            cache_client: SDK 클라이언트 캐시 사용 여부 (사용자 키는 False)
 
         Returns:
-            Response | Iterator[Response]: 응답 객체 또는 스트림
+            Response | Iterator[Response]: 응답 객체 또는 스트림 이벤트 제너레이터
 
         Raises:
             OpenAIClientException: OpenAI API 호출 중 오류 발생 시
         """
-        try:
-            client = OpenAI(api_key=api_key)
+        if stream:
+            logger.debug("스트리밍 응답 시작")
+            return self._stream_chat_completion(messages, api_key, model, temperature, max_tokens, cache_client)
 
-            logger.debug(f"Chat Completions API 요청 시작 (model: {model}, stream: {stream})")
+        try:
+            logger.debug("Chat Completions API 요청 시작 (model: %s, stream: %s)", model, stream)
 
-            response = client.responses.create(
-                model=model,
-                input=messages,
-                temperature=temperature,
-                max_output_tokens=max_tokens,
-                stream=stream
-            )
+            with self._client(api_key, cache=cache_client) as client:
+                response = client.responses.create(
+                    model=model,
+                    input=messages,
+                    temperature=temperature,
+                    max_output_tokens=max_tokens
+                )
 
-            if stream:
-                logger.debug("스트리밍 응답 시작")
-                return response
-            else:
-                logger.debug(f"Chat Completions API 응답 완료 (ID: {response.id})")
-                return response
+            logger.debug("Chat Completions API 응답 완료 (ID: %s)", response.id)
+            return response
 
         except Exception as e:
             error_msg = f"Chat Completions API 호출 중 오류 발생: {str(e)}"
@@ -119,4 +404,33 @@ class OpenAIClient:
                 message=error_msg,
                 error_code="CHAT_COMPLETIONS_ERROR",
                 details={"model": model, "stream": stream}
-            ) 
\ No newline at end of file
+            ) 
+
+    def _stream_chat_completion(
+        self,
+        messages: List[Dict],
+        api_key: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        cache_client: bool
+    ) -> Iterator[Response]:
+        """create_chat_completion 스트림 - 클라이언트를 스트림이 끝날 때까지 사용 중으로 유지 (캐시에서 밀려나도 닫히지 않음)"""
+        try:
+            with self._client(api_key, cache=cache_client) as client:
+                with client.responses.create(
+                    model=model,
+                    input=messages,
+                    temperature=temperature,
+                    max_output_tokens=max_tokens,
+                    stream=True
+                ) as stream:
+                    yield from stream
+        except Exception as e:
+            error_msg = f"Chat Completions API 호출 중 오류 발생: {str(e)}"
+            logger.error(error_msg)
+            raise OpenAIClientException(
+                message=error_msg,
+                error_code="CHAT_COMPLETIONS_ERROR",
+                details={"model": model, "stream": True}
+            )
@@ -0,0 +1,165 @@
+"""
+스팬 배치 내보내기
+
+- BatchSpanExporter: 끝난 스팬을 큐에 모아 백그라운드 스레드가 TRACE_EXPORT_INTERVAL초마다(또는 배치가 차면) 내보냄.
+  요청 스레드는 큐에 넣기만 하며, 큐가 가득 차면 새 스팬을 버리고 개수만 셈
+- OTLPHttpSink: OTLP/HTTP JSON(/v1/traces)으로 수집기에 전송, 실패한 배치는 로컬 파일 싱크에 기록
+- JsonlFileSink: 스팬 하나를 한 줄 JSON으로 파일에 추가 (수집기가 없을 때)
+"""
+
+import json
+import os
+import threading
+from typing import Any, Dict, List
+import httpx
+from src.utils.logger import get_logger
+from src.config.config import settings
+
+logger = get_logger(__name__)
+
+# OTLP SpanKind / StatusCode 값
+_OTLP_SPAN_KINDS = {"internal": 1, "server": 2, "client": 3}
+_OTLP_STATUS_CODES = {"unset": 0, "ok": 1, "error": 2}
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items()]
+
+
+class JsonlFileSink:
+    """스팬을 JSONL 파일에 추가"""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def write(self, spans: list) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        lines = "".join(json.dumps(span.to_dict(), ensure_ascii=False) + "\n" for span in spans)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(lines)
+
+
+class OTLPHttpSink:
+    """OTLP/HTTP JSON 수집기 전송 (실패 시 fallback 싱크에 기록)"""
+
+    def __init__(self, endpoint: str, service_name: str, fallback: JsonlFileSink = None, timeout: float = 5.0, transport: httpx.BaseTransport = None):
+        endpoint = endpoint.rstrip("/")
+        self.url = endpoint if endpoint.endswith("/v1/traces") else endpoint + "/v1/traces"
+        self.service_name = service_name
+        self.fallback = fallback
+        self.client = httpx.Client(timeout=timeout, transport=transport)
+
+    def encode(self, spans: list) -> Dict[str, Any]:
+        """OTLP ExportTraceServiceRequest (JSON 인코딩)"""
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": _otlp_attributes({"service.name": self.service_name, "process.pid": os.getpid()})},
+                "scopeSpans": [{
+                    "scope": {"name": self.service_name},
+                    "spans": [{
+                        "traceId": span.trace_id,
+                        "spanId": span.span_id,
+                        "parentSpanId": span.parent_span_id,
+                        "name": span.name,
+                        "kind": _OTLP_SPAN_KINDS.get(span.kind, 1),
+                        "startTimeUnixNano": str(span.start_ns),
+                        "endTimeUnixNano": str(span.end_ns),
+                        "attributes": _otlp_attributes(span.attributes),
+                        "status": {"code": _OTLP_STATUS_CODES[span.status], "message": span.status_message}
+                    } for span in spans]
+                }]
+            }]
+        }
+
+    def write(self, spans: list) -> None:
+        try:
+            response = self.client.post(self.url, json=self.encode(spans))
+            response.raise_for_status()
+        except Exception as e:
+            logger.warning(f"스팬 전송 실패: {self.url} ({str(e)}), {len(spans)}개를 로컬 파일에 기록")
+            if self.fallback is not None:
+                self.fallback.write(spans)
+
+
+class BatchSpanExporter:
+    """끝난 스팬을 모아 백그라운드 스레드에서 배치로 내보냄"""
+
+    def __init__(self, sink, batch_size: int = 256, interval: float = 5.0, max_queue: int = 8192):
+        self.sink = sink
+        self.batch_size = batch_size
+        self.interval = interval
+        self.max_queue = max_queue
+        self.dropped = 0
+        self._queue: list = []
+        self._lock = threading.Lock()
+        self._export_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._worker = None
+        self._worker_pid = None
+
+    def export(self, span) -> None:
+        """스팬을 큐에 추가 (블로킹 I/O 없음)"""
+        with self._lock:
+            if len(self._queue) >= self.max_queue:
+                self.dropped += 1
+                return
+            self._queue.append(span)
+            queued = len(self._queue)
+            # fork된 워커에는 부모의 스레드가 없으므로 프로세스마다 새로 시작
+            if self._worker_pid != os.getpid():
+                self._worker_pid = os.getpid()
+                self._worker = threading.Thread(target=self._export_loop, name="span-exporter", daemon=True)
+                self._worker.start()
+        if queued >= self.batch_size:
+            self._wakeup.set()
+
+    def flush(self) -> None:
+        """큐에 남은 스팬을 모두 내보냄"""
+        with self._export_lock:
+            while True:
+                with self._lock:
+                    batch, self._queue = self._queue[:self.batch_size], self._queue[self.batch_size:]
+                    dropped, self.dropped = self.dropped, 0
+                if dropped:
+                    logger.warning(f"스팬 큐가 가득 차 {dropped}개를 버렸습니다 (TRACE_MAX_QUEUE: {self.max_queue})")
+                if not batch:
+                    return
+                try:
+                    self.sink.write(batch)
+                except Exception as e:
+                    logger.warning(f"스팬 내보내기 실패: {str(e)} ({len(batch)}개 버림)")
+
+    def _export_loop(self) -> None:
+        while True:
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+            self.flush()
+
+
+def create_span_exporter() -> BatchSpanExporter:
+    """설정에 맞는 내보내기 생성 - TRACE_OTLP_ENDPOINT가 있으면 OTLP, 없으면 TRACE_FILE"""
+    file_sink = JsonlFileSink(settings.TRACE_FILE)
+    if settings.TRACE_OTLP_ENDPOINT:
+        sink = OTLPHttpSink(settings.TRACE_OTLP_ENDPOINT, settings.TRACE_SERVICE_NAME, fallback=file_sink)
+        logger.info(f"스팬 내보내기: OTLP ({sink.url})")
+    else:
+        sink = file_sink
+        logger.info(f"스팬 내보내기: 파일 ({settings.TRACE_FILE})")
+    return BatchSpanExporter(
+        sink,
+        batch_size=settings.TRACE_BATCH_SIZE,
+        interval=settings.TRACE_EXPORT_INTERVAL,
+        max_queue=settings.TRACE_MAX_QUEUE
+    )
@@ -0,0 +1,88 @@
+"""
+업스트림(OpenAI) 도달 가능 여부 확인
+
+- GET {base_url}/models 한 번으로 확인하며, 응답이 오면(401/429 포함) 도달 가능, 연결 실패/타임아웃/5xx는 실패로 봄
+- 결과는 HEALTH_PROBE_INTERVAL초 동안 캐시하고, 만료되면 백그라운드 스레드 하나가 갱신함 (동시에 하나만 실행)
+  → 준비 상태 조회는 업스트림 호출을 기다리지 않고 마지막 결과를 바로 반환하며, 로드밸런서 폴링 빈도와 무관하게
+    업스트림 요청은 워커당 주기마다 최대 한 번
+"""
+
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+import httpx
+from src.utils.logger import get_logger
+from src.config.config import settings
+
+logger = get_logger(__name__)
+
+DEFAULT_BASE_URL = "https://api.openai.com/v1"
+
+
+class UpstreamProbe:
+    """캐시되는 업스트림 확인 요청"""
+
+    def __init__(self, key_pool=None, interval: float = None, timeout: float = None, transport: httpx.BaseTransport = None):
+        self.key_pool = key_pool
+        self.interval = settings.HEALTH_PROBE_INTERVAL if interval is None else interval
+        self.client = httpx.Client(timeout=settings.HEALTH_PROBE_TIMEOUT if timeout is None else timeout, transport=transport)
+        self._result: Optional[Dict[str, Any]] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        # 갱신 중인 프로세스 (fork 전 부모의 갱신 스레드는 자식에 없으므로 pid로 구분)
+        self._running_pid = None
+
+    def _target(self):
+        """확인 요청 URL과 헤더 (첫 번째 서버 키 사용, 없으면 인증 없이 도달 여부만 확인)"""
+        key = self.key_pool.keys[0] if self.key_pool is not None and len(self.key_pool) else None
+        base_url = (key.base_url if key is not None and key.base_url else DEFAULT_BASE_URL).rstrip("/")
+        headers = {"Authorization": f"Bearer {key.api_key}"} if key is not None else {}
+        return f"{base_url}/models", headers
+
+    def probe(self) -> Dict[str, Any]:
+        """지금 확인 요청을 보내 결과 갱신 (블로킹)"""
+        url, headers = self._target()
+        started = time.monotonic()
+        try:
+            response = self.client.get(url, headers=headers)
+            result = {"ok": response.status_code < 500, "status_code": response.status_code, "error": None}
+        except httpx.HTTPError as e:
+            result = {"ok": False, "status_code": None, "error": type(e).__name__}
+        result["latency_ms"] = round((time.monotonic() - started) * 1000, 1)
+
+        with self._lock:
+            previous = self._result
+            self._result = result
+            self._checked_at = time.monotonic()
+            self._running_pid = None
+        if previous is None or previous["ok"] != result["ok"]:
+            if result["ok"]:
+                logger.info(f"업스트림 확인 성공: {url} ({result['status_code']}, {result['latency_ms']}ms)")
+            else:
+                logger.warning(f"업스트림 확인 실패: {url} ({result['status_code'] or result['error']})")
+        return result
+
+    def _probe_in_background(self) -> None:
+        try:
+            self.probe()
+        except Exception as e:
+            with self._lock:
+                self._running_pid = None
+            logger.warning(f"업스트림 확인 중 오류: {str(e)}")
+
+    def state(self) -> Dict[str, Any]:
+        """
+        마지막 확인 결과 (기다리지 않음)
+
+        결과가 없거나 만료되었으면 백그라운드 갱신을 시작하고, 아직 결과가 없으면 ok=None(확인 전)을 반환함
+        """
+        now = time.monotonic()
+        with self._lock:
+            result, checked_at = self._result, self._checked_at
+            if (result is None or now - checked_at >= self.interval) and self._running_pid != os.getpid():
+                self._running_pid = os.getpid()
+                threading.Thread(target=self._probe_in_background, name="upstream-probe", daemon=True).start()
+        if result is None:
+            return {"ok": None, "status_code": None, "error": None, "latency_ms": None, "age_seconds": None}
+        return {**result, "age_seconds": round(now - checked_at, 1)}
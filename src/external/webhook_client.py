@@ -0,0 +1,140 @@
+import hashlib
+import hmac
+import ipaddress
+import json
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
+from urllib.parse import urlsplit
+import httpx
+from src.utils.logger import get_logger
+from src.config.config import settings
+
+logger = get_logger(__name__)
+
+
+def resolve_host(host: str) -> List[str]:
+    """호스트 이름의 모든 IP 주소 (IP 리터럴이면 그대로)"""
+    return [info[4][0] for info in socket.getaddrinfo(host, None, proto=socket.IPPROTO_TCP)]
+
+
+class WebhookClient:
+    """
+    HMAC 서명 웹훅 전송 클라이언트
+
+    - 커넥션 풀을 공유하는 단일 httpx.Client 사용
+    - 전송/재시도는 전용 스레드풀에서 실행되어 작업 워커를 점유하지 않음
+    - 서명: HMAC-SHA256(secret, "{timestamp}.{body}")를 X-Webhook-Signature 헤더로 전송
+    - SSRF 방지: 호스트를 해석해 루프백/사설/링크 로컬/예약 주소면 거부 (제출 시와 매 전송 시도 직전에 확인해
+      제출 뒤 DNS가 내부 주소로 바뀌는 경우도 차단). JOB_WEBHOOK_ALLOWED_HOSTS가 있으면 그 호스트만 허용
+    - 리다이렉트는 따라가지 않음
+    """
+
+    SIGNATURE_HEADER = "X-Webhook-Signature"
+    TIMESTAMP_HEADER = "X-Webhook-Timestamp"
+    RETRY_BACKOFF_BASE = 1.0
+
+    def __init__(
+        self,
+        secret: str = None,
+        timeout: float = None,
+        max_retries: int = None,
+        max_workers: int = 2,
+        transport: httpx.BaseTransport = None,
+        allowed_hosts: List[str] = None,
+        resolver: Callable[[str], List[str]] = None
+    ):
+        self.secret = settings.JOB_WEBHOOK_SECRET if secret is None else secret
+        self.allowed_hosts = frozenset(host.lower() for host in (settings.JOB_WEBHOOK_ALLOWED_HOSTS if allowed_hosts is None else allowed_hosts))
+        self.resolver = resolver or resolve_host
+        self.max_retries = settings.JOB_WEBHOOK_MAX_RETRIES if max_retries is None else max_retries
+        self.client = httpx.Client(
+            timeout=settings.JOB_WEBHOOK_TIMEOUT if timeout is None else timeout,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            transport=transport,
+            follow_redirects=False
+        )
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="webhook")
+
+    @property
+    def enabled(self) -> bool:
+        """서명 키가 설정된 경우에만 웹훅 사용 가능"""
+        return bool(self.secret)
+
+    @staticmethod
+    def sign(secret: str, timestamp: str, body: bytes) -> str:
+        """웹훅 서명 생성 (수신 측 검증에도 동일하게 사용)"""
+        message = timestamp.encode("utf-8") + b"." + body
+        return "sha256=" + hmac.new(secret.encode("utf-8"), message, hashlib.sha256).hexdigest()
+
+    def check_url(self, url: str) -> Optional[str]:
+        """
+        웹훅 URL 검사
+
+        Returns:
+            Optional[str]: 거부 사유 (허용되면 None)
+        """
+        parsed = urlsplit(url)
+        if parsed.scheme not in ("http", "https") or not parsed.hostname:
+            return "webhook_url은 http 또는 https URL이어야 합니다."
+        host = parsed.hostname.lower()
+        if self.allowed_hosts:
+            # 허용 목록은 운영자가 지정한 수신 서버이므로 내부 주소여도 허용
+            return None if host in self.allowed_hosts else f"허용되지 않은 웹훅 호스트입니다: {host}"
+        try:
+            addresses = self.resolver(host)
+        except (OSError, UnicodeError):
+            return f"웹훅 호스트를 확인할 수 없습니다: {host}"
+        if not addresses:
+            return f"웹훅 호스트를 확인할 수 없습니다: {host}"
+        for address in addresses:
+            ip = ipaddress.ip_address(address.split("%", 1)[0])
+            if ip.version == 6 and ip.ipv4_mapped is not None:
+                ip = ip.ipv4_mapped
+            if not ip.is_global or ip.is_multicast:
+                return f"내부/예약 주소로는 웹훅을 보낼 수 없습니다: {host} ({ip})"
+        return None
+
+    def send(self, url: str, payload: dict) -> None:
+        """웹훅 비동기 전송 (전용 스레드풀에 위임)"""
+        self.executor.submit(self.deliver, url, payload)
+
+    def deliver(self, url: str, payload: dict) -> bool:
+        """
+        웹훅 동기 전송 - 5xx/네트워크 오류는 지수 백오프로 재시도
+
+        Returns:
+            bool: 전송 성공 여부
+        """
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+        for attempt in range(self.max_retries + 1):
+            # 제출 뒤 DNS가 내부 주소로 바뀌었을 수 있으므로 시도마다 다시 확인
+            reason = self.check_url(url)
+            if reason:
+                logger.warning(f"웹훅 전송 차단: {url} ({reason})")
+                return False
+            timestamp = str(int(time.time()))
+            headers = {
+                "Content-Type": "application/json",
+                self.TIMESTAMP_HEADER: timestamp,
+                self.SIGNATURE_HEADER: self.sign(self.secret, timestamp, body)
+            }
+            try:
+                response = self.client.post(url, content=body, headers=headers)
+                if response.status_code < 500:
+                    if response.status_code >= 400:
+                        logger.warning(f"웹훅 전송 거부됨: {url} (상태 코드: {response.status_code})")
+                        return False
+                    logger.debug(f"웹훅 전송 완료: {url} (시도: {attempt + 1})")
+                    return True
+                logger.warning(f"웹훅 전송 실패: {url} (상태 코드: {response.status_code}, 시도: {attempt + 1})")
+            except httpx.HTTPError as e:
+                logger.warning(f"웹훅 전송 오류: {url} ({str(e)}, 시도: {attempt + 1})")
+
+            if attempt < self.max_retries:
+                time.sleep(self.RETRY_BACKOFF_BASE * (2 ** attempt))
+
+        logger.error(f"웹훅 전송 최종 실패: {url}")
+        return False
@@ -0,0 +1,38 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from src.models.response_dto import ChatResponse
+import time
+
+
+class UpstreamBatch(BaseModel):
+    """업스트림(Batch API)이 보고한 배치 상태"""
+    batch_id: str                   = Field(description="업스트림 배치 ID")
+    status: str                     = Field(description="업스트림 배치 상태 (validating, in_progress, completed, failed, expired, cancelled 등)")
+    input_file_id: Optional[str]    = Field(default=None, description="입력 파일 ID")
+    output_file_id: Optional[str]   = Field(default=None, description="결과 파일 ID")
+    error_file_id: Optional[str]    = Field(default=None, description="에러 파일 ID")
+
+
+class BatchJob(BaseModel):
+    """배치 작업 상태 DTO (로컬 작업 저장소에 저장되는 단위)"""
+    job_id: str                     = Field(description="배치 작업 ID")
+    status: str                     = Field(default="submitted", description="작업 상태 (submitted, in_progress, completed, failed, expired, cancelled)")
+    created_at: int                 = Field(default_factory=lambda: int(time.time()), description="생성 시간 (Unix timestamp)")
+    updated_at: int                 = Field(default_factory=lambda: int(time.time()), description="마지막 갱신 시간 (Unix timestamp)")
+    request_count: int              = Field(default=0, ge=0, description="요청 수")
+    request_ids: List[str]          = Field(default_factory=list, description="요청 순서대로의 request_id 목록")
+    upstream_batch_id: Optional[str] = Field(default=None, description="업스트림 배치 ID")
+    upstream_status: Optional[str]  = Field(default=None, description="업스트림 배치 상태")
+    output_file_id: Optional[str]   = Field(default=None, description="결과 파일 ID")
+    error_file_id: Optional[str]    = Field(default=None, description="에러 파일 ID")
+    completed_count: int            = Field(default=0, ge=0, description="성공한 요청 수")
+    failed_count: int               = Field(default=0, ge=0, description="실패한 요청 수")
+    total_cost: int                 = Field(default=0, ge=0, description="총 비용 (밀리센트, 배치 가격 기준)")
+    last_polled_at: float           = Field(default=0.0, description="마지막 업스트림 조회 시간 (Unix timestamp)")
+    error: Optional[str]            = Field(default=None, description="에러 메시지")
+
+
+class BatchJobResults(BaseModel):
+    """배치 작업 결과 DTO"""
+    job: BatchJob                   = Field(description="배치 작업 상태")
+    results: List[ChatResponse]     = Field(default_factory=list, description="요청 순서대로의 응답 목록 (완료 전에는 비어 있음)")
@@ -0,0 +1,24 @@
+from pydantic import BaseModel, Field
+from typing import Optional
+from src.models.request_dto import ChatRequest
+from src.models.response_dto import ChatResponse
+import time
+
+
+class JobRequest(ChatRequest):
+    """비동기 작업 요청 DTO (ChatRequest + 완료 알림 웹훅)"""
+    webhook_url: Optional[str]          = Field(default=None, description="완료 시 결과를 전송할 웹훅 URL (HMAC 서명)")
+
+
+class Job(BaseModel):
+    """비동기 작업 상태 DTO"""
+    job_id: str                     = Field(description="작업 ID")
+    request_id: str                 = Field(default="", description="요청 ID")
+    model: str                      = Field(default="", description="사용 모델")
+    status: str                     = Field(default="queued", description="작업 상태 (queued, in_progress, completed, failed)")
+    background: bool                = Field(default=False, description="Responses API background 모드 사용 여부")
+    created_at: float               = Field(default_factory=time.time, description="생성 시간 (Unix timestamp)")
+    started_at: Optional[float]     = Field(default=None, description="실행 시작 시간 (Unix timestamp)")
+    completed_at: Optional[float]   = Field(default=None, description="완료 시간 (Unix timestamp)")
+    result: Optional[ChatResponse]  = Field(default=None, description="완료 시 채팅 응답")
+    error: Optional[str]            = Field(default=None, description="실패 시 에러 메시지")
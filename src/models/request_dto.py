@@ -19,4 +19,14 @@ class ChatRequest(BaseModel):
     temperature: Optional[float]        = Field(default=0.7, ge=0.0, le=2.0, description="응답 다양성 (0.0-2.0)")
     model: Optional[str]                = Field(default="gpt-4o-mini", description="사용할 OpenAI 모델")
     openai_api_key: Optional[str]       = Field(default="", description="사용자 제공 API Key")
-    use_user_api_key: Optional[bool]    = Field(default=False, description="사용자 API Key 사용 여부")
\ No newline at end of file
+    use_user_api_key: Optional[bool]    = Field(default=False, description="사용자 API Key 사용 여부")
+    priority: Optional[str]             = Field(default=None, description="우선순위 클래스 (interactive, background)")
+    deadline: Optional[float]           = Field(default=None, gt=0.0, description="업스트림 대기 허용 시간 (초)")
+
+
+class LogPolicyUpdate(BaseModel):
+    """로그 정책 변경 DTO (주어진 값만 변경)"""
+    sample_rate: Optional[float]        = Field(default=None, ge=0.0, le=1.0, description="INFO 이하 로그를 남길 요청 비율")
+    rate_per_logger: Optional[float]    = Field(default=None, ge=0.0, description="로거별 초당 INFO 이하 줄 수 (0이면 제한 없음)")
+    burst: Optional[float]              = Field(default=None, ge=1.0, description="로거별 토큰 버킷 크기")
+    prompt_chars: Optional[int]         = Field(default=None, ge=0, description="프롬프트 내용을 기록할 최대 글자 수 (0이면 길이만)")
@@ -1,9 +1,41 @@
 from datetime import datetime
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Dict, Optional
 import time
 
 
+class TokenUsage:
+    """
+    업스트림 usage에서 한 번만 읽어 둔 토큰 수 (정산/비용/메트릭/응답 생성에 공유하는 내부 타입)
+
+    SDK usage 객체를 단계마다 hasattr/getattr로 다시 탐색하지 않도록 슬롯 객체 하나에 모아 둠
+    """
+
+    __slots__ = ("input_tokens", "output_tokens", "total_tokens", "cached_tokens", "reasoning_tokens")
+
+    def __init__(self, input_tokens: int = 0, output_tokens: int = 0, total_tokens: int = 0, cached_tokens: int = 0, reasoning_tokens: int = 0):
+        self.input_tokens = input_tokens
+        self.output_tokens = output_tokens
+        self.total_tokens = total_tokens
+        self.cached_tokens = cached_tokens
+        self.reasoning_tokens = reasoning_tokens
+
+    @classmethod
+    def from_openai_usage(cls, usage) -> "TokenUsage":
+        """SDK ResponseUsage에서 생성 (usage가 없으면 모두 0)"""
+        if usage is None:
+            return cls()
+        input_tokens_details = usage.input_tokens_details
+        output_tokens_details = usage.output_tokens_details
+        return cls(
+            usage.input_tokens,
+            usage.output_tokens,
+            usage.total_tokens,
+            (input_tokens_details.cached_tokens or 0) if input_tokens_details else 0,
+            (output_tokens_details.reasoning_tokens or 0) if output_tokens_details else 0
+        )
+
+
 class ChatResponse(BaseModel):
     """채팅 응답 데이터 클래스 (OpenAI Response 구조 기반)"""
     
@@ -12,7 +44,7 @@ class ChatResponse(BaseModel):
     request_id: str         = Field(description="세션 ID")
     object: str             = Field(default="response", description="응답 객체 타입")
     created_at: int         = Field(default_factory=lambda: int(time.time()), description="생성 시간 (Unix timestamp)")
-    status: str             = Field(default="completed", description="응답 상태 (completed, failed)")
+    status: str             = Field(default="completed", description="응답 상태 (completed, failed, cancelled)")
     model: str              = Field(default="gpt-4o-mini", description="사용된 OpenAI 모델")
     
     # 응답 텍스트
@@ -33,6 +65,8 @@ class ChatResponse(BaseModel):
     
     # 성능 측정
     response_time: Optional[float] = Field(default=None, ge=0.0, description="응답 시간 (초)")
+    queue_time: Optional[float] = Field(default=None, ge=0.0, description="스케줄러 대기 시간 (초)")
+    timings: Optional[Dict[str, float]] = Field(default=None, description="단계별 처리 시간 (밀리초, STAGE_TIMINGS_IN_RESPONSE 설정 시)")
     
     # 상태 정보
     success: bool           = Field(default=True, description="성공 여부")
@@ -59,6 +93,7 @@ class ChatResponse(BaseModel):
                 "text_format_type": "text",
                 "cost": 42,
                 "response_time": 1.23,
+                "queue_time": 0.0,
                 "success": True,
                 "error": None,
                 "use_user_api_key": False
@@ -106,63 +141,96 @@ User API Key: {self.use_user_api_key}
             "text_format_type": self.text_format_type,
             "cost": self.cost,
             "response_time": self.response_time,
+            "queue_time": self.queue_time,
+            "timings": self.timings,
             "success": self.success,
             "error": self.error,
             "use_user_api_key": self.use_user_api_key
         }
     
     @classmethod
-    def from_openai_response(cls, openai_response, request_id: str = "", response_time: float = None, use_user_api_key: bool = False, cost: int = None):
-        """OpenAI Response에서 ChatResponse 생성"""
+    def from_openai_response(cls, openai_response, request_id: str = "", response_time: float = None, use_user_api_key: bool = False, cost: int = None, queue_time: float = None, usage: "TokenUsage" = None):
+        """
+        OpenAI Response에서 ChatResponse 생성
+
+        서버가 계산한 값만 담으므로 필드 검증 없이(model_construct) 생성함.
+        정산에서 이미 읽은 usage(TokenUsage)를 넘기면 SDK usage 객체를 다시 읽지 않음
+        """
         # 사용자 API Key 사용 시 비용 측정을 위해 토큰을 0으로 설정
         if use_user_api_key:
-            input_tokens = 0
-            output_tokens = 0
-            total_tokens = 0
-            cached_tokens = 0
-            reasoning_tokens = 0
-        else:
-            input_tokens = openai_response.usage.input_tokens
-            output_tokens = openai_response.usage.output_tokens
-            total_tokens = openai_response.usage.total_tokens
-            # 새로운 토큰 세부 정보 추출 - 안전한 방식으로 처리
-            cached_tokens = 0
-            if hasattr(openai_response.usage, 'input_tokens_details'):
-                input_tokens_details = openai_response.usage.input_tokens_details
-                if input_tokens_details and hasattr(input_tokens_details, 'cached_tokens'):
-                    cached_tokens = getattr(input_tokens_details, 'cached_tokens', 0)
+            usage = TokenUsage()
+        elif usage is None:
+            usage = TokenUsage.from_openai_usage(openai_response.usage)
             
-            reasoning_tokens = 0
-            if hasattr(openai_response.usage, 'output_tokens_details'):
-                output_tokens_details = openai_response.usage.output_tokens_details
-                if output_tokens_details and hasattr(output_tokens_details, 'reasoning_tokens'):
-                    reasoning_tokens = getattr(output_tokens_details, 'reasoning_tokens', 0)
-            
-        return cls(
+        return cls.model_construct(
             id=openai_response.id,
             request_id=request_id,
             object=openai_response.object,
-            created_at=openai_response.created_at,
+            created_at=int(openai_response.created_at),
             status=openai_response.status,
             model=openai_response.model,
             output_text=openai_response.output_text,
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
-            total_tokens=total_tokens,
-            cached_tokens=cached_tokens,
-            reasoning_tokens=reasoning_tokens,
+            input_tokens=usage.input_tokens,
+            output_tokens=usage.output_tokens,
+            total_tokens=usage.total_tokens,
+            cached_tokens=usage.cached_tokens,
+            reasoning_tokens=usage.reasoning_tokens,
             text_format_type=openai_response.text.format.type,
             cost=cost,
             response_time=response_time,
+            queue_time=queue_time,
             success=True,
+            error=None,
             use_user_api_key=use_user_api_key
         )
     
+    @classmethod
+    def from_response_body(cls, body: dict, request_id: str = "", cost: int = None):
+        """
+        Responses API의 JSON 본문(dict)에서 ChatResponse 생성
+
+        Batch API 결과 파일처럼 SDK 객체 없이 원본 JSON만 있는 경우에 사용
+        """
+        usage = body.get("usage") or {}
+        input_tokens_details = usage.get("input_tokens_details") or {}
+        output_tokens_details = usage.get("output_tokens_details") or {}
+
+        # output 배열에서 output_text 조각만 이어붙임 (SDK의 output_text 프로퍼티와 동일)
+        output_text = "".join(
+            content.get("text", "")
+            for item in body.get("output") or []
+            if item.get("type") == "message"
+            for content in item.get("content") or []
+            if content.get("type") == "output_text"
+        )
+
+        text_format = (body.get("text") or {}).get("format") or {}
+
+        return cls(
+            id=body.get("id", ""),
+            request_id=request_id,
+            object=body.get("object", "response"),
+            created_at=int(body.get("created_at") or time.time()),
+            status=body.get("status") or "completed",
+            model=body.get("model", ""),
+            output_text=output_text,
+            input_tokens=usage.get("input_tokens", 0),
+            output_tokens=usage.get("output_tokens", 0),
+            total_tokens=usage.get("total_tokens", 0),
+            cached_tokens=input_tokens_details.get("cached_tokens", 0),
+            reasoning_tokens=output_tokens_details.get("reasoning_tokens", 0),
+            text_format_type=text_format.get("type", "text"),
+            cost=cost,
+            response_time=None,
+            success=True,
+            use_user_api_key=False
+        )
+
     @classmethod
     def create_error_response(cls, request_id: str, error_message: str):
-        """에러 응답 생성"""
+        """에러 응답 생성 (서버가 만든 값이므로 검증 생략)"""
         current_timestamp = int(time.time())
-        return cls(
+        return cls.model_construct(
             id="",
             request_id=request_id,
             object="response",
@@ -178,6 +246,7 @@ User API Key: {self.use_user_api_key}
             text_format_type="text",
             cost=0,
             response_time=0.0,
+            queue_time=None,
             success=False,
             error=error_message,
             use_user_api_key=False
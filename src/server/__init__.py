@@ -0,0 +1,4 @@
+from .supervisor import Supervisor
+from .listeners import bind_sockets, close_sockets, serve
+
+__all__ = ["Supervisor", "bind_sockets", "close_sockets", "serve"]
\ No newline at end of file
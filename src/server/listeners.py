@@ -0,0 +1,105 @@
+"""
+리슨 소켓 생성 및 ASGI 서버 실행 (HTTP/1.1 uvicorn / HTTP/2 h2c hypercorn, TCP + Unix 도메인 소켓)
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import stat
+from typing import List
+import uvicorn
+from src.utils.logger import get_logger, get_uvicorn_custom_log
+from src.config.config import settings
+from src.exceptions.chat_exceptions import ConfigurationException
+
+logger = get_logger(__name__)
+
+LISTEN_BACKLOG = 2048
+# 같은 호스트의 같은 그룹 사용자만 접속 가능하도록 제한
+UDS_PERMISSIONS = 0o660
+
+
+def _bind_tcp(host: str, port: int) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(LISTEN_BACKLOG)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _bind_uds(path: str) -> socket.socket:
+    # 이전 실행에서 남은 소켓 파일은 제거 (일반 파일이면 건드리지 않음)
+    if os.path.exists(path):
+        if not stat.S_ISSOCK(os.stat(path).st_mode):
+            raise ConfigurationException(f"Unix 소켓 경로에 다른 파일이 있습니다: {path}", config_key="SERVER_UDS")
+        os.unlink(path)
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.bind(path)
+    os.chmod(path, UDS_PERMISSIONS)
+    sock.listen(LISTEN_BACKLOG)
+    sock.set_inheritable(True)
+    return sock
+
+
+def bind_sockets(host: str, port: int, uds_path: str = None) -> List[socket.socket]:
+    """
+    리슨 소켓 생성 (TCP + 선택적 Unix 도메인 소켓)
+
+    fork 전에 만들어 두면 워커들이 같은 소켓을 상속해 커널이 연결을 분배함
+    """
+    uds_path = settings.SERVER_UDS if uds_path is None else uds_path
+    sockets = [_bind_tcp(host, port)]
+    if uds_path:
+        sockets.append(_bind_uds(uds_path))
+        logger.info(f"Unix 도메인 소켓 리슨: {uds_path}")
+    return sockets
+
+
+def close_sockets(sockets: List[socket.socket]) -> None:
+    """소켓을 닫고 Unix 소켓 파일 정리 (마스터 프로세스에서만 호출)"""
+    for sock in sockets:
+        path = sock.getsockname() if sock.family == socket.AF_UNIX else None
+        sock.close()
+        if path and os.path.exists(path):
+            os.unlink(path)
+
+
+def _serve_http2(app, sockets: List[socket.socket]) -> None:
+    try:
+        from hypercorn.config import Config
+        from hypercorn.asyncio import serve as hypercorn_serve
+    except ImportError:
+        raise ConfigurationException(
+            "SERVER_HTTP2를 사용하려면 hypercorn 패키지가 필요합니다 (pip install hypercorn).",
+            config_key="SERVER_HTTP2"
+        )
+
+    config = Config()
+    # 같은 소켓에서 HTTP/1.1과 h2c(prior knowledge / Upgrade)를 함께 처리
+    config.bind = [f"fd://{sock.fileno()}" for sock in sockets]
+    config.h2_max_concurrent_streams = settings.SERVER_HTTP2_MAX_STREAMS
+    config.accesslog = logging.getLogger("hypercorn.access")
+    config.errorlog = logging.getLogger("hypercorn.error")
+    asyncio.run(hypercorn_serve(app, config))
+
+
+def serve(app, host: str, port: int, sockets: List[socket.socket]) -> None:
+    """
+    이미 열린 소켓으로 ASGI 앱 실행 (종료 신호를 받을 때까지 반환하지 않음)
+
+    SERVER_HTTP2가 켜져 있으면 hypercorn(HTTP/1.1 + h2c), 아니면 uvicorn(HTTP/1.1)을 사용
+    """
+    if settings.SERVER_HTTP2:
+        _serve_http2(app, sockets)
+        return
+
+    config = uvicorn.Config(app, host=host, port=port, log_config=get_uvicorn_custom_log(), access_log=True)
+    uvicorn.Server(config).run(sockets=sockets)
@@ -0,0 +1,146 @@
+"""
+멀티 프로세스 서빙 - preload 후 fork하는 워커 감독(supervisor)
+"""
+
+import os
+import signal
+import socket
+import time
+from typing import Dict, List
+from src.server.listeners import bind_sockets, close_sockets, serve
+from src.utils.logger import get_logger
+from src.utils.shared_metrics import metrics
+from src.config.config import settings
+
+logger = get_logger(__name__)
+
+# 시작 후 이 시간 안에 종료되면 비정상 종료로 보고 재시작을 지연시킴
+CRASH_LOOP_WINDOW = 5.0
+
+
+class Supervisor:
+    """
+    워커 프로세스 감독
+
+    - 마스터에서 앱을 import(preload)하고 리슨 소켓을 연 뒤 fork하므로, 워커는 import 비용 없이 시작하고
+      커널이 연결을 워커들에 분배함
+    - 워커가 죽으면 같은 번호(공유 메트릭 영역)로 재시작, 시작 직후 반복 종료 시 지수 백오프
+    - SIGTERM/SIGINT를 받으면 워커에 SIGTERM을 전달하고 WORKER_SHUTDOWN_TIMEOUT 후에도 남은 워커는 SIGKILL
+    """
+
+    POLL_INTERVAL = 0.5
+
+    def __init__(self, app, host: str, port: int, workers: int = None):
+        self.app = app
+        self.host = host
+        self.port = port
+        self.workers = settings.SERVER_WORKERS if workers is None else workers
+        if self.workers > metrics.max_workers:
+            logger.warning(f"워커 수({self.workers})가 공유 메트릭 영역 수({metrics.max_workers})보다 많아 조정합니다.")
+            self.workers = metrics.max_workers
+        self.sockets: List[socket.socket] = []
+        self._pids: Dict[int, int] = {}
+        self._started_at: Dict[int, float] = {}
+        self._crash_counts: Dict[int, int] = {}
+        self._restart_at: Dict[int, float] = {}
+        self._stopping = False
+
+    def _spawn(self, index: int) -> None:
+        pid = os.fork()
+        if pid == 0:
+            self._run_worker(index)
+            return
+        self._pids[pid] = index
+        self._started_at[index] = time.monotonic()
+        logger.info(f"워커 시작: #{index} (pid: {pid})")
+
+    def _run_worker(self, index: int) -> None:
+        """자식 프로세스 진입점 - 반환하지 않음"""
+        exit_code = 0
+        try:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            metrics.bind_worker(index)
+            serve(self.app, self.host, self.port, self.sockets)
+        except BaseException as e:
+            logger.error(f"워커 비정상 종료: #{index} ({str(e)})")
+            exit_code = 1
+        finally:
+            os._exit(exit_code)
+
+    def _handle_stop(self, signum, frame) -> None:
+        self._stopping = True
+
+    def _reap(self) -> None:
+        """종료된 워커 정리 및 재시작 예약"""
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+
+            index = self._pids.pop(pid, None)
+            if index is None:
+                continue
+
+            lifetime = time.monotonic() - self._started_at.get(index, 0.0)
+            exit_code = os.waitstatus_to_exitcode(status)
+            if self._stopping:
+                logger.info(f"워커 종료: #{index} (pid: {pid}, 코드: {exit_code})")
+                continue
+
+            self._crash_counts[index] = self._crash_counts.get(index, 0) + 1 if lifetime < CRASH_LOOP_WINDOW else 0
+            backoff = min(2 ** self._crash_counts[index] - 1, settings.WORKER_RESTART_MAX_BACKOFF)
+            self._restart_at[index] = time.monotonic() + backoff
+            logger.warning(f"워커 종료 감지: #{index} (pid: {pid}, 코드: {exit_code}, {backoff:.0f}s 후 재시작)")
+
+    def _restart_due(self) -> None:
+        now = time.monotonic()
+        for index, restart_at in list(self._restart_at.items()):
+            if restart_at <= now:
+                del self._restart_at[index]
+                self._spawn(index)
+
+    def _shutdown(self) -> None:
+        logger.info(f"워커 종료 중... ({len(self._pids)}개)")
+        for pid in list(self._pids):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+        deadline = time.monotonic() + settings.WORKER_SHUTDOWN_TIMEOUT
+        while self._pids and time.monotonic() < deadline:
+            self._reap()
+            time.sleep(0.1)
+
+        for pid in list(self._pids):
+            logger.warning(f"워커 강제 종료: pid {pid}")
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+        self._reap()
+
+    def run(self) -> None:
+        """워커를 띄우고 종료 신호를 받을 때까지 감독"""
+        self.sockets = bind_sockets(self.host, self.port)
+        logger.info(f"멀티 프로세스 서버 시작 (Host: {self.host}, Port: {self.port}, 워커: {self.workers}, pid: {os.getpid()})")
+
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        signal.signal(signal.SIGINT, self._handle_stop)
+
+        for index in range(self.workers):
+            self._spawn(index)
+
+        try:
+            while not self._stopping:
+                self._reap()
+                self._restart_due()
+                time.sleep(self.POLL_INTERVAL)
+        finally:
+            self._shutdown()
+            close_sockets(self.sockets)
+            logger.info("멀티 프로세스 서버 종료")
@@ -0,0 +1,355 @@
+import json
+import os
+import threading
+import time
+import uuid
+from typing import List, Optional
+import msgpack
+from pydantic import ValidationError
+from src.external.batch_upstream import BatchUpstream, create_batch_upstream
+from src.models.batch_dto import BatchJob, BatchJobResults, UpstreamBatch
+from src.models.request_dto import ChatRequest
+from src.models.response_dto import ChatResponse
+from src.services.chat_service import ChatService
+from src.utils.cost_calculator import LLMCostCalculator
+from src.utils.logger import get_logger
+from src.config.config import settings
+from src.exceptions.chat_exceptions import ValidationException, JobNotFoundException
+
+logger = get_logger(__name__)
+
+
+class BatchJobStore:
+    """
+    배치 작업 상태를 디스크에 저장하는 로컬 작업 저장소
+
+    작업마다 디렉토리를 만들고 job.json(상태), input.jsonl(Batch API 입력),
+    results.jsonl(ChatResponse 목록)을 저장. 모든 쓰기는 임시 파일 + os.replace로 원자적으로 수행
+    """
+
+    JOB_FILE = "job.json"
+    INPUT_FILE = "input.jsonl"
+    RESULTS_FILE = "results.jsonl"
+
+    def __init__(self, base_dir: str):
+        self.base_dir = base_dir
+
+    def _job_dir(self, job_id: str) -> str:
+        # job_id는 서버에서 생성한 값만 허용 (경로 조작 방지)
+        if not job_id or os.sep in job_id or job_id.startswith("."):
+            raise JobNotFoundException(f"존재하지 않는 배치 작업입니다: {job_id}", job_id=job_id)
+        return os.path.join(self.base_dir, job_id)
+
+    def _write(self, job_id: str, filename: str, data: bytes) -> None:
+        job_dir = self._job_dir(job_id)
+        os.makedirs(job_dir, exist_ok=True)
+        path = os.path.join(job_dir, filename)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def save_job(self, job: BatchJob) -> None:
+        job.updated_at = int(time.time())
+        self._write(job.job_id, self.JOB_FILE, job.model_dump_json().encode("utf-8"))
+
+    def load_job(self, job_id: str) -> BatchJob:
+        path = os.path.join(self._job_dir(job_id), self.JOB_FILE)
+        if not os.path.exists(path):
+            raise JobNotFoundException(f"존재하지 않는 배치 작업입니다: {job_id}", job_id=job_id)
+        with open(path, "rb") as f:
+            return BatchJob.model_validate_json(f.read())
+
+    def save_input(self, job_id: str, input_jsonl: bytes) -> None:
+        self._write(job_id, self.INPUT_FILE, input_jsonl)
+
+    def save_results(self, job_id: str, results: List[ChatResponse]) -> None:
+        data = "\n".join(result.model_dump_json() for result in results)
+        self._write(job_id, self.RESULTS_FILE, data.encode("utf-8"))
+
+    def load_results(self, job_id: str) -> List[ChatResponse]:
+        path = os.path.join(self._job_dir(job_id), self.RESULTS_FILE)
+        if not os.path.exists(path):
+            return []
+        with open(path, "rb") as f:
+            return [ChatResponse.model_validate_json(line) for line in f.read().splitlines() if line.strip()]
+
+
+class BatchService:
+    """
+    OpenAI Batch API 기반 오프라인 대량 작업 서비스
+
+    ChatRequest JSONL을 Batch API 입력 파일로 변환해 제출하고, 조회 시점에 업스트림을 폴링하여
+    완료된 결과를 배치 가격 기준 비용이 계산된 ChatResponse로 변환. 동기 채팅 경로와 별개의
+    업스트림 한도를 사용하므로 대화형 요청의 처리량을 소모하지 않음
+    """
+
+    # 더 이상 업스트림 폴링이 필요 없는 상태
+    TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+    def __init__(
+        self,
+        chat_service: ChatService = None,
+        upstream: BatchUpstream = None,
+        store: BatchJobStore = None,
+        poll_interval: float = None
+    ):
+        self.chat_service = chat_service or ChatService()
+        self._upstream = upstream
+        self.store = store or BatchJobStore(settings.BATCH_CACHE_DIR)
+        self.poll_interval = settings.BATCH_POLL_INTERVAL if poll_interval is None else poll_interval
+        self._lock = threading.Lock()
+
+    @property
+    def upstream(self) -> BatchUpstream:
+        """업스트림 지연 생성 (API Key 미설정 시에도 서버 기동 가능하도록)"""
+        if self._upstream is None:
+            self._upstream = create_batch_upstream(settings.BATCH_UPSTREAM, self.chat_service.default_api_key)
+        return self._upstream
+
+    def parse_jsonl(self, payload: bytes) -> List[ChatRequest]:
+        """
+        ChatRequest JSONL 파싱
+
+        Raises:
+            ValidationException: 빈 입력, 잘못된 JSON/필드, 요청 수 초과 시
+        """
+        requests = []
+        for line_number, line in enumerate(payload.splitlines(), start=1):
+            if not line.strip():
+                continue
+            try:
+                requests.append(ChatRequest.model_validate_json(line))
+            except ValidationError as e:
+                raise ValidationException(
+                    message=f"{line_number}번째 줄의 요청 형식이 올바르지 않습니다: {e.errors()[0]['msg']}",
+                    field="line",
+                    value=str(line_number)
+                )
+
+        self._check_request_count(requests)
+        return requests
+
+    def parse_msgpack(self, payload: bytes) -> List[ChatRequest]:
+        """
+        ChatRequest msgpack 파싱 (ChatRequest 맵을 이어 붙인 스트림 또는 맵 배열)
+
+        Raises:
+            ValidationException: 빈 입력, 잘못된 msgpack/필드, 요청 수 초과 시
+        """
+        unpacker = msgpack.Unpacker(raw=False)
+        unpacker.feed(payload)
+        requests = []
+        try:
+            for item in unpacker:
+                for body in item if isinstance(item, list) else [item]:
+                    requests.append(ChatRequest.model_validate(body))
+        except ValidationError as e:
+            raise ValidationException(
+                message=f"{len(requests) + 1}번째 요청 형식이 올바르지 않습니다: {e.errors()[0]['msg']}",
+                field="index",
+                value=str(len(requests) + 1)
+            )
+        except (ValueError, msgpack.UnpackException) as e:
+            raise ValidationException(message=f"msgpack 본문을 해석할 수 없습니다: {str(e)}", field="body")
+
+        self._check_request_count(requests)
+        return requests
+
+    def _check_request_count(self, requests: List[ChatRequest]) -> None:
+        if not requests:
+            raise ValidationException(message="배치 요청이 비어 있습니다.", field="body")
+        if len(requests) > settings.BATCH_MAX_REQUESTS:
+            raise ValidationException(
+                message=f"배치 요청 수는 {settings.BATCH_MAX_REQUESTS}개를 넘을 수 없습니다.",
+                field="body",
+                value=str(len(requests))
+            )
+
+    def _to_batch_line(self, custom_id: str, request: ChatRequest) -> str:
+        """ChatRequest를 Batch API 입력 한 줄로 변환"""
+        return json.dumps({
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": BatchUpstream.ENDPOINT,
+            "body": {
+                "model": request.model,
+                "input": self.chat_service.build_messages(request),
+                "instructions": request.instructions,
+                "temperature": request.temperature,
+                "max_output_tokens": request.max_tokens
+            }
+        }, ensure_ascii=False)
+
+    def create_job(self, requests: List[ChatRequest]) -> BatchJob:
+        """
+        배치 작업 생성 및 업스트림 제출
+
+        Raises:
+            ValidationException: 요청 검증 실패 또는 사용자 API Key 요청 포함 시
+        """
+        for request in requests:
+            self.chat_service.validate_request(request)
+            # 배치는 디스크에 장시간 보관되므로 사용자 키를 저장하지 않고 서버 키만 사용
+            if request.use_user_api_key:
+                raise ValidationException(
+                    message="배치 작업은 사용자 API Key를 지원하지 않습니다.",
+                    field="use_user_api_key",
+                    value=request.request_id
+                )
+
+        job_id = f"batch_{uuid.uuid4().hex}"
+        input_jsonl = "\n".join(
+            self._to_batch_line(f"{job_id}-{index}", request)
+            for index, request in enumerate(requests)
+        ).encode("utf-8")
+
+        job = BatchJob(
+            job_id=job_id,
+            request_count=len(requests),
+            request_ids=[request.request_id or "" for request in requests]
+        )
+        self.store.save_input(job_id, input_jsonl)
+
+        try:
+            upstream_batch = self.upstream.submit(input_jsonl, metadata={"job_id": job_id})
+        except Exception as e:
+            job.status = "failed"
+            job.error = str(getattr(e, "message", e))
+            self.store.save_job(job)
+            raise
+
+        self._apply_upstream_state(job, upstream_batch)
+        self.store.save_job(job)
+
+        logger.info(f"배치 작업 생성 완료: {job_id} (요청 수: {job.request_count}, 업스트림: {job.upstream_batch_id})")
+        return job
+
+    def _apply_upstream_state(self, job: BatchJob, upstream_batch: UpstreamBatch) -> None:
+        job.upstream_batch_id = upstream_batch.batch_id
+        job.upstream_status = upstream_batch.status
+        job.output_file_id = upstream_batch.output_file_id
+        job.error_file_id = upstream_batch.error_file_id
+        job.last_polled_at = time.time()
+
+        if upstream_batch.status in self.TERMINAL_STATUSES:
+            job.status = upstream_batch.status
+        else:
+            job.status = "in_progress"
+
+    def get_job(self, job_id: str, refresh: bool = True) -> BatchJob:
+        """
+        배치 작업 조회 - 폴링 주기가 지났고 작업이 진행 중이면 업스트림 상태를 갱신
+
+        Raises:
+            JobNotFoundException: 작업이 없을 때
+        """
+        job = self.store.load_job(job_id)
+        if not refresh or job.status in self.TERMINAL_STATUSES:
+            return job
+        if time.time() - job.last_polled_at < self.poll_interval:
+            return job
+
+        with self._lock:
+            # 대기 중 다른 스레드가 이미 갱신했을 수 있으므로 다시 로드
+            job = self.store.load_job(job_id)
+            if job.status in self.TERMINAL_STATUSES or time.time() - job.last_polled_at < self.poll_interval:
+                return job
+
+            upstream_batch = self.upstream.retrieve(job.upstream_batch_id)
+            self._apply_upstream_state(job, upstream_batch)
+
+            if job.status in self.TERMINAL_STATUSES:
+                self._collect_results(job)
+
+            self.store.save_job(job)
+            return job
+
+    def get_results(self, job_id: str) -> BatchJobResults:
+        """배치 작업 결과 조회 (완료 전에는 빈 결과)"""
+        job = self.get_job(job_id)
+        return BatchJobResults(job=job, results=self.store.load_results(job_id))
+
+    def cancel_job(self, job_id: str) -> BatchJob:
+        """배치 작업 취소 요청"""
+        with self._lock:
+            job = self.store.load_job(job_id)
+            if job.status in self.TERMINAL_STATUSES:
+                return job
+
+            upstream_batch = self.upstream.cancel(job.upstream_batch_id)
+            self._apply_upstream_state(job, upstream_batch)
+            if job.status in self.TERMINAL_STATUSES:
+                self._collect_results(job)
+            self.store.save_job(job)
+
+        logger.info(f"배치 작업 취소 요청: {job_id} (업스트림 상태: {job.upstream_status})")
+        return job
+
+    def _collect_results(self, job: BatchJob) -> None:
+        """업스트림 결과/에러 파일을 내려받아 요청 순서대로 ChatResponse 목록으로 저장"""
+        results: List[Optional[ChatResponse]] = [None] * job.request_count
+        total_cost = 0
+
+        for file_id in (job.output_file_id, job.error_file_id):
+            if not file_id:
+                continue
+            for line in self.upstream.download(file_id).splitlines():
+                if not line.strip():
+                    continue
+                item = json.loads(line)
+                index = self._parse_index(job, item.get("custom_id", ""))
+                if index is None:
+                    continue
+
+                result = self._to_chat_response(item, job.request_ids[index])
+                total_cost += result.cost or 0
+                results[index] = result
+
+        for index, result in enumerate(results):
+            if result is None:
+                results[index] = ChatResponse.create_error_response(
+                    request_id=job.request_ids[index],
+                    error_message=f"배치 결과가 없습니다 (배치 상태: {job.upstream_status})"
+                )
+
+        job.completed_count = sum(1 for result in results if result.success)
+        job.failed_count = job.request_count - job.completed_count
+        job.total_cost = total_cost
+        self.store.save_results(job.job_id, results)
+
+        logger.info(f"배치 작업 결과 수집 완료: {job.job_id} (성공: {job.completed_count}, 실패: {job.failed_count}, 비용: {total_cost} 밀리센트)")
+
+    @staticmethod
+    def _parse_index(job: BatchJob, custom_id: str) -> Optional[int]:
+        prefix = f"{job.job_id}-"
+        if not custom_id.startswith(prefix):
+            return None
+        try:
+            index = int(custom_id[len(prefix):])
+        except ValueError:
+            return None
+        return index if 0 <= index < job.request_count else None
+
+    @staticmethod
+    def _to_chat_response(item: dict, request_id: str) -> ChatResponse:
+        """Batch API 결과 한 줄을 ChatResponse로 변환 (배치 가격 기준 비용 포함)"""
+        response = item.get("response") or {}
+        body = response.get("body") or {}
+
+        if item.get("error") or response.get("status_code") != 200:
+            error = item.get("error") or body.get("error") or {}
+            return ChatResponse.create_error_response(
+                request_id=request_id,
+                error_message=f"배치 요청 실패: {error.get('message', '알 수 없는 오류')}"
+            )
+
+        usage = body.get("usage") or {}
+        cost = LLMCostCalculator.calculate_batch_cost(
+            model=body.get("model", ""),
+            input_tokens=usage.get("input_tokens", 0),
+            output_tokens=usage.get("output_tokens", 0),
+            cached_tokens=(usage.get("input_tokens_details") or {}).get("cached_tokens", 0),
+            reasoning_tokens=(usage.get("output_tokens_details") or {}).get("reasoning_tokens", 0)
+        )
+        return ChatResponse.from_response_body(body, request_id=request_id, cost=cost)
@@ -1,16 +1,30 @@
+import threading
 import time
+from typing import Iterator, Union
+from src.external.coordination_store import create_coordination_store
+from src.external.key_pool import KeyPool, UpstreamKey
 from src.external.openai_client import OpenAIClient
 from src.models.request_dto import ChatRequest, History
-from src.models.response_dto import ChatResponse
+from src.models.response_dto import ChatResponse, TokenUsage
 from src.utils.logger import get_logger
 from src.utils.cost_calculator import LLMCostCalculator
-from src.config.config import OPENAI_API_KEY
+from src.utils.concurrency_limiter import AdaptiveConcurrencyLimiter
+from src.utils.distributed_quota import SpendTracker
+from src.utils.metric_labels import error_label, key_mode_label, model_label, status_label
+from src.utils.rate_limiter import CHARS_PER_TOKEN, RateLimiter, estimate_tokens
+from src.utils.request_scheduler import PRIORITY_CLASSES, RequestScheduler
+from src.utils.shared_metrics import metrics
+from src.utils.stage_timer import StageTimer
+from src.utils.tracing import SPAN_KIND_CLIENT, open_span, trace_span
+from src.config.config import settings
 from openai.types.responses import Response
 from src.exceptions.chat_exceptions import (
     ChatServiceException,
     OpenAIClientException,
     ValidationException,
-    ConfigurationException
+    ConfigurationException,
+    RateLimitException,
+    OverloadedException
 )
 
 logger = get_logger(__name__)
@@ -21,36 +35,66 @@ class ChatService:
     
     def __init__(self):
         self.openai_client = OpenAIClient()
+        self.key_pool = KeyPool.from_settings(pacer=self.openai_client.pacer)
         self.default_api_key = self._load_default_api_key()
+        self.coordination_store = create_coordination_store(
+            settings.COORDINATION_BACKEND,
+            url=settings.COORDINATION_URL,
+            path=settings.COORDINATION_FILE,
+            key_prefix=settings.COORDINATION_KEY_PREFIX
+        )
+        self.rate_limiter = RateLimiter(store=self.coordination_store)
+        self.spend_tracker = SpendTracker(store=self.coordination_store)
+        self.concurrency_limiter = AdaptiveConcurrencyLimiter()
+        self.scheduler = RequestScheduler()
     
     def _load_default_api_key(self) -> str:
-        """기본 API Key 로드"""
-        if OPENAI_API_KEY:
-            logger.info(f"성공적으로 OPENAI_API_KEY를 불러왔습니다: {OPENAI_API_KEY[:4]}****")
-            return OPENAI_API_KEY
+        """기본 API Key 로드 (키 풀의 첫 번째 키)"""
+        if len(self.key_pool):
+            api_key = self.key_pool.keys[0].api_key
+            logger.info(f"성공적으로 OPENAI_API_KEY를 불러왔습니다: {api_key[:4]}**** (풀 키 {len(self.key_pool)}개)")
+            return api_key
         else:
             logger.warning("OPENAI_API_KEY가 설정되지 않았습니다. 사용자 API Key만 사용 가능합니다.")
             return None
     
-    def _select_api_key(self, request_api_key: str = None, use_user_api_key: bool = False) -> str:
+    def _select_api_key(self, model: str, request_api_key: str = None, use_user_api_key: bool = False) -> UpstreamKey:
         """
-        API Key 선택 - use_user_api_key가 True면 사용자 키 사용, 아니면 기본 키 사용
+        API Key 선택 - use_user_api_key가 True면 사용자 키 사용, 아니면 서버 키 풀에서 선택
         """
         if use_user_api_key and request_api_key:
             logger.debug("사용자 API Key 사용")
-            return request_api_key
-        elif self.default_api_key:
-            logger.debug("기본 API Key 사용")
-            return self.default_api_key
-        else:
+            return UpstreamKey(request_api_key)
+        
+        upstream_key = self.key_pool.acquire(model)
+        if upstream_key is None:
             raise ConfigurationException("사용 가능한 API Key가 없습니다.", config_key="OPENAI_API_KEY")
+        logger.debug("서버 API Key 사용: %s", upstream_key.key_id)
+        return upstream_key
+    
+    @staticmethod
+    def _is_key_failure(error: Exception) -> bool:
+        """키 헬스에 반영할 업스트림 오류인지 판단 (인증/한도/서버 오류/연결 실패)"""
+        if not isinstance(error, OpenAIClientException) or error.error_code != "OPENAI_API_ERROR":
+            return False
+        status_code = error.details.get("status_code")
+        return status_code is None or status_code in (401, 403, 429) or status_code >= 500
     
-    def _calculate_cost(self, openai_response: Response, use_user_api_key: bool = False) -> int:
+    @staticmethod
+    def _is_overload_failure(error: Exception) -> bool:
+        """동시 실행 한도를 줄여야 하는 업스트림 오류인지 판단 (429/서버 오류/연결 실패·타임아웃)"""
+        if not isinstance(error, OpenAIClientException) or error.error_code != "OPENAI_API_ERROR":
+            return False
+        status_code = error.details.get("status_code")
+        return status_code is None or status_code == 429 or status_code >= 500
+    
+    def _calculate_cost(self, model: str, usage: TokenUsage, use_user_api_key: bool = False) -> int:
         """
-        OpenAI 응답을 기반으로 비용 계산 (고성능 최적화 버전)
+        토큰 사용량을 기반으로 비용 계산
         
         Args:
-            openai_response: OpenAI 응답 객체
+            model: 응답에 기록된 OpenAI 모델명
+            usage: 응답 usage에서 읽어 둔 토큰 수
             use_user_api_key: 사용자 API Key 사용 여부
             
         Returns:
@@ -59,36 +103,72 @@ class ChatService:
         if use_user_api_key:
             return 0
         try:
-            input_tokens = getattr(openai_response.usage, 'input_tokens', 0)
-            output_tokens = getattr(openai_response.usage, 'output_tokens', 0)
-            
-            cached_tokens = 0
-            if hasattr(openai_response.usage, 'input_tokens_details'):
-                input_tokens_details = openai_response.usage.input_tokens_details
-                if input_tokens_details and hasattr(input_tokens_details, 'cached_tokens'):
-                    cached_tokens = getattr(input_tokens_details, 'cached_tokens', 0)
-            
-            reasoning_tokens = 0
-            if hasattr(openai_response.usage, 'output_tokens_details'):
-                output_tokens_details = openai_response.usage.output_tokens_details
-                if output_tokens_details and hasattr(output_tokens_details, 'reasoning_tokens'):
-                    reasoning_tokens = getattr(output_tokens_details, 'reasoning_tokens', 0)
-            
             cost = LLMCostCalculator.calculate_cost(
-                model=openai_response.model,
-                input_tokens=input_tokens,
-                output_tokens=output_tokens,
-                cached_tokens=cached_tokens,
-                reasoning_tokens=reasoning_tokens
+                model=model,
+                input_tokens=usage.input_tokens,
+                output_tokens=usage.output_tokens,
+                cached_tokens=usage.cached_tokens,
+                reasoning_tokens=usage.reasoning_tokens
             )
             
-            logger.debug(f"비용 계산 완료: {cost} 밀리센트 (model: {openai_response.model}, input: {input_tokens}, output: {output_tokens}, cached: {cached_tokens}, reasoning: {reasoning_tokens})")
+            logger.debug(
+                "비용 계산 완료: %s 밀리센트 (model: %s, input: %s, output: %s, cached: %s, reasoning: %s)",
+                cost, model, usage.input_tokens, usage.output_tokens, usage.cached_tokens, usage.reasoning_tokens
+            )
             return cost
             
         except Exception as e:
             logger.warning(f"비용 계산 중 오류 발생: {str(e)}, 기본값 0 사용")
             return 0
     
+    def _record_metrics(self, model: str, ticket, response_time: float, usage: TokenUsage, cost: int, background: bool, use_user_api_key: bool) -> None:
+        """업스트림 응답의 지연/토큰/비용을 공유 메모리 메트릭에 기록 (워커 합산)"""
+        labels = {"model": model_label(model), "key_mode": key_mode_label(use_user_api_key)}
+        metrics.observe("llm_queue_wait_seconds", ticket.queue_wait, labels={"priority": ticket.priority})
+        if not background:
+            metrics.observe("llm_upstream_latency_seconds", response_time, labels={**labels, "status": "success"})
+        for token_type, count in (
+            ("input", usage.input_tokens),
+            ("output", usage.output_tokens),
+            ("cached", usage.cached_tokens),
+            ("reasoning", usage.reasoning_tokens)
+        ):
+            if count:
+                metrics.inc("llm_tokens_total", count, labels={**labels, "type": token_type})
+        if cost:
+            metrics.inc("llm_cost_millicents_total", cost, labels=labels)
+    
+    def _record_request(self, request: ChatRequest, duration: float, error: Exception = None, cancelled: bool = False, stage_timer: StageTimer = None) -> None:
+        """요청 한 건의 결과와 종단 간 처리 시간(한도 대기 + 스케줄러 대기 + 업스트림), 지나온 단계별 시간 기록"""
+        labels = {
+            "model": model_label(request.model),
+            "status": status_label(error, cancelled),
+            "key_mode": key_mode_label(bool(request.use_user_api_key and request.openai_api_key))
+        }
+        metrics.inc("llm_requests_total", labels={**labels, "error": error_label(error)})
+        metrics.observe("llm_request_duration_seconds", duration, labels=labels)
+        if stage_timer is not None:
+            stage_timer.record()
+    
+    @staticmethod
+    def _span_attributes(request: ChatRequest, tenant_id: str) -> dict:
+        """요청 스팬 공통 속성"""
+        return {
+            "llm.model": request.model,
+            "llm.key_mode": key_mode_label(bool(request.use_user_api_key and request.openai_api_key)),
+            "tenant_id": tenant_id or settings.DEFAULT_TENANT,
+            "request_id": request.request_id or None
+        }
+    
+    @staticmethod
+    def _annotate_span(span, response: ChatResponse) -> None:
+        """요청 스팬에 결과(응답 ID/토큰/비용) 기록"""
+        span.set_attribute("llm.response_id", response.id or None)
+        span.set_attribute("llm.status", response.status)
+        span.set_attribute("llm.input_tokens", response.input_tokens)
+        span.set_attribute("llm.output_tokens", response.output_tokens)
+        span.set_attribute("llm.cost_millicents", response.cost)
+    
     def _create_system_message(self, request: ChatRequest) -> dict:
         """시스템 메시지 생성"""
         return {
@@ -102,8 +182,15 @@ class ChatService:
             "content": user_prompt
         }
 
+    def build_messages(self, request: ChatRequest) -> list[dict]:
+        """요청으로부터 OpenAI 형식의 메시지 리스트 구성"""
+        system_message = self._create_system_message(request)
+        conversation_history = [item.model_dump() for item in (request.conversation_history or [])]
+        user_message = self._create_user_message(request.user_prompt)
+
+        return [system_message] + conversation_history + [user_message]
     
-    def _validate_request(self, request: ChatRequest) -> None:
+    def validate_request(self, request: ChatRequest) -> None:
         """요청 데이터 검증"""
         user_prompt = getattr(request, 'user_prompt', None)
         if not user_prompt or user_prompt.strip() == "":
@@ -126,13 +213,207 @@ class ChatService:
                 field="temperature",
                 value=str(request.temperature)
             )
+        
+        if request.priority and request.priority not in PRIORITY_CLASSES:
+            raise ValidationException(
+                message=f"priority는 {', '.join(PRIORITY_CLASSES)} 중 하나여야 합니다.",
+                field="priority",
+                value=request.priority
+            )
+    
+    def _admit(self, request: ChatRequest, messages: list[dict], upstream_key: UpstreamKey, use_user_api_key: bool, tenant_id: str, priority: str = None):
+        """
+        업스트림 호출 허가 획득
+        
+        요청 한도 확인 (추정 입력 토큰 + max_tokens 사전 차감, 응답 usage로 정산)
+        → 모델별 동시 실행 한도 (과부하 시 조기 차단)
+        → 업스트림 실행 슬롯 대기 (테넌트 공정성 + 우선순위 + 마감 시각)
+        
+        Returns:
+            tuple: (요청 한도 lease, 동시 실행 permit, 스케줄러 ticket, 추정 토큰 수)
+        """
+        estimated_tokens = estimate_tokens(messages, request.instructions) + (request.max_tokens or 0)
+        rate_limit_lease = concurrency_permit = None
+        try:
+            self.spend_tracker.check(tenant_id)
+            rate_limit_lease = self.rate_limiter.acquire(
+                api_key=upstream_key.api_key,
+                tenant_id=tenant_id,
+                model=request.model,
+                estimated_tokens=estimated_tokens
+            )
+            concurrency_permit = self.concurrency_limiter.acquire(request.model)
+            ticket = self.scheduler.acquire(
+                tenant_id=tenant_id,
+                key_id=upstream_key.key_id,
+                priority=priority or request.priority or "interactive",
+                deadline=request.deadline,
+                cost=estimated_tokens
+            )
+        except (RateLimitException, OverloadedException) as e:
+            metrics.inc("llm_requests_rejected_total", labels={
+                "model": model_label(request.model),
+                "reason": getattr(e, "scope", None) or "overloaded"
+            })
+            if rate_limit_lease:
+                rate_limit_lease.settle(0)
+            if concurrency_permit:
+                concurrency_permit.release()
+            if not use_user_api_key:
+                self.key_pool.release(upstream_key, latency=0.0, success=True)
+            raise
+        return rate_limit_lease, concurrency_permit, ticket, estimated_tokens
+    
+    def _release_failed(self, model: str, error: Exception, rate_limit_lease, concurrency_permit, upstream_key: UpstreamKey, use_user_api_key: bool, latency: float) -> None:
+        """업스트림 호출 실패 시 허가 반환 (실패한 요청은 토큰을 소비하지 않은 것으로 보고 전액 반환)"""
+        metrics.observe("llm_upstream_latency_seconds", latency, labels={
+            "model": model_label(model),
+            "key_mode": key_mode_label(use_user_api_key),
+            "status": "error"
+        })
+        rate_limit_lease.settle(0)
+        concurrency_permit.release(success=not self._is_overload_failure(error))
+        if not use_user_api_key:
+            self.key_pool.release(upstream_key, latency=latency, success=not self._is_key_failure(error))
+    
+    def _complete(
+        self,
+        request: ChatRequest,
+        openai_response: Response,
+        tenant_id: str,
+        rate_limit_lease,
+        concurrency_permit,
+        ticket,
+        upstream_key: UpstreamKey,
+        use_user_api_key: bool,
+        response_time: float,
+        estimated_tokens: int,
+        stage_timer: StageTimer,
+        background: bool = False
+    ) -> ChatResponse:
+        """업스트림 응답 정산 (요청 한도/동시 실행 한도/사용액/메트릭/키 풀) 후 ChatResponse 생성"""
+        # usage는 여기서 한 번만 읽어 정산/비용/메트릭/응답 생성에 같이 사용
+        usage = TokenUsage.from_openai_usage(openai_response.usage)
+        rate_limit_lease.settle(usage.total_tokens if openai_response.usage else estimated_tokens)
+        
+        if response_time < 0:
+            logger.warning(f"음수 응답 시간 감지: {response_time:.2f}s, 0으로 조정")
+            response_time = 0.0
+        
+        # 업스트림 지연을 동시 실행 한도에 반영 (background 폴링 시간은 제외)
+        concurrency_permit.release(
+            latency=None if background else response_time,
+            output_tokens=usage.output_tokens
+        )
+        
+        # 비용 계산
+        cost = self._calculate_cost(openai_response.model, usage, use_user_api_key)
+        
+        # 테넌트 사용액 누적 (클러스터 합계는 주기적으로 동기화)
+        self.spend_tracker.record(tenant_id, cost)
+        self._record_metrics(request.model, ticket, response_time, usage, cost, background, use_user_api_key)
+        
+        # 키 풀 헬스/사용량 반영
+        if not use_user_api_key:
+            self.key_pool.release(
+                upstream_key,
+                latency=response_time,
+                success=True,
+                input_tokens=usage.input_tokens,
+                output_tokens=usage.output_tokens,
+                cost=cost
+            )
+        stage_timer.mark("settle")
+        
+        response = ChatResponse.from_openai_response(
+            openai_response=openai_response,
+            request_id=request.request_id,
+            response_time=response_time,
+            use_user_api_key=use_user_api_key,
+            cost=cost,
+            queue_time=ticket.queue_wait,
+            usage=usage
+        )
+        stage_timer.mark("build")
+        if settings.STAGE_TIMINGS_IN_RESPONSE:
+            response.timings = stage_timer.as_millis()
+        return response
+    
+    def _complete_cancelled(
+        self,
+        request: ChatRequest,
+        messages: list[dict],
+        output_text: str,
+        tenant_id: str,
+        rate_limit_lease,
+        concurrency_permit,
+        ticket,
+        upstream_key: UpstreamKey,
+        use_user_api_key: bool,
+        response_time: float
+    ) -> ChatResponse:
+        """
+        생성 도중 취소된 스트림 정산
+        
+        취소된 응답에는 usage가 없으므로 입력은 추정치, 출력은 이미 받은 텍스트 길이로 토큰을 추정해 정산함
+        """
+        input_tokens = estimate_tokens(messages, request.instructions)
+        output_tokens = len(output_text) // CHARS_PER_TOKEN
+        rate_limit_lease.settle(input_tokens + output_tokens)
+        # 취소는 업스트림 상태와 무관하므로 지연 표본으로 쓰지 않음
+        concurrency_permit.release()
+        
+        cost = 0 if use_user_api_key else LLMCostCalculator.calculate_cost(
+            model=request.model,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens
+        )
+        self.spend_tracker.record(tenant_id, cost)
+        if cost:
+            metrics.inc("llm_cost_millicents_total", cost, labels={"model": model_label(request.model), "key_mode": key_mode_label(use_user_api_key)})
+        
+        if not use_user_api_key:
+            self.key_pool.release(
+                upstream_key,
+                latency=response_time,
+                success=True,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                cost=cost
+            )
+        
+        return ChatResponse.model_construct(
+            id="",
+            request_id=request.request_id,
+            status="cancelled",
+            model=request.model,
+            output_text=output_text,
+            input_tokens=0 if use_user_api_key else input_tokens,
+            output_tokens=0 if use_user_api_key else output_tokens,
+            total_tokens=0 if use_user_api_key else input_tokens + output_tokens,
+            cost=cost,
+            response_time=response_time,
+            queue_time=ticket.queue_wait,
+            use_user_api_key=use_user_api_key
+        )
     
-    def process_chat_request(self, request: ChatRequest) -> ChatResponse:
+    def process_chat_request(
+        self,
+        request: ChatRequest,
+        background: bool = False,
+        tenant_id: str = None,
+        priority: str = None,
+        stage_timer: StageTimer = None
+    ) -> ChatResponse:
         """
         채팅 요청을 처리하여 응답을 반환
         
         Args:
             request: 채팅 요청 데이터
+            background: Responses API background 모드 사용 여부 (비동기 작업용)
+            tenant_id: 요청 한도를 적용할 테넌트 ID (없으면 DEFAULT_TENANT)
+            priority: 스케줄러 우선순위 클래스 (없으면 request.priority, 그것도 없으면 interactive)
+            stage_timer: 단계별 시간을 기록할 StageTimer (라우트가 Server-Timing용으로 넘김, 없으면 새로 생성)
             
         Returns:
             ChatResponse: 채팅 응답 데이터
@@ -140,61 +421,92 @@ class ChatService:
         Raises:
             ChatServiceException: 채팅 서비스 처리 중 오류 발생 시
             ValidationException: 요청 데이터 검증 실패 시
+            RateLimitException: 요청 한도 초과 시
+            OverloadedException: 모델별 동시 실행 한도 초과로 차단 시
         """
+        start_time = time.perf_counter()
+        stage_timer = stage_timer or StageTimer()
+        with trace_span("chat.process", attributes=self._span_attributes(request, tenant_id)) as span:
+            try:
+                response = self._process_chat_request(request, background, tenant_id, priority, stage_timer)
+            except Exception as e:
+                self._record_request(request, time.perf_counter() - start_time, error=e, stage_timer=stage_timer)
+                raise
+            self._record_request(request, time.perf_counter() - start_time, stage_timer=stage_timer)
+            self._annotate_span(span, response)
+        return response
+    
+    def _process_chat_request(self, request: ChatRequest, background: bool, tenant_id: str, priority: str, stage_timer: StageTimer) -> ChatResponse:
+        """process_chat_request 본체 (검증 → 허가 → 업스트림 호출 → 정산)"""
         try:
-            logger.debug(f"채팅 요청 처리 시작")
-            
-            # 요청 데이터 검증
-            self._validate_request(request)
+            logger.debug("채팅 요청 처리 시작")
             
-            # 메시지 구성
-            system_message = self._create_system_message(request)
-            conversation_history = [item.model_dump() for item in (request.conversation_history or [])]
-            user_message = self._create_user_message(request.user_prompt)
-
-            # 메시지 리스트 구성
-            messages = [system_message] + conversation_history + [user_message]
+            with trace_span("chat.prepare"):
+                # 요청 데이터 검증
+                self.validate_request(request)
+                stage_timer.mark("validate")
+                
+                # 메시지 리스트 구성
+                messages = self.build_messages(request)
+                stage_timer.mark("messages")
+                
+                # API Key 선택
+                use_user_api_key = bool(request.use_user_api_key and request.openai_api_key)
+                upstream_key = self._select_api_key(request.model, request.openai_api_key, request.use_user_api_key)
+                stage_timer.mark("key_select")
             
-            # API Key 선택
-            selected_api_key = self._select_api_key(request.openai_api_key, request.use_user_api_key)
-            use_user_api_key = bool(request.use_user_api_key and request.openai_api_key)
+            # 요청 한도 → 동시 실행 한도 → 스케줄러 슬롯
+            tenant_id = tenant_id or settings.DEFAULT_TENANT
+            with trace_span("chat.admit") as span:
+                rate_limit_lease, concurrency_permit, ticket, estimated_tokens = self._admit(
+                    request, messages, upstream_key, use_user_api_key, tenant_id, priority
+                )
+                span.set_attribute("llm.queue_wait_ms", round(ticket.queue_wait * 1000, 3))
+                stage_timer.mark("admit")
             
             # 응답 시간 측정 시작
             start_time = time.perf_counter()
             
-            # OpenAI API 호출
-            openai_response = self.openai_client.generate_response(
-                messages=messages,
-                api_key=selected_api_key,
-                model=request.model,
-                instructions=request.instructions,
-                max_tokens=request.max_tokens,
-                temperature=request.temperature
-            )
-            
-            # 응답 시간 계산
-            response_time = time.perf_counter() - start_time
-            if response_time < 0:
-                logger.warning(f"음수 응답 시간 감지: {response_time:.2f}s, 0으로 조정")
-                response_time = 0.0
-            
-            # 비용 계산
-            cost = self._calculate_cost(openai_response, use_user_api_key)
+            # OpenAI API 호출 (SDK 재시도는 HTTP 시도마다 자식 스팬으로 기록)
+            try:
+                with trace_span("openai.responses.create", kind=SPAN_KIND_CLIENT, attributes={"llm.key_id": upstream_key.key_id, "llm.background": background}):
+                    openai_response = self.openai_client.generate_response(
+                        messages=messages,
+                        api_key=upstream_key.api_key,
+                        organization=upstream_key.organization,
+                        project=upstream_key.project,
+                        base_url=upstream_key.base_url,
+                        model=request.model,
+                        instructions=request.instructions,
+                        max_tokens=request.max_tokens,
+                        temperature=request.temperature,
+                        background=background,
+                        poll_interval=settings.JOB_POLL_INTERVAL,
+                        timeout=settings.JOB_TIMEOUT,
+                        cache_client=not use_user_api_key
+                    )
+            except Exception as e:
+                self._release_failed(
+                    request.model, e, rate_limit_lease, concurrency_permit,
+                    upstream_key, use_user_api_key, time.perf_counter() - start_time
+                )
+                raise
+            finally:
+                self.scheduler.release(ticket)
+                stage_timer.mark("upstream")
             
-            # 응답 생성
-            response = ChatResponse.from_openai_response(
-                openai_response=openai_response,
-                request_id=request.request_id,
-                response_time=response_time,
-                use_user_api_key=use_user_api_key,
-                cost=cost
-            )
+            # 정산(비용/사용액/메트릭) 및 응답 생성
+            with trace_span("chat.settle"):
+                response = self._complete(
+                    request, openai_response, tenant_id, rate_limit_lease, concurrency_permit, ticket,
+                    upstream_key, use_user_api_key, time.perf_counter() - start_time, estimated_tokens, stage_timer, background
+                )
             
-            logger.info(f"채팅 응답 처리 완료: {response.response_time:.2f}s (User API Key: {use_user_api_key})")
+            logger.info("채팅 응답 처리 완료: %.2fs (대기: %.2fs, User API Key: %s)", response.response_time, ticket.queue_wait, use_user_api_key)
             return response
             
-        except (ValidationException, OpenAIClientException):
-            # 검증 에러와 OpenAI 에러는 그대로 재발생
+        except (ValidationException, OpenAIClientException, RateLimitException, OverloadedException):
+            # 검증 에러, OpenAI 에러, 한도 초과, 과부하 차단은 그대로 재발생
             raise
         except Exception as e:
             error_msg = f"채팅 요청 처리 중 예상치 못한 오류: {str(e)}"
@@ -205,4 +517,149 @@ class ChatService:
                 details={"request_id": request.request_id}
             )
     
- 
\ No newline at end of file
+    def stream_chat_request(
+        self,
+        request: ChatRequest,
+        tenant_id: str = None,
+        priority: str = None,
+        cancel_event: threading.Event = None
+    ) -> Iterator[Union[str, ChatResponse]]:
+        """
+        채팅 요청을 스트리밍으로 처리 - 출력 텍스트 조각(str)을 차례로 반환하고 마지막에 ChatResponse를 반환
+        
+        process_chat_request와 같은 한도/스케줄링/정산을 거치며, 스케줄러 슬롯은 스트림이 끝날 때까지 점유함.
+        cancel_event가 설정되면 업스트림 스트림을 닫고 status="cancelled" 응답으로 정산함
+        
+        Raises:
+            process_chat_request와 동일
+        """
+        start_time = time.perf_counter()
+        stage_timer = StageTimer()
+        # yield를 가로질러 현재 스팬을 바꿀 수 없으므로(소비 측 컨텍스트가 매번 다를 수 있음) 스팬 하나로 기록
+        span = open_span("chat.stream", attributes=self._span_attributes(request, tenant_id))
+        stream = self._stream_chat_request(request, tenant_id, priority, cancel_event, stage_timer)
+        cancelled = False
+        try:
+            for item in stream:
+                if isinstance(item, ChatResponse):
+                    cancelled = item.status == "cancelled"
+                    if span is not None:
+                        self._annotate_span(span, item)
+                yield item
+        except GeneratorExit:
+            # 소비자가 중간에 닫으면 본체도 닫아 취소 정산을 바로 실행
+            stream.close()
+            self._record_request(request, time.perf_counter() - start_time, cancelled=True, stage_timer=stage_timer)
+            if span is not None:
+                span.set_attribute("llm.status", "cancelled")
+            raise
+        except Exception as e:
+            self._record_request(request, time.perf_counter() - start_time, error=e, stage_timer=stage_timer)
+            if span is not None:
+                span.set_error(e)
+            raise
+        finally:
+            if span is not None:
+                for stage, duration in stage_timer.as_millis().items():
+                    span.set_attribute(f"llm.stage.{stage}_ms", duration)
+                span.end()
+        self._record_request(request, time.perf_counter() - start_time, cancelled=cancelled, stage_timer=stage_timer)
+    
+    def _stream_chat_request(
+        self,
+        request: ChatRequest,
+        tenant_id: str,
+        priority: str,
+        cancel_event: threading.Event,
+        stage_timer: StageTimer
+    ) -> Iterator[Union[str, ChatResponse]]:
+        """stream_chat_request 본체 (upstream 단계는 첫 조각부터 스트림 종료까지, 소비자 대기 시간 포함)"""
+        try:
+            self.validate_request(request)
+            stage_timer.mark("validate")
+            messages = self.build_messages(request)
+            stage_timer.mark("messages")
+            use_user_api_key = bool(request.use_user_api_key and request.openai_api_key)
+            upstream_key = self._select_api_key(request.model, request.openai_api_key, request.use_user_api_key)
+            stage_timer.mark("key_select")
+            tenant_id = tenant_id or settings.DEFAULT_TENANT
+            rate_limit_lease, concurrency_permit, ticket, estimated_tokens = self._admit(
+                request, messages, upstream_key, use_user_api_key, tenant_id, priority
+            )
+            stage_timer.mark("admit")
+        except (ValidationException, OpenAIClientException, RateLimitException, OverloadedException):
+            raise
+        except Exception as e:
+            error_msg = f"채팅 요청 처리 중 예상치 못한 오류: {str(e)}"
+            logger.error(error_msg)
+            raise ChatServiceException(message=error_msg, error_code="CHAT_PROCESSING_ERROR", details={"request_id": request.request_id})
+        
+        start_time = time.perf_counter()
+        chunks = []
+        completed_response = None
+        events = None
+        try:
+            # 슬롯을 기다리는 동안 취소되었으면 업스트림을 호출하지 않음
+            if not (cancel_event and cancel_event.is_set()):
+                events = self.openai_client.stream_response(
+                    messages=messages,
+                    api_key=upstream_key.api_key,
+                    organization=upstream_key.organization,
+                    project=upstream_key.project,
+                    base_url=upstream_key.base_url,
+                    model=request.model,
+                    instructions=request.instructions,
+                    max_tokens=request.max_tokens,
+                    temperature=request.temperature,
+                    cache_client=not use_user_api_key
+                )
+                for event in events:
+                    if cancel_event and cancel_event.is_set():
+                        break
+                    if event.type == "response.output_text.delta":
+                        chunks.append(event.delta)
+                        yield event.delta
+                    elif event.type in ("response.completed", "response.incomplete"):
+                        completed_response = event.response
+        except GeneratorExit:
+            # 소비자가 스트림을 중간에 닫으면 취소로 정산
+            if events is not None:
+                events.close()
+            self.scheduler.release(ticket)
+            self._complete_cancelled(
+                request, messages, "".join(chunks), tenant_id, rate_limit_lease, concurrency_permit, ticket,
+                upstream_key, use_user_api_key, time.perf_counter() - start_time
+            )
+            raise
+        except Exception as e:
+            self.scheduler.release(ticket)
+            self._release_failed(
+                request.model, e, rate_limit_lease, concurrency_permit,
+                upstream_key, use_user_api_key, time.perf_counter() - start_time
+            )
+            if isinstance(e, OpenAIClientException):
+                raise
+            error_msg = f"채팅 스트리밍 처리 중 예상치 못한 오류: {str(e)}"
+            logger.error(error_msg)
+            raise ChatServiceException(message=error_msg, error_code="CHAT_PROCESSING_ERROR", details={"request_id": request.request_id})
+        
+        # 취소 시 업스트림 HTTP 스트림을 닫아 생성을 중단
+        if events is not None:
+            events.close()
+        self.scheduler.release(ticket)
+        stage_timer.mark("upstream")
+        response_time = time.perf_counter() - start_time
+        
+        if completed_response is None:
+            response = self._complete_cancelled(
+                request, messages, "".join(chunks), tenant_id, rate_limit_lease, concurrency_permit, ticket,
+                upstream_key, use_user_api_key, response_time
+            )
+            logger.info("채팅 스트림 취소: %.2fs (출력 %d자)", response_time, len(response.output_text))
+        else:
+            response = self._complete(
+                request, completed_response, tenant_id, rate_limit_lease, concurrency_permit, ticket,
+                upstream_key, use_user_api_key, response_time, estimated_tokens, stage_timer
+            )
+            logger.info("채팅 스트림 완료: %.2fs (대기: %.2fs)", response.response_time, ticket.queue_wait)
+        yield response
@@ -0,0 +1,71 @@
+import os
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+import orjson
+from src.external.upstream_probe import UpstreamProbe
+from src.utils.loop_monitor import LoopLagMonitor, loop_monitor
+from src.config.config import settings
+
+
+class HealthService:
+    """
+    liveness / readiness 판단
+
+    - liveness: 프로세스와 이벤트 루프가 응답하는지만 확인 (의존성은 보지 않음 - 실패하면 재시작 대상)
+    - readiness: 트래픽을 받아도 되는지 확인 - 서버 API Key, 키 회로(모든 키가 일시 제외되었는지),
+      이벤트 루프 지연, 스케줄러 대기열 포화, 캐시된 업스트림 확인 결과
+    - readiness 결과는 인코딩된 본문째 HEALTH_CACHE_TTL초 동안 캐시하므로 로드밸런서가 자주 폴링해도 비용이 거의 없음
+    """
+
+    def __init__(self, chat_service, probe: UpstreamProbe = None, monitor: LoopLagMonitor = None, cache_ttl: float = None):
+        self.chat_service = chat_service
+        self.probe = probe or UpstreamProbe(chat_service.key_pool)
+        self.monitor = monitor or loop_monitor
+        self.cache_ttl = settings.HEALTH_CACHE_TTL if cache_ttl is None else cache_ttl
+        self.started_at = time.time()
+        self._cached: Optional[Tuple[float, int, bytes]] = None
+
+    def liveness(self) -> Dict[str, Any]:
+        return {
+            "status": "alive",
+            "pid": os.getpid(),
+            "uptime_seconds": round(time.time() - self.started_at, 1)
+        }
+
+    def readiness(self) -> Tuple[int, bytes]:
+        """(HTTP 상태 코드, JSON 본문) - 준비되지 않았으면 503"""
+        now = time.monotonic()
+        cached = self._cached
+        if cached is not None and now - cached[0] < self.cache_ttl:
+            return cached[1], cached[2]
+
+        checks = self.checks()
+        ready = all(check["ok"] is not False for check in checks.values())
+        body = orjson.dumps({
+            "status": "ready" if ready else "not_ready",
+            "checks": checks,
+            "served_by": os.getpid(),
+            "timestamp": datetime.now().isoformat()
+        })
+        status_code = 200 if ready else 503
+        self._cached = (now, status_code, body)
+        return status_code, body
+
+    def checks(self) -> Dict[str, Dict[str, Any]]:
+        """항목별 확인 결과 (ok: True/False, 업스트림 확인 전이면 None - 실패로 보지 않음)"""
+        key_pool = self.chat_service.key_pool
+        configured = len(key_pool)
+        available = key_pool.available_count()
+        queue_ratio = self.chat_service.scheduler.queue_ratio()
+        lag = self.monitor.current_lag()
+
+        checks = {
+            "api_keys": {"ok": configured > 0 or not settings.HEALTH_REQUIRE_SERVER_KEY, "configured": configured},
+            "key_circuit": {"ok": configured == 0 or available > 0, "available": available, "ejected": configured - available},
+            "event_loop": {"ok": lag <= settings.HEALTH_MAX_LOOP_LAG, "lag_seconds": round(lag, 4)},
+            "scheduler_queue": {"ok": queue_ratio < settings.HEALTH_MAX_QUEUE_RATIO, "usage_ratio": round(queue_ratio, 3)}
+        }
+        if settings.HEALTH_PROBE_ENABLED:
+            checks["upstream"] = self.probe.state()
+        return checks
@@ -0,0 +1,239 @@
+import contextvars
+import os
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+from src.external.webhook_client import WebhookClient
+from src.models.job_dto import Job, JobRequest
+from src.services.chat_service import ChatService
+from src.utils.logger import get_logger
+from src.utils.ttl_store import TTLStore
+from src.config.config import settings
+from src.exceptions.chat_exceptions import (
+    ChatServiceException,
+    ValidationException,
+    JobNotFoundException
+)
+
+logger = get_logger(__name__)
+
+_JOB_ID_PATTERN = re.compile(r"^job_[0-9a-f]{32}$")
+
+
+class JobFileStore:
+    """
+    워커 프로세스 간에 공유되는 파일 기반 작업 저장소 (멀티 프로세스 모드용)
+
+    작업마다 {job_id}.json 파일 하나를 임시 파일 + os.replace로 원자적으로 저장하므로,
+    어느 워커가 작업을 실행하든 다른 워커의 폴링 요청에서 같은 상태를 읽을 수 있음.
+    TTLStore와 같은 인터페이스이며, TTL은 마지막 저장 시각(mtime) 기준이고
+    만료/초과 파일은 저장 시 주기적으로 정리함
+    """
+
+    PRUNE_INTERVAL = 60.0
+
+    def __init__(self, base_dir: str, max_entries: int, ttl: float):
+        self.base_dir = base_dir
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._last_pruned = 0.0
+        os.makedirs(base_dir, exist_ok=True)
+
+    def _path(self, job_id: str) -> Optional[str]:
+        # job_id는 서버에서 생성한 형식만 허용 (경로 조작 방지)
+        if not _JOB_ID_PATTERN.match(job_id or ""):
+            return None
+        return os.path.join(self.base_dir, f"{job_id}.json")
+
+    def put(self, job_id: str, job: Job) -> None:
+        """작업 저장 (기존 파일은 덮어쓰고 TTL 연장)"""
+        path = self._path(job_id)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(job.model_dump_json().encode("utf-8"))
+        os.replace(tmp_path, path)
+        if time.time() - self._last_pruned >= min(self.PRUNE_INTERVAL, self.ttl):
+            self._prune()
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """작업 조회 (없거나 만료되었으면 None)"""
+        path = self._path(job_id)
+        if path is None:
+            return None
+        try:
+            if os.path.getmtime(path) + self.ttl <= time.time():
+                os.remove(path)
+                return None
+            with open(path, "rb") as f:
+                return Job.model_validate_json(f.read())
+        except FileNotFoundError:
+            return None
+
+    def _entries(self):
+        entries = []
+        for name in os.listdir(self.base_dir):
+            if not name.endswith(".json"):
+                continue
+            try:
+                entries.append((os.path.getmtime(os.path.join(self.base_dir, name)), name))
+            except FileNotFoundError:
+                continue
+        return entries
+
+    def _prune(self) -> None:
+        """만료된 파일과, 최대 항목 수를 넘는 오래된 파일 제거"""
+        now = time.time()
+        self._last_pruned = now
+        entries = sorted(self._entries())
+        expired = [name for mtime, name in entries if mtime + self.ttl <= now]
+        overflow = [name for _, name in entries[len(expired):]][:max(0, len(entries) - len(expired) - self.max_entries)]
+        for name in expired + overflow:
+            try:
+                os.remove(os.path.join(self.base_dir, name))
+            except FileNotFoundError:
+                pass
+
+    def __len__(self) -> int:
+        now = time.time()
+        return sum(1 for mtime, _ in self._entries() if mtime + self.ttl > now)
+
+    def stats(self) -> Dict[str, Any]:
+        """저장소 상태 정보"""
+        return {"entries": len(self), "max_entries": self.max_entries, "ttl_seconds": self.ttl, "path": self.base_dir}
+
+
+class JobService:
+    """
+    장시간 실행 요청(o1/o3 계열 등)을 위한 비동기 작업 서비스
+
+    요청은 즉시 작업 ID를 반환하고, 크기가 제한된 백그라운드 스레드풀에서 실행됨.
+    background 지원 모델은 Responses API background 모드로 실행해 업스트림 연결을 오래 점유하지 않으며,
+    결과는 TTL 저장소에서 폴링하거나 HMAC 서명 웹훅으로 전달받을 수 있음
+    """
+
+    def __init__(
+        self,
+        chat_service: ChatService = None,
+        webhook_client: WebhookClient = None,
+        max_workers: int = None,
+        max_pending: int = None,
+        store=None
+    ):
+        self.chat_service = chat_service or ChatService()
+        self.webhook_client = webhook_client or WebhookClient()
+        self.max_pending = settings.JOB_MAX_PENDING if max_pending is None else max_pending
+        # 멀티 프로세스 모드에서는 폴링 요청이 작업을 실행하지 않은 워커로 갈 수 있으므로 공유 파일 저장소 사용
+        if store is not None:
+            self.store = store
+        elif settings.SERVER_WORKERS > 1:
+            self.store = JobFileStore(settings.JOB_STORE_DIR, settings.JOB_MAX_ENTRIES, settings.JOB_TTL)
+        else:
+            self.store: TTLStore[Job] = TTLStore(settings.JOB_MAX_ENTRIES, settings.JOB_TTL)
+        self.executor = ThreadPoolExecutor(
+            max_workers=settings.JOB_WORKERS if max_workers is None else max_workers,
+            thread_name_prefix="job"
+        )
+        self.background_models = frozenset(settings.JOB_BACKGROUND_MODELS)
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+
+    def _validate_webhook_url(self, webhook_url: str) -> None:
+        if not self.webhook_client.enabled:
+            raise ValidationException(
+                message="웹훅 서명 키(JOB_WEBHOOK_SECRET)가 설정되지 않아 webhook_url을 사용할 수 없습니다.",
+                field="webhook_url",
+                value=webhook_url
+            )
+        # 스킴 확인 + 호스트를 해석해 내부/예약 주소 거부 (전송 시에도 다시 확인함)
+        reason = self.webhook_client.check_url(webhook_url)
+        if reason:
+            raise ValidationException(message=reason, field="webhook_url", value=webhook_url)
+
+    def submit(self, request: JobRequest, tenant_id: str = None) -> Job:
+        """
+        비동기 작업 제출 - 검증 후 즉시 반환
+
+        Raises:
+            ValidationException: 요청 검증 실패 시
+            ChatServiceException: 대기 작업 수가 한도를 넘었을 때
+        """
+        self.chat_service.validate_request(request)
+        if request.webhook_url:
+            self._validate_webhook_url(request.webhook_url)
+
+        with self._pending_lock:
+            if self._pending >= self.max_pending:
+                raise ChatServiceException(
+                    message=f"대기 중인 작업이 너무 많습니다 (최대 {self.max_pending}개).",
+                    error_code="JOB_QUEUE_FULL"
+                )
+            self._pending += 1
+
+        job = Job(
+            job_id=f"job_{uuid.uuid4().hex}",
+            request_id=request.request_id or "",
+            model=request.model,
+            background=request.model in self.background_models
+        )
+        self.store.put(job.job_id, job)
+
+        try:
+            # 작업 로그도 제출한 요청의 request_id/테넌트로 귀속되도록 요청 컨텍스트를 복사해 실행
+            self.executor.submit(contextvars.copy_context().run, self._run, job, request, tenant_id)
+        except RuntimeError:
+            with self._pending_lock:
+                self._pending -= 1
+            raise
+
+        logger.info(f"비동기 작업 제출: {job.job_id} (model: {job.model}, background: {job.background})")
+        return job
+
+    def get_job(self, job_id: str) -> Job:
+        """
+        작업 상태 조회
+
+        Raises:
+            JobNotFoundException: 작업이 없거나 TTL이 만료되었을 때
+        """
+        job = self.store.get(job_id)
+        if job is None:
+            raise JobNotFoundException(f"존재하지 않거나 만료된 작업입니다: {job_id}", job_id=job_id)
+        return job
+
+    def _run(self, job: Job, request: JobRequest, tenant_id: str = None) -> None:
+        """워커 스레드에서 작업 실행"""
+        job.status = "in_progress"
+        job.started_at = time.time()
+        self.store.put(job.job_id, job)
+
+        try:
+            # 비동기 작업은 명시하지 않으면 background 우선순위로 스케줄링
+            job.result = self.chat_service.process_chat_request(
+                request,
+                background=job.background,
+                tenant_id=tenant_id,
+                priority=request.priority or "background"
+            )
+            job.status = "completed"
+        except Exception as e:
+            job.error = getattr(e, "message", str(e))
+            job.status = "failed"
+            logger.warning(f"비동기 작업 실패: {job.job_id} ({job.error})")
+        finally:
+            job.completed_at = time.time()
+            with self._pending_lock:
+                self._pending -= 1
+
+        # 완료된 작업은 TTL을 완료 시점부터 다시 계산
+        self.store.put(job.job_id, job)
+        logger.info(f"비동기 작업 종료: {job.job_id} (상태: {job.status}, 소요: {job.completed_at - job.started_at:.2f}s)")
+
+        if request.webhook_url:
+            self.webhook_client.send(request.webhook_url, job.model_dump(mode="json"))
+
+    def stats(self) -> dict:
+        """작업 서비스 상태 정보"""
+        return {"pending": self._pending, "max_pending": self.max_pending, "store": self.store.stats()}
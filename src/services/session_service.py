@@ -0,0 +1,96 @@
+import re
+import threading
+import time
+import uuid
+from typing import List
+from src.models.request_dto import ChatRequest, History
+from src.utils.logger import get_logger
+from src.utils.ttl_store import TTLStore
+from src.config.config import settings
+from src.exceptions.chat_exceptions import ValidationException
+
+logger = get_logger(__name__)
+
+# 서버가 발급하는 세션 ID 형식 (uuid4 128비트 → 추측 불가능한 값이 세션 기록 접근 권한 역할)
+SESSION_ID_PATTERN = re.compile(r"^sess_[0-9a-f]{32}$")
+
+
+class ChatSession:
+    """서버가 보관하는 멀티턴 대화 세션"""
+
+    __slots__ = ("session_id", "tenant_id", "history", "turns", "created_at", "lock")
+
+    def __init__(self, session_id: str, tenant_id: str = ""):
+        self.session_id = session_id
+        self.tenant_id = tenant_id
+        self.history: List[History] = []
+        self.turns = 0
+        self.created_at = time.time()
+        self.lock = threading.Lock()
+
+
+class SessionService:
+    """
+    WebSocket 채팅 세션 저장소
+
+    - 턴마다 대화 기록을 다시 보내지 않도록 서버에서 기록을 보관하고 다음 턴 요청에 채워 넣음
+    - 기록은 최근 max_history개 메시지만 유지하며, 마지막 사용 후 ttl이 지나면 만료
+    - 같은 테넌트가 같은 session_id로 다시 연결하면 (같은 워커 안에서) 기록을 이어서 사용
+    - session_id는 서버가 발급한 값만 이어서 사용 가능: 형식이 다르면 거부하고, 없거나 만료된 ID면
+      클라이언트가 보낸 값을 쓰지 않고 새 ID를 발급함 (다른 클라이언트가 정한 ID로 기록을 공유하지 않도록)
+    """
+
+    def __init__(self, max_sessions: int = None, ttl: float = None, max_history: int = None):
+        self.max_history = settings.WS_MAX_HISTORY if max_history is None else max_history
+        self.store: TTLStore[ChatSession] = TTLStore(
+            settings.WS_MAX_SESSIONS if max_sessions is None else max_sessions,
+            settings.WS_SESSION_TTL if ttl is None else ttl
+        )
+
+    def open(self, session_id: str = None, tenant_id: str = None) -> ChatSession:
+        """
+        기존 세션 조회 (테넌트별로 구분), 없거나 만료되었으면 새 ID로 새 세션 생성
+
+        Raises:
+            ValidationException: session_id가 서버 발급 형식이 아닐 때
+        """
+        if session_id and not SESSION_ID_PATTERN.match(session_id):
+            raise ValidationException(
+                message="session_id는 서버가 발급한 값(sess_...)만 사용할 수 있습니다.",
+                field="session_id",
+                value=session_id
+            )
+        tenant_id = tenant_id or ""
+        session = self.store.get((tenant_id, session_id)) if session_id else None
+        if session is None:
+            session = ChatSession(f"sess_{uuid.uuid4().hex}", tenant_id)
+            logger.debug(f"채팅 세션 생성: {session.session_id}")
+        self.store.put((tenant_id, session.session_id), session)
+        return session
+
+    def prepare(self, session: ChatSession, request: ChatRequest) -> None:
+        """요청에 대화 기록이 없으면 세션 기록을 채우고, 있으면 세션 기록을 요청 기록으로 교체"""
+        with session.lock:
+            if request.conversation_history:
+                session.history = list(request.conversation_history)[-self.max_history:]
+            else:
+                request.conversation_history = list(session.history)
+
+    def record_turn(self, session: ChatSession, user_prompt: str, output_text: str) -> None:
+        """완료된 턴을 기록에 추가 (오래된 메시지부터 잘라냄)"""
+        with session.lock:
+            session.history.append(History(role="user", content=user_prompt))
+            session.history.append(History(role="assistant", content=output_text))
+            if len(session.history) > self.max_history:
+                del session.history[:len(session.history) - self.max_history]
+            session.turns += 1
+        self.store.put((session.tenant_id, session.session_id), session)
+
+    def reset(self, session: ChatSession) -> None:
+        """세션 대화 기록 초기화"""
+        with session.lock:
+            session.history = []
+
+    def stats(self) -> dict:
+        """세션 저장소 상태 정보"""
+        return {"max_history": self.max_history, "store": self.store.stats()}
@@ -0,0 +1,228 @@
+"""
+업스트림 지연 기반 적응형 동시 실행 한도 (AIMD) 및 부하 차단
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+from src.utils.logger import get_logger
+from src.utils.metric_labels import model_label
+from src.utils.shared_metrics import metrics
+from src.config.config import settings
+from src.exceptions.chat_exceptions import OverloadedException
+
+logger = get_logger(__name__)
+
+# 지연 정규화 기준 출력 토큰 수 (출력이 긴 요청이 과부하로 오인되지 않도록)
+LATENCY_TOKENS_UNIT = 100
+
+
+class _ModelConcurrency:
+    """모델 하나의 동시 실행 한도 상태"""
+
+    __slots__ = (
+        "model", "labels", "limit", "published_limit", "in_flight", "waiters", "condition",
+        "baseline_latency", "latency_ewma", "last_decrease_at",
+        "completed", "shed_count", "decrease_count"
+    )
+
+    def __init__(self, model: str, limit: float, lock: threading.Lock):
+        self.model = model
+        self.labels = {"model": model_label(model)}
+        self.limit = limit
+        # 공유 메트릭에 반영한 한도 (정수 한도가 바뀔 때만 차이를 게이지에 더함)
+        self.published_limit = int(limit)
+        metrics.gauge_add("llm_concurrency_limit", self.published_limit, labels=self.labels)
+        self.in_flight = 0
+        self.waiters: deque = deque()
+        self.condition = threading.Condition(lock)
+        self.baseline_latency = 0.0
+        self.latency_ewma = 0.0
+        self.last_decrease_at = 0.0
+        self.completed = 0
+        self.shed_count = 0
+        self.decrease_count = 0
+
+
+class ConcurrencyPermit:
+    """동시 실행 허가 - 업스트림 호출이 끝나면 release로 결과를 반영"""
+
+    __slots__ = ("limiter", "state", "queue_wait", "_released")
+
+    def __init__(self, limiter: "AdaptiveConcurrencyLimiter", state: _ModelConcurrency, queue_wait: float):
+        self.limiter = limiter
+        self.state = state
+        self.queue_wait = queue_wait
+        self._released = False
+
+    def release(self, latency: Optional[float] = None, success: bool = True, output_tokens: int = 0) -> None:
+        """
+        허가 반환 (한 번만 적용)
+
+        Args:
+            latency: 업스트림 지연 (초), None이면 한도 조정에 반영하지 않음 (background 폴링 등)
+            success: 과부하성 실패(429/5xx/타임아웃)가 아니면 True
+            output_tokens: 출력 토큰 수 (지연 정규화용)
+        """
+        if self._released:
+            return
+        self._released = True
+        self.limiter._release(self.state, latency, success, output_tokens)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    모델별 적응형 동시 실행 한도
+
+    - 한도 조정 (AIMD): 정규화 지연이 기준 지연 × tolerance 이하이고 한도 근처까지 사용 중이면 +1/limit (창당 약 +1),
+      지연이 기준을 넘거나 과부하성 실패가 나면 × backoff_ratio (기준 지연 한 번에 최대 1회)
+    - 기준 지연: 관측 최솟값을 따라 내려가고, 위로는 천천히 따라 올라감 (업스트림 자체가 느려진 경우 대응)
+    - 부하 차단: 한도가 가득 차면 최대 queue_target 동안만 대기, 가장 오래 기다린 요청의 대기 시간이
+      이미 queue_target을 넘었으면 즉시 OverloadedException (503 + Retry-After)
+    - 한도/진행 중/차단 수는 공유 메트릭(llm_concurrency_limit, llm_inflight, llm_requests_shed_total)으로도
+      기록되어 /metrics에서 전체 워커 합산으로 조회됨
+    """
+
+    BASELINE_DRIFT = 0.01
+    EWMA_ALPHA = 0.1
+
+    def __init__(
+        self,
+        initial_limit: int = None,
+        min_limit: int = None,
+        max_limit: int = None,
+        latency_tolerance: float = None,
+        backoff_ratio: float = None,
+        queue_target: float = None,
+        adaptive: bool = None
+    ):
+        self.initial_limit = settings.CONCURRENCY_INITIAL_LIMIT if initial_limit is None else initial_limit
+        self.min_limit = settings.CONCURRENCY_MIN_LIMIT if min_limit is None else min_limit
+        self.max_limit = settings.CONCURRENCY_MAX_LIMIT if max_limit is None else max_limit
+        self.latency_tolerance = settings.CONCURRENCY_LATENCY_TOLERANCE if latency_tolerance is None else latency_tolerance
+        self.backoff_ratio = settings.CONCURRENCY_BACKOFF_RATIO if backoff_ratio is None else backoff_ratio
+        self.queue_target = settings.CONCURRENCY_QUEUE_TARGET if queue_target is None else queue_target
+        self.adaptive = settings.CONCURRENCY_ADAPTIVE if adaptive is None else adaptive
+        self._states: Dict[str, _ModelConcurrency] = {}
+        self._lock = threading.Lock()
+
+    def _get_state(self, model: str) -> _ModelConcurrency:
+        state = self._states.get(model)
+        if state is None:
+            state = self._states[model] = _ModelConcurrency(model, float(self.initial_limit), self._lock)
+        return state
+
+    def _shed(self, state: _ModelConcurrency) -> OverloadedException:
+        state.shed_count += 1
+        metrics.inc("llm_requests_shed_total", labels=state.labels)
+        return OverloadedException(
+            message=f"동시 처리 한도({int(state.limit)})에 도달했습니다 (model: {state.model}).",
+            retry_after=max(self.queue_target, min(state.latency_ewma, 30.0)),
+            model=state.model
+        )
+
+    def acquire(self, model: str) -> ConcurrencyPermit:
+        """
+        동시 실행 허가 획득 (한도가 가득 차면 최대 queue_target 동안 대기)
+
+        Raises:
+            OverloadedException: 대기 시간이 queue_target을 넘었을 때
+        """
+        with self._lock:
+            state = self._get_state(model)
+            now = time.monotonic()
+
+            if state.in_flight < int(state.limit) and not state.waiters:
+                state.in_flight += 1
+                metrics.gauge_add("llm_inflight", 1, labels=state.labels)
+                return ConcurrencyPermit(self, state, 0.0)
+
+            # 이미 대기열 지연이 목표를 넘었으면 기다리지 않고 즉시 차단
+            if state.waiters and now - state.waiters[0] > self.queue_target:
+                raise self._shed(state)
+
+            state.waiters.append(now)
+            deadline = now + self.queue_target
+            try:
+                while state.in_flight >= int(state.limit):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise self._shed(state)
+                    state.condition.wait(remaining)
+            finally:
+                state.waiters.remove(now)
+
+            state.in_flight += 1
+            metrics.gauge_add("llm_inflight", 1, labels=state.labels)
+            return ConcurrencyPermit(self, state, time.monotonic() - now)
+
+    def _release(self, state: _ModelConcurrency, latency: Optional[float], success: bool, output_tokens: int) -> None:
+        with self._lock:
+            in_flight = state.in_flight
+            state.in_flight -= 1
+            state.completed += 1
+            metrics.gauge_add("llm_inflight", -1, labels=state.labels)
+            if self.adaptive:
+                self._adjust(state, latency, success, output_tokens, in_flight)
+                self._publish_limit(state)
+            state.condition.notify()
+
+    @staticmethod
+    def _publish_limit(state: _ModelConcurrency) -> None:
+        """정수 한도가 바뀌었으면 공유 메트릭 게이지에 반영 (lock 보유 상태에서 호출)"""
+        limit = int(state.limit)
+        if limit != state.published_limit:
+            metrics.gauge_add("llm_concurrency_limit", limit - state.published_limit, labels=state.labels)
+            state.published_limit = limit
+
+    def _adjust(self, state: _ModelConcurrency, latency: Optional[float], success: bool, output_tokens: int, in_flight: int) -> None:
+        """AIMD 한도 조정 (lock 보유 상태에서 호출)"""
+        now = time.monotonic()
+
+        if latency is not None:
+            sample = latency / max(1.0, output_tokens / LATENCY_TOKENS_UNIT)
+            if state.baseline_latency == 0.0 or sample < state.baseline_latency:
+                state.baseline_latency = sample
+            else:
+                state.baseline_latency += self.BASELINE_DRIFT * (sample - state.baseline_latency)
+            state.latency_ewma = sample if state.latency_ewma == 0.0 else state.latency_ewma + self.EWMA_ALPHA * (sample - state.latency_ewma)
+            congested = sample > state.baseline_latency * self.latency_tolerance
+        else:
+            congested = False
+
+        if not success or congested:
+            # 같은 혼잡에 대해 동시에 끝난 요청들이 연달아 줄이지 않도록 기준 지연 동안 한 번만 감소
+            if now - state.last_decrease_at >= max(state.baseline_latency, 0.1):
+                previous = state.limit
+                state.limit = max(float(self.min_limit), state.limit * self.backoff_ratio)
+                state.last_decrease_at = now
+                state.decrease_count += 1
+                if int(previous) != int(state.limit):
+                    logger.info(f"동시 실행 한도 감소: {state.model} {int(previous)} -> {int(state.limit)}")
+        elif latency is not None and in_flight * 2 >= state.limit:
+            # 한도의 절반 이상을 쓰고 있을 때만 증가 (유휴 상태에서 한도가 무한정 커지지 않도록)
+            state.limit = min(float(self.max_limit), state.limit + 1.0 / state.limit)
+
+    def stats(self) -> Dict[str, Any]:
+        """모델별 한도/진행 중/대기/차단 수 (오토스케일링 지표용)"""
+        with self._lock:
+            models = {
+                model: {
+                    "limit": int(state.limit),
+                    "in_flight": state.in_flight,
+                    "waiting": len(state.waiters),
+                    "shed": state.shed_count,
+                    "completed": state.completed,
+                    "decreases": state.decrease_count,
+                    "baseline_latency": round(state.baseline_latency, 4),
+                    "latency_ewma": round(state.latency_ewma, 4)
+                }
+                for model, state in self._states.items()
+            }
+        return {
+            "adaptive": self.adaptive,
+            "in_flight": sum(model["in_flight"] for model in models.values()),
+            "shed": sum(model["shed"] for model in models.values()),
+            "models": models
+        }
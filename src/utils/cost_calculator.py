@@ -2,7 +2,7 @@
 OpenAI 모델 비용 계산 유틸리티 (고성능 최적화 버전)
 """
 
-from .model_pricing import get_model_costs, is_supported_model, get_supported_models, DEFAULT_MODEL
+from .model_pricing import get_model_costs, is_supported_model, get_supported_models, DEFAULT_MODEL, BATCH_PRICE_PERCENT
 
 
 class LLMCostCalculator:
@@ -88,6 +88,33 @@ class LLMCostCalculator:
         
         return normal_input_cost + cached_input_cost + output_cost
     
+    @classmethod
+    def calculate_batch_cost(
+        cls,
+        model: str,
+        input_tokens: int,
+        output_tokens: int,
+        cached_tokens: int = 0,
+        reasoning_tokens: int = 0
+    ) -> int:
+        """
+        Batch API 가격 기준 비용 계산
+
+        동기 호출 비용에 BATCH_PRICE_PERCENT를 적용하며, 과소 청구를 막기 위해 올림 처리
+
+        Args:
+            model: 모델명
+            input_tokens: 입력 토큰 수
+            output_tokens: 출력 토큰 수
+            cached_tokens: 캐시된 토큰 수
+            reasoning_tokens: 추론 토큰 수 (현재 미사용)
+
+        Returns:
+            int: 총 비용 (밀리센트 단위, 정수)
+        """
+        cost = cls.calculate_cost(model, input_tokens, output_tokens, cached_tokens, reasoning_tokens)
+        return (cost * BATCH_PRICE_PERCENT + 99) // 100
+    
     @classmethod
     def is_supported_model(cls, model: str) -> bool:
         """모델 지원 여부 확인 - O(1) 시간복잡도"""
@@ -0,0 +1,190 @@
+"""
+요청 시 실행하는 샘플링 CPU 프로파일러
+
+- 세션 동안 별도 스레드가 초당 rate번 sys._current_frames()로 모든 스레드의 스택을 읽어 스택별 표본 수를 셈
+  → 대상 코드에 훅을 걸지 않으므로 세션이 없을 때는 스레드도, 추적 함수도 없어 오버헤드가 0
+- 표본은 코드 객체 튜플로만 모으고 이름/파일 변환은 세션이 끝난 뒤 한 번만 수행함
+- 락/셀렉터/큐 대기처럼 알려진 대기 함수에서 멈춘 스택은 기본적으로 제외함 (include_idle로 포함)
+- 결과는 flamegraph.pl 등이 읽는 collapsed stack 텍스트 또는 speedscope JSON으로 내보냄
+- 동시 세션 수는 PROFILER_MAX_SESSIONS로 제한하며, 프로파일은 요청을 받은 워커 프로세스만 대상으로 함
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+from src.exceptions.chat_exceptions import RateLimitException
+from src.utils.logger import get_logger
+from src.config.config import settings
+
+logger = get_logger(__name__)
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+# 가장 안쪽 프레임이 이 함수들이면 CPU를 쓰지 않고 기다리는 중으로 봄 (파일 이름, 함수 이름)
+_IDLE_LEAVES = {
+    ("threading.py", "wait"),
+    ("threading.py", "_wait_for_tstate_lock"),
+    ("selectors.py", "select"),
+    ("queue.py", "get"),
+    ("socket.py", "accept"),
+    ("socket.py", "readinto"),
+    ("ssl.py", "read"),
+    ("thread.py", "_worker"),
+}
+
+_MAX_DEPTH = 128
+
+
+class ProfileResult:
+    """샘플링 결과 (스레드별 스택 표본 수)"""
+
+    def __init__(self, samples: Counter, thread_names: Dict[int, str], duration: float, rate: float, sample_count: int):
+        self.samples = samples
+        self.thread_names = thread_names
+        self.duration = duration
+        self.rate = rate
+        self.sample_count = sample_count
+        self.pid = os.getpid()
+
+    @staticmethod
+    def _frame_name(code) -> str:
+        return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+    def _thread_name(self, ident: int) -> str:
+        return self.thread_names.get(ident, f"thread-{ident}")
+
+    def collapsed(self) -> str:
+        """collapsed stack 형식 (`스레드;바깥 함수;...;안쪽 함수 표본수` 한 줄씩)"""
+        lines = []
+        for (ident, stack), count in self.samples.most_common():
+            frames = ";".join(self._frame_name(code).replace(";", ":") for code in stack)
+            lines.append(f"{self._thread_name(ident).replace(';', ':')};{frames} {count}")
+        return "\n".join(lines) + ("\n" if lines else "")
+
+    def speedscope(self) -> Dict[str, Any]:
+        """speedscope 파일 형식 (스레드마다 sampled 프로파일 하나, 가중치 단위는 초)"""
+        frames: List[Dict[str, Any]] = []
+        frame_index: Dict[Any, int] = {}
+        profiles: Dict[int, Dict[str, Any]] = {}
+        interval = 1.0 / self.rate
+        for (ident, stack), count in self.samples.items():
+            indexes = []
+            for code in stack:
+                index = frame_index.get(code)
+                if index is None:
+                    index = frame_index[code] = len(frames)
+                    frames.append({"name": code.co_name, "file": code.co_filename, "line": code.co_firstlineno})
+                indexes.append(index)
+            profile = profiles.get(ident)
+            if profile is None:
+                profile = profiles[ident] = {
+                    "type": "sampled",
+                    "name": self._thread_name(ident),
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": 0,
+                    "samples": [],
+                    "weights": []
+                }
+            profile["samples"].append(indexes)
+            profile["weights"].append(count * interval)
+            profile["endValue"] += count * interval
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": f"pid {self.pid} ({self.duration:g}s @ {self.rate:g}Hz)",
+            "exporter": "llm-server cpu_profiler",
+            "activeProfileIndex": 0,
+            "shared": {"frames": frames},
+            "profiles": sorted(profiles.values(), key=lambda profile: -profile["endValue"])
+        }
+
+
+class SamplingProfiler:
+    """모든 스레드를 주기적으로 샘플링하는 프로파일러 (세션 수 제한)"""
+
+    def __init__(self, max_sessions: int = None):
+        self.max_sessions = max_sessions or settings.PROFILER_MAX_SESSIONS
+        self._active = 0
+        self._lock = threading.Lock()
+
+    @property
+    def active_sessions(self) -> int:
+        return self._active
+
+    def _acquire(self, duration: float) -> None:
+        with self._lock:
+            if self._active >= self.max_sessions:
+                raise RateLimitException(
+                    f"이미 실행 중인 프로파일링 세션이 있습니다 (최대 {self.max_sessions}개)",
+                    retry_after=duration,
+                    scope="profiler"
+                )
+            self._active += 1
+
+    def _release(self) -> None:
+        with self._lock:
+            self._active -= 1
+
+    def profile(self, duration: float, rate: float, include_idle: bool = False) -> ProfileResult:
+        """duration초 동안 초당 rate번 샘플링 (블로킹 - 이벤트 루프에서는 스레드로 실행)"""
+        self._acquire(duration)
+        try:
+            logger.info(f"CPU 프로파일링 시작: {duration:g}s, {rate:g}Hz")
+            result = self._sample(duration, rate, include_idle)
+            logger.info(f"CPU 프로파일링 완료: 표본 {result.sample_count}회, 고유 스택 {len(result.samples)}개")
+            return result
+        finally:
+            self._release()
+
+    def _sample(self, duration: float, rate: float, include_idle: bool) -> ProfileResult:
+        samples: Counter = Counter()
+        thread_names: Dict[int, str] = {}
+        own_ident = threading.get_ident()
+        interval = 1.0 / rate
+        started = time.monotonic()
+        deadline = started + duration
+        next_at = started
+        sample_count = 0
+
+        while True:
+            now = time.monotonic()
+            if now >= deadline:
+                break
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+                stack = self._stack(frame, include_idle)
+                if stack is not None:
+                    samples[(ident, stack)] += 1
+                    if ident not in thread_names:
+                        thread_names.update((thread.ident, thread.name) for thread in threading.enumerate())
+            frame = None
+            sample_count += 1
+            # 늦어진 주기는 건너뛰고 다음 예정 시각에 맞춤 (표본 간격 일정 유지)
+            next_at += interval
+            if next_at < now:
+                next_at = now + interval
+            time.sleep(max(0.0, min(next_at, deadline) - time.monotonic()))
+
+        return ProfileResult(samples, thread_names, time.monotonic() - started, rate, sample_count)
+
+    @staticmethod
+    def _stack(frame, include_idle: bool) -> Optional[Tuple]:
+        """바깥 → 안쪽 순서의 코드 객체 튜플 (대기 중인 스택은 include_idle이 아니면 None)"""
+        codes = []
+        while frame is not None and len(codes) < _MAX_DEPTH:
+            codes.append(frame.f_code)
+            frame = frame.f_back
+        if not codes:
+            return None
+        leaf = codes[0]
+        if not include_idle and (os.path.basename(leaf.co_filename), leaf.co_name) in _IDLE_LEAVES:
+            return None
+        codes.reverse()
+        return tuple(codes)
+
+
+cpu_profiler = SamplingProfiler()
@@ -0,0 +1,237 @@
+"""
+조정 저장소 기반 클러스터 단위 토큰 버킷 리스(lease)와 테넌트 사용액 카운터
+
+레플리카마다 한도를 따로 적용하면 레플리카 수만큼 한도가 늘어나므로, 공유 저장소의 버킷에서
+토큰을 묶음(lease) 단위로 미리 받아 두고 요청 경로에서는 로컬 잔량만 차감함
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict
+from src.utils.logger import get_logger
+from src.config.config import settings
+from src.exceptions.chat_exceptions import RateLimitException
+
+if TYPE_CHECKING:
+    # rate_limiter와 같은 이유로 실행 시에는 import하지 않음 (src.external → openai_client → rate_limiter → 이 모듈)
+    from src.external.coordination_store import CoordinationStore
+
+logger = get_logger(__name__)
+
+SECONDS_PER_DAY = 86400
+
+
+class LeasedTokenBucket:
+    """
+    공유 버킷에서 토큰을 lease_size 단위로 받아 쓰는 로컬 버킷 (TokenBucket과 같은 인터페이스)
+
+    - 로컬 잔량으로 충분하면 네트워크 왕복 없이 차감
+    - 부족하면 RateLimiter가 lock을 놓은 상태에서 reserve로 부족분을 받아 온 뒤 다시 확인함
+      (저장소 왕복 동안 다른 키/테넌트의 요청이 막히지 않음)
+    - 잔량이 lease_size의 절반 아래로 내려가면 백그라운드에서 다음 묶음을 미리 받아 둠
+    - 저장소 장애 시에는 가용성을 위해 허용(fail-open)하고 경고 로그를 남김
+    """
+
+    __slots__ = ("store", "key", "capacity", "refill_rate", "lease_size", "max_wait", "tokens", "lock", "prefetcher", "_prefetching")
+
+    def __init__(
+        self,
+        store: "CoordinationStore",
+        key: str,
+        capacity: float,
+        refill_rate: float,
+        lease_size: float,
+        max_wait: float,
+        lock: threading.Lock,
+        prefetcher: ThreadPoolExecutor
+    ):
+        self.store = store
+        self.key = key
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.lease_size = lease_size
+        self.max_wait = max_wait
+        self.tokens = 0.0
+        self.lock = lock
+        self.prefetcher = prefetcher
+        self._prefetching = False
+
+    def _refill(self, now: float) -> None:
+        # 충전은 공유 저장소에서 이루어짐
+        pass
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """로컬 잔량만 사용하므로 대기 없음 (부족분은 limiter lock 밖에서 reserve로 먼저 받아 둠)"""
+        return 0.0
+
+    def shortfall(self, amount: float) -> float:
+        """amount를 차감하기 위해 공유 버킷에서 더 받아야 하는 양 (limiter lock 보유 상태에서 호출)"""
+        return max(0.0, amount - self.tokens)
+
+    def reserve(self, shortfall: float) -> float:
+        """
+        공유 버킷에서 (부족분 + lease_size)를 예약하고 필요한 대기 시간을 반환 (limiter lock 밖에서 호출)
+
+        max_wait 안에 받을 수 없으면 로컬 잔량은 그대로 두고 max_wait를 넘는 대기 시간을 반환
+        """
+        request = max(shortfall, min(shortfall + self.lease_size, self.capacity))
+        try:
+            reserved, wait = self.store.reserve(self.key, request, self.capacity, self.refill_rate, self.max_wait)
+        except Exception as e:
+            logger.warning(f"조정 저장소 예약 실패, 로컬 허용으로 대체: {self.key} ({str(e)})")
+            reserved, wait, request = True, 0.0, shortfall
+
+        if reserved:
+            with self.lock:
+                self.tokens += request
+        return wait
+
+    def take(self, amount: float) -> None:
+        self.tokens -= amount
+        if self.tokens < self.lease_size / 2 and not self._prefetching:
+            self._prefetching = True
+            self.prefetcher.submit(self._prefetch)
+
+    def refund(self, amount: float) -> None:
+        """정산으로 남은 토큰은 로컬 lease에 되돌려 다음 요청에 사용"""
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+    def _prefetch(self) -> None:
+        """다음 lease를 대기 없이 받을 수 있을 때만 미리 예약"""
+        try:
+            reserved, _ = self.store.reserve(self.key, self.lease_size, self.capacity, self.refill_rate, 0.0)
+            if reserved:
+                with self.lock:
+                    self.tokens += self.lease_size
+        except Exception as e:
+            logger.warning(f"조정 저장소 lease 선예약 실패: {self.key} ({str(e)})")
+        finally:
+            self._prefetching = False
+
+
+class SpendTracker:
+    """
+    테넌트별 일일 사용액(밀리센트) 카운터와 예산 한도
+
+    - 요청 경로에서는 로컬 미반영분만 누적하고, flush_interval마다 공유 저장소에 합산 (왕복 없음)
+    - 예산 확인은 마지막으로 동기화한 클러스터 합계 + 로컬 미반영분 기준
+    - TENANT_DAILY_BUDGETS에 테넌트 또는 "default" 예산이 있으면 초과 시 RateLimitException (0은 무제한)
+    """
+
+    def __init__(self, store: "CoordinationStore" = None, budgets: Dict[str, int] = None, flush_interval: float = None):
+        if store is None:
+            from src.external.coordination_store import LocalCoordinationStore
+            store = LocalCoordinationStore()
+        self.store = store
+        self.budgets = settings.TENANT_DAILY_BUDGETS if budgets is None else budgets
+        self.flush_interval = settings.COORDINATION_FLUSH_INTERVAL if flush_interval is None else flush_interval
+        self._pending: Dict[str, int] = {}
+        self._synced: Dict[str, int] = {}
+        # 날짜가 바뀌기 전에 반영하지 못한 사용액 (날짜 → 테넌트 → 금액, 다음 flush에서 그 날짜 키에 합산)
+        self._stale: Dict[str, Dict[str, int]] = {}
+        self._synced_day = self._day()
+        self._lock = threading.Lock()
+        self._flusher = None
+
+    @staticmethod
+    def _day() -> str:
+        return time.strftime("%Y%m%d", time.gmtime())
+
+    def _counter_key(self, day: str, tenant_id: str) -> str:
+        return f"spend:{day}:{tenant_id}"
+
+    def get_budget(self, tenant_id: str) -> int:
+        return int(self.budgets.get(tenant_id, self.budgets.get("default", 0)))
+
+    def spent(self, tenant_id: str) -> int:
+        """오늘 사용액 (클러스터 합계 + 로컬 미반영분)"""
+        with self._lock:
+            self._roll_day()
+            return self._synced.get(tenant_id, 0) + self._pending.get(tenant_id, 0)
+
+    def check(self, tenant_id: str) -> None:
+        """
+        테넌트 예산 확인
+
+        Raises:
+            RateLimitException: 오늘 사용액이 예산에 도달했을 때 (UTC 자정까지 대기)
+        """
+        budget = self.get_budget(tenant_id)
+        if budget <= 0:
+            return
+        if self.spent(tenant_id) >= budget:
+            raise RateLimitException(
+                message=f"테넌트 일일 예산을 초과했습니다 ({tenant_id}).",
+                retry_after=SECONDS_PER_DAY - time.time() % SECONDS_PER_DAY,
+                scope="tenant_budget"
+            )
+
+    def record(self, tenant_id: str, cost: int) -> None:
+        """사용액 누적 (로컬, 주기적으로 공유 저장소에 반영)"""
+        if not cost:
+            return
+        with self._lock:
+            self._roll_day()
+            self._pending[tenant_id] = self._pending.get(tenant_id, 0) + cost
+            if self._flusher is None:
+                self._flusher = threading.Thread(target=self._flush_loop, name="spend-flusher", daemon=True)
+                self._flusher.start()
+
+    def _roll_day(self) -> None:
+        """날짜가 바뀌면 로컬 합계 초기화 (lock 보유 상태에서 호출, 미반영분은 이전 날짜로 옮겨 둠)"""
+        day = self._day()
+        if day != self._synced_day:
+            self._defer(self._synced_day, self._pending)
+            self._pending = {}
+            self._synced_day = day
+            self._synced.clear()
+
+    def _defer(self, day: str, amounts: Dict[str, int]) -> None:
+        """지난 날짜의 미반영분 보관 (lock 보유 상태에서 호출)"""
+        stale = self._stale.setdefault(day, {})
+        for tenant_id, amount in amounts.items():
+            stale[tenant_id] = stale.get(tenant_id, 0) + amount
+
+    def flush(self) -> None:
+        """로컬 미반영분을 공유 저장소에 합산하고 클러스터 합계를 갱신"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            stale, self._stale = self._stale, {}
+            day = self._synced_day
+            tenants = set(self._synced) | set(pending)
+
+        for stale_day, amounts in stale.items():
+            for tenant_id, amount in amounts.items():
+                try:
+                    self.store.incr(self._counter_key(stale_day, tenant_id), amount, SECONDS_PER_DAY * 2)
+                except Exception as e:
+                    logger.warning(f"테넌트 사용액 동기화 실패: {tenant_id} ({str(e)})")
+                    with self._lock:
+                        self._defer(stale_day, {tenant_id: amount})
+
+        for tenant_id in tenants:
+            key = self._counter_key(day, tenant_id)
+            amount = pending.get(tenant_id, 0)
+            try:
+                total = self.store.incr(key, amount, SECONDS_PER_DAY * 2) if amount else self.store.get(key)
+            except Exception as e:
+                logger.warning(f"테넌트 사용액 동기화 실패: {tenant_id} ({str(e)})")
+                with self._lock:
+                    if day == self._synced_day:
+                        self._pending[tenant_id] = self._pending.get(tenant_id, 0) + amount
+                    else:
+                        self._defer(day, {tenant_id: amount})
+                continue
+            with self._lock:
+                if day == self._synced_day:
+                    self._synced[tenant_id] = total
+
+    def _flush_loop(self) -> None:
+        while True:
+            time.sleep(self.flush_interval)
+            self.flush()
+
+    def stats(self, tenant_id: str) -> Dict[str, int]:
+        """테넌트 사용액/예산 정보"""
+        return {"tenant_id": tenant_id, "spent": self.spent(tenant_id), "budget": self.get_budget(tenant_id)}
@@ -7,12 +7,13 @@ from src.exceptions.chat_exceptions import (
     ConfigurationException
 )
 from src.utils.logger import get_logger
+from src.utils.request_context import current_request_id
 
 logger = get_logger(__name__)
 
 
 class ErrorHandler:
-    """에러 처리 핸들러"""
+    """에러 처리 핸들러 (request_id를 넘기지 않으면 현재 요청 컨텍스트의 request_id 사용)"""
     
     @staticmethod
     def handle_chat_service_error(exception: ChatServiceException, request_id: str = "") -> ChatResponse:
@@ -20,7 +21,7 @@ class ErrorHandler:
         logger.error(f"채팅 서비스 에러: {exception.message} (코드: {exception.error_code})")
         
         return ChatResponse.create_error_response(
-            request_id=request_id,
+            request_id=request_id or current_request_id(),
             error_message=f"채팅 서비스 오류: {exception.message}"
         )
     
@@ -30,7 +31,7 @@ class ErrorHandler:
         logger.error(f"OpenAI 클라이언트 에러: {exception.message} (코드: {exception.error_code})")
         
         return ChatResponse.create_error_response(
-            request_id=request_id,
+            request_id=request_id or current_request_id(),
             error_message=f"AI 서비스 연결 오류: {exception.message}"
         )
     
@@ -40,7 +41,7 @@ class ErrorHandler:
         logger.error(f"검증 에러: {exception.message} (필드: {exception.field}, 값: {exception.value})")
         
         return ChatResponse.create_error_response(
-            request_id=request_id,
+            request_id=request_id or current_request_id(),
             error_message=f"입력 데이터 오류: {exception.message}"
         )
     
@@ -50,7 +51,7 @@ class ErrorHandler:
         logger.error(f"설정 에러: {exception.message} (키: {exception.config_key})")
         
         return ChatResponse.create_error_response(
-            request_id=request_id,
+            request_id=request_id or current_request_id(),
             error_message=f"시스템 설정 오류: {exception.message}"
         )
     
@@ -60,7 +61,7 @@ class ErrorHandler:
         logger.error(f"예상치 못한 에러: {str(exception)}")
         
         return ChatResponse.create_error_response(
-            request_id=request_id,
+            request_id=request_id or current_request_id(),
             error_message=f"시스템 오류가 발생했습니다: {str(exception)}"
         )
     
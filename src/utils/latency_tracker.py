@@ -0,0 +1,114 @@
+"""
+모델별 업스트림 지연 백분위수 추적 (TTFT / 생성 속도 / 전체 지연)
+
+- 모델·지표마다 고정 크기 링 버퍼 하나 (값/시각을 미리 할당한 array('d')에 덮어씀)
+  → 메모리는 (모델 수 × 지표 수 × LATENCY_SAMPLE_SIZE × 16바이트)로 고정되고, 표본 기록 시 컨테이너가 커지지 않음
+- 백분위수는 조회 시에만 계산: 창(최근 N초) 안의 표본을 골라 정렬 후 nearest-rank
+- 모델 이름은 metric_labels.model_label로 정규화하여 모델 수를 제한함
+- 워커 프로세스별 값 (공유 메모리 아님)
+"""
+
+import math
+import threading
+import time
+from array import array
+from typing import Dict, Iterable, List, Optional
+from src.utils.metric_labels import model_label
+from src.config.config import settings
+
+METRIC_TTFT = "ttft_seconds"
+METRIC_TPS = "output_tokens_per_second"
+METRIC_LATENCY = "latency_seconds"
+LATENCY_METRICS = (METRIC_TTFT, METRIC_TPS, METRIC_LATENCY)
+
+PERCENTILES = (50, 90, 99)
+
+
+class SampleRing:
+    """고정 크기 표본 링 버퍼 (가장 오래된 표본부터 덮어씀)"""
+
+    __slots__ = ("values", "times", "size", "index", "count")
+
+    def __init__(self, size: int):
+        self.values = array("d", bytes(8 * size))
+        self.times = array("d", bytes(8 * size))
+        self.size = size
+        self.index = 0
+        self.count = 0
+
+    def add(self, value: float, now: float) -> None:
+        index = self.index
+        self.values[index] = value
+        self.times[index] = now
+        self.index = index + 1 if index + 1 < self.size else 0
+        if self.count < self.size:
+            self.count += 1
+
+    def since(self, cutoff: float) -> List[float]:
+        """cutoff 이후 기록된 표본 값"""
+        values, times = self.values, self.times
+        return [values[i] for i in range(self.count) if times[i] >= cutoff]
+
+
+def percentiles(values: List[float], ranks: Iterable[int] = PERCENTILES) -> Dict[str, Optional[float]]:
+    """nearest-rank 백분위수 (표본이 없으면 None)"""
+    if not values:
+        return {f"p{rank}": None for rank in ranks}
+    ordered = sorted(values)
+    last = len(ordered) - 1
+    return {f"p{rank}": round(ordered[min(last, max(0, math.ceil(rank / 100 * len(ordered)) - 1))], 4) for rank in ranks}
+
+
+class LatencyTracker:
+    """모델별 TTFT / 출력 토큰 생성 속도 / 전체 지연 표본 저장소"""
+
+    def __init__(self, sample_size: int = None, windows: Iterable[float] = None):
+        self.sample_size = sample_size or settings.LATENCY_SAMPLE_SIZE
+        self.windows = tuple(windows or settings.LATENCY_WINDOWS)
+        self._rings: Dict[str, Dict[str, SampleRing]] = {}
+        self._lock = threading.Lock()
+
+    def _model_rings(self, model: str) -> Dict[str, SampleRing]:
+        """모델의 지표별 링 버퍼 (처음 본 모델만 할당, lock 보유 상태에서 호출)"""
+        rings = self._rings.get(model)
+        if rings is None:
+            rings = self._rings[model] = {metric: SampleRing(self.sample_size) for metric in LATENCY_METRICS}
+        return rings
+
+    def record(self, model: str, latency: float, ttft: float = None, output_tokens: int = 0, generation_time: float = None) -> None:
+        """
+        업스트림 호출 한 건 기록
+
+        Args:
+            model: 요청 모델명
+            latency: 업스트림 호출 전체 시간 (초)
+            ttft: 첫 출력 토큰까지의 시간 (초, 스트리밍만)
+            output_tokens: 출력 토큰 수
+            generation_time: 첫 토큰부터 마지막 토큰까지의 시간 (초, 스트리밍만) - 생성 속도 계산에 사용
+        """
+        now = time.monotonic()
+        with self._lock:
+            rings = self._model_rings(model_label(model))
+            rings[METRIC_LATENCY].add(latency, now)
+            if ttft is not None:
+                rings[METRIC_TTFT].add(ttft, now)
+            # 토큰 하나로는 생성 구간이 없으므로 2개 이상일 때만 속도 계산
+            if generation_time and output_tokens > 1:
+                rings[METRIC_TPS].add((output_tokens - 1) / generation_time, now)
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, dict]]]:
+        """모델 → 지표 → 창("60s") → {count, p50, p90, p99}"""
+        now = time.monotonic()
+        with self._lock:
+            samples = {
+                model: {metric: {window: ring.since(now - window) for window in self.windows} for metric, ring in rings.items()}
+                for model, rings in self._rings.items()
+            }
+        # 정렬/백분위수 계산은 lock 밖에서
+        return {
+            model: {
+                metric: {f"{window:g}s": {"count": len(values), **percentiles(values)} for window, values in by_window.items()}
+                for metric, by_window in metrics.items()
+            }
+            for model, metrics in samples.items()
+        }
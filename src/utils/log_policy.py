@@ -0,0 +1,228 @@
+"""
+로그 정책 (요청 단위 샘플링 / 로거별 토큰 버킷 / PII 마스킹)
+
+- INFO 이하 로그는 요청 단위로 샘플링함: request_id의 해시로 결정하므로 같은 요청의 로그는 모두 남거나 모두 빠짐
+  (request_id가 없는 요청은 요청마다 한 번 난수로 결정)
+- 샘플링을 통과한 로그도 로거마다 토큰 버킷(초당 LOG_RATE_PER_LOGGER줄, 최대 LOG_BURST줄)을 넘으면 버림
+- WARNING 이상은 항상 기록함
+- 버린 로그 수는 LOG_SUPPRESSION_SUMMARY_INTERVAL초마다 요약 한 줄로 남기고 log_records_suppressed_total에 누적함
+- 정책 값은 fork 전에 만든 공유 mmap에 있으므로 관리 API로 바꾸면 재시작 없이 모든 워커에 적용됨
+- PII 마스킹 패턴은 시작 시 하나의 정규식으로 컴파일하고, 마스킹은 로그 리스너 스레드에서 실행함
+"""
+
+import logging
+import mmap
+import random
+import re
+import struct
+import threading
+import time
+import zlib
+from typing import Dict, Iterable, Optional
+from src.config.config import settings
+from src.utils.request_context import get_request_context
+from src.utils.shared_metrics import metrics
+
+# 버전(q) / 샘플링 비율(d) / 로거별 초당 줄 수(d) / 버스트(d) / 프롬프트 기록 글자 수(q)
+_POLICY = struct.Struct("qdddq")
+_VERSION = struct.Struct("q")
+
+# 이름 → 패턴 (앞에 있을수록 우선, 예: 주민등록번호가 카드번호보다 먼저)
+REDACTION_PATTERNS = {
+    "email": r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}",
+    "api_key": r"\b(?:sk|pk|rk)-[A-Za-z0-9_-]{16,}|(?i:bearer)\s+[A-Za-z0-9._~+/-]{16,}=*",
+    "rrn": r"\b\d{6}-?[1-4]\d{6}\b",
+    "card": r"\b\d{4}[ -]?\d{4}[ -]?\d{4}[ -]?\d{1,7}\b",
+    "phone": r"(?:\+\d{1,3}[ -]?)?\b0?1[016789][ -]?\d{3,4}[ -]?\d{4}\b|\b0\d{1,2}-\d{3,4}-\d{4}\b",
+    "ip": r"\b(?:\d{1,3}\.){3}\d{1,3}\b",
+}
+
+
+class Redactor:
+    """PII 마스킹 (모든 패턴을 이름 있는 그룹으로 묶어 한 번에 치환)"""
+
+    def __init__(self, extra_patterns: Iterable[str] = ()):
+        groups = [f"(?P<{name}>{pattern})" for name, pattern in REDACTION_PATTERNS.items()]
+        groups += [f"(?P<custom{index}>{pattern})" for index, pattern in enumerate(extra_patterns)]
+        self.pattern = re.compile("|".join(groups))
+
+    @staticmethod
+    def _replacement(match: re.Match) -> str:
+        name = match.lastgroup
+        return "[REDACTED]" if name.startswith("custom") else f"[{name.upper()}]"
+
+    def redact(self, text: str) -> str:
+        return self.pattern.sub(self._replacement, text)
+
+
+class _Bucket:
+    """로거 하나의 토큰 버킷"""
+
+    __slots__ = ("tokens", "updated")
+
+    def __init__(self, tokens: float, updated: float):
+        self.tokens = tokens
+        self.updated = updated
+
+
+class LogPolicy:
+    """
+    로그 샘플링/한도 정책
+
+    Args:
+        sample_rate: INFO 이하 로그를 남길 요청 비율 (0.0-1.0)
+        rate_per_logger: 로거별 초당 최대 줄 수 (0이면 제한 없음)
+        burst: 토큰 버킷 크기
+        prompt_chars: 프롬프트 내용을 기록할 최대 글자 수 (0이면 길이만 기록)
+        summary_interval: 억제 요약 로그 주기 (초)
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = None,
+        rate_per_logger: float = None,
+        burst: float = None,
+        prompt_chars: int = None,
+        summary_interval: float = None
+    ):
+        # 익명 mmap은 MAP_SHARED로 생성되어 fork된 워커와 공유됨
+        self._buffer = mmap.mmap(-1, _POLICY.size)
+        self._write_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._version = -1
+        self.sample_rate = 1.0
+        self.rate_per_logger = 0.0
+        self.burst = 1.0
+        self.prompt_chars = 0
+        self.summary_interval = settings.LOG_SUPPRESSION_SUMMARY_INTERVAL if summary_interval is None else summary_interval
+        self._buckets: Dict[str, _Bucket] = {}
+        self._rate_limited: Dict[str, int] = {}
+        self._sampled_out = 0
+        self._summary_at = time.monotonic() + self.summary_interval
+        self._summary_logger = logging.getLogger(__name__)
+        self.update(
+            sample_rate=settings.LOG_SAMPLE_RATE if sample_rate is None else sample_rate,
+            rate_per_logger=settings.LOG_RATE_PER_LOGGER if rate_per_logger is None else rate_per_logger,
+            burst=settings.LOG_BURST if burst is None else burst,
+            prompt_chars=settings.LOG_PROMPT_CHARS if prompt_chars is None else prompt_chars
+        )
+
+    def update(self, sample_rate: float = None, rate_per_logger: float = None, burst: float = None, prompt_chars: int = None) -> dict:
+        """정책 변경 (주어진 값만, 모든 워커에 적용) 후 현재 정책 반환"""
+        with self._write_lock:
+            self._refresh()
+            version = max(self._version, 0)
+            values = (
+                min(1.0, max(0.0, self.sample_rate if sample_rate is None else sample_rate)),
+                max(0.0, self.rate_per_logger if rate_per_logger is None else rate_per_logger),
+                max(1.0, self.burst if burst is None else burst),
+                max(0, self.prompt_chars if prompt_chars is None else prompt_chars)
+            )
+            # 쓰는 동안 버전을 홀수로 두어 다른 워커가 반쯤 쓴 값을 읽지 않도록 함
+            _VERSION.pack_into(self._buffer, 0, version + 1)
+            _POLICY.pack_into(self._buffer, 0, version + 1, *values)
+            _VERSION.pack_into(self._buffer, 0, version + 2)
+        self._refresh()
+        return self.snapshot()
+
+    def _refresh(self) -> None:
+        """공유 메모리의 정책이 바뀌었으면 다시 읽음"""
+        version = _VERSION.unpack_from(self._buffer, 0)[0]
+        if version == self._version or version % 2:
+            return
+        _, sample_rate, rate_per_logger, burst, prompt_chars = _POLICY.unpack_from(self._buffer, 0)
+        if _VERSION.unpack_from(self._buffer, 0)[0] != version:
+            return
+        self.sample_rate, self.rate_per_logger, self.burst, self.prompt_chars = sample_rate, rate_per_logger, burst, prompt_chars
+        self._version = version
+
+    def snapshot(self) -> dict:
+        self._refresh()
+        return {
+            "sample_rate": self.sample_rate,
+            "rate_per_logger": self.rate_per_logger,
+            "burst": self.burst,
+            "prompt_chars": self.prompt_chars,
+            "summary_interval": self.summary_interval
+        }
+
+    def sampled(self, context) -> bool:
+        """요청의 INFO 이하 로그를 남길지 (같은 request_id는 항상 같은 결과)"""
+        if self.sample_rate >= 1.0:
+            return True
+        if context.request_id:
+            point = zlib.crc32(context.request_id.encode("utf-8")) / 4294967296
+        else:
+            if context.log_sample is None:
+                context.log_sample = random.random()
+            point = context.log_sample
+        return point < self.sample_rate
+
+    def _take(self, name: str, now: float) -> bool:
+        """로거의 토큰 하나 사용 (lock 보유 상태에서 호출)"""
+        bucket = self._buckets.get(name)
+        if bucket is None:
+            bucket = self._buckets[name] = _Bucket(self.burst, now)
+        bucket.tokens = min(self.burst, bucket.tokens + (now - bucket.updated) * self.rate_per_logger)
+        bucket.updated = now
+        if bucket.tokens < 1.0:
+            return False
+        bucket.tokens -= 1.0
+        return True
+
+    def allow(self, record: logging.LogRecord) -> bool:
+        """레코드를 기록할지 결정 (로그를 남기는 스레드에서 실행)"""
+        if record.levelno >= logging.WARNING:
+            return True
+        self._refresh()
+        context = get_request_context()
+        if context is not None and not self.sampled(context):
+            with self._lock:
+                self._sampled_out += 1
+            metrics.inc("log_records_suppressed_total", labels={"reason": "sampled"})
+            return False
+
+        now = time.monotonic()
+        summary = None
+        with self._lock:
+            if self.rate_per_logger > 0 and not self._take(record.name, now):
+                self._rate_limited[record.name] = self._rate_limited.get(record.name, 0) + 1
+                allowed = False
+            else:
+                allowed = True
+            if now >= self._summary_at:
+                summary = self._drain_summary(now)
+        if not allowed:
+            metrics.inc("log_records_suppressed_total", labels={"reason": "rate_limited"})
+        if summary:
+            self._summary_logger.warning(summary)
+        return allowed
+
+    def _drain_summary(self, now: float) -> Optional[str]:
+        """억제 요약 문자열 (억제된 로그가 없으면 None) - lock 보유 상태에서 호출"""
+        self._summary_at = now + self.summary_interval
+        sampled_out, rate_limited = self._sampled_out, self._rate_limited
+        self._sampled_out, self._rate_limited = 0, {}
+        if not sampled_out and not rate_limited:
+            return None
+        by_logger = ", ".join(f"{name}: {count}" for name, count in sorted(rate_limited.items(), key=lambda item: -item[1]))
+        return (
+            f"로그 억제 요약 (최근 {self.summary_interval:g}s): 샘플링 제외 {sampled_out}건, "
+            f"한도 초과 {sum(rate_limited.values())}건" + (f" ({by_logger})" if by_logger else "")
+        )
+
+
+class LogPolicyFilter(logging.Filter):
+    """LogPolicy를 적용하는 필터 (큐 핸들러에 붙여 요청 스레드에서 실행)"""
+
+    def __init__(self, policy: LogPolicy = None):
+        super().__init__()
+        self.policy = policy or log_policy
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return self.policy.allow(record)
+
+
+log_policy = LogPolicy()
+
+redactor = Redactor(settings.LOG_REDACT_PATTERNS)
@@ -1,24 +1,238 @@
+import atexit
+import glob
+import gzip
 import logging
-import sys
+import logging.handlers
 import os
-from typing import Optional
-from src.config.config import LOG_LEVEL, LOG_FILE
+import queue
+import shutil
+import sys
+import threading
+import time
+from typing import List, Optional
+import orjson
+from src.config.config import LOG_LEVEL, LOG_FILE, settings
+from src.utils.log_policy import LogPolicyFilter, Redactor, redactor
+from src.utils.request_context import RequestContextFilter
+from src.utils.shared_metrics import metrics
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    한 줄 JSON 로그 포맷터 (LOG_FORMAT=json)
+
+    요청 컨텍스트(request_id/tenant_id/trace_id)를 필드로 포함하고, 타임스탬프 문자열은 초 단위로 캐시함.
+    리스너 스레드 하나에서만 호출되므로 캐시에 잠금이 필요 없음
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._cached_second = None
+        self._cached_prefix = ""
+
+    def _timestamp(self, created: float) -> str:
+        second = int(created)
+        if second != self._cached_second:
+            self._cached_second = second
+            self._cached_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        return f"{self._cached_prefix}.{int((created - second) * 1000):03d}Z"
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": self._timestamp(record.created),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": _context_field(record, "request_id"),
+            "tenant_id": _context_field(record, "tenant_id"),
+            "trace_id": _context_field(record, "trace_id"),
+            "pid": record.process
+        }
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc_info"] = record.exc_text
+        if record.stack_info:
+            entry["stack_info"] = record.stack_info
+        return orjson.dumps(entry).decode("utf-8")
+
+
+def _context_field(record: logging.LogRecord, name: str) -> Optional[str]:
+    """RequestContextFilter가 붙인 값 (요청 밖이면 None)"""
+    value = getattr(record, name, "-")
+    return None if value == "-" else value
+
+
+class ContextQueueHandler(logging.handlers.QueueHandler):
+    """
+    요청 스레드에서는 컨텍스트 필드만 붙여 큐에 넣는 핸들러
+
+    기본 QueueHandler.prepare는 메시지를 요청 스레드에서 포맷하므로, 레코드를 그대로 넘겨
+    메시지 조립(%-포맷)/포맷팅/쓰기를 모두 리스너 스레드에서 하도록 함.
+    큐가 가득 차면 요청 스레드를 막지 않고 레코드를 버리고 개수만 셈 (log_records_dropped_total)
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            metrics.inc("log_records_dropped_total")
+
+
+class LogQueueListener(logging.handlers.QueueListener):
+    """
+    큐의 레코드를 핸들러로 넘기는 리스너 스레드
+
+    redactor가 주어지면 핸들러로 넘기기 전에 메시지를 한 번 조립해 PII를 마스킹함 (요청 스레드가 아닌 리스너에서 실행)
+    """
+
+    def __init__(self, log_queue: queue.Queue, *handlers: logging.Handler, respect_handler_level: bool = False, redactor: Redactor = None):
+        super().__init__(log_queue, *handlers, respect_handler_level=respect_handler_level)
+        self.redactor = redactor
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if self.redactor is not None:
+            try:
+                record.msg = self.redactor.redact(record.getMessage())
+                record.args = None
+            except Exception:
+                # 메시지 조립 오류는 핸들러의 handleError가 보고하도록 그대로 넘김 (리스너 스레드는 계속 실행)
+                pass
+        return record
+
+    def enqueue_sentinel(self) -> None:
+        # 기본 구현은 put_nowait이라 큐가 가득 차 있으면 queue.Full로 종료하지 못함
+        self.queue.put(self._sentinel)
+
+
+class CompressingRotatingFileHandler(logging.handlers.BaseRotatingHandler):
+    """
+    크기/시간 기준 로그 파일 교체 + gzip 압축
+
+    - 파일이 max_bytes 이상이 되거나 interval초 경계(UTC 기준)를 넘으면 app.log → app.log.20240101-000000 으로 이름을 바꿈
+    - 압축과 오래된 백업 정리(backup_count개 유지)는 별도 스레드에서 실행 (리스너 스레드도 막지 않음)
+    - 쓰기 자체가 리스너 스레드에서 실행되므로 교체는 요청 스레드에서 일어나지 않음
+    - 워커마다 핸들러가 따로 있으므로, 다른 워커가 교체한 파일은 다시 열기만 하고 중복 교체하지 않음
+    """
+
+    def __init__(self, filename: str, max_bytes: int = 0, interval: int = 0, backup_count: int = 7, compress: bool = True):
+        super().__init__(filename, "a", encoding="utf-8", delay=True)
+        self.max_bytes = max_bytes
+        self.interval = interval
+        self.backup_count = backup_count
+        self.compress = compress
+        self.rollover_at = self._next_rollover(time.time())
+
+    def _next_rollover(self, now: float) -> float:
+        return (now // self.interval + 1) * self.interval if self.interval > 0 else float("inf")
+
+    def _stream_inode(self) -> Optional[int]:
+        return os.fstat(self.stream.fileno()).st_ino if self.stream else None
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if record.created >= self.rollover_at:
+            return True
+        if self.stream is None:
+            self.stream = self._open()
+        # 다른 워커가 파일을 교체했으면 새 파일로 다시 열기 (WatchedFileHandler와 같은 방식)
+        try:
+            rotated = os.stat(self.baseFilename).st_ino != self._stream_inode()
+        except FileNotFoundError:
+            rotated = True
+        if rotated:
+            self.stream.close()
+            self.stream = self._open()
+        # 레코드 하나만큼 넘을 수 있지만 포맷을 두 번 하지 않도록 현재 크기만 확인
+        return self.max_bytes > 0 and self.stream.tell() >= self.max_bytes
+
+    def doRollover(self) -> None:
+        inode = self._stream_inode()
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        self.rollover_at = self._next_rollover(time.time())
+        try:
+            current = os.stat(self.baseFilename)
+        except FileNotFoundError:
+            return
+        # 다른 워커가 이미 교체한 파일이거나 빈 파일이면 이름을 바꾸지 않음
+        if (inode is not None and current.st_ino != inode) or current.st_size == 0:
+            return
+
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        destination = f"{self.baseFilename}.{stamp}"
+        suffix = 1
+        while os.path.exists(destination) or os.path.exists(destination + ".gz"):
+            destination = f"{self.baseFilename}.{stamp}.{suffix}"
+            suffix += 1
+        os.rename(self.baseFilename, destination)
+        threading.Thread(target=self._finish_rollover, args=(destination,), name="log-compressor", daemon=True).start()
+
+    def _finish_rollover(self, rotated: str) -> None:
+        """교체된 파일 압축 후 오래된 백업 삭제"""
+        try:
+            if self.compress:
+                with open(rotated, "rb") as source, gzip.open(rotated + ".gz", "wb") as target:
+                    shutil.copyfileobj(source, target)
+                os.remove(rotated)
+            self._prune_backups()
+        except OSError as e:
+            sys.stderr.write(f"로그 파일 압축/정리 실패: {rotated} ({str(e)})\n")
+
+    def backups(self) -> List[str]:
+        """교체된 백업 파일 (오래된 순)"""
+        return sorted(glob.glob(glob.escape(self.baseFilename) + ".*"), key=os.path.getmtime)
+
+    def _prune_backups(self) -> None:
+        if self.backup_count <= 0:
+            return
+        # 압축 중인 원본(.gz가 아닌 파일)은 다른 정리 스레드가 지우지 않도록 압축 사용 시 .gz만 대상
+        backups = [path for path in self.backups() if not self.compress or path.endswith(".gz")]
+        for path in backups[:-self.backup_count]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
 
 
 class LoggerConfig:
-    """중앙화된 로거 설정 클래스"""
+    """
+    중앙화된 로거 설정 클래스
+
+    루트 로거에는 ContextQueueHandler 하나만 붙이고, 콘솔/파일 핸들러는 QueueListener 스레드에서 실행함.
+    요청 스레드는 로그 레코드를 큐에 넣기만 하므로 stdout/디스크가 느려도 요청 처리가 막히지 않음
+    """
     
     def __init__(
         self,
         level: int = logging.INFO,
-        format_string: str = "%(asctime)s [%(levelname)s] (%(name)s) : %(message)s",
-        log_file: Optional[str] = None
+        format_string: str = "%(asctime)s [%(levelname)s] (%(name)s) [%(request_id)s] : %(message)s",
+        log_file: Optional[str] = None,
+        log_format: str = None
     ):
         self.level = level
         self.format_string = format_string
         self.log_file = log_file
+        self.log_format = (log_format or settings.LOG_FORMAT).lower()
+        self.queue_handler: Optional[ContextQueueHandler] = None
+        self.listener: Optional[LogQueueListener] = None
+        self.handlers: List[logging.Handler] = []
         self._configured = False
     
+    def _create_formatter(self) -> logging.Formatter:
+        if self.log_format == "json":
+            return JsonFormatter()
+        return logging.Formatter(self.format_string)
+    
     def configure(self):
         """로거 설정 적용"""
         if self._configured:
@@ -30,12 +244,12 @@ class LoggerConfig:
             root_logger.removeHandler(handler)
         
         # 포맷터 생성
-        formatter = logging.Formatter(self.format_string)
+        formatter = self._create_formatter()
         
         # 콘솔 핸들러
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+        self.handlers.append(console_handler)
         
         # 파일 핸들러 (선택사항)
         if self.log_file:
@@ -44,19 +258,58 @@ class LoggerConfig:
             if log_dir and not os.path.exists(log_dir):
                 os.makedirs(log_dir, exist_ok=True)
             
-            file_handler = logging.FileHandler(self.log_file, encoding='utf-8')
+            file_handler = CompressingRotatingFileHandler(
+                self.log_file,
+                max_bytes=settings.LOG_ROTATE_MAX_BYTES,
+                interval=settings.LOG_ROTATE_INTERVAL,
+                backup_count=settings.LOG_BACKUP_COUNT,
+                compress=settings.LOG_COMPRESS
+            )
             file_handler.setFormatter(formatter)
-            root_logger.addHandler(file_handler)
+            self.handlers.append(file_handler)
+        
+        # 요청 처리 중 기록된 로그에 request_id/tenant_id/trace_id 속성 추가 (contextvars이므로 요청 스레드에서 실행)
+        self.queue_handler = ContextQueueHandler(queue.Queue(settings.LOG_QUEUE_SIZE))
+        self.queue_handler.addFilter(RequestContextFilter())
+        # 요청 단위 샘플링 / 로거별 한도 (src/utils/log_policy.py)
+        self.queue_handler.addFilter(LogPolicyFilter())
+        root_logger.addHandler(self.queue_handler)
+        self._start_listener()
+        # fork된 워커에는 리스너 스레드가 없으므로 새 큐/리스너로 다시 시작
+        os.register_at_fork(after_in_child=self._restart_listener_in_child)
+        # 마스터 프로세스 종료 시 남은 로그 기록 (워커는 os._exit으로 끝나므로 앱 종료 이벤트에서 shutdown_logging 호출)
+        atexit.register(self.stop)
         
         # 루트 로거 레벨 설정
         root_logger.setLevel(self.level)
         
         self._configured = True
+    
+    def _start_listener(self) -> None:
+        self.listener = LogQueueListener(
+            self.queue_handler.queue, *self.handlers,
+            respect_handler_level=True, redactor=redactor if settings.LOG_REDACT else None
+        )
+        self.listener.start()
+    
+    def _restart_listener_in_child(self) -> None:
+        if self.listener is None or self.listener._thread is None:
+            return
+        self.queue_handler.queue = queue.Queue(settings.LOG_QUEUE_SIZE)
+        self._start_listener()
+    
+    def stop(self) -> None:
+        """큐에 남은 로그를 모두 쓰고 리스너 종료"""
+        if self.listener is not None and self.listener._thread is not None:
+            self.listener.stop()
+
+
+_logger_config: Optional[LoggerConfig] = None
 
 
 def setup_logging(
     level: int = None,
-    format_string: str = "%(asctime)s [%(levelname)s] (%(name)s) : %(message)s",
+    format_string: str = "%(asctime)s [%(levelname)s] (%(name)s) [%(request_id)s] : %(message)s",
     log_file: Optional[str] = None
 ):
     """로깅 설정"""
@@ -76,8 +329,17 @@ def setup_logging(
     if log_file is None:
         log_file = LOG_FILE
     
-    logger_config = LoggerConfig(level, format_string, log_file)
-    logger_config.configure()
+    global _logger_config
+    if _logger_config is not None:
+        _logger_config.stop()
+    _logger_config = LoggerConfig(level, format_string, log_file)
+    _logger_config.configure()
+
+
+def shutdown_logging() -> None:
+    """큐에 남은 로그를 모두 기록 (앱 종료 시 호출)"""
+    if _logger_config is not None:
+        _logger_config.stop()
 
 
 def get_logger(name: str = None) -> logging.Logger:
@@ -95,7 +357,7 @@ def setup_dev_logging():
     """개발 환경용 로깅 설정"""
     setup_logging(
         level=logging.INFO,
-        format_string="%(asctime)s [%(levelname)s] (%(name)s) : %(message)s"
+        format_string="%(asctime)s [%(levelname)s] (%(name)s) [%(request_id)s] : %(message)s"
     )
 
 
@@ -103,50 +365,34 @@ def setup_prod_logging(log_file: str = "logs/app.log"):
     """프로덕션 환경용 로깅 설정"""
     setup_logging(
         level=logging.INFO,
-        format_string="%(asctime)s [%(levelname)s] (%(name)s:%(funcName)s:%(lineno)d) : %(message)s",
+        format_string="%(asctime)s [%(levelname)s] (%(name)s:%(funcName)s:%(lineno)d) [%(request_id)s] : %(message)s",
         log_file=log_file
     ) 
 
 def get_uvicorn_custom_log():
-    """Uvicorn용 커스텀 로그 설정"""
+    """
+    Uvicorn용 커스텀 로그 설정
+
+    uvicorn 로거는 자체 핸들러 없이 루트 로거로 전파하여, 접근 로그도 같은 큐/포맷(LOG_FORMAT)으로 기록함
+    """
     return {
         "version": 1,
         "disable_existing_loggers": False,
-        "formatters": {
-            "default": {
-                "format": "%(asctime)s [%(levelname)s] (%(name)s) : %(message)s"
-            },
-            "access": {
-                "format": "%(asctime)s [%(levelname)s] (%(name)s) : %(message)s"
-            }
-        },
-        "handlers": {
-            "default": {
-                "formatter": "default",
-                "class": "logging.StreamHandler",
-                "stream": "ext://sys.stdout"
-            },
-            "access": {
-                "formatter": "access",
-                "class": "logging.StreamHandler",
-                "stream": "ext://sys.stdout"
-            }
-        },
         "loggers": {
             "uvicorn": {
-                "handlers": ["default"],
+                "handlers": [],
                 "level": "INFO",
-                "propagate": False
+                "propagate": True
             },
             "uvicorn.error": {
-                "handlers": ["default"],
+                "handlers": [],
                 "level": "INFO",
-                "propagate": False
+                "propagate": True
             },
             "uvicorn.access": {
-                "handlers": ["access"],
+                "handlers": [],
                 "level": "INFO",
-                "propagate": False
+                "propagate": True
             }
         }
-    } 
\ No newline at end of file
+    }
@@ -0,0 +1,186 @@
+"""
+이벤트 루프 지연 모니터 / 멈춤(stall) 감지
+
+- 이벤트 루프에서 EVENT_LOOP_MONITOR_INTERVAL초마다 깨어나는 태스크가 예정 시각보다 늦게 깨어난 시간(지연)을 잼
+  → 블로킹 코드가 루프를 잡고 있으면 그만큼 지연이 커짐
+- 최근 지연 표본 몇 개의 최댓값을 준비 상태(readiness) 판단에 사용하고, event_loop_lag_seconds 히스토그램에 기록함
+- 감시 스레드가 측정 태스크의 마지막 실행 시각을 확인하여, STALL_THRESHOLD초 넘게 깨어나지 못하고 있으면
+  그 순간 이벤트 루프 스레드의 스택(sys._current_frames)을 잡아 호출 위치(파일:줄)별로 횟수/멈춘 시간을 집계함
+  → 루프가 다시 돌면 측정된 지연을 그 멈춤의 지속 시간으로 기록
+- 워커 프로세스마다 앱 시작 이벤트에서 시작
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Any, Dict, List, Optional
+from src.utils.logger import get_logger
+from src.utils.shared_metrics import metrics
+from src.config.config import settings
+
+logger = get_logger(__name__)
+
+LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# 호출 위치로 고를 애플리케이션 코드 경로 (프로젝트 루트, 가상환경/표준 라이브러리 제외)
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_MAX_STACK_FRAMES = 40
+
+
+def _is_project_frame(filename: str) -> bool:
+    return filename.startswith(_PROJECT_ROOT) and "site-packages" not in filename and filename != __file__
+
+
+class StallSite:
+    """호출 위치 하나의 멈춤 집계"""
+
+    __slots__ = ("site", "count", "total_seconds", "max_seconds", "last_seen", "stack")
+
+    def __init__(self, site: str, stack: List[str]):
+        self.site = site
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.last_seen = 0.0
+        self.stack = stack
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "site": self.site,
+            "count": self.count,
+            "total_seconds": round(self.total_seconds, 4),
+            "max_seconds": round(self.max_seconds, 4),
+            "last_seen": self.last_seen,
+            "stack": self.stack
+        }
+
+
+class LoopLagMonitor:
+    """이벤트 루프 지연 측정 태스크 + 멈춤 감시 스레드"""
+
+    def __init__(self, interval: float = None, window: int = 20, stall_threshold: float = None, max_sites: int = None):
+        self.interval = interval or settings.EVENT_LOOP_MONITOR_INTERVAL
+        self.stall_threshold = settings.STALL_THRESHOLD if stall_threshold is None else stall_threshold
+        self.max_sites = max_sites or settings.STALL_MAX_SITES
+        self.recent = deque(maxlen=window)
+        self.last_lag = 0.0
+        self.last_tick = None
+        self.loop_thread_id = None
+        self._task: Optional[asyncio.Task] = None
+        self._sites: Dict[str, StallSite] = {}
+        self._lock = threading.Lock()
+        self._pending: Optional[StallSite] = None
+        self._watchdog = None
+        self._watchdog_stop = threading.Event()
+        self.dropped_sites = 0
+
+    async def start(self) -> None:
+        """현재 이벤트 루프에서 측정 태스크와 감시 스레드 시작 (앱 시작 이벤트에서 호출)"""
+        if self._task is None or self._task.done():
+            self.loop_thread_id = threading.get_ident()
+            self.last_tick = time.monotonic()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        if self.stall_threshold > 0 and (self._watchdog is None or not self._watchdog.is_alive()):
+            self._watchdog_stop.clear()
+            self._watchdog = threading.Thread(target=self._watch, name="loop-stall-watchdog", daemon=True)
+            self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._watchdog_stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            self.record(max(0.0, now - expected), now)
+
+    def record(self, lag: float, now: float) -> None:
+        self.last_lag = lag
+        self.last_tick = now
+        self.recent.append(lag)
+        metrics.observe("event_loop_lag_seconds", lag, buckets=LAG_BUCKETS)
+        # 감시 스레드가 잡은 멈춤이 끝남 → 측정된 지연을 지속 시간으로 기록
+        pending = self._pending
+        if pending is not None:
+            self._pending = None
+            with self._lock:
+                pending.total_seconds += lag
+                pending.max_seconds = max(pending.max_seconds, lag)
+
+    def current_lag(self) -> float:
+        """
+        최근 지연의 최댓값 (초)
+
+        측정 태스크 자체가 예정보다 오래 깨어나지 못하고 있으면(루프가 지금 막혀 있으면) 그 경과 시간을 반영함
+        """
+        lag = max(self.recent, default=0.0)
+        if self.last_tick is not None and self._task is not None:
+            lag = max(lag, time.monotonic() - self.last_tick - self.interval)
+        return lag
+
+    def _watch(self) -> None:
+        """측정 태스크가 stall_threshold초 넘게 깨어나지 못하면 루프 스레드의 스택을 잡음 (멈춤당 한 번)"""
+        check_interval = max(0.01, self.stall_threshold / 4)
+        captured_tick = None
+        while not self._watchdog_stop.wait(check_interval):
+            tick = self.last_tick
+            if tick is None or tick == captured_tick or self._task is None:
+                continue
+            if time.monotonic() - tick - self.interval >= self.stall_threshold:
+                captured_tick = tick
+                frame = sys._current_frames().get(self.loop_thread_id)
+                if frame is not None:
+                    self._capture(frame)
+
+    def _capture(self, frame) -> None:
+        """스택을 호출 위치별로 집계 (호출 위치: 가장 안쪽의 애플리케이션 코드 프레임, 없으면 가장 안쪽 프레임)"""
+        summary = traceback.extract_stack(frame, limit=_MAX_STACK_FRAMES)
+        del frame
+        site_frame = next((entry for entry in reversed(summary) if _is_project_frame(entry.filename)), summary[-1])
+        site = f"{os.path.relpath(site_frame.filename, _PROJECT_ROOT)}:{site_frame.lineno} ({site_frame.name})"
+        stack = [f"{entry.filename}:{entry.lineno} {entry.name}" + (f" | {entry.line}" if entry.line else "") for entry in summary]
+
+        with self._lock:
+            stall = self._sites.get(site)
+            if stall is None:
+                if len(self._sites) >= self.max_sites:
+                    self.dropped_sites += 1
+                    return
+                stall = self._sites[site] = StallSite(site, stack)
+            stall.count += 1
+            stall.last_seen = time.time()
+            stall.stack = stack
+        self._pending = stall
+        metrics.inc("event_loop_stalls_total")
+        logger.warning(f"이벤트 루프 멈춤 감지 ({self.stall_threshold:g}s 이상): {site}")
+
+    def stalls(self) -> List[Dict[str, Any]]:
+        """호출 위치별 멈춤 집계 (횟수 많은 순)"""
+        with self._lock:
+            sites = [stall.to_dict() for stall in self._sites.values()]
+        return sorted(sites, key=lambda site: (-site["count"], -site["total_seconds"]))
+
+    def reset_stalls(self) -> None:
+        with self._lock:
+            self._sites = {}
+            self.dropped_sites = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "interval": self.interval,
+            "last_lag": round(self.last_lag, 4),
+            "max_recent_lag": round(self.current_lag(), 4),
+            "stall_threshold": self.stall_threshold
+        }
+
+
+loop_monitor = LoopLagMonitor()
@@ -0,0 +1,267 @@
+"""
+메모리 할당 프로파일링 (tracemalloc)
+
+- 관리 API로 tracemalloc을 시작/중지하고, 시작 시점(또는 마지막 기준점)의 스냅샷과 현재 스냅샷을 비교해
+  늘어난 할당 위치를 파일:줄 단위로 보여줌 → 워커 RSS가 서서히 늘 때 어디서 쌓이는지 확인
+  * 스냅샷은 비용이 크므로 기준점 하나만 보관하고, 한 번에 하나씩만 찍음
+  * 켜져 있는 동안 모든 할당이 느려지므로 MEMORY_TRACE_MAX_SECONDS가 지나면 자동으로 중지함
+    (멀티 프로세스 모드에서 중지 요청이 다른 워커로 가도 추적이 무기한 남지 않음)
+  * tracemalloc 자체와 import 기계의 할당은 결과에서 제외
+- 요청별 할당 표본 (MEMORY_REQUEST_SAMPLE_RATE > 0)
+  * 표본으로 뽑힌 요청을 처리하는 동안만 tracemalloc을 켜고(traceback 1프레임), 끝나면 다시 끔
+  * 요청 처리 중 추적된 메모리의 최고점(peak)과 처리 후 남은 양(retained)을 요청 크기/대화 기록 수와 함께 기록
+  * 동시에 하나의 요청만 측정하므로 오버헤드는 표본 비율과 요청 하나의 처리 시간으로 제한됨
+  * 관리 API 추적 중에는 표본을 뽑지 않음 (측정마다 reset_peak를 호출하므로 /memory의 peak_bytes가 초기화됨)
+  * tracemalloc은 프로세스 전체를 추적하므로, 같은 시간에 처리 중인 다른 요청의 할당도 섞일 수 있음 (근사치)
+- 값은 워커 프로세스별
+"""
+
+import os
+import random
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+from src.exceptions.chat_exceptions import ValidationException
+from src.utils.logger import get_logger
+from src.utils.shared_metrics import metrics
+from src.config.config import settings
+
+logger = get_logger(__name__)
+
+GROUP_BY = ("lineno", "filename", "traceback")
+ALLOC_BUCKETS = (16e3, 64e3, 256e3, 1e6, 4e6, 16e6, 64e6, 256e6)
+# 요청 크기 구간별 집계 경계 (바이트)
+REQUEST_SIZE_BUCKETS = (1024, 10 * 1024, 100 * 1024, 1024 * 1024)
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def _frame_site(frame) -> str:
+    filename = frame.filename
+    if filename.startswith(_PROJECT_ROOT + os.sep):
+        filename = os.path.relpath(filename, _PROJECT_ROOT)
+    return f"{filename}:{frame.lineno}"
+
+
+class MemoryProfiler:
+    """관리 API용 tracemalloc 세션 (기준점 스냅샷 하나와 비교)"""
+
+    def __init__(self, max_seconds: float = None):
+        self.max_seconds = settings.MEMORY_TRACE_MAX_SECONDS if max_seconds is None else max_seconds
+        self.active = False
+        self.started_at: Optional[float] = None
+        self.expires_at: Optional[float] = None
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+        self._baseline_at: Optional[float] = None
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+    def start(self, frames: int = None) -> Dict[str, Any]:
+        """
+        tracemalloc 시작 후 기준점 스냅샷 (이미 실행 중이면 기준점만 새로 찍음)
+
+        max_seconds 뒤 자동 중지되며, 다시 호출하면 그 시점부터 다시 계산함
+        """
+        frames = frames or settings.MEMORY_TRACE_FRAMES
+        with self._lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(frames)
+            if not self.active:
+                self.active = True
+                self.started_at = time.time()
+            self._rebase()
+            self._schedule_stop()
+        logger.warning(f"메모리 할당 추적 시작 (traceback {tracemalloc.get_traceback_limit()}프레임, 최대 {self.max_seconds:g}s)")
+        return self.status()
+
+    def _schedule_stop(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+        timer = threading.Timer(self.max_seconds, self._expire)
+        timer.daemon = True
+        timer.name = "memory-trace-timeout"
+        self._timer = timer
+        self.expires_at = time.time() + self.max_seconds
+        timer.start()
+
+    def _expire(self) -> None:
+        if self._stop(timer=threading.current_thread()):
+            logger.warning(f"메모리 할당 추적 시간 초과 ({self.max_seconds:g}s) - 자동 중지")
+
+    def stop(self) -> Dict[str, Any]:
+        """tracemalloc 중지 (추적 정보와 기준점 해제)"""
+        self._stop()
+        logger.warning("메모리 할당 추적 중지")
+        return self.status()
+
+    def _stop(self, timer: threading.Thread = None) -> bool:
+        with self._lock:
+            # 만료 타이머가 호출했는데 그 사이 다시 시작되어 새 타이머가 잡혔으면 중지하지 않음
+            if timer is not None and self._timer is not timer:
+                return False
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self.active = False
+            self.started_at = None
+            self.expires_at = None
+            self._baseline = None
+            self._baseline_at = None
+            if tracemalloc.is_tracing():
+                tracemalloc.stop()
+        return True
+
+    def status(self) -> Dict[str, Any]:
+        tracing = tracemalloc.is_tracing()
+        traced, peak = tracemalloc.get_traced_memory() if tracing else (0, 0)
+        return {
+            "pid": os.getpid(),
+            "active": self.active,
+            "tracing": tracing,
+            "frames": tracemalloc.get_traceback_limit() if tracing else None,
+            "started_at": self.started_at,
+            "expires_at": self.expires_at,
+            "baseline_at": self._baseline_at,
+            "traced_bytes": traced,
+            "peak_bytes": peak,
+            "tracemalloc_overhead_bytes": tracemalloc.get_tracemalloc_memory() if tracing else 0
+        }
+
+    def _rebase(self, snapshot: tracemalloc.Snapshot = None) -> None:
+        self._baseline = snapshot or tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+        self._baseline_at = time.time()
+
+    def snapshot(self, limit: int = None, group_by: str = "lineno", compare: bool = True, rebase: bool = False) -> Dict[str, Any]:
+        """
+        현재 할당 위치 상위 limit개 (블로킹 - 이벤트 루프에서는 스레드로 실행)
+
+        compare면 기준점 대비 늘어난 크기 순, 아니면 현재 크기 순이며, rebase면 이번 스냅샷을 새 기준점으로 삼음
+        """
+        if group_by not in GROUP_BY:
+            raise ValidationException(f"group_by는 {', '.join(GROUP_BY)} 중 하나여야 합니다", "group_by", group_by)
+        limit = limit or settings.MEMORY_TOP_LIMIT
+        with self._lock:
+            if not self.active or not tracemalloc.is_tracing():
+                raise ValidationException("메모리 할당 추적이 실행 중이 아닙니다 (POST /api/v1/admin/memory/start)", "memory", "stopped")
+            snapshot = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+            baseline, baseline_at = self._baseline, self._baseline_at
+            if compare and baseline is not None:
+                stats = snapshot.compare_to(baseline, group_by)
+            else:
+                stats = snapshot.statistics(group_by)
+                baseline_at = None
+            if rebase:
+                self._rebase(snapshot)
+
+        top = []
+        for stat in stats[:limit]:
+            entry = {
+                "site": _frame_site(stat.traceback[0]),
+                "size_bytes": stat.size,
+                "count": stat.count,
+                "size_diff_bytes": getattr(stat, "size_diff", None),
+                "count_diff": getattr(stat, "count_diff", None)
+            }
+            if group_by == "traceback":
+                entry["traceback"] = [_frame_site(frame) for frame in stat.traceback]
+            top.append(entry)
+        return {
+            **self.status(),
+            "group_by": group_by,
+            "compared_to": baseline_at,
+            "total_bytes": sum(stat.size for stat in stats),
+            "top": top
+        }
+
+
+class RequestAllocationSampler:
+    """표본 요청 처리 중의 메모리 할당량 측정 (동시에 하나씩)"""
+
+    def __init__(self, profiler: MemoryProfiler, sample_rate: float = None, history_size: int = None):
+        self.profiler = profiler
+        self.sample_rate = settings.MEMORY_REQUEST_SAMPLE_RATE if sample_rate is None else sample_rate
+        self.records = deque(maxlen=history_size or settings.MEMORY_REQUEST_HISTORY)
+        self._window = threading.Lock()
+
+    @contextmanager
+    def measure(self, request_bytes: int, history_messages: int = 0):
+        """표본으로 뽑히면 블록 실행 동안의 할당을 측정 (아니면, 또는 관리 API 추적 중이면 아무것도 하지 않음)"""
+        if (
+            not self.sample_rate or self.profiler.active
+            or random.random() >= self.sample_rate or not self._window.acquire(blocking=False)
+        ):
+            yield
+            return
+        started_here = False
+        try:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(1)
+                started_here = True
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            started = time.perf_counter()
+            try:
+                yield
+            finally:
+                self._record(before, started, request_bytes, history_messages)
+        finally:
+            if started_here and not self.profiler.active and tracemalloc.is_tracing():
+                tracemalloc.stop()
+            self._window.release()
+
+    def _record(self, before: int, started: float, request_bytes: int, history_messages: int) -> None:
+        # 측정 중에 관리 API가 추적을 중지했으면 버림
+        if not tracemalloc.is_tracing():
+            return
+        current, peak = tracemalloc.get_traced_memory()
+        peak_bytes = max(0, peak - before)
+        self.records.append({
+            "timestamp": time.time(),
+            "request_bytes": request_bytes,
+            "history_messages": history_messages,
+            "peak_bytes": peak_bytes,
+            "retained_bytes": current - before,
+            "duration": round(time.perf_counter() - started, 4)
+        })
+        metrics.observe("llm_request_alloc_peak_bytes", peak_bytes, buckets=ALLOC_BUCKETS)
+
+    def summary(self) -> Dict[str, Any]:
+        """표본 요약 - 요청 크기 구간별 평균 최고 할당량과, 요청 1바이트당 할당 바이트"""
+        records = list(self.records)
+        buckets: List[Dict[str, Any]] = []
+        bounds = REQUEST_SIZE_BUCKETS + (None,)
+        lower = 0
+        for upper in bounds:
+            group = [record for record in records if record["request_bytes"] >= lower and (upper is None or record["request_bytes"] < upper)]
+            if group:
+                buckets.append({
+                    "request_bytes_min": lower,
+                    "request_bytes_max": upper,
+                    "samples": len(group),
+                    "avg_peak_bytes": round(sum(record["peak_bytes"] for record in group) / len(group)),
+                    "max_peak_bytes": max(record["peak_bytes"] for record in group),
+                    "avg_retained_bytes": round(sum(record["retained_bytes"] for record in group) / len(group))
+                })
+            lower = upper
+        total_request_bytes = sum(record["request_bytes"] for record in records)
+        return {
+            "pid": os.getpid(),
+            "sample_rate": self.sample_rate,
+            "samples": len(records),
+            "peak_bytes_per_request_byte": round(sum(record["peak_bytes"] for record in records) / total_request_bytes, 2) if total_request_bytes else None,
+            "by_request_size": buckets,
+            "recent": records[-20:]
+        }
+
+
+memory_profiler = MemoryProfiler()
+allocation_sampler = RequestAllocationSampler(memory_profiler)
@@ -0,0 +1,65 @@
+"""
+메트릭 라벨 값 정규화
+
+라벨 값은 요청 입력(모델명, 오류 내용)에서 오므로, 고정된 값 집합으로 바꿔 시리즈 수를 제한함
+"""
+
+from typing import Optional
+from src.utils.cost_calculator import LLMCostCalculator
+from src.exceptions.chat_exceptions import (
+    ChatServiceException,
+    OpenAIClientException,
+    ValidationException,
+    ConfigurationException,
+    RateLimitException,
+    OverloadedException
+)
+
+OTHER = "other"
+
+
+def model_label(model: Optional[str]) -> str:
+    """가격표에 있는 모델만 그대로, 나머지는 other"""
+    return model if model and LLMCostCalculator.is_supported_model(model) else OTHER
+
+
+def key_mode_label(use_user_api_key: bool) -> str:
+    """서버 키 풀(server) / 사용자 키(user)"""
+    return "user" if use_user_api_key else "server"
+
+
+def error_label(error: Optional[Exception]) -> str:
+    """예외를 고정된 오류 분류로 변환 (없으면 none)"""
+    if error is None:
+        return "none"
+    if isinstance(error, RateLimitException):
+        return "rate_limited"
+    if isinstance(error, OverloadedException):
+        return "overloaded"
+    if isinstance(error, ValidationException):
+        return "validation"
+    if isinstance(error, ConfigurationException):
+        return "configuration"
+    if isinstance(error, OpenAIClientException):
+        if error.error_code != "OPENAI_API_ERROR":
+            return "upstream_other"
+        status_code = error.details.get("status_code")
+        if status_code is None:
+            return "upstream_connection"
+        if status_code == 429:
+            return "upstream_429"
+        return "upstream_5xx" if status_code >= 500 else "upstream_4xx"
+    if isinstance(error, ChatServiceException):
+        return "service"
+    return "internal"
+
+
+def status_label(error: Optional[Exception], cancelled: bool = False) -> str:
+    """요청 결과 분류 (success / cancelled / rejected / error)"""
+    if cancelled:
+        return "cancelled"
+    if error is None:
+        return "success"
+    if isinstance(error, (RateLimitException, OverloadedException)):
+        return "rejected"
+    return "error"
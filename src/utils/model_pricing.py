@@ -39,6 +39,9 @@ MODEL_PRICES_USD = {
 # 기본 모델
 DEFAULT_MODEL = "gpt-4o-mini"
 
+# Batch API 가격 비율 (백분율, 동기 호출 대비 50% 할인)
+BATCH_PRICE_PERCENT = 50
+
 # 성능 최적화를 위한 미리 계산된 토큰당 비용 (밀리센트 단위, 정수)
 # 계산 공식: 달러 * 100,000 (밀리센트 변환) / 1,000,000 (토큰 단위)
 def _calculate_millicent_per_token(usd_per_million_tokens: float) -> int:
@@ -0,0 +1,90 @@
+"""
+Prometheus 텍스트 노출 형식(0.0.4) 렌더링
+
+공유 메모리 메트릭의 모든 워커 합산 값을 메트릭 패밀리별로 묶어 # HELP / # TYPE과 함께 출력함.
+이름이 <패밀리>_bucket인 시리즈가 있으면 <패밀리>_bucket/_sum/_count를 histogram 하나로 묶음
+"""
+
+import math
+import re
+from typing import Dict, List, Tuple
+from src.utils.shared_metrics import KIND_GAUGE, KIND_GAUGE_LATEST, SharedMetrics
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+METRIC_HELP = {
+    "http_requests_total": "HTTP 요청 수 (method, 라우트 path, status)",
+    "http_request_duration_seconds": "HTTP 요청 처리 시간 (초)",
+    "http_requests_in_flight": "처리 중인 HTTP 요청 수",
+    "ws_connections": "열린 WebSocket 연결 수",
+    "llm_requests_total": "LLM 요청 수 (model, status, error, key_mode)",
+    "llm_requests_rejected_total": "요청 한도/과부하로 거부된 LLM 요청 수",
+    "llm_request_duration_seconds": "LLM 요청 종단 간 처리 시간 (한도 대기 + 스케줄러 대기 + 업스트림, 초)",
+    "llm_upstream_latency_seconds": "업스트림(OpenAI) 호출 시간 (초)",
+    "llm_queue_wait_seconds": "스케줄러 대기 시간 (초)",
+    "llm_stage_duration_seconds": "요청 처리 단계별 시간 (stage: parse, validate, messages, key_select, admit, upstream, settle, build, serialize, 초)",
+    "llm_tokens_total": "토큰 사용량 (type: input, output, cached, reasoning)",
+    "llm_cost_millicents_total": "계산된 비용 (밀리센트)",
+    "llm_concurrency_limit": "모델별 적응형 동시 실행 한도 (워커 합산)",
+    "llm_inflight": "모델별 진행 중인 업스트림 호출 수",
+    "llm_requests_shed_total": "동시 실행 한도 대기 목표를 넘겨 차단된 요청 수",
+    "llm_upstream_remaining_requests": "업스트림 응답 헤더의 남은 요청 수 (key_id, model, 가장 최근 관측값)",
+    "llm_upstream_remaining_tokens": "업스트림 응답 헤더의 남은 토큰 수 (key_id, model, 가장 최근 관측값)",
+    "event_loop_lag_seconds": "이벤트 루프가 예정보다 늦게 깨어난 시간 (초)",
+    "llm_request_alloc_peak_bytes": "표본 요청 처리 중 추적된 메모리 최고 증가량 (바이트, MEMORY_REQUEST_SAMPLE_RATE)",
+    "event_loop_stalls_total": "STALL_THRESHOLD를 넘겨 스택을 기록한 이벤트 루프 멈춤 수",
+    "log_records_dropped_total": "로그 큐가 가득 차서 버린 로그 레코드 수",
+    "log_records_suppressed_total": "로그 정책으로 버린 INFO 이하 로그 레코드 수 (reason: sampled, rate_limited)",
+}
+
+_HISTOGRAM_SUFFIXES = ("_bucket", "_sum", "_count")
+_LE_PATTERN = re.compile(r'le="([^"]*)"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def _sort_key(series: str, family: str) -> Tuple[str, int, float]:
+    """같은 라벨 집합끼리 모으고, 히스토그램은 버킷(le 오름차순) → _sum → _count 순서로 정렬"""
+    name, _, labels = series.partition("{")
+    suffix_rank = _HISTOGRAM_SUFFIXES.index(name[len(family):]) if name != family else 0
+    le = _LE_PATTERN.search(labels)
+    bound = math.inf if le is None or le.group(1) == "+Inf" else float(le.group(1))
+    # le를 뺀 나머지 라벨이 같으면 같은 그룹 (_sum/_count에는 le가 없음)
+    group = _LE_PATTERN.sub("", labels).rstrip("}").replace(",,", ",").strip(",")
+    return group, suffix_rank, bound
+
+
+def render(shared_metrics: SharedMetrics) -> str:
+    """모든 워커 합산 메트릭을 Prometheus 텍스트 형식으로 변환"""
+    collected = shared_metrics.collect()
+
+    histograms = set()
+    for series in collected:
+        name = series.partition("{")[0]
+        if name.endswith("_bucket"):
+            histograms.add(name[:-len("_bucket")])
+
+    families: Dict[str, List[str]] = {}
+    types: Dict[str, str] = {}
+    for series, (kind, _) in collected.items():
+        name = series.partition("{")[0]
+        family = name
+        for suffix in _HISTOGRAM_SUFFIXES:
+            if name.endswith(suffix) and name[:-len(suffix)] in histograms:
+                family = name[:-len(suffix)]
+                break
+        families.setdefault(family, []).append(series)
+        types[family] = "histogram" if family in histograms else ("gauge" if kind in (KIND_GAUGE, KIND_GAUGE_LATEST) else "counter")
+
+    lines = []
+    for family in sorted(families):
+        if family in METRIC_HELP:
+            lines.append(f"# HELP {family} {METRIC_HELP[family]}")
+        lines.append(f"# TYPE {family} {types[family]}")
+        for series in sorted(families[family], key=lambda series: _sort_key(series, family)):
+            lines.append(f"{series} {_format_value(collected[series][1])}")
+    return "\n".join(lines) + "\n"
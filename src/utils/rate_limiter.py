@@ -0,0 +1,249 @@
+"""
+API Key/테넌트별 RPM/TPM 토큰 버킷 레이트 리미터
+"""
+
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from src.utils.distributed_quota import LeasedTokenBucket
+from src.utils.logger import get_logger
+from src.utils.ttl_store import TTLStore
+from src.config.config import settings
+from src.exceptions.chat_exceptions import RateLimitException
+
+if TYPE_CHECKING:
+    # src.external 패키지는 openai_client를 통해 이 모듈을 import하므로 실행 시에는 import하지 않음 (순환 import)
+    from src.external.coordination_store import CoordinationStore
+
+logger = get_logger(__name__)
+
+# 평균적으로 토큰 1개 ≈ 4글자 (영문 기준, 보수적 사전 차감용 추정치)
+CHARS_PER_TOKEN = 4
+
+# 메시지마다 붙는 역할/구분자 토큰 추정치
+TOKENS_PER_MESSAGE = 4
+
+LIMIT_NAMES = ("key_rpm", "key_tpm", "tenant_rpm", "tenant_tpm")
+
+
+def estimate_tokens(messages: List[dict], instructions: str = "") -> int:
+    """메시지 리스트의 입력 토큰 수 추정 (문자 수 기반)"""
+    chars = len(instructions or "")
+    for message in messages:
+        chars += len(message.get("content") or "")
+    return chars // CHARS_PER_TOKEN + TOKENS_PER_MESSAGE * len(messages)
+
+
+def key_fingerprint(api_key: str) -> str:
+    """API Key 식별자 (원본 키를 메모리/로그에 남기지 않기 위한 해시)"""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:12]
+
+
+class TokenBucket:
+    """
+    예약(reservation) 방식 토큰 버킷
+
+    토큰이 부족해도 즉시 차감(음수 허용)하고 필요한 대기 시간을 돌려줌.
+    대기 중인 요청들이 도착 순서대로 미래 용량을 나눠 갖게 되어 별도의 대기열 자료구조가 필요 없음
+    """
+
+    __slots__ = ("capacity", "refill_rate", "tokens", "updated_at")
+
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+            self.updated_at = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """amount만큼 차감했을 때 잔량이 0 이상이 되기까지 필요한 대기 시간 (초)"""
+        self._refill(now)
+        deficit = amount - self.tokens
+        return deficit / self.refill_rate if deficit > 0 else 0.0
+
+    def take(self, amount: float) -> None:
+        self.tokens -= amount
+
+    def refund(self, amount: float) -> None:
+        """차감분 반환 (음수면 추가 차감)"""
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+
+class RateLimitLease:
+    """사전 차감된 토큰 정보 - 실제 사용량으로 정산(settle)할 때 사용"""
+
+    __slots__ = ("limiter", "token_charges", "wait_time", "_settled")
+
+    def __init__(self, limiter: "RateLimiter", token_charges: List[Tuple[TokenBucket, int]], wait_time: float):
+        self.limiter = limiter
+        self.token_charges = token_charges
+        self.wait_time = wait_time
+        self._settled = False
+
+    def settle(self, actual_tokens: int) -> None:
+        """실제 사용 토큰으로 정산 - 남은 차감분 반환 또는 초과분 추가 차감 (한 번만 적용)"""
+        if self._settled:
+            return
+        self._settled = True
+        if self.token_charges:
+            self.limiter._settle(self.token_charges, actual_tokens)
+
+
+class RateLimiter:
+    """
+    API Key/테넌트별 RPM·TPM 토큰 버킷 리미터
+
+    - 요청 시 (추정 입력 토큰 + max_tokens)를 TPM 버킷에서 사전 차감하고, 응답 usage로 차액 정산
+    - 대기 시간이 max_wait 이하이고 대기 인원이 max_queue 미만이면 대기 후 진행, 아니면 즉시 RateLimitException
+    - 한도는 모델별로 설정 가능 (RATE_LIMITS["default"]에 모델별 값을 덮어씀, 0은 무제한)
+    - 조정 저장소(store)가 주어지면 레플리카 전체가 공유하는 버킷에서 토큰을 묶음 단위로 받아 사용
+    """
+
+    BUCKET_IDLE_TTL = 300.0
+    MAX_BUCKETS = 100000
+
+    def __init__(
+        self,
+        limits: Dict[str, Dict[str, int]] = None,
+        max_wait: float = None,
+        max_queue: int = None,
+        store: "CoordinationStore" = None,
+        lease_fraction: float = None
+    ):
+        self.limits = settings.RATE_LIMITS if limits is None else limits
+        self.max_wait = settings.RATE_LIMIT_MAX_WAIT if max_wait is None else max_wait
+        self.max_queue = settings.RATE_LIMIT_MAX_QUEUE if max_queue is None else max_queue
+        self.store = store
+        self.lease_fraction = settings.COORDINATION_LEASE_FRACTION if lease_fraction is None else lease_fraction
+        self._buckets: TTLStore[TokenBucket] = TTLStore(self.MAX_BUCKETS, self.BUCKET_IDLE_TTL)
+        self._lock = threading.Lock()
+        self._prefetcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lease") if store else None
+        self._waiting = 0
+        self.rejected_count = 0
+
+    def get_limits(self, model: str) -> Dict[str, int]:
+        """모델별 한도 (기본값 + 모델별 덮어쓰기)"""
+        limits = dict(self.limits.get("default", {}))
+        limits.update(self.limits.get(model, {}))
+        return {name: int(limits.get(name, 0)) for name in LIMIT_NAMES}
+
+    def _get_bucket(self, scope: str, identity: str, model: str, limit_per_minute: int) -> Optional[TokenBucket]:
+        if limit_per_minute <= 0:
+            return None
+        bucket_key = (scope, identity, model)
+        bucket = self._buckets.get(bucket_key)
+        if bucket is None or bucket.capacity != limit_per_minute:
+            bucket = self._create_bucket(bucket_key, limit_per_minute)
+        # 접근할 때마다 유휴 TTL 연장
+        self._buckets.put(bucket_key, bucket)
+        return bucket
+
+    def _create_bucket(self, bucket_key: Tuple[str, str, str], limit_per_minute: int):
+        if self.store is None:
+            return TokenBucket(limit_per_minute, limit_per_minute / 60.0)
+        return LeasedTokenBucket(
+            store=self.store,
+            key="bucket:" + ":".join(bucket_key),
+            capacity=limit_per_minute,
+            refill_rate=limit_per_minute / 60.0,
+            lease_size=max(1.0, limit_per_minute * self.lease_fraction),
+            max_wait=self.max_wait,
+            lock=self._lock,
+            prefetcher=self._prefetcher
+        )
+
+    def _collect_buckets(self, scopes: Tuple[Tuple[str, str], ...], model: str, limits: Dict[str, int]) -> List[Tuple[str, TokenBucket]]:
+        buckets = []
+        for scope, identity in scopes:
+            bucket = self._get_bucket(scope, identity, model, limits[scope])
+            if bucket is not None:
+                buckets.append((scope, bucket))
+        return buckets
+
+    def acquire(self, api_key: str, tenant_id: str, model: str, estimated_tokens: int) -> RateLimitLease:
+        """
+        요청 1건과 추정 토큰을 차감하고 필요 시 대기
+
+        Raises:
+            RateLimitException: 대기 시간이 max_wait를 넘거나 대기열이 가득 찼을 때
+        """
+        limits = self.get_limits(model)
+        key_id = key_fingerprint(api_key)
+
+        # 공유 버킷 예약(저장소 왕복)은 lock 밖에서 한 번만 수행하고, 받아 온 뒤 다시 계산함
+        reserve_wait, reserve_scope, reserved = 0.0, "", False
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                request_buckets = self._collect_buckets((("key_rpm", key_id), ("tenant_rpm", tenant_id)), model, limits)
+                token_buckets = self._collect_buckets((("key_tpm", key_id), ("tenant_tpm", tenant_id)), model, limits)
+
+                # 버킷 용량보다 큰 요청도 언젠가는 처리될 수 있도록 차감량을 용량으로 제한
+                charges = [(scope, bucket, 1) for scope, bucket in request_buckets]
+                charges += [(scope, bucket, min(estimated_tokens, int(bucket.capacity))) for scope, bucket in token_buckets]
+
+                shortfalls = []
+                if not reserved:
+                    shortfalls = [
+                        (scope, bucket, bucket.shortfall(amount)) for scope, bucket, amount in charges
+                        if isinstance(bucket, LeasedTokenBucket) and bucket.shortfall(amount) > 0
+                    ]
+
+                if not shortfalls:
+                    wait_time, limited_by = reserve_wait, reserve_scope
+                    for scope, bucket, amount in charges:
+                        bucket_wait = bucket.wait_time(amount, now)
+                        if bucket_wait > wait_time:
+                            wait_time, limited_by = bucket_wait, scope
+
+                    if wait_time > 0 and (wait_time > self.max_wait or self._waiting >= self.max_queue):
+                        self.rejected_count += 1
+                        raise RateLimitException(
+                            message=f"요청 한도를 초과했습니다 ({limited_by}, model: {model}).",
+                            retry_after=wait_time,
+                            scope=limited_by
+                        )
+
+                    # 예약 후 다른 요청이 lease를 먼저 썼으면 잔량이 음수가 되고, 다음 예약에서 그만큼 더 받아 옴
+                    for _, bucket, amount in charges:
+                        bucket.take(amount)
+
+                    if wait_time > 0:
+                        self._waiting += 1
+                    break
+
+            for scope, bucket, shortfall in shortfalls:
+                bucket_wait = bucket.reserve(shortfall)
+                if bucket_wait > reserve_wait:
+                    reserve_wait, reserve_scope = bucket_wait, scope
+            reserved = True
+
+        if wait_time > 0:
+            logger.debug("레이트 리밋 대기: %.3fs (%s, model: %s)", wait_time, limited_by, model)
+            try:
+                time.sleep(wait_time)
+            finally:
+                with self._lock:
+                    self._waiting -= 1
+
+        token_charges = [(bucket, amount) for scope, bucket, amount in charges if scope.endswith("_tpm")]
+        return RateLimitLease(self, token_charges, wait_time)
+
+    def _settle(self, token_charges: List[Tuple[TokenBucket, int]], actual_tokens: int) -> None:
+        with self._lock:
+            now = time.monotonic()
+            for bucket, charged in token_charges:
+                bucket._refill(now)
+                bucket.refund(charged - min(actual_tokens, int(bucket.capacity)))
+
+    def stats(self) -> Dict[str, int]:
+        """리미터 상태 정보"""
+        return {"waiting": self._waiting, "rejected": self.rejected_count, "buckets": len(self._buckets)}
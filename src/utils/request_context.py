@@ -0,0 +1,91 @@
+"""
+요청 컨텍스트 (contextvars)
+
+- RequestContextMiddleware가 요청마다 RequestContext를 하나 만들고(헤더의 X-Request-ID/X-Tenant-ID, 시작 시각),
+  본문 검증이 끝난 라우트가 bind_request로 request_id/모델/키 모드를 채움
+- 예외 핸들러, ErrorHandler, 서비스, 로그 레코드는 본문을 다시 읽지 않고 현재 컨텍스트를 참조함
+- run_in_threadpool은 컨텍스트를 복사해 넘기므로 워커 스레드에서도 같은 RequestContext 객체를 봄
+"""
+
+import logging
+import time
+from contextvars import ContextVar, Token
+from typing import Optional
+from src.utils.tracing import current_span
+
+
+class RequestContext:
+    """요청 하나의 식별/귀속 정보"""
+
+    __slots__ = ("request_id", "tenant_id", "model", "use_user_api_key", "started_at", "stages", "log_sample")
+
+    def __init__(self, request_id: str = "", tenant_id: str = ""):
+        self.request_id = request_id
+        self.tenant_id = tenant_id
+        self.model = ""
+        self.use_user_api_key = False
+        self.started_at = time.perf_counter()
+        # 라우트가 start_stage_timer로 붙이는 단계별 시간 (src/utils/stage_timer.py)
+        self.stages = None
+        # request_id가 없는 요청의 로그 샘플링 난수 (src/utils/log_policy.py)
+        self.log_sample = None
+
+    def elapsed(self) -> float:
+        """요청 시작 후 경과 시간 (초)"""
+        return time.perf_counter() - self.started_at
+
+
+_current_context: ContextVar[Optional[RequestContext]] = ContextVar("request_context", default=None)
+
+
+def start_request_context(request_id: str = "", tenant_id: str = "") -> Token:
+    """새 요청 컨텍스트 설정 (반환된 토큰으로 reset_request_context 호출)"""
+    return _current_context.set(RequestContext(request_id, tenant_id))
+
+
+def reset_request_context(token: Token) -> None:
+    """start_request_context 이전 상태로 복원"""
+    _current_context.reset(token)
+
+
+def get_request_context() -> Optional[RequestContext]:
+    """현재 요청 컨텍스트 (요청 처리 중이 아니면 None)"""
+    return _current_context.get()
+
+
+def current_request_id() -> str:
+    """현재 요청의 request_id (없으면 빈 문자열)"""
+    context = _current_context.get()
+    return context.request_id if context else ""
+
+
+def bind_request(request, tenant_id: str = None) -> None:
+    """검증된 ChatRequest의 request_id/모델/키 모드를 현재 컨텍스트에 기록 (본문의 request_id가 헤더보다 우선)"""
+    context = _current_context.get()
+    if context is None:
+        return
+    if request.request_id:
+        context.request_id = request.request_id
+    if tenant_id:
+        context.tenant_id = tenant_id
+    context.model = request.model
+    context.use_user_api_key = bool(request.use_user_api_key and request.openai_api_key)
+
+
+class RequestContextFilter(logging.Filter):
+    """
+    로그 레코드에 request_id/tenant_id/trace_id 속성을 붙이는 필터 (요청 밖에서는 "-")
+
+    contextvars를 읽으므로 큐 리스너가 아닌 로그를 남기는 스레드에서 실행되어야 함
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        context = _current_context.get()
+        if context is None:
+            record.request_id = record.tenant_id = "-"
+        else:
+            record.request_id = context.request_id or "-"
+            record.tenant_id = context.tenant_id or "-"
+        span = current_span()
+        record.trace_id = span.trace_id if span is not None and span.sampled else "-"
+        return True
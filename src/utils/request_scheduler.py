@@ -0,0 +1,295 @@
+"""
+테넌트 공정성 + 우선순위 기반 업스트림 요청 스케줄러
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from src.utils.logger import get_logger
+from src.config.config import settings
+from src.exceptions.chat_exceptions import RateLimitException
+
+logger = get_logger(__name__)
+
+# 우선순위 클래스 (앞쪽이 높은 우선순위)
+PRIORITY_CLASSES = ("interactive", "background")
+
+# 유휴 플로우 finish tag가 이 수를 넘으면 virtual_time이 지난 항목 정리
+IDLE_FLOW_PRUNE_MIN = 1024
+
+
+class ScheduleTicket:
+    """스케줄러 대기열의 요청 1건"""
+
+    __slots__ = (
+        "flow_id", "priority", "deadline", "cost", "seq", "event",
+        "enqueued_at", "granted_at", "granted", "cancelled"
+    )
+
+    def __init__(self, flow_id: str, priority: str, deadline: float, cost: float, seq: int):
+        self.flow_id = flow_id
+        self.priority = priority
+        self.deadline = deadline
+        self.cost = cost
+        self.seq = seq
+        self.event = threading.Event()
+        self.enqueued_at = time.monotonic()
+        self.granted_at = 0.0
+        self.granted = False
+        self.cancelled = False
+
+    @property
+    def queue_wait(self) -> float:
+        """대기열에서 기다린 시간 (초)"""
+        return max(0.0, self.granted_at - self.enqueued_at) if self.granted else 0.0
+
+    def __lt__(self, other: "ScheduleTicket") -> bool:
+        # 플로우 내부는 마감 시각이 빠른 순(EDF), 같으면 도착 순
+        return (self.deadline, self.seq) < (other.deadline, other.seq)
+
+
+class _Flow:
+    """테넌트·API Key 단위 플로우 (가중 공정 큐의 단위)"""
+
+    __slots__ = ("weight", "finish_tag", "queue")
+
+    def __init__(self, weight: float, finish_tag: float):
+        self.weight = weight
+        self.finish_tag = finish_tag
+        self.queue: List[ScheduleTicket] = []
+
+
+class _LatencyStat:
+    """건수/합계/최대 누적 통계"""
+
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "avg": round(self.total / self.count, 4) if self.count else 0.0,
+            "max": round(self.max, 4)
+        }
+
+
+class _PriorityClass:
+    """우선순위 클래스별 플로우 집합과 통계"""
+
+    __slots__ = ("flows", "idle_finish_tags", "idle_prune_at", "virtual_time", "queued", "rejected", "queue_wait", "upstream_time")
+
+    def __init__(self):
+        self.flows: Dict[str, _Flow] = {}
+        # 대기열이 비어 제거된 플로우의 finish tag (virtual_time을 넘는 동안만 보관 - 다시 도착하면 이어서 과금)
+        self.idle_finish_tags: Dict[str, float] = {}
+        self.idle_prune_at = IDLE_FLOW_PRUNE_MIN
+        self.virtual_time = 0.0
+        self.queued = 0
+        self.rejected = 0
+        self.queue_wait = _LatencyStat()
+        self.upstream_time = _LatencyStat()
+
+
+class RequestScheduler:
+    """
+    업스트림 동시 실행 슬롯을 배분하는 스케줄러
+
+    - 우선순위: interactive 클래스가 비어 있을 때만 background 클래스에 슬롯 배정 (엄격한 우선순위)
+    - 클래스 내부: 테넌트·API Key 플로우 간 가중 공정 큐(Start-time Fair Queuing, 비용 = 추정 토큰 / 테넌트 가중치)
+    - 플로우 내부: 마감 시각이 빠른 요청부터 (EDF)
+    - 마감 시각까지 슬롯을 받지 못하면 RateLimitException으로 거부
+    - 대기열 대기 시간과 업스트림 처리 시간을 클래스별로 분리 집계
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = None,
+        max_queue: int = None,
+        tenant_weights: Dict[str, float] = None,
+        deadlines: Dict[str, float] = None
+    ):
+        self.max_concurrency = settings.SCHEDULER_MAX_CONCURRENCY if max_concurrency is None else max_concurrency
+        self.max_queue = settings.SCHEDULER_MAX_QUEUE if max_queue is None else max_queue
+        self.tenant_weights = settings.SCHEDULER_TENANT_WEIGHTS if tenant_weights is None else tenant_weights
+        self.deadlines = settings.SCHEDULER_DEADLINES if deadlines is None else deadlines
+        self._classes = {priority: _PriorityClass() for priority in PRIORITY_CLASSES}
+        self._active = 0
+        self._queued = 0
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_concurrency > 0
+
+    def acquire(
+        self,
+        tenant_id: str,
+        key_id: str,
+        priority: str = "interactive",
+        deadline: float = None,
+        cost: float = 1.0
+    ) -> ScheduleTicket:
+        """
+        업스트림 실행 슬롯을 받을 때까지 대기
+
+        Args:
+            tenant_id: 테넌트 ID
+            key_id: API Key 식별자 (key_fingerprint)
+            priority: 우선순위 클래스 (interactive | background)
+            deadline: 허용 대기 시간(초), 없으면 클래스 기본값
+            cost: 요청 비용 (추정 토큰 수)
+
+        Raises:
+            RateLimitException: 대기열이 가득 찼거나 마감 시각까지 슬롯을 받지 못했을 때
+        """
+        budget = self.deadlines.get(priority, 60.0) if deadline is None else deadline
+        ticket = ScheduleTicket(
+            flow_id=f"{tenant_id}:{key_id}",
+            priority=priority,
+            deadline=time.monotonic() + budget,
+            cost=max(cost, 1.0),
+            seq=next(self._seq)
+        )
+        priority_class = self._classes[priority]
+
+        with self._lock:
+            if not self.enabled or (self._active < self.max_concurrency and self._queued == 0):
+                self._grant(ticket)
+                return ticket
+
+            if self._queued >= self.max_queue:
+                priority_class.rejected += 1
+                raise RateLimitException(
+                    message=f"업스트림 대기열이 가득 찼습니다 (최대 {self.max_queue}건).",
+                    retry_after=1.0,
+                    scope="scheduler_queue"
+                )
+
+            flow = priority_class.flows.get(ticket.flow_id)
+            if flow is None:
+                weight = float(self.tenant_weights.get(tenant_id, 1.0))
+                finish_tag = max(priority_class.virtual_time, priority_class.idle_finish_tags.pop(ticket.flow_id, 0.0))
+                flow = priority_class.flows[ticket.flow_id] = _Flow(weight, finish_tag)
+            heapq.heappush(flow.queue, ticket)
+            priority_class.queued += 1
+            self._queued += 1
+
+        ticket.event.wait(budget)
+
+        with self._lock:
+            if ticket.granted:
+                return ticket
+            # 마감 시각 초과 - 대기열에서는 배정 시점에 건너뜀
+            ticket.cancelled = True
+            priority_class.queued -= 1
+            priority_class.rejected += 1
+            self._queued -= 1
+
+        logger.warning(f"스케줄러 대기 시간 초과: {budget:.1f}s (priority: {priority}, tenant: {tenant_id})")
+        raise RateLimitException(
+            message=f"업스트림 대기 시간({budget:.0f}s)을 초과했습니다.",
+            retry_after=1.0,
+            scope="scheduler_deadline"
+        )
+
+    def release(self, ticket: ScheduleTicket) -> None:
+        """업스트림 처리 완료 - 슬롯 반환 후 다음 요청 배정"""
+        upstream_time = time.monotonic() - ticket.granted_at
+        with self._lock:
+            self._classes[ticket.priority].upstream_time.add(upstream_time)
+            self._active -= 1
+            self._dispatch()
+
+    def _grant(self, ticket: ScheduleTicket) -> None:
+        ticket.granted = True
+        ticket.granted_at = time.monotonic()
+        self._classes[ticket.priority].queue_wait.add(ticket.queue_wait)
+        self._active += 1
+        ticket.event.set()
+
+    def _dispatch(self) -> None:
+        """빈 슬롯만큼 대기 요청 배정 (lock 보유 상태에서 호출)"""
+        while self._active < self.max_concurrency:
+            ticket = self._next_ticket()
+            if ticket is None:
+                return
+            self._grant(ticket)
+
+    def _next_ticket(self) -> Optional[ScheduleTicket]:
+        for priority_class in self._classes.values():
+            while priority_class.flows:
+                # 가상 시작 시각이 가장 작은 플로우 선택 (같으면 먼저 도착한 요청)
+                flow_id, flow = min(
+                    priority_class.flows.items(),
+                    key=lambda item: (max(priority_class.virtual_time, item[1].finish_tag), item[1].queue[0].seq)
+                )
+                ticket = heapq.heappop(flow.queue)
+                if not ticket.cancelled:
+                    start_tag = max(priority_class.virtual_time, flow.finish_tag)
+                    flow.finish_tag = start_tag + ticket.cost / flow.weight
+                    priority_class.virtual_time = start_tag
+                if not flow.queue:
+                    del priority_class.flows[flow_id]
+                    self._park_flow(priority_class, flow_id, flow)
+                if ticket.cancelled:
+                    continue
+
+                priority_class.queued -= 1
+                self._queued -= 1
+                return ticket
+        return None
+
+    @staticmethod
+    def _park_flow(priority_class: _PriorityClass, flow_id: str, flow: _Flow) -> None:
+        """
+        대기열이 빈 플로우의 finish tag 보관 (lock 보유 상태에서 호출)
+
+        요청을 하나씩 보내는 테넌트도 마지막 요청 비용만큼 뒤로 밀리도록 하며,
+        virtual_time이 이미 지난 태그는 의미가 없으므로 보관 수가 idle_prune_at을 넘을 때 정리함
+        """
+        if flow.finish_tag > priority_class.virtual_time:
+            priority_class.idle_finish_tags[flow_id] = flow.finish_tag
+        if len(priority_class.idle_finish_tags) > priority_class.idle_prune_at:
+            priority_class.idle_finish_tags = {
+                idle_id: finish_tag for idle_id, finish_tag in priority_class.idle_finish_tags.items()
+                if finish_tag > priority_class.virtual_time
+            }
+            # 남은 항목이 많으면 다음 정리 시점을 늦춰 정리 비용을 분산
+            priority_class.idle_prune_at = max(IDLE_FLOW_PRUNE_MIN, 2 * len(priority_class.idle_finish_tags))
+
+    def queue_ratio(self) -> float:
+        """대기열 사용률 (대기 중 / max_queue, 스케줄러가 꺼져 있으면 0.0) - 잠금 없이 읽음"""
+        if not self.enabled or not self.max_queue:
+            return 0.0
+        return self._queued / self.max_queue
+
+    def stats(self) -> Dict[str, Any]:
+        """스케줄러 상태 및 클래스별 대기/업스트림 시간"""
+        with self._lock:
+            return {
+                "max_concurrency": self.max_concurrency,
+                "active": self._active,
+                "queued": self._queued,
+                "classes": {
+                    priority: {
+                        "queued": priority_class.queued,
+                        "flows": len(priority_class.flows),
+                        "rejected": priority_class.rejected,
+                        "queue_wait": priority_class.queue_wait.to_dict(),
+                        "upstream_time": priority_class.upstream_time.to_dict()
+                    }
+                    for priority, priority_class in self._classes.items()
+                }
+            }
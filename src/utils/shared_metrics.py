@@ -0,0 +1,250 @@
+"""
+멀티 프로세스 공유 메모리 메트릭 저장소
+
+fork 전에 익명 공유 mmap을 만들어 두고 워커마다 고정 영역을 배정함.
+각 워커는 자기 영역에만 쓰므로 프로세스 간 잠금이 필요 없고, 조회 시에는 모든 워커 영역을 합산함.
+워커가 재시작되어도 같은 영역을 이어 쓰므로 카운터는 단조 증가를 유지함.
+시리즈 이름 → 위치는 (이름, 라벨) 단위로 캐시하여, 기록 한 번은 캐시 조회와 값 갱신만 수행함
+"""
+
+import bisect
+import mmap
+import os
+import struct
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+from src.config.config import settings
+
+# 영역 헤더: 항목 수(q) / pid(q) / 시작 시각(d) / 예약(q)
+_HEADER = struct.Struct("qqdq")
+# 항목: 종류(B) + 시리즈 이름(127s) + 값(d) = 136바이트 (값이 8바이트 정렬됨)
+_NAME_SIZE = 127
+_ENTRY = struct.Struct(f"B{_NAME_SIZE}sd")
+_VALUE = struct.Struct("d")
+_VALUE_OFFSET = 1 + _NAME_SIZE
+
+KIND_COUNTER = 1
+KIND_GAUGE = 2
+# 워커 합산 대신 가장 최근에 기록된 워커의 값을 쓰는 게이지 (업스트림 잔여 용량처럼 모든 워커가 같은 값을 관측하는 경우)
+KIND_GAUGE_LATEST = 3
+# KIND_GAUGE_LATEST 값의 기록 시각 (조회 결과에는 포함하지 않음)
+KIND_STAMP = 4
+_STAMP_SUFFIX = "#ts"
+
+# 지연 시간 히스토그램 기본 버킷 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def series_name(name: str, labels: Optional[Dict[str, str]] = None) -> str:
+    """Prometheus 형식 시리즈 이름 (name{label="value",...})"""
+    if not labels:
+        return name
+    label_text = ",".join(f'{key}="{value}"' for key, value in sorted(labels.items()))
+    return f"{name}{{{label_text}}}"
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+        return True
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+
+
+class SharedMetrics:
+    """
+    워커별 영역으로 나뉜 공유 메모리 카운터/게이지/히스토그램
+
+    - counter: 단조 증가, 워커 합산
+    - gauge: 워커별 현재 값, 합산 (워커 재시작 시 0으로 초기화)
+    - latest gauge: 워커별 마지막 설정 값과 시각, 조회 시 가장 최근 값 (합산하지 않음)
+    - histogram: le 버킷 누적 카운터 + _sum + _count 카운터로 표현
+    """
+
+    def __init__(self, max_workers: int = None, slots_per_worker: int = None):
+        self.max_workers = max(1, settings.SERVER_WORKERS if max_workers is None else max_workers)
+        self.slots_per_worker = settings.METRICS_SLOTS_PER_WORKER if slots_per_worker is None else slots_per_worker
+        self.region_size = _HEADER.size + _ENTRY.size * self.slots_per_worker
+        # 익명 mmap은 MAP_SHARED로 생성되어 fork된 자식과 공유됨
+        self._buffer = mmap.mmap(-1, self.region_size * self.max_workers)
+        self._lock = threading.Lock()
+        self._offsets: Dict[str, int] = {}
+        # (이름, 라벨 항목) → 값 위치 / 히스토그램 위치 목록 캐시 (시리즈 이름 생성을 건너뜀)
+        self._series_cache: Dict[tuple, int] = {}
+        self._histogram_cache: Dict[tuple, tuple] = {}
+        self._latest_cache: Dict[tuple, tuple] = {}
+        self.worker_index = 0
+        self.dropped = 0
+        self.bind_worker(0)
+
+    def _region(self, worker_index: int) -> int:
+        return worker_index * self.region_size
+
+    def bind_worker(self, worker_index: int) -> None:
+        """현재 프로세스에 워커 영역 배정 (fork 직후 자식에서 호출)"""
+        with self._lock:
+            self.worker_index = worker_index
+            self._offsets = {}
+            self._series_cache = {}
+            self._histogram_cache = {}
+            self._latest_cache = {}
+            region = self._region(worker_index)
+            count = _HEADER.unpack_from(self._buffer, region)[0]
+            for slot in range(count):
+                offset = region + _HEADER.size + slot * _ENTRY.size
+                kind, raw_name, _ = _ENTRY.unpack_from(self._buffer, offset)
+                self._offsets[raw_name.rstrip(b"\0").decode("utf-8")] = offset
+                if kind == KIND_GAUGE:
+                    _VALUE.pack_into(self._buffer, offset + _VALUE_OFFSET, 0.0)
+            _HEADER.pack_into(self._buffer, region, count, os.getpid(), time.time(), 0)
+
+    def _offset(self, series: str, kind: int) -> Optional[int]:
+        """시리즈의 값 위치 (없으면 새 항목 할당, 영역이 가득 차면 None) - lock 보유 상태에서 호출"""
+        offset = self._offsets.get(series)
+        if offset is not None:
+            return offset
+
+        region = self._region(self.worker_index)
+        count = _HEADER.unpack_from(self._buffer, region)[0]
+        encoded = series.encode("utf-8")
+        if count >= self.slots_per_worker or len(encoded) > _NAME_SIZE:
+            self.dropped += 1
+            return None
+
+        offset = region + _HEADER.size + count * _ENTRY.size
+        _ENTRY.pack_into(self._buffer, offset, kind, encoded, 0.0)
+        # 항목을 다 쓴 뒤에 개수를 늘려 다른 프로세스가 미완성 항목을 읽지 않도록 함
+        struct.pack_into("q", self._buffer, region, count + 1)
+        self._offsets[series] = offset
+        return offset
+
+    def _add_locked(self, series: str, kind: int, amount: float) -> None:
+        offset = self._offset(series, kind)
+        if offset is not None:
+            self._add_at(offset, amount)
+
+    def _add_at(self, offset: int, amount: float) -> None:
+        value_offset = offset + _VALUE_OFFSET
+        _VALUE.pack_into(self._buffer, value_offset, _VALUE.unpack_from(self._buffer, value_offset)[0] + amount)
+
+    def _add(self, name: str, labels: Optional[Dict[str, str]], kind: int, amount: float) -> None:
+        key = (name, tuple(labels.items())) if labels else (name,)
+        with self._lock:
+            offset = self._series_cache.get(key)
+            if offset is None:
+                offset = self._offset(series_name(name, labels), kind)
+                if offset is None:
+                    return
+                self._series_cache[key] = offset
+            self._add_at(offset, amount)
+
+    def inc(self, name: str, amount: float = 1.0, labels: Dict[str, str] = None) -> None:
+        """카운터 증가"""
+        self._add(name, labels, KIND_COUNTER, amount)
+
+    def gauge_add(self, name: str, amount: float, labels: Dict[str, str] = None) -> None:
+        """게이지 증감 (진행 중 요청 수 등)"""
+        self._add(name, labels, KIND_GAUGE, amount)
+
+    def gauge_set(self, name: str, value: float, labels: Dict[str, str] = None) -> None:
+        """가장 최근 값 게이지 설정 (조회 시 워커 중 가장 나중에 설정한 값)"""
+        key = (name, tuple(labels.items())) if labels else (name,)
+        with self._lock:
+            offsets = self._latest_cache.get(key)
+            if offsets is None:
+                series = series_name(name, labels)
+                value_offset = self._offset(series, KIND_GAUGE_LATEST)
+                stamp_offset = self._offset(series + _STAMP_SUFFIX, KIND_STAMP)
+                if value_offset is None or stamp_offset is None:
+                    return
+                offsets = self._latest_cache[key] = (value_offset, stamp_offset)
+            value_offset, stamp_offset = offsets
+            _VALUE.pack_into(self._buffer, value_offset + _VALUE_OFFSET, float(value))
+            _VALUE.pack_into(self._buffer, stamp_offset + _VALUE_OFFSET, time.time())
+
+    def _histogram_offsets(self, name: str, labels: Dict[str, str], bounds: tuple) -> Optional[tuple]:
+        """히스토그램 시리즈 위치 (버킷 상한, 버킷 위치, +Inf/_sum/_count 위치) - lock 보유 상태에서 호출"""
+        bucket_series = [series_name(f"{name}_bucket", {**labels, "le": str(bound)}) for bound in bounds]
+        bucket_series.append(series_name(f"{name}_bucket", {**labels, "le": "+Inf"}))
+        offsets = [self._offset(series, KIND_COUNTER) for series in bucket_series]
+        sum_offset = self._offset(series_name(f"{name}_sum", labels), KIND_COUNTER)
+        count_offset = self._offset(series_name(f"{name}_count", labels), KIND_COUNTER)
+        if None in offsets or sum_offset is None or count_offset is None:
+            return None
+        return bounds, offsets, sum_offset, count_offset
+
+    def observe(self, name: str, value: float, labels: Dict[str, str] = None, buckets: Iterable[float] = DEFAULT_BUCKETS) -> None:
+        """히스토그램 관측 (누적 버킷 + _sum + _count)"""
+        labels = labels or {}
+        buckets = tuple(buckets)
+        key = (name, tuple(labels.items()), buckets)
+        with self._lock:
+            histogram = self._histogram_cache.get(key)
+            if histogram is None:
+                # 처음 관측할 때 모든 버킷 시리즈를 만들어 둠 (버킷 목록이 항상 완전하도록)
+                histogram = self._histogram_offsets(name, labels, buckets)
+                if histogram is None:
+                    return
+                self._histogram_cache[key] = histogram
+            bounds, offsets, sum_offset, count_offset = histogram
+            # 누적 버킷이므로 관측값 이상인 상한의 버킷(+Inf 포함)만 증가
+            for offset in offsets[bisect.bisect_left(bounds, value):]:
+                self._add_at(offset, 1.0)
+            self._add_at(sum_offset, value)
+            self._add_at(count_offset, 1.0)
+
+    def _read_region(self, worker_index: int) -> List[Tuple[str, int, float]]:
+        region = self._region(worker_index)
+        count = _HEADER.unpack_from(self._buffer, region)[0]
+        entries = []
+        for slot in range(min(count, self.slots_per_worker)):
+            kind, raw_name, value = _ENTRY.unpack_from(self._buffer, region + _HEADER.size + slot * _ENTRY.size)
+            entries.append((raw_name.rstrip(b"\0").decode("utf-8", errors="replace"), kind, value))
+        return entries
+
+    def collect(self) -> Dict[str, Tuple[int, float]]:
+        """모든 워커 합산 값과 종류 (시리즈 이름 → (종류, 값), latest 게이지는 가장 최근 값)"""
+        totals: Dict[str, Tuple[int, float]] = {}
+        latest: Dict[str, Tuple[float, float]] = {}
+        for worker_index in range(self.max_workers):
+            entries = self._read_region(worker_index)
+            stamps = {series[:-len(_STAMP_SUFFIX)]: value for series, kind, value in entries if kind == KIND_STAMP}
+            for series, kind, value in entries:
+                if kind == KIND_STAMP:
+                    continue
+                if kind == KIND_GAUGE_LATEST:
+                    stamp = stamps.get(series, 0.0)
+                    if series not in latest or stamp > latest[series][0]:
+                        latest[series] = (stamp, value)
+                    continue
+                previous = totals.get(series)
+                totals[series] = (kind, previous[1] + value if previous else value)
+        for series, (_, value) in latest.items():
+            totals[series] = (KIND_GAUGE_LATEST, value)
+        return totals
+
+    def snapshot(self) -> Dict[str, float]:
+        """모든 워커 합산 값 (시리즈 이름 → 값)"""
+        return {series: value for series, (_, value) in self.collect().items()}
+
+    def workers(self) -> List[Dict[str, float]]:
+        """영역을 사용 중인 워커 정보"""
+        result = []
+        for worker_index in range(self.max_workers):
+            count, pid, started_at, _ = _HEADER.unpack_from(self._buffer, self._region(worker_index))
+            if pid:
+                result.append({
+                    "index": worker_index,
+                    "pid": pid,
+                    "alive": _pid_alive(pid),
+                    "started_at": started_at,
+                    "series": count
+                })
+        return result
+
+
+# 앱 import 시점(fork 전)에 생성되어 모든 워커가 공유
+metrics = SharedMetrics()
@@ -0,0 +1,75 @@
+"""
+요청 처리 단계별 시간 측정
+
+- 라우트가 start_stage_timer로 StageTimer를 만들어 현재 RequestContext에 붙이고 서비스에 넘김
+- 서비스는 단계가 끝날 때마다 mark(단계명)를 호출 (직전 mark 이후 경과 시간이 그 단계 시간)
+- RequestContextMiddleware는 응답 시작 시 컨텍스트의 StageTimer로 Server-Timing 헤더를 만듦
+- record()는 단계별 시간을 llm_stage_duration_seconds{stage} 히스토그램에 기록 (워커 합산)
+
+단계: parse(본문 수신/파싱/검증, 라우트 진입까지), validate, messages, key_select,
+admit(요청 한도/동시 실행 한도/스케줄러 대기), upstream, settle(정산/비용/메트릭), build, serialize
+"""
+
+import time
+from typing import Dict, Optional
+from src.utils.request_context import get_request_context
+from src.utils.shared_metrics import metrics
+
+STAGE_METRIC = "llm_stage_duration_seconds"
+
+# 단계 대부분은 마이크로초~밀리초 단위이므로 기본 버킷보다 촘촘하게 시작
+STAGE_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class StageTimer:
+    """단계별 경과 시간 누적 (같은 단계를 여러 번 mark하면 합산)"""
+
+    __slots__ = ("stages", "_last")
+
+    def __init__(self, started_at: float = None):
+        self.stages: Dict[str, float] = {}
+        self._last = time.perf_counter() if started_at is None else started_at
+
+    def mark(self, stage: str) -> None:
+        """직전 mark 이후 경과 시간을 stage에 기록"""
+        now = time.perf_counter()
+        self.stages[stage] = self.stages.get(stage, 0.0) + (now - self._last)
+        self._last = now
+
+    def as_millis(self) -> Dict[str, float]:
+        """단계별 시간 (밀리초, 소수점 3자리)"""
+        return {stage: round(duration * 1000, 3) for stage, duration in self.stages.items()}
+
+    def header_value(self, total: float = None) -> str:
+        """Server-Timing 헤더 값 (total이 있으면 마지막에 total 항목 추가)"""
+        entries = [f"{stage};dur={duration * 1000:.3f}" for stage, duration in self.stages.items()]
+        if total is not None:
+            entries.append(f"total;dur={total * 1000:.3f}")
+        return ", ".join(entries)
+
+    def record(self, *stages: str) -> None:
+        """지정한 단계(없으면 전체) 시간을 히스토그램에 기록"""
+        for stage in stages or tuple(self.stages):
+            if stage in self.stages:
+                metrics.observe(STAGE_METRIC, self.stages[stage], labels={"stage": stage}, buckets=STAGE_BUCKETS)
+
+
+def start_stage_timer() -> StageTimer:
+    """
+    라우트 진입 시 호출 - 새 StageTimer를 현재 요청 컨텍스트에 붙여 반환
+
+    요청 컨텍스트가 있으면 요청 시작부터 지금까지를 parse 단계로 기록함
+    """
+    context = get_request_context()
+    if context is None:
+        return StageTimer()
+    timer = StageTimer(context.started_at)
+    timer.mark("parse")
+    context.stages = timer
+    return timer
+
+
+def current_stage_timer() -> Optional[StageTimer]:
+    """현재 요청 컨텍스트의 StageTimer (없으면 None)"""
+    context = get_request_context()
+    return context.stages if context else None
@@ -2,18 +2,37 @@ import psutil
 import platform
 import os
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+# cgroup 한도 파일 (v2 / v1)
+_CGROUP_ROOT = "/sys/fs/cgroup"
+# cgroup v1의 "무제한" 메모리 한도 (페이지 크기로 내림한 int64 최댓값 근처)
+_CGROUP_V1_UNLIMITED = 1 << 62
+
+
+def _read_cgroup(path: str) -> Optional[str]:
+    try:
+        with open(os.path.join(_CGROUP_ROOT, path)) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
 class SystemInfoCollector:
-    """시스템 정보 수집 클래스"""
+    """
+    시스템 정보 수집 클래스
+
+    모든 수집 함수는 기다리지 않음 (CPU 사용률은 직전 호출 이후의 평균).
+    주기적인 수집은 SystemSampler(src/utils/system_sampler.py)가 백그라운드 스레드에서 수행함
+    """
     
     @staticmethod
     def get_system_info() -> Dict[str, Any]:
-        """전체 시스템 정보 수집"""
+        """전체 시스템 정보 수집 (소켓 목록 순회 포함 - 요청 처리 경로에서는 SystemSampler 스냅샷 사용)"""
         try:
             return {
                 "timestamp": datetime.now().isoformat(),
@@ -46,8 +65,8 @@ class SystemInfoCollector:
     
     @staticmethod
     def _get_cpu_info() -> Dict[str, Any]:
-        """CPU 정보"""
-        cpu_percent = psutil.cpu_percent(interval=1)
+        """CPU 정보 (사용률은 직전 호출 이후의 평균, 첫 호출은 0.0)"""
+        cpu_percent = psutil.cpu_percent(interval=None)
         cpu_count = psutil.cpu_count()
         cpu_freq = psutil.cpu_freq()
         
@@ -93,10 +112,10 @@ class SystemInfoCollector:
         }
     
     @staticmethod
-    def _get_network_info() -> Dict[str, Any]:
-        """네트워크 정보"""
+    def _get_network_info(include_connections: bool = True) -> Dict[str, Any]:
+        """네트워크 정보 (include_connections면 모든 소켓을 순회해 연결 수를 셈)"""
         network_io = psutil.net_io_counters()
-        network_connections = len(psutil.net_connections())
+        network_connections = len(psutil.net_connections()) if include_connections else None
         
         return {
             "bytes_sent": network_io.bytes_sent,
@@ -107,19 +126,22 @@ class SystemInfoCollector:
         }
     
     @staticmethod
-    def _get_process_info() -> Dict[str, Any]:
-        """현재 프로세스 정보"""
-        current_process = psutil.Process()
+    def _get_process_info(current_process: psutil.Process = None) -> Dict[str, Any]:
+        """현재 프로세스 정보 (같은 Process 객체를 다시 넘기면 cpu_percent는 직전 호출 이후의 평균)"""
+        current_process = current_process or psutil.Process()
         
-        return {
-            "pid": current_process.pid,
-            "name": current_process.name(),
-            "cpu_percent": current_process.cpu_percent(),
-            "memory_mb": round(current_process.memory_info().rss / (1024**2), 2),
-            "memory_percent": current_process.memory_percent(),
-            "num_threads": current_process.num_threads(),
-            "create_time": datetime.fromtimestamp(current_process.create_time()).isoformat()
-        }
+        with current_process.oneshot():
+            memory_info = current_process.memory_info()
+            return {
+                "pid": current_process.pid,
+                "name": current_process.name(),
+                "cpu_percent": current_process.cpu_percent(),
+                "memory_mb": round(memory_info.rss / (1024**2), 2),
+                "memory_percent": round(current_process.memory_percent(), 2),
+                "num_threads": current_process.num_threads(),
+                "num_fds": current_process.num_fds() if hasattr(current_process, "num_fds") else None,
+                "create_time": datetime.fromtimestamp(current_process.create_time()).isoformat()
+            }
     
     @staticmethod
     def _get_docker_info() -> Dict[str, Any]:
@@ -153,12 +175,65 @@ class SystemInfoCollector:
         
         return docker_info
     
+    @staticmethod
+    def _get_container_limits() -> Dict[str, Any]:
+        """컨테이너(cgroup v2/v1) 메모리/CPU 한도와 사용량 (한도가 없거나 읽을 수 없으면 None)"""
+        limits = {
+            "cgroup_version": None,
+            "memory_limit_mb": None,
+            "memory_usage_mb": None,
+            "memory_usage_percent": None,
+            "cpu_limit_cores": None,
+            "cpu_throttled_periods": None,
+            "cpu_throttled_seconds": None
+        }
+        
+        memory_max = _read_cgroup("memory.max")
+        if memory_max is not None:
+            limits["cgroup_version"] = 2
+            memory_limit = None if memory_max == "max" else int(memory_max)
+            memory_usage = _read_cgroup("memory.current")
+            cpu_max = (_read_cgroup("cpu.max") or "max").split()
+            quota, period = cpu_max[0], (cpu_max[1] if len(cpu_max) > 1 else "100000")
+            cpu_stat = _read_cgroup("cpu.stat")
+            throttled_scale = 1e6  # usec
+            throttled_key = "throttled_usec"
+        else:
+            memory_limit_raw = _read_cgroup("memory/memory.limit_in_bytes")
+            if memory_limit_raw is None:
+                return limits
+            limits["cgroup_version"] = 1
+            memory_limit = int(memory_limit_raw) if int(memory_limit_raw) < _CGROUP_V1_UNLIMITED else None
+            memory_usage = _read_cgroup("memory/memory.usage_in_bytes")
+            quota = _read_cgroup("cpu/cpu.cfs_quota_us") or "-1"
+            period = _read_cgroup("cpu/cpu.cfs_period_us") or "100000"
+            quota = "max" if quota == "-1" else quota
+            cpu_stat = _read_cgroup("cpu/cpu.stat")
+            throttled_scale = 1e9  # ns
+            throttled_key = "throttled_time"
+        
+        if memory_limit:
+            limits["memory_limit_mb"] = round(memory_limit / (1024**2), 2)
+        if memory_usage is not None:
+            limits["memory_usage_mb"] = round(int(memory_usage) / (1024**2), 2)
+            if memory_limit:
+                limits["memory_usage_percent"] = round(int(memory_usage) / memory_limit * 100, 2)
+        if quota != "max":
+            limits["cpu_limit_cores"] = round(int(quota) / int(period), 2)
+        if cpu_stat:
+            stats = dict(line.split() for line in cpu_stat.splitlines() if len(line.split()) == 2)
+            if "nr_throttled" in stats:
+                limits["cpu_throttled_periods"] = int(stats["nr_throttled"])
+            if throttled_key in stats:
+                limits["cpu_throttled_seconds"] = round(int(stats[throttled_key]) / throttled_scale, 3)
+        return limits
+    
     @staticmethod
     def get_simple_status() -> Dict[str, Any]:
         """간단한 상태 정보 (헬스체크용)"""
         try:
             memory = psutil.virtual_memory()
-            cpu_percent = psutil.cpu_percent(interval=0.1)
+            cpu_percent = psutil.cpu_percent(interval=None)
             
             return {
                 "status": "healthy",
@@ -0,0 +1,158 @@
+"""
+시스템 지표 백그라운드 샘플러
+
+- SYSTEM_SAMPLE_INTERVAL초마다 백그라운드 스레드가 CPU/메모리/디스크/프로세스/컨테이너 지표를 수집해
+  변경되지 않는 SystemSnapshot을 새로 만들고 참조만 교체함 → 조회는 잠금/수집 없이 최신 스냅샷을 그대로 반환
+- 스냅샷은 만들 때 JSON 본문까지 미리 인코딩하므로 엔드포인트는 직렬화도 하지 않음
+- CPU 사용률은 기다리지 않는 psutil 호출(직전 샘플 이후의 평균)로 계산하고,
+  모든 소켓을 순회하는 연결 수 집계는 SYSTEM_SAMPLE_CONNECTIONS일 때만 수행함
+- 최근 SYSTEM_HISTORY_SIZE개 샘플의 주요 값은 추이 그래프용으로 고정 크기 deque에 보관함
+- 값은 워커 프로세스별 (fork 후 워커마다 스레드를 새로 시작)
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+import orjson
+import psutil
+from src.utils.logger import get_logger
+from src.utils.system_info import SystemInfoCollector
+from src.config.config import settings
+
+logger = get_logger(__name__)
+
+
+class SystemSnapshot:
+    """한 시점의 시스템 지표 (만든 뒤 변경하지 않음)"""
+
+    __slots__ = ("taken_at", "info", "status", "info_body", "status_body")
+
+    def __init__(self, taken_at: float, info: Dict[str, Any], status: Dict[str, Any]):
+        self.taken_at = taken_at
+        self.info = info
+        self.status = status
+        self.info_body = orjson.dumps(info)
+        self.status_body = orjson.dumps(status)
+
+
+class SystemSampler:
+    """주기적으로 SystemSnapshot을 갱신하는 샘플러"""
+
+    def __init__(self, interval: float = None, history_size: int = None, include_connections: bool = None):
+        self.interval = interval or settings.SYSTEM_SAMPLE_INTERVAL
+        self.include_connections = settings.SYSTEM_SAMPLE_CONNECTIONS if include_connections is None else include_connections
+        self.history = deque(maxlen=history_size or settings.SYSTEM_HISTORY_SIZE)
+        self._snapshot: Optional[SystemSnapshot] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._worker = None
+        self._worker_pid = None
+        self._process = None
+        self._process_pid = None
+        self._static = None
+
+    def start(self) -> None:
+        """샘플링 스레드 시작 (프로세스마다 한 번, 앱 시작 이벤트에서 호출)"""
+        with self._lock:
+            if self._worker_pid == os.getpid():
+                return
+            self._worker_pid = os.getpid()
+            self._stop.clear()
+            self._worker = threading.Thread(target=self._sample_loop, name="system-sampler", daemon=True)
+            self._worker.start()
+
+    def stop(self) -> None:
+        with self._lock:
+            self._stop.set()
+            self._worker_pid = None
+
+    def snapshot(self) -> SystemSnapshot:
+        """최신 스냅샷 (샘플러가 아직 돌지 않았으면 한 번 수집)"""
+        snapshot = self._snapshot
+        if snapshot is None or self._process_pid != os.getpid():
+            snapshot = self.sample()
+        return snapshot
+
+    def history_points(self) -> List[Dict[str, Any]]:
+        """최근 샘플의 주요 값 (오래된 순)"""
+        return list(self.history)
+
+    def _sample_loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.sample()
+            except Exception as e:
+                logger.warning(f"시스템 지표 수집 실패: {str(e)}")
+            self._stop.wait(self.interval)
+
+    def _current_process(self) -> psutil.Process:
+        """cpu_percent 계산을 위해 재사용하는 Process 객체 (fork 후 새로 만듦)"""
+        if self._process_pid != os.getpid():
+            self._process = psutil.Process()
+            self._process_pid = os.getpid()
+            # 첫 cpu_percent 호출은 기준값만 잡고 0.0을 반환하므로 미리 호출
+            self._process.cpu_percent()
+            psutil.cpu_percent(interval=None)
+            self.history.clear()
+        return self._process
+
+    def _static_info(self) -> Dict[str, Any]:
+        """바뀌지 않는 정보 (플랫폼/Docker)는 한 번만 수집"""
+        if self._static is None:
+            self._static = {
+                "system": SystemInfoCollector._get_system_info(),
+                "docker": SystemInfoCollector._get_docker_info()
+            }
+        return self._static
+
+    def sample(self) -> SystemSnapshot:
+        """지금 한 번 수집해 스냅샷 교체"""
+        process = self._current_process()
+        now = time.time()
+        static = self._static_info()
+        cpu = SystemInfoCollector._get_cpu_info()
+        memory = SystemInfoCollector._get_memory_info()
+        process_info = SystemInfoCollector._get_process_info(process)
+        container = SystemInfoCollector._get_container_limits()
+        timestamp = datetime.fromtimestamp(now).isoformat()
+        info = {
+            "timestamp": timestamp,
+            "sample_interval": self.interval,
+            "system": static["system"],
+            "cpu": cpu,
+            "memory": memory,
+            "disk": SystemInfoCollector._get_disk_info(),
+            "network": SystemInfoCollector._get_network_info(include_connections=self.include_connections),
+            "process": process_info,
+            "container": container,
+            "docker": static["docker"]
+        }
+        status = {
+            "status": "healthy",
+            "timestamp": timestamp,
+            "pid": process_info["pid"],
+            "cpu_usage": cpu["usage_percent"],
+            "memory_usage": memory["usage_percent"],
+            "memory_available_gb": memory["available_gb"],
+            "process_cpu_percent": process_info["cpu_percent"],
+            "process_memory_mb": process_info["memory_mb"],
+            "container_memory_usage_percent": container["memory_usage_percent"]
+        }
+        snapshot = SystemSnapshot(now, info, status)
+        self.history.append({
+            "timestamp": timestamp,
+            "cpu_usage": cpu["usage_percent"],
+            "load_1m": cpu["load_average"][0] if cpu["load_average"] else None,
+            "memory_usage": memory["usage_percent"],
+            "process_cpu_percent": process_info["cpu_percent"],
+            "process_memory_mb": process_info["memory_mb"],
+            "process_threads": process_info["num_threads"]
+        })
+        self._snapshot = snapshot
+        return snapshot
+
+
+system_sampler = SystemSampler()
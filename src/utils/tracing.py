@@ -0,0 +1,212 @@
+"""
+분산 추적 (W3C Trace Context)
+
+- TracingMiddleware가 요청의 traceparent 헤더를 읽어 서버 스팬을 열고, 서비스/업스트림 호출은 trace_span으로 자식 스팬을 만듦
+- 샘플링은 루트에서 한 번만 결정(헤드 샘플링): 들어온 traceparent가 있으면 그 sampled 플래그를 따르고,
+  없으면 TRACE_SAMPLE_RATIO 확률로 샘플링함. 샘플링되지 않은 트레이스의 자식은 새 스팬을 만들지 않음
+- 끝난 스팬은 BatchSpanExporter 큐에 넣기만 하고, 내보내기(OTLP/HTTP 또는 JSONL 파일)는 백그라운드 스레드가 배치로 처리함
+- 현재 스팬은 contextvars로 전파되므로 run_in_threadpool/작업 스레드에서도 같은 트레이스에 이어짐
+"""
+
+import random
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional, Tuple
+from src.config.config import settings
+
+SPAN_KIND_INTERNAL = "internal"
+SPAN_KIND_SERVER = "server"
+SPAN_KIND_CLIENT = "client"
+
+_TRACEPARENT_PATTERN = re.compile(r"^([0-9a-f]{2})-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})(-.*)?$")
+_INVALID_TRACE_ID = "0" * 32
+_INVALID_SPAN_ID = "0" * 16
+
+
+class Span:
+    """스팬 하나 (샘플링되지 않은 스팬은 ID만 전파하고 내보내지 않음)"""
+
+    __slots__ = (
+        "trace_id", "span_id", "parent_span_id", "name", "kind", "sampled",
+        "start_ns", "end_ns", "attributes", "status", "status_message"
+    )
+
+    def __init__(self, name: str, trace_id: str, span_id: str, parent_span_id: str = "", kind: str = SPAN_KIND_INTERNAL, sampled: bool = True):
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.parent_span_id = parent_span_id
+        self.name = name
+        self.kind = kind
+        self.sampled = sampled
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.attributes: Dict[str, Any] = {}
+        self.status = "unset"
+        self.status_message = ""
+
+    @property
+    def traceparent(self) -> str:
+        """이 스팬을 부모로 하는 traceparent 헤더 값"""
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        if self.sampled and value is not None:
+            self.attributes[key] = value
+
+    def set_error(self, error: BaseException) -> None:
+        """오류 상태 기록 (예외 타입/메시지)"""
+        self.status = "error"
+        self.status_message = str(error)[:256]
+        self.set_attribute("error.type", type(error).__name__)
+
+    def end(self) -> None:
+        """스팬 종료 - 샘플링된 스팬만 내보내기 큐에 넣음"""
+        if self.end_ns:
+            return
+        self.end_ns = time.time_ns()
+        if self.sampled:
+            _get_exporter().export(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSONL 파일용 평탄한 표현"""
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_span_id or None,
+            "name": self.name,
+            "kind": self.kind,
+            "start_time_unix_nano": self.start_ns,
+            "end_time_unix_nano": self.end_ns,
+            "duration_ms": round((self.end_ns - self.start_ns) / 1_000_000, 3),
+            "status": self.status,
+            "status_message": self.status_message or None,
+            "attributes": self.attributes
+        }
+
+
+# 추적이 꺼져 있을 때 trace_span이 돌려주는 공용 스팬 (기록/전파하지 않음)
+_NOOP_SPAN = Span("noop", _INVALID_TRACE_ID, _INVALID_SPAN_ID, sampled=False)
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+_exporter = None
+
+
+def _get_exporter():
+    """설정에 맞는 BatchSpanExporter (첫 스팬 종료 시 생성)"""
+    global _exporter
+    if _exporter is None:
+        from src.external.trace_exporter import create_span_exporter
+
+        _exporter = create_span_exporter()
+    return _exporter
+
+
+def shutdown() -> None:
+    """남은 스팬을 모두 내보냄 (앱 종료 시 호출)"""
+    if _exporter is not None:
+        _exporter.flush()
+
+
+def _new_trace_id() -> str:
+    return f"{random.getrandbits(128) or 1:032x}"
+
+
+def _new_span_id() -> str:
+    return f"{random.getrandbits(64) or 1:016x}"
+
+
+def parse_traceparent(header: Optional[str]) -> Optional[Tuple[str, str, bool]]:
+    """
+    traceparent 헤더 파싱
+
+    Returns:
+        (trace_id, parent_span_id, sampled) - 형식이 잘못되었거나 ID가 모두 0이면 None
+    """
+    if not header:
+        return None
+    match = _TRACEPARENT_PATTERN.match(header.strip().lower())
+    if match is None:
+        return None
+    version, trace_id, span_id, flags, rest = match.groups()
+    # 버전 ff는 무효, 버전 00은 뒤에 추가 필드가 없어야 함 (이후 버전은 앞 4개 필드만 해석)
+    if version == "ff" or (version == "00" and rest):
+        return None
+    if trace_id == _INVALID_TRACE_ID or span_id == _INVALID_SPAN_ID:
+        return None
+    return trace_id, span_id, bool(int(flags, 16) & 0x01)
+
+
+def start_span(name: str, kind: str = SPAN_KIND_INTERNAL, traceparent: str = None) -> Span:
+    """
+    스팬 시작 (현재 컨텍스트에 설정하지 않음 - trace_span 또는 호출자가 관리)
+
+    traceparent가 주어지면 그 트레이스를 이어받고, 아니면 현재 스팬의 자식으로 만듦.
+    부모가 없으면 새 트레이스를 시작하며 이때 샘플링 여부를 결정함
+    """
+    parent = parse_traceparent(traceparent) if traceparent else None
+    if parent is not None:
+        trace_id, parent_span_id, sampled = parent
+    else:
+        current = _current_span.get()
+        if current is not None:
+            trace_id, parent_span_id, sampled = current.trace_id, current.span_id, current.sampled
+        else:
+            trace_id, parent_span_id, sampled = _new_trace_id(), "", random.random() < settings.TRACE_SAMPLE_RATIO
+    return Span(name, trace_id, _new_span_id(), parent_span_id, kind, sampled)
+
+
+def open_span(name: str, kind: str = SPAN_KIND_INTERNAL, attributes: Dict[str, Any] = None, parent_required: bool = False) -> Optional[Span]:
+    """
+    현재 컨텍스트에 설정하지 않는 스팬 시작 - with 블록으로 감쌀 수 없는 구간(HTTP 훅, 제너레이터)용, 호출자가 end() 호출
+
+    Returns:
+        기록할 스팬 - 추적이 꺼져 있거나, 샘플링되지 않았거나, parent_required인데 현재 스팬이 없으면 None
+    """
+    if not settings.TRACING_ENABLED:
+        return None
+    current = _current_span.get()
+    if (current is None and parent_required) or (current is not None and not current.sampled):
+        return None
+    span = start_span(name, kind)
+    if not span.sampled:
+        return None
+    for key, value in (attributes or {}).items():
+        span.set_attribute(key, value)
+    return span
+
+
+@contextmanager
+def trace_span(name: str, kind: str = SPAN_KIND_INTERNAL, traceparent: str = None, attributes: Dict[str, Any] = None) -> Iterator[Span]:
+    """
+    스팬을 열고 현재 스팬으로 설정하는 컨텍스트 매니저 (예외는 오류 상태로 기록 후 다시 발생)
+
+    추적이 꺼져 있거나 부모 트레이스가 샘플링되지 않았으면 새 스팬을 만들지 않고 기존 스팬을 그대로 돌려줌
+    """
+    if not settings.TRACING_ENABLED:
+        yield _NOOP_SPAN
+        return
+    current = _current_span.get()
+    if traceparent is None and current is not None and not current.sampled:
+        yield current
+        return
+
+    span = start_span(name, kind, traceparent)
+    for key, value in (attributes or {}).items():
+        span.set_attribute(key, value)
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException as e:
+        span.set_error(e)
+        raise
+    finally:
+        _current_span.reset(token)
+        span.end()
+
+
+def current_span() -> Optional[Span]:
+    """현재 스팬 (없으면 None)"""
+    return _current_span.get()
@@ -0,0 +1,71 @@
+"""
+크기 제한 + TTL 기반 인메모리 저장소
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLStore(Generic[V]):
+    """
+    최대 항목 수와 TTL을 갖는 스레드 안전 저장소
+
+    특징:
+    - 삽입 순서(OrderedDict)로 관리하여 만료/초과 항목을 앞에서부터 O(1)로 제거
+    - 갱신(put) 시 TTL이 연장되고 맨 뒤로 이동
+    - 별도 정리 스레드 없이 접근 시점에 만료 항목을 정리
+    """
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._items: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, key: Hashable, value: V) -> None:
+        """항목 저장 (기존 항목은 덮어쓰고 TTL 연장)"""
+        now = time.monotonic()
+        with self._lock:
+            self._items.pop(key, None)
+            self._items[key] = (now + self.ttl, value)
+            self._evict(now)
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """항목 조회 (없거나 만료되었으면 None)"""
+        now = time.monotonic()
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at <= now:
+                del self._items[key]
+                return None
+            return value
+
+    def pop(self, key: Hashable) -> Optional[V]:
+        """항목 제거 후 반환"""
+        with self._lock:
+            item = self._items.pop(key, None)
+        return item[1] if item else None
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._evict(time.monotonic())
+            return len(self._items)
+
+    def stats(self) -> Dict[str, Any]:
+        """저장소 상태 정보"""
+        return {"entries": len(self), "max_entries": self.max_entries, "ttl_seconds": self.ttl}
+
+    def _evict(self, now: float) -> None:
+        # 앞쪽(가장 오래 갱신되지 않은) 항목부터 만료 또는 초과분 제거
+        while self._items:
+            key, (expires_at, _) = next(iter(self._items.items()))
+            if expires_at > now and len(self._items) <= self.max_entries:
+                break
+            del self._items[key]
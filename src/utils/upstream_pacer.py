@@ -0,0 +1,224 @@
+"""
+OpenAI 레이트 리밋 헤더 기반 업스트림 페이싱
+
+응답마다 오는 x-ratelimit-* 헤더로 API Key·모델별 남은 업스트림 용량을 추적하고,
+남은 예산이 임계치 아래로 떨어지면 리셋 시점까지 요청을 고르게 분산시켜 429를 사전에 피함
+"""
+
+import re
+import threading
+import time
+from typing import Any, Dict, List, Mapping, Optional
+from src.utils.logger import get_logger
+from src.utils.metric_labels import model_label
+from src.utils.rate_limiter import key_fingerprint
+from src.utils.shared_metrics import metrics
+from src.config.config import settings
+
+logger = get_logger(__name__)
+
+# "6m0s", "1s", "20ms", "1h2m3.5s" 형식의 리셋 시간
+_DURATION_PATTERN = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+
+def parse_reset_duration(value: Optional[str]) -> Optional[float]:
+    """x-ratelimit-reset-* 헤더 값을 초 단위로 변환 (파싱 불가 시 None)"""
+    if not value:
+        return None
+    matches = _DURATION_PATTERN.findall(value)
+    if not matches:
+        return None
+    return sum(float(number) * _DURATION_UNITS[unit] for number, unit in matches)
+
+
+def _parse_int(value: Optional[str]) -> Optional[int]:
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class UpstreamCapacity:
+    """API Key·모델 하나에 대한 업스트림 잔여 용량 상태"""
+
+    __slots__ = (
+        "key_id", "model",
+        "limit_requests", "limit_tokens",
+        "remaining_requests", "remaining_tokens",
+        "requests_reset_at", "tokens_reset_at",
+        "next_slot_at", "updated_at", "paced_count", "paced_seconds"
+    )
+
+    def __init__(self, key_id: str, model: str):
+        self.key_id = key_id
+        self.model = model
+        self.limit_requests: Optional[int] = None
+        self.limit_tokens: Optional[int] = None
+        self.remaining_requests: Optional[float] = None
+        self.remaining_tokens: Optional[float] = None
+        self.requests_reset_at = 0.0
+        self.tokens_reset_at = 0.0
+        self.next_slot_at = 0.0
+        self.updated_at = 0.0
+        self.paced_count = 0
+        self.paced_seconds = 0.0
+
+    def headroom(self, now: float) -> Dict[str, Optional[float]]:
+        """요청/토큰별 잔여 비율 (리셋 시점이 지났으면 1.0, 정보가 없으면 None)"""
+        return {
+            "requests": self._fraction(self.remaining_requests, self.limit_requests, self.requests_reset_at, now),
+            "tokens": self._fraction(self.remaining_tokens, self.limit_tokens, self.tokens_reset_at, now)
+        }
+
+    @staticmethod
+    def _fraction(remaining: Optional[float], limit: Optional[int], reset_at: float, now: float) -> Optional[float]:
+        if remaining is None or not limit:
+            return None
+        if now >= reset_at:
+            return 1.0
+        return max(0.0, remaining / limit)
+
+
+class UpstreamPacer:
+    """
+    레이트 리밋 헤더 기반 적응형 페이서
+
+    - observe(): 응답 헤더로 잔여 용량 갱신 (가장 최신 관측값이 진실)
+    - pace(): 잔여 비율이 threshold 미만이면 "리셋까지 남은 시간 / 남은 요청 수" 간격으로 요청 시작 시점을 배정
+      (다음 슬롯 시각을 공유하여 동시 요청도 순서대로 분산됨)
+    - 관측 사이에 보낸 요청은 추정치만큼 잔여량에서 미리 차감
+    - 관측한 잔여 요청/토큰 수는 공유 메트릭(llm_upstream_remaining_requests/_tokens, key_id·model 라벨)에도
+      가장 최근 값으로 기록 (사용자 키는 시리즈 수가 늘지 않도록 제외)
+    """
+
+    # 사용자 키까지 추적하므로 항목 수 제한 (초과 시 가장 오래된 항목 제거)
+    MAX_TRACKED = 10000
+
+    def __init__(self, threshold: float = None, max_delay: float = None):
+        self.threshold = settings.UPSTREAM_PACING_THRESHOLD if threshold is None else threshold
+        self.max_delay = settings.UPSTREAM_PACING_MAX_DELAY if max_delay is None else max_delay
+        self._capacities: Dict[tuple, UpstreamCapacity] = {}
+        self._lock = threading.Lock()
+
+    def _get_capacity(self, key_id: str, model: str) -> UpstreamCapacity:
+        capacity = self._capacities.get((key_id, model))
+        if capacity is None:
+            if len(self._capacities) >= self.MAX_TRACKED:
+                del self._capacities[next(iter(self._capacities))]
+            capacity = self._capacities[(key_id, model)] = UpstreamCapacity(key_id, model)
+        return capacity
+
+    def observe(self, api_key: str, model: str, headers: Mapping[str, str], export_metrics: bool = True) -> None:
+        """응답 헤더에서 레이트 리밋 정보 갱신 (export_metrics면 공유 메트릭 게이지에도 기록)"""
+        remaining_requests = _parse_int(headers.get("x-ratelimit-remaining-requests"))
+        remaining_tokens = _parse_int(headers.get("x-ratelimit-remaining-tokens"))
+        if remaining_requests is None and remaining_tokens is None:
+            return
+
+        now = time.monotonic()
+        requests_reset = parse_reset_duration(headers.get("x-ratelimit-reset-requests"))
+        tokens_reset = parse_reset_duration(headers.get("x-ratelimit-reset-tokens"))
+
+        key_id = key_fingerprint(api_key)
+        with self._lock:
+            capacity = self._get_capacity(key_id, model)
+            capacity.limit_requests = _parse_int(headers.get("x-ratelimit-limit-requests")) or capacity.limit_requests
+            capacity.limit_tokens = _parse_int(headers.get("x-ratelimit-limit-tokens")) or capacity.limit_tokens
+            if remaining_requests is not None:
+                capacity.remaining_requests = remaining_requests
+                capacity.requests_reset_at = now + (requests_reset or 0.0)
+            if remaining_tokens is not None:
+                capacity.remaining_tokens = remaining_tokens
+                capacity.tokens_reset_at = now + (tokens_reset or 0.0)
+            capacity.updated_at = time.time()
+
+        if export_metrics:
+            labels = {"key_id": key_id, "model": model_label(model)}
+            if remaining_requests is not None:
+                metrics.gauge_set("llm_upstream_remaining_requests", remaining_requests, labels=labels)
+            if remaining_tokens is not None:
+                metrics.gauge_set("llm_upstream_remaining_tokens", remaining_tokens, labels=labels)
+
+    def _interval(self, remaining: Optional[float], limit: Optional[int], reset_at: float, units: float, now: float) -> float:
+        """잔여 예산을 리셋 시점까지 고르게 쓰기 위한 요청 간 간격 (여유가 있으면 0)"""
+        if remaining is None or not limit or now >= reset_at:
+            return 0.0
+        if remaining / limit >= self.threshold:
+            return 0.0
+        remaining_units = max(remaining / units, 0.0)
+        return (reset_at - now) / (remaining_units + 1.0)
+
+    def delay_for(self, api_key: str, model: str, estimated_tokens: int) -> float:
+        """
+        이번 요청을 보내기 전 대기해야 할 시간(초)을 배정하고 잔여량을 미리 차감
+
+        Returns:
+            float: 대기 시간 (최대 max_delay)
+        """
+        now = time.monotonic()
+        with self._lock:
+            capacity = self._capacities.get((key_fingerprint(api_key), model))
+            if capacity is None:
+                return 0.0
+
+            interval = max(
+                self._interval(capacity.remaining_requests, capacity.limit_requests, capacity.requests_reset_at, 1.0, now),
+                self._interval(capacity.remaining_tokens, capacity.limit_tokens, capacity.tokens_reset_at, max(estimated_tokens, 1), now)
+            )
+
+            # 다음 응답 헤더가 오기 전까지 자체적으로 잔여량 차감
+            if capacity.remaining_requests is not None and now < capacity.requests_reset_at:
+                capacity.remaining_requests -= 1
+            if capacity.remaining_tokens is not None and now < capacity.tokens_reset_at:
+                capacity.remaining_tokens -= estimated_tokens
+
+            if interval <= 0:
+                return 0.0
+
+            slot = max(now, capacity.next_slot_at)
+            delay = min(slot - now, self.max_delay)
+            capacity.next_slot_at = now + delay + interval
+            capacity.paced_count += 1
+            capacity.paced_seconds += delay
+            return delay
+
+    def pace(self, api_key: str, model: str, estimated_tokens: int) -> float:
+        """필요 시 대기 후 실제 대기 시간을 반환"""
+        delay = self.delay_for(api_key, model, estimated_tokens)
+        if delay > 0:
+            logger.debug(f"업스트림 페이싱 대기: {delay:.3f}s (model: {model})")
+            time.sleep(delay)
+        return delay
+
+    def headroom(self, api_key: str, model: str) -> float:
+        """API Key·모델의 잔여 비율 (요청/토큰 중 작은 값, 관측 전이면 1.0)"""
+        now = time.monotonic()
+        with self._lock:
+            capacity = self._capacities.get((key_fingerprint(api_key), model))
+            if capacity is None:
+                return 1.0
+            fractions = [value for value in capacity.headroom(now).values() if value is not None]
+        return min(fractions) if fractions else 1.0
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """API Key·모델별 관측된 잔여 용량 (메트릭/모니터링용)"""
+        now = time.monotonic()
+        with self._lock:
+            return [
+                {
+                    "key_id": capacity.key_id,
+                    "model": capacity.model,
+                    "limit_requests": capacity.limit_requests,
+                    "limit_tokens": capacity.limit_tokens,
+                    "remaining_requests": capacity.remaining_requests,
+                    "remaining_tokens": capacity.remaining_tokens,
+                    "requests_reset_in": max(0.0, capacity.requests_reset_at - now),
+                    "tokens_reset_in": max(0.0, capacity.tokens_reset_at - now),
+                    "headroom": capacity.headroom(now),
+                    "paced_count": capacity.paced_count,
+                    "paced_seconds": round(capacity.paced_seconds, 3),
+                    "updated_at": capacity.updated_at
+                }
+                for capacity in self._capacities.values()
+            ]
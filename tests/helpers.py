@@ -0,0 +1,61 @@
+"""
+테스트 공용 도구
+- 고정 응답을 반환하는 가짜 업스트림 클라이언트
+- 채팅 요청 본문 및 채팅 라우터를 올린 테스트 앱(ASGITransport) 기반 테스트 클래스
+"""
+
+import unittest
+from types import SimpleNamespace
+import httpx
+from fastapi import FastAPI
+from src.api import routes
+from src.api.request_context_middleware import RequestContextMiddleware
+
+CHAT_BODY = {"user_prompt": "안녕", "model": "gpt-4o-mini", "use_user_api_key": True, "openai_api_key": "sk-test"}
+
+
+def make_usage(input_tokens: int = 10, output_tokens: int = 5, cached_tokens: int = None, reasoning_tokens: int = None):
+    """Responses API usage 객체 (세부 토큰 수를 주지 않으면 details는 None)"""
+    return SimpleNamespace(
+        input_tokens=input_tokens, output_tokens=output_tokens, total_tokens=input_tokens + output_tokens,
+        input_tokens_details=None if cached_tokens is None else SimpleNamespace(cached_tokens=cached_tokens),
+        output_tokens_details=None if reasoning_tokens is None else SimpleNamespace(reasoning_tokens=reasoning_tokens)
+    )
+
+
+class FakeClient:
+    """고정 응답을 반환하는 가짜 업스트림 클라이언트"""
+
+    def __init__(self, usage=None):
+        self.usage = usage or make_usage()
+
+    def generate_response(self, messages, api_key, **kwargs):
+        return SimpleNamespace(
+            id="resp_1", object="response", created_at=0, status="completed", model=kwargs["model"],
+            output_text="안녕", usage=self.usage, text=SimpleNamespace(format=SimpleNamespace(type="text"))
+        )
+
+
+def build_chat_app(*middlewares) -> FastAPI:
+    """채팅 라우터를 올린 테스트 앱 (RequestContextMiddleware가 주어진 미들웨어보다 바깥에 위치)"""
+    app = FastAPI()
+    for middleware in middlewares:
+        app.add_middleware(middleware)
+    app.add_middleware(RequestContextMiddleware)
+    app.include_router(routes.router)
+    return app
+
+
+class ChatAppTestCase(unittest.IsolatedAsyncioTestCase):
+    """routes.chat_service의 업스트림 클라이언트를 FakeClient로 바꾸고 self.client로 app을 호출하는 기반 클래스"""
+
+    app: FastAPI = None
+
+    async def asyncSetUp(self):
+        self.original_client = routes.chat_service.openai_client
+        routes.chat_service.openai_client = FakeClient()
+        self.client = httpx.AsyncClient(transport=httpx.ASGITransport(app=self.app), base_url="http://test")
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+        routes.chat_service.openai_client = self.original_client
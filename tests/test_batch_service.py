@@ -0,0 +1,147 @@
+"""
+배치 작업 테스트
+- JSONL/msgpack 파싱 및 검증 테스트
+- 로컬 업스트림을 통한 제출/폴링/결과 수집 테스트
+- 배치 가격 비용 계산 테스트
+- 작업 상태 영속화 테스트
+"""
+
+import json
+import tempfile
+import unittest
+import msgpack
+from src.external.batch_upstream import LocalBatchUpstream
+from src.models.request_dto import ChatRequest
+from src.services.batch_service import BatchService, BatchJobStore
+from src.services.chat_service import ChatService
+from src.utils.cost_calculator import LLMCostCalculator
+from src.exceptions.chat_exceptions import ValidationException, JobNotFoundException
+
+
+def _to_jsonl(requests: list[dict]) -> bytes:
+    return "\n".join(json.dumps(request, ensure_ascii=False) for request in requests).encode("utf-8")
+
+
+class TestBatchService(unittest.TestCase):
+    """배치 작업 서비스 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.upstream = LocalBatchUpstream()
+        self.batch_service = BatchService(
+            chat_service=ChatService(),
+            upstream=self.upstream,
+            store=BatchJobStore(self.temp_dir.name),
+            poll_interval=0
+        )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_parse_jsonl(self):
+        """JSONL 파싱 테스트"""
+        payload = _to_jsonl([
+            {"request_id": "req-1", "user_prompt": "안녕하세요"},
+            {"request_id": "req-2", "user_prompt": "반가워요", "model": "gpt-4o"}
+        ]) + b"\n\n"
+
+        requests = self.batch_service.parse_jsonl(payload)
+
+        self.assertEqual(len(requests), 2)
+        self.assertEqual(requests[1].model, "gpt-4o")
+
+    def test_parse_jsonl_invalid_line(self):
+        """잘못된 JSONL 줄 검증 테스트"""
+        payload = _to_jsonl([{"user_prompt": "안녕하세요"}]) + b"\n{not json}"
+
+        with self.assertRaises(ValidationException) as context:
+            self.batch_service.parse_jsonl(payload)
+        self.assertEqual(context.exception.value, "2")
+
+    def test_reject_user_api_key(self):
+        """사용자 API Key 요청 거부 테스트"""
+        requests = [ChatRequest(user_prompt="안녕하세요", openai_api_key="sk-test", use_user_api_key=True)]
+
+        with self.assertRaises(ValidationException):
+            self.batch_service.create_job(requests)
+
+    def test_parse_msgpack(self):
+        """msgpack 스트림/배열 파싱 테스트"""
+        stream = msgpack.packb({"request_id": "req-1", "user_prompt": "a"}) + msgpack.packb({"request_id": "req-2", "user_prompt": "b"})
+        array = msgpack.packb([{"request_id": "req-1", "user_prompt": "a"}, {"request_id": "req-2", "user_prompt": "b"}])
+
+        for payload in (stream, array):
+            requests = self.batch_service.parse_msgpack(payload)
+            self.assertEqual([request.request_id for request in requests], ["req-1", "req-2"])
+
+        with self.assertRaises(ValidationException):
+            self.batch_service.parse_msgpack(msgpack.packb({"temperature": 5}))
+        with self.assertRaises(ValidationException):
+            self.batch_service.parse_msgpack(b"")
+
+    def test_submit_and_collect_results(self):
+        """제출 후 폴링하여 결과 수집 테스트"""
+        requests = self.batch_service.parse_jsonl(_to_jsonl([
+            {"request_id": "req-1", "user_prompt": "첫 번째 질문", "system_prompt": "친절하게"},
+            {"request_id": "req-2", "user_prompt": "두 번째 질문"}
+        ]))
+
+        job = self.batch_service.create_job(requests)
+        self.assertEqual(job.status, "in_progress")
+        self.assertEqual(job.request_ids, ["req-1", "req-2"])
+
+        results = self.batch_service.get_results(job.job_id)
+
+        self.assertEqual(results.job.status, "completed")
+        self.assertEqual(results.job.completed_count, 2)
+        self.assertEqual([result.request_id for result in results.results], ["req-1", "req-2"])
+        self.assertEqual(results.results[0].output_text, "첫 번째 질문")
+        self.assertEqual(results.job.total_cost, sum(result.cost for result in results.results))
+
+    def test_batch_pricing(self):
+        """배치 가격 비용 계산 테스트"""
+        full_cost = LLMCostCalculator.calculate_cost("gpt-4o", 1000, 500)
+        batch_cost = LLMCostCalculator.calculate_batch_cost("gpt-4o", 1000, 500)
+
+        self.assertEqual(batch_cost, (full_cost + 1) // 2)
+
+    def test_failed_request_in_batch(self):
+        """배치 내 개별 요청 실패 테스트"""
+        def responder(body):
+            raise RuntimeError("upstream failure")
+
+        self.batch_service.upstream.responder = responder
+        requests = [ChatRequest(request_id="req-1", user_prompt="안녕하세요")]
+
+        job = self.batch_service.create_job(requests)
+        results = self.batch_service.get_results(job.job_id)
+
+        self.assertEqual(results.job.failed_count, 1)
+        self.assertFalse(results.results[0].success)
+
+    def test_job_persistence(self):
+        """작업 상태 영속화 테스트"""
+        job = self.batch_service.create_job([ChatRequest(request_id="req-1", user_prompt="안녕하세요")])
+        self.batch_service.get_job(job.job_id)
+
+        reloaded_service = BatchService(
+            chat_service=self.batch_service.chat_service,
+            upstream=self.upstream,
+            store=BatchJobStore(self.temp_dir.name)
+        )
+        reloaded = reloaded_service.get_results(job.job_id)
+
+        self.assertEqual(reloaded.job.status, "completed")
+        self.assertEqual(len(reloaded.results), 1)
+
+    def test_unknown_job(self):
+        """존재하지 않는 작업 조회 테스트"""
+        with self.assertRaises(JobNotFoundException):
+            self.batch_service.get_job("batch_missing")
+        with self.assertRaises(JobNotFoundException):
+            self.batch_service.get_job("../etc")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,262 @@
+"""
+WebSocket 채팅 채널 테스트
+- 스트리밍 delta/done 프레임 및 세션 기록 유지 테스트
+- 진행 중인 생성 취소 테스트
+- msgpack 프레임 및 ping/pong 테스트
+- 잘못된 프레임/중복 턴 오류 테스트
+- 유휴 연결 종료 테스트
+- ChatService 스트리밍 완료/취소 정산 테스트
+- 세션 ID: 서버 발급 값만 이어서 사용 테스트
+"""
+
+import asyncio
+import json
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+import msgpack
+from src.api.chat_socket import ChatSocketConnection
+from src.models.request_dto import ChatRequest
+from src.models.response_dto import ChatResponse
+from src.services.chat_service import ChatService
+from src.services.session_service import SESSION_ID_PATTERN, SessionService
+from src.exceptions.chat_exceptions import ValidationException
+
+
+class FakeWebSocket:
+    """receive/send_text/send_bytes/close만 흉내 내는 WebSocket"""
+
+    def __init__(self):
+        self.incoming: asyncio.Queue = asyncio.Queue()
+        self.outgoing: asyncio.Queue = asyncio.Queue()
+        self.close_code = None
+
+    async def receive(self):
+        return await self.incoming.get()
+
+    async def send_text(self, data: str):
+        await self.outgoing.put(json.loads(data))
+
+    async def send_bytes(self, data: bytes):
+        await self.outgoing.put(msgpack.unpackb(data, raw=False))
+
+    async def close(self, code: int = 1000):
+        self.close_code = code
+        await self.incoming.put({"type": "websocket.disconnect", "code": code})
+
+    def client_send(self, frame: dict, binary: bool = False):
+        if binary:
+            self.incoming.put_nowait({"type": "websocket.receive", "bytes": msgpack.packb(frame)})
+        else:
+            self.incoming.put_nowait({"type": "websocket.receive", "text": json.dumps(frame)})
+
+    def client_disconnect(self):
+        self.incoming.put_nowait({"type": "websocket.disconnect", "code": 1000})
+
+    async def next_frame(self, frame_type: str = None) -> dict:
+        while True:
+            frame = await asyncio.wait_for(self.outgoing.get(), timeout=5)
+            if frame_type is None or frame["type"] == frame_type:
+                return frame
+
+
+class FakeChatService:
+    """출력 조각 두 개를 스트리밍하고, "slow" 프롬프트는 취소될 때까지 대기하는 가짜 서비스"""
+
+    def __init__(self):
+        self.requests = []
+
+    def stream_chat_request(self, request, tenant_id=None, priority=None, cancel_event=None):
+        self.requests.append(request.model_copy(deep=True))
+        yield "안녕"
+        if request.user_prompt == "slow":
+            cancel_event.wait(timeout=5)
+            yield ChatResponse(id="", request_id=request.request_id, status="cancelled", output_text="안녕")
+            return
+        yield "하세요"
+        yield ChatResponse(id="resp_1", request_id=request.request_id, output_text="안녕하세요")
+
+
+class FakeStreamClient:
+    """출력 조각 세 개와 완료 이벤트를 보내는 가짜 업스트림 클라이언트"""
+
+    def __init__(self):
+        self.closed = False
+
+    def stream_response(self, messages, api_key, **kwargs):
+        try:
+            for text in ("하나", "둘", "셋"):
+                yield SimpleNamespace(type="response.output_text.delta", delta=text)
+            usage = SimpleNamespace(input_tokens=10, output_tokens=3, total_tokens=13, input_tokens_details=None, output_tokens_details=None)
+            yield SimpleNamespace(type="response.completed", response=SimpleNamespace(
+                id="resp_1", object="response", created_at=0, status="completed", model=kwargs["model"],
+                output_text="하나둘셋", usage=usage, text=SimpleNamespace(format=SimpleNamespace(type="text"))
+            ))
+        finally:
+            self.closed = True
+
+
+class TestChatServiceStream(unittest.TestCase):
+    """ChatService 스트리밍 정산 테스트 클래스"""
+
+    def setUp(self):
+        self.chat_service = ChatService()
+        self.chat_service.openai_client = FakeStreamClient()
+        self.request = ChatRequest(user_prompt="안녕", use_user_api_key=True, openai_api_key="sk-test")
+
+    def test_stream_completed(self):
+        """출력 조각 스트리밍 후 ChatResponse 반환 및 슬롯 반환 테스트"""
+        items = list(self.chat_service.stream_chat_request(self.request))
+
+        self.assertEqual(items[:3], ["하나", "둘", "셋"])
+        self.assertEqual(items[-1].output_text, "하나둘셋")
+        self.assertEqual(self.chat_service.scheduler.stats()["active"], 0)
+
+    def test_stream_cancelled(self):
+        """취소 시 업스트림 스트림 종료 및 cancelled 응답 정산 테스트"""
+        cancel_event = threading.Event()
+        stream = self.chat_service.stream_chat_request(self.request, cancel_event=cancel_event)
+
+        self.assertEqual(next(stream), "하나")
+        cancel_event.set()
+        response = next(stream)
+
+        self.assertEqual((response.status, response.output_text), ("cancelled", "하나"))
+        self.assertTrue(self.chat_service.openai_client.closed)
+        self.assertEqual(self.chat_service.scheduler.stats()["active"], 0)
+
+
+class TestChatSocket(unittest.IsolatedAsyncioTestCase):
+    """WebSocket 채팅 채널 테스트 클래스"""
+
+    def setUp(self):
+        self.websocket = FakeWebSocket()
+        self.chat_service = FakeChatService()
+        self.session_service = SessionService(max_sessions=10, ttl=60, max_history=10)
+        self.session = self.session_service.open()
+
+    def _connect(self, encoding: str = "json", **kwargs) -> asyncio.Task:
+        connection = ChatSocketConnection(
+            self.websocket,
+            chat_service=self.chat_service,
+            session_service=self.session_service,
+            session=self.session,
+            encoding=encoding,
+            **kwargs
+        )
+        return asyncio.create_task(connection.run())
+
+    async def test_stream_and_session_history(self):
+        """delta/done 프레임 스트리밍 및 다음 턴에 세션 기록 사용 테스트"""
+        task = self._connect()
+        self.assertEqual((await self.websocket.next_frame())["session_id"], self.session.session_id)
+
+        self.websocket.client_send({"type": "chat", "id": "t1", "user_prompt": "첫 질문"})
+        self.assertEqual((await self.websocket.next_frame())["text"], "안녕")
+        self.assertEqual((await self.websocket.next_frame())["text"], "하세요")
+        done = await self.websocket.next_frame()
+        self.assertEqual(done["type"], "done")
+        self.assertEqual(done["response"]["request_id"], "t1")
+
+        self.websocket.client_send({"type": "chat", "id": "t2", "user_prompt": "두 번째 질문"})
+        await self.websocket.next_frame("done")
+        self.websocket.client_disconnect()
+        await task
+
+        second_history = self.chat_service.requests[1].conversation_history
+        self.assertEqual([item.role for item in second_history], ["user", "assistant"])
+        self.assertEqual(second_history[1].content, "안녕하세요")
+        self.assertEqual(len(self.session.history), 4)
+
+    async def test_cancel(self):
+        """진행 중인 생성 취소 테스트"""
+        task = self._connect()
+        await self.websocket.next_frame("session")
+
+        self.websocket.client_send({"type": "chat", "id": "t1", "user_prompt": "slow"})
+        await self.websocket.next_frame("delta")
+        self.websocket.client_send({"type": "cancel", "id": "t1"})
+
+        cancelled = await self.websocket.next_frame()
+        self.assertEqual(cancelled["type"], "cancelled")
+        self.assertEqual(cancelled["response"]["status"], "cancelled")
+        # 취소된 턴은 세션 기록에 남기지 않음
+        self.assertEqual(self.session.history, [])
+
+        self.websocket.client_disconnect()
+        await task
+
+    async def test_msgpack_ping_pong(self):
+        """msgpack 인코딩 및 ping/pong 테스트"""
+        task = self._connect(encoding="msgpack")
+        await self.websocket.next_frame("session")
+
+        self.websocket.client_send({"type": "ping", "ts": 123}, binary=True)
+        self.assertEqual(await self.websocket.next_frame(), {"type": "pong", "ts": 123})
+
+        self.websocket.client_disconnect()
+        await task
+
+    async def test_invalid_frames(self):
+        """잘못된 프레임, 검증 실패, 중복 턴 오류 테스트"""
+        task = self._connect()
+        await self.websocket.next_frame("session")
+
+        self.websocket.incoming.put_nowait({"type": "websocket.receive", "text": "not json"})
+        self.assertEqual((await self.websocket.next_frame())["error_code"], "INVALID_FRAME")
+
+        self.websocket.client_send({"type": "chat", "id": "t0", "temperature": 5})
+        self.assertEqual((await self.websocket.next_frame())["error_code"], "VALIDATION_ERROR")
+
+        self.websocket.client_send({"type": "chat", "id": "t1", "user_prompt": "slow"})
+        await self.websocket.next_frame("delta")
+        self.websocket.client_send({"type": "chat", "id": "t2", "user_prompt": "또 질문"})
+        error = await self.websocket.next_frame("error")
+        self.assertEqual((error["id"], error["error_code"]), ("t2", "TURN_IN_PROGRESS"))
+
+        # 연결이 끊기면 진행 중인 생성도 취소됨
+        self.websocket.client_disconnect()
+        await task
+        await self.websocket.next_frame("cancelled")
+
+    async def test_idle_timeout(self):
+        """유휴 연결 종료 테스트"""
+        task = self._connect(ping_interval=0.05, idle_timeout=0.1)
+        await self.websocket.next_frame("session")
+        await self.websocket.next_frame("ping")
+
+        started = time.monotonic()
+        await asyncio.wait_for(task, timeout=5)
+
+        self.assertEqual(self.websocket.close_code, 1001)
+        self.assertLess(time.monotonic() - started, 1)
+
+
+
+class TestSessionService(unittest.TestCase):
+    """세션 저장소 테스트 클래스"""
+
+    def test_only_server_issued_ids_resume(self):
+        """발급한 ID는 같은 테넌트에서만 이어지고, 클라이언트가 정한 ID는 거부하거나 새 ID로 바꿈"""
+        session_service = SessionService(max_sessions=10, ttl=60, max_history=10)
+        session = session_service.open()
+        self.assertRegex(session.session_id, SESSION_ID_PATTERN)
+
+        self.assertIs(session_service.open(session.session_id), session)
+        self.assertIsNot(session_service.open(session.session_id, tenant_id="other"), session)
+
+        for chosen in ("shared", "sess_1", "../sess", "sess_" + "G" * 32):
+            with self.assertRaises(ValidationException):
+                session_service.open(chosen)
+
+        # 형식은 맞지만 발급한 적 없는(또는 만료된) ID는 그대로 쓰지 않고 새 ID 발급
+        unknown = "sess_" + "0" * 32
+        fresh = session_service.open(unknown)
+        self.assertNotEqual(fresh.session_id, unknown)
+        self.assertEqual(fresh.history, [])
+        self.assertIsNot(session_service.open(unknown), fresh)
+
+
+if __name__ == "__main__":
+    unittest.main()
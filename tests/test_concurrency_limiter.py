@@ -0,0 +1,118 @@
+"""
+적응형 동시 실행 한도 테스트
+- 한도 내 즉시 허가 테스트
+- 대기 목표 초과 시 차단 테스트
+- 대기 중 슬롯 반환 시 진행 테스트
+- 지연 증가/실패 시 한도 감소 테스트
+- 정상 지연 시 한도 증가 테스트
+- 한도/진행 중/차단 수 공유 메트릭 기록 테스트
+"""
+
+import threading
+import unittest
+from src.utils.concurrency_limiter import AdaptiveConcurrencyLimiter
+from src.utils.shared_metrics import metrics
+from src.exceptions.chat_exceptions import OverloadedException
+
+
+def _limiter(**overrides):
+    options = dict(
+        initial_limit=2, min_limit=1, max_limit=10, latency_tolerance=2.0,
+        backoff_ratio=0.5, queue_target=0.05, adaptive=True
+    )
+    options.update(overrides)
+    return AdaptiveConcurrencyLimiter(**options)
+
+
+class TestAdaptiveConcurrencyLimiter(unittest.TestCase):
+    """적응형 동시 실행 한도 테스트 클래스"""
+
+    def test_shed_when_full(self):
+        """한도가 가득 차면 queue_target 후 차단 테스트"""
+        limiter = _limiter()
+        limiter.acquire("gpt-4o-mini")
+        limiter.acquire("gpt-4o-mini")
+
+        with self.assertRaises(OverloadedException) as context:
+            limiter.acquire("gpt-4o-mini")
+        self.assertGreater(context.exception.retry_after, 0)
+
+        # 다른 모델은 별도 한도
+        limiter.acquire("o3")
+
+        stats = limiter.stats()
+        self.assertEqual(stats["models"]["gpt-4o-mini"]["shed"], 1)
+        self.assertEqual(stats["in_flight"], 3)
+
+    def test_waiter_proceeds_after_release(self):
+        """대기 중 슬롯이 반환되면 진행 테스트"""
+        limiter = _limiter(initial_limit=1, queue_target=2.0)
+        permit = limiter.acquire("gpt-4o-mini")
+
+        threading.Timer(0.05, permit.release).start()
+        waited = limiter.acquire("gpt-4o-mini")
+
+        self.assertGreater(waited.queue_wait, 0)
+
+    def test_decrease_on_latency_spike(self):
+        """지연이 기준의 tolerance 배를 넘으면 한도 감소 테스트"""
+        limiter = _limiter(initial_limit=8)
+
+        limiter.acquire("gpt-4o-mini").release(latency=0.05)
+        limiter.acquire("gpt-4o-mini").release(latency=1.0)
+
+        self.assertEqual(limiter.stats()["models"]["gpt-4o-mini"]["limit"], 4)
+
+    def test_decrease_on_failure_once_per_window(self):
+        """과부하성 실패 시 한 창에 한 번만 감소 테스트"""
+        limiter = _limiter(initial_limit=8)
+        permits = [limiter.acquire("gpt-4o-mini") for _ in range(3)]
+
+        for permit in permits:
+            permit.release(success=False)
+
+        self.assertEqual(limiter.stats()["models"]["gpt-4o-mini"]["limit"], 4)
+
+    def test_increase_when_busy_and_healthy(self):
+        """한도 근처 사용 중 정상 지연이면 한도 증가 테스트"""
+        limiter = _limiter(initial_limit=2)
+
+        for _ in range(10):
+            permits = [limiter.acquire("gpt-4o-mini") for _ in range(limiter.stats()["models"].get("gpt-4o-mini", {}).get("limit", 2))]
+            for permit in permits:
+                permit.release(latency=0.05)
+
+        self.assertGreater(limiter.stats()["models"]["gpt-4o-mini"]["limit"], 2)
+
+    def test_static_limit(self):
+        """adaptive 비활성화 시 한도 고정 테스트"""
+        limiter = _limiter(initial_limit=2, adaptive=False)
+
+        limiter.acquire("gpt-4o-mini").release(success=False)
+
+        self.assertEqual(limiter.stats()["models"]["gpt-4o-mini"]["limit"], 2)
+
+    def test_shared_metrics(self):
+        """한도/진행 중/차단 수가 공유 메트릭에 반영되는지 테스트"""
+        labels = '{model="gpt-4o"}'
+        before = metrics.snapshot()
+
+        def delta(name: str) -> float:
+            return metrics.snapshot().get(name + labels, 0) - before.get(name + labels, 0)
+
+        limiter = _limiter(initial_limit=4)
+        permits = [limiter.acquire("gpt-4o") for _ in range(4)]
+        with self.assertRaises(OverloadedException):
+            limiter.acquire("gpt-4o")
+        self.assertEqual(delta("llm_concurrency_limit"), 4)
+        self.assertEqual(delta("llm_inflight"), 4)
+        self.assertEqual(delta("llm_requests_shed_total"), 1)
+
+        for permit in permits:
+            permit.release(success=False)
+        self.assertEqual(delta("llm_concurrency_limit"), 2)
+        self.assertEqual(delta("llm_inflight"), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+MessagePack 콘텐츠 협상 테스트
+- msgpack 요청 본문 → ChatRequest 검증 테스트
+- Accept 헤더 기반 응답 인코딩 선택 테스트
+- 잘못된 msgpack/필드 오류 응답 테스트
+- 중첩 모델 인코딩 테스트
+"""
+
+import json
+import unittest
+import httpx
+import msgpack
+from fastapi import APIRouter, FastAPI, Request
+from src.api.content_negotiation import NegotiatedRoute, negotiate, pack
+from src.models.batch_dto import BatchJob, BatchJobResults
+from src.models.request_dto import ChatRequest
+from src.models.response_dto import ChatResponse
+
+router = APIRouter(route_class=NegotiatedRoute)
+
+
+@router.post("/echo", response_model=ChatResponse)
+async def echo(request: ChatRequest, http_request: Request):
+    history = " / ".join(item.content for item in request.conversation_history)
+    return negotiate(http_request, ChatResponse(id="resp_1", request_id=request.request_id, output_text=history))
+
+
+app = FastAPI()
+app.include_router(router)
+
+HISTORY = [{"role": "user", "content": "안녕"}, {"role": "assistant", "content": "반가워요"}]
+
+
+class TestContentNegotiation(unittest.IsolatedAsyncioTestCase):
+    """MessagePack 콘텐츠 협상 테스트 클래스"""
+
+    async def asyncSetUp(self):
+        self.client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+
+    async def _post(self, body: bytes, content_type: str, accept: str = None) -> httpx.Response:
+        headers = {"content-type": content_type}
+        if accept:
+            headers["accept"] = accept
+        return await self.client.post("/echo", content=body, headers=headers)
+
+    async def test_msgpack_request_and_response(self):
+        """msgpack 요청 본문 검증 및 msgpack 응답 테스트"""
+        body = msgpack.packb({"request_id": "r1", "user_prompt": "hi", "conversation_history": HISTORY})
+        response = await self._post(body, "application/msgpack", accept="application/msgpack")
+
+        self.assertEqual(response.headers["content-type"], "application/msgpack")
+        payload = msgpack.unpackb(response.content)
+        self.assertEqual((payload["request_id"], payload["output_text"]), ("r1", "안녕 / 반가워요"))
+        self.assertEqual(payload, ChatResponse.model_validate(payload).model_dump())
+
+    async def test_accept_preference(self):
+        """Accept 선호도에 따른 응답 인코딩 선택 테스트"""
+        body = json.dumps({"request_id": "r1", "user_prompt": "hi"}).encode()
+
+        default = await self._post(body, "application/json")
+        self.assertEqual(default.json()["request_id"], "r1")
+
+        preferred_json = await self._post(body, "application/json", accept="application/msgpack;q=0.5, application/json")
+        self.assertEqual(preferred_json.headers["content-type"], "application/json")
+
+        preferred_msgpack = await self._post(body, "application/json", accept="application/json;q=0.5, application/msgpack")
+        self.assertEqual(msgpack.unpackb(preferred_msgpack.content)["request_id"], "r1")
+
+    async def test_invalid_bodies(self):
+        """잘못된 msgpack 및 필드 검증 실패 테스트"""
+        broken = await self._post(b"\xc1", "application/msgpack")
+        self.assertEqual(broken.status_code, 400)
+
+        invalid = await self._post(msgpack.packb({"user_prompt": "hi", "temperature": 5}), "application/msgpack")
+        self.assertEqual(invalid.status_code, 422)
+        self.assertEqual(invalid.json()["detail"][0]["loc"], ["body", "temperature"])
+
+    def test_pack_nested_models(self):
+        """중첩 모델(BatchJobResults) 인코딩 테스트"""
+        results = BatchJobResults(job=BatchJob(job_id="batch_1"), results=[ChatResponse(id="resp_1", request_id="r1")])
+
+        self.assertEqual(msgpack.unpackb(pack(results)), results.model_dump())
+
+
+if __name__ == "__main__":
+    unittest.main()
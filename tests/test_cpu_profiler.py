@@ -0,0 +1,119 @@
+"""
+샘플링 CPU 프로파일러 테스트
+- 모든 스레드의 스택 샘플링 및 collapsed stack 출력 테스트
+- 대기 중인 스레드 제외/포함 테스트
+- speedscope JSON 구조 테스트
+- 동시 세션 수 제한 테스트
+- /api/v1/admin/profile/cpu 엔드포인트 테스트
+"""
+
+import threading
+import time
+import unittest
+from unittest.mock import patch
+import httpx
+from fastapi import FastAPI
+from src.api.admin_routes import admin_router
+from src.api.exception_handlers import authorization_exception_handler, validation_exception_handler
+from src.exceptions.chat_exceptions import AuthorizationException, RateLimitException, ValidationException
+from src.utils.cpu_profiler import SamplingProfiler, SPEEDSCOPE_SCHEMA
+from src.config.config import settings
+
+app = FastAPI()
+app.add_exception_handler(AuthorizationException, authorization_exception_handler)
+app.add_exception_handler(ValidationException, validation_exception_handler)
+app.include_router(admin_router)
+
+
+def spin(stop):
+    while not stop.is_set():
+        sum(range(1000))
+
+
+class BusyThreads:
+    """CPU를 쓰는 스레드 하나와 기다리기만 하는 스레드 하나"""
+
+    def __enter__(self):
+        self.stop = threading.Event()
+        self.threads = [
+            threading.Thread(target=spin, args=(self.stop,), name="busy-worker", daemon=True),
+            threading.Thread(target=self.stop.wait, name="idle-worker", daemon=True)
+        ]
+        for thread in self.threads:
+            thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop.set()
+        for thread in self.threads:
+            thread.join()
+
+
+class TestCpuProfiler(unittest.IsolatedAsyncioTestCase):
+    """샘플링 CPU 프로파일러 테스트 클래스"""
+
+    def test_collapsed(self):
+        """CPU를 쓰는 스레드의 스택이 `스레드;...;함수 표본수` 형식으로 나오고, 대기 중인 스레드는 제외"""
+        with BusyThreads():
+            result = SamplingProfiler(max_sessions=1).profile(0.3, 200)
+
+        self.assertGreater(result.sample_count, 10)
+        lines = result.collapsed().splitlines()
+        busy = [line for line in lines if line.startswith("busy-worker;")]
+        self.assertTrue(busy, lines)
+        self.assertIn("spin (test_cpu_profiler.py:", busy[0])
+        self.assertTrue(busy[0].rsplit(" ", 1)[1].isdigit())
+        self.assertFalse(any(line.startswith("idle-worker;") for line in lines))
+
+        with BusyThreads():
+            result = SamplingProfiler(max_sessions=1).profile(0.1, 100, include_idle=True)
+        self.assertTrue(any(line.startswith("idle-worker;") for line in result.collapsed().splitlines()))
+
+    def test_speedscope(self):
+        """스레드마다 sampled 프로파일 하나, 프레임 인덱스는 공유 프레임 목록을 가리킴"""
+        with BusyThreads():
+            document = SamplingProfiler(max_sessions=1).profile(0.2, 100).speedscope()
+
+        self.assertEqual(document["$schema"], SPEEDSCOPE_SCHEMA)
+        frames = document["shared"]["frames"]
+        profiles = {profile["name"]: profile for profile in document["profiles"]}
+        busy = profiles["busy-worker"]
+        self.assertEqual((busy["type"], busy["unit"]), ("sampled", "seconds"))
+        self.assertEqual(len(busy["samples"]), len(busy["weights"]))
+        self.assertAlmostEqual(sum(busy["weights"]), busy["endValue"])
+        self.assertTrue(all(0 <= index < len(frames) for sample in busy["samples"] for index in sample))
+        self.assertIn("spin", {frames[sample[-1]]["name"] for sample in busy["samples"]})
+
+    def test_session_cap(self):
+        """동시 세션 수를 넘으면 바로 거부하고, 끝나면 다시 실행 가능"""
+        profiler = SamplingProfiler(max_sessions=1)
+        running = threading.Thread(target=profiler.profile, args=(0.3, 50))
+        running.start()
+        time.sleep(0.05)
+        with self.assertRaises(RateLimitException):
+            profiler.profile(0.1, 50)
+        running.join()
+        self.assertEqual(profiler.active_sessions, 0)
+        profiler.profile(0.05, 50)
+
+    async def test_endpoint(self):
+        """관리 토큰 필요, collapsed는 텍스트, speedscope는 JSON 파일, 범위 밖 값은 400"""
+        headers = {"Authorization": "Bearer admin-secret"}
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            with patch.object(settings, "ADMIN_TOKEN", "admin-secret"):
+                unauthorized = await client.get("/api/v1/admin/profile/cpu")
+                collapsed = await client.get("/api/v1/admin/profile/cpu", params={"seconds": 0.1, "rate": 50}, headers=headers)
+                speedscope = await client.get("/api/v1/admin/profile/cpu", params={"seconds": 0.1, "format": "speedscope"}, headers=headers)
+                invalid = await client.get("/api/v1/admin/profile/cpu", params={"rate": 100000}, headers=headers)
+
+        self.assertEqual(unauthorized.status_code, 401)
+        self.assertEqual(collapsed.status_code, 200)
+        self.assertTrue(collapsed.headers["content-type"].startswith("text/plain"))
+        self.assertGreater(int(collapsed.headers["x-profile-samples"]), 0)
+        self.assertIn(".speedscope.json", speedscope.headers["content-disposition"])
+        self.assertEqual(speedscope.json()["$schema"], SPEEDSCOPE_SCHEMA)
+        self.assertEqual(invalid.status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
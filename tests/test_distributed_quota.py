@@ -0,0 +1,154 @@
+"""
+클러스터 한도 조정 테스트
+- 로컬 파일 저장소 공유 테스트
+- 레플리카 간 공유 한도 테스트
+- lease 단위 선예약(왕복 최소화) 및 저장소 왕복 중 다른 테넌트 비차단 테스트
+- 테넌트 일일 예산 및 날짜 변경 시 미반영분 테스트
+"""
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+from src.external.coordination_store import LocalCoordinationStore, create_coordination_store
+from src.utils.distributed_quota import SpendTracker
+from src.utils.rate_limiter import RateLimiter
+from src.exceptions.chat_exceptions import RateLimitException, ConfigurationException
+
+
+class CountingStore(LocalCoordinationStore):
+    """reserve 호출 횟수를 세는 메모리 저장소 (delay만큼 느린 왕복 흉내)"""
+
+    def __init__(self):
+        super().__init__()
+        self.reserve_calls = 0
+        self.delay = 0.0
+
+    def reserve(self, *args, **kwargs):
+        self.reserve_calls += 1
+        time.sleep(self.delay)
+        return super().reserve(*args, **kwargs)
+
+
+def _limiter(store, **limits):
+    values = {"key_rpm": 0, "key_tpm": 0, "tenant_rpm": 0, "tenant_tpm": 0}
+    values.update(limits)
+    return RateLimiter(limits={"default": values}, max_wait=0, max_queue=10, store=store, lease_fraction=0.1)
+
+
+def _accepted(limiter, count):
+    accepted = 0
+    for _ in range(count):
+        try:
+            limiter.acquire("sk-test", "tenant-a", "gpt-4o-mini", 1)
+            accepted += 1
+        except RateLimitException:
+            pass
+    return accepted
+
+
+class TestDistributedQuota(unittest.TestCase):
+    """클러스터 한도 조정 테스트 클래스"""
+
+    def test_file_store_shared(self):
+        """같은 파일을 쓰는 저장소 간 버킷 공유 테스트"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "coordination.json")
+            first, second = LocalCoordinationStore(path), LocalCoordinationStore(path)
+
+            self.assertEqual(first.reserve("bucket", 6, 10, 0.001, 0), (True, 0.0))
+            reserved, wait = second.reserve("bucket", 6, 10, 0.001, 0)
+
+            self.assertFalse(reserved)
+            self.assertGreater(wait, 0)
+            self.assertEqual(first.incr("counter", 5, 60) + second.incr("counter", 5, 60), 15)
+            self.assertEqual(second.get("counter"), 10)
+
+    def test_limit_shared_across_replicas(self):
+        """레플리카 두 개가 하나의 한도를 나눠 쓰는지 테스트"""
+        store = LocalCoordinationStore()
+        replica_a, replica_b = _limiter(store, key_rpm=20), _limiter(store, key_rpm=20)
+
+        accepted = _accepted(replica_a, 15) + _accepted(replica_b, 15)
+
+        # lease 선예약분만큼 덜 허용될 수는 있어도 한도를 넘지는 않음
+        self.assertLessEqual(accepted, 20)
+        self.assertGreaterEqual(accepted, 16)
+
+    def test_leases_avoid_per_request_round_trip(self):
+        """요청마다 저장소를 호출하지 않는지 테스트"""
+        store = CountingStore()
+        limiter = _limiter(store, key_rpm=1000)
+
+        self.assertEqual(_accepted(limiter, 200), 200)
+        limiter._prefetcher.shutdown(wait=True)
+
+        self.assertLessEqual(store.reserve_calls, 200 // 100 * 2 + 2)
+
+    def test_reservation_outside_lock(self):
+        """한 테넌트의 저장소 예약이 느려도 다른 테넌트의 요청이 기다리지 않는지 테스트"""
+        store = CountingStore()
+        limiter = _limiter(store, tenant_rpm=1000)
+        limiter.acquire("sk-test", "tenant-b", "gpt-4o-mini", 1)
+        limiter._prefetcher.shutdown(wait=True)
+        store.delay = 0.5
+
+        slow = threading.Thread(target=limiter.acquire, args=("sk-test", "tenant-a", "gpt-4o-mini", 1))
+        slow.start()
+        time.sleep(0.05)
+        started = time.monotonic()
+        limiter.acquire("sk-test", "tenant-b", "gpt-4o-mini", 1)
+        elapsed = time.monotonic() - started
+        slow.join()
+
+        self.assertLess(elapsed, 0.2)
+
+    def test_spend_budget_across_replicas(self):
+        """레플리카 간 테넌트 사용액 합산 및 예산 초과 거부 테스트"""
+        store = LocalCoordinationStore()
+        replica_a = SpendTracker(store, budgets={"tenant-a": 1000}, flush_interval=60)
+        replica_b = SpendTracker(store, budgets={"tenant-a": 1000}, flush_interval=60)
+
+        replica_a.record("tenant-a", 600)
+        replica_b.record("tenant-a", 300)
+        replica_a.flush()
+        replica_b.flush()
+        replica_b.check("tenant-a")
+
+        replica_b.record("tenant-a", 200)
+        with self.assertRaises(RateLimitException) as context:
+            replica_b.check("tenant-a")
+        self.assertEqual(context.exception.scope, "tenant_budget")
+
+        replica_b.flush()
+        replica_a.flush()
+        self.assertEqual(replica_a.spent("tenant-a"), 1100)
+        replica_a.check("tenant-b")
+
+    def test_spend_day_rollover(self):
+        """날짜가 바뀌기 전 미반영분이 이전 날짜 카운터에 합산되는지 테스트"""
+        store = LocalCoordinationStore()
+        tracker = SpendTracker(store, budgets={}, flush_interval=60)
+
+        with patch.object(tracker, "_day", return_value="20260101"):
+            tracker._synced_day = "20260101"
+            tracker.record("tenant-a", 100)
+        with patch.object(tracker, "_day", return_value="20260102"):
+            tracker.record("tenant-a", 30)
+            tracker.flush()
+            self.assertEqual(tracker.spent("tenant-a"), 30)
+
+        self.assertEqual(store.get("spend:20260101:tenant-a"), 100)
+        self.assertEqual(store.get("spend:20260102:tenant-a"), 30)
+
+    def test_unknown_backend(self):
+        """지원하지 않는 저장소 설정 테스트"""
+        self.assertIsNone(create_coordination_store("none"))
+        with self.assertRaises(ConfigurationException):
+            create_coordination_store("etcd")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+"""
+liveness / readiness 테스트
+- 항목별 준비 상태 판단 (API Key, 키 회로, 이벤트 루프 지연, 대기열 포화, 업스트림) 테스트
+- readiness 결과 캐시 테스트
+- 업스트림 확인: 기다리지 않음, 동시에 하나만 실행, 응답 코드별 판정 테스트
+- 이벤트 루프 지연 측정 테스트
+- /api/v1/health/live, /api/v1/health/ready 엔드포인트 테스트
+"""
+
+import asyncio
+import json
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+import httpx
+from fastapi import FastAPI
+from src.api.system_routes import system_router
+from src.external.key_pool import KeyPool, UpstreamKey
+from src.external.upstream_probe import UpstreamProbe
+from src.services.health_service import HealthService
+from src.utils.loop_monitor import LoopLagMonitor
+from src.utils.request_scheduler import RequestScheduler
+from src.config.config import settings
+
+app = FastAPI()
+app.include_router(system_router)
+
+
+def make_service(keys=1, probe_status=401):
+    key_pool = KeyPool([UpstreamKey(f"sk-test-{index}") for index in range(keys)])
+    chat_service = SimpleNamespace(key_pool=key_pool, scheduler=RequestScheduler(max_queue=10))
+    probe = UpstreamProbe(key_pool, interval=60, transport=httpx.MockTransport(lambda request: httpx.Response(probe_status)))
+    return HealthService(chat_service, probe=probe, monitor=LoopLagMonitor(interval=0.25), cache_ttl=0)
+
+
+class TestHealth(unittest.IsolatedAsyncioTestCase):
+    """liveness / readiness 테스트 클래스"""
+
+    def test_readiness_checks(self):
+        """모든 항목이 통과하면 200, 하나라도 실패하면 503과 실패 항목"""
+        service = make_service()
+        service.probe.probe()
+        status_code, body = service.readiness()
+        self.assertEqual(status_code, 200, body)
+        self.assertEqual(json.loads(body)["checks"]["upstream"]["status_code"], 401)
+
+        with patch.object(settings, "HEALTH_REQUIRE_SERVER_KEY", True):
+            status_code, body = make_service(keys=0).readiness()
+        self.assertEqual(status_code, 503)
+        self.assertFalse(json.loads(body)["checks"]["api_keys"]["ok"])
+
+        for key in service.chat_service.key_pool.keys:
+            key.ejected_until = time.monotonic() + 60
+        self.assertFalse(json.loads(service.readiness()[1])["checks"]["key_circuit"]["ok"])
+        for key in service.chat_service.key_pool.keys:
+            key.ejected_until = 0.0
+
+        service.monitor.record(2.0, time.monotonic())
+        self.assertFalse(json.loads(service.readiness()[1])["checks"]["event_loop"]["ok"])
+        service.monitor.recent.clear()
+
+        service.chat_service.scheduler._queued = 10
+        status_code, body = service.readiness()
+        self.assertEqual(status_code, 503)
+        self.assertEqual(json.loads(body)["checks"]["scheduler_queue"], {"ok": False, "usage_ratio": 1.0})
+
+    def test_readiness_cache(self):
+        """캐시 유효 기간 안에서는 항목을 다시 확인하지 않고 같은 본문을 반환"""
+        service = make_service()
+        service.cache_ttl = 60
+        with patch.object(service, "checks", wraps=service.checks) as checks:
+            first = service.readiness()
+            for _ in range(100):
+                self.assertIs(service.readiness()[1], first[1])
+        self.assertEqual(checks.call_count, 1)
+
+    def test_upstream_probe(self):
+        """확인 결과를 기다리지 않고, 동시에 하나만 실행하며, 5xx/연결 실패는 실패로 판정"""
+        release = threading.Event()
+        requests = []
+
+        def slow(request):
+            requests.append(request)
+            release.wait(5)
+            return httpx.Response(503)
+
+        probe = UpstreamProbe(KeyPool([UpstreamKey("sk-probe", base_url="http://upstream.test/v1")]), interval=60, transport=httpx.MockTransport(slow))
+        started = time.perf_counter()
+        states = [probe.state() for _ in range(20)]
+        self.assertLess(time.perf_counter() - started, 0.5)
+        self.assertTrue(all(state["ok"] is None for state in states))
+
+        release.set()
+        deadline = time.monotonic() + 5
+        while probe.state()["ok"] is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(len(requests), 1)
+        self.assertEqual(str(requests[0].url), "http://upstream.test/v1/models")
+        self.assertEqual(requests[0].headers["authorization"], "Bearer sk-probe")
+        self.assertEqual((probe.state()["ok"], probe.state()["status_code"]), (False, 503))
+
+        def refuse(request):
+            raise httpx.ConnectError("연결 거부")
+
+        failing = UpstreamProbe(interval=60, transport=httpx.MockTransport(refuse))
+        self.assertEqual(failing.probe()["error"], "ConnectError")
+
+    async def test_loop_lag(self):
+        """이벤트 루프를 막으면 지연으로 측정됨"""
+        monitor = LoopLagMonitor(interval=0.01)
+        await monitor.start()
+        try:
+            await asyncio.sleep(0.05)
+            time.sleep(0.2)
+            await asyncio.sleep(0.05)
+        finally:
+            await monitor.stop()
+        self.assertGreaterEqual(monitor.current_lag(), 0.15)
+
+    async def test_endpoints(self):
+        """liveness는 항상 200, readiness는 항목별 결과를 반환"""
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            with patch.object(settings, "HEALTH_PROBE_ENABLED", False):
+                live = await client.get("/api/v1/health/live")
+                ready = await client.get("/api/v1/health/ready")
+
+        self.assertEqual((live.status_code, live.json()["status"]), (200, "alive"))
+        self.assertIn(ready.status_code, (200, 503))
+        self.assertEqual(set(ready.json()["checks"]), {"api_keys", "key_circuit", "event_loop", "scheduler_queue"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,278 @@
+"""
+비동기 작업 테스트
+- 작업 제출/완료/실패 테스트
+- background 모드 선택 테스트
+- 대기열 한도 테스트
+- TTL 저장소 테스트
+- 워커 간 공유 파일 작업 저장소 테스트
+- 웹훅 서명/재시도 테스트
+- 웹훅 내부 주소 차단(SSRF) 및 허용 호스트 테스트
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+import httpx
+from src.external.webhook_client import WebhookClient
+from src.models.job_dto import Job, JobRequest
+from src.models.response_dto import ChatResponse
+from src.services.chat_service import ChatService
+from src.services.job_service import JobFileStore, JobService
+from src.utils.ttl_store import TTLStore
+from src.exceptions.chat_exceptions import ChatServiceException, ValidationException, JobNotFoundException
+
+
+class FakeChatService(ChatService):
+    """업스트림 호출 없이 응답을 돌려주는 채팅 서비스"""
+
+    def __init__(self, release: threading.Event = None, fail: bool = False):
+        super().__init__()
+        self.release = release
+        self.fail = fail
+        self.background_calls = []
+
+    def process_chat_request(self, request, background=False, tenant_id=None, priority=None):
+        self.background_calls.append(background)
+        if self.release:
+            self.release.wait(5)
+        if self.fail:
+            raise ChatServiceException("upstream failure")
+        return ChatResponse(id="resp_1", request_id=request.request_id, model=request.model, output_text="ok")
+
+
+def public_resolver(host):
+    return ["93.184.216.34"]
+
+
+def _wait_for_status(job_service, job_id, statuses, timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = job_service.get_job(job_id)
+        if job.status in statuses:
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"작업 상태 대기 시간 초과: {job_id}")
+
+
+class TestJobService(unittest.TestCase):
+    """비동기 작업 서비스 테스트 클래스"""
+
+    def test_submit_and_complete(self):
+        """작업 제출 및 완료 테스트"""
+        job_service = JobService(chat_service=FakeChatService(), webhook_client=WebhookClient(secret=""), max_workers=1)
+
+        job = job_service.submit(JobRequest(request_id="req-1", user_prompt="안녕하세요", model="o3"))
+        self.assertIn(job.status, ("queued", "in_progress", "completed"))
+        self.assertTrue(job.background)
+
+        job = _wait_for_status(job_service, job.job_id, ("completed",))
+        self.assertEqual(job.result.output_text, "ok")
+        self.assertEqual(job_service.chat_service.background_calls, [True])
+
+    def test_non_background_model(self):
+        """background 미지원 모델 실행 테스트"""
+        job_service = JobService(chat_service=FakeChatService(), webhook_client=WebhookClient(secret=""), max_workers=1)
+
+        job = job_service.submit(JobRequest(user_prompt="안녕하세요", model="gpt-4o-mini"))
+        _wait_for_status(job_service, job.job_id, ("completed",))
+
+        self.assertEqual(job_service.chat_service.background_calls, [False])
+
+    def test_failed_job(self):
+        """작업 실패 테스트"""
+        job_service = JobService(chat_service=FakeChatService(fail=True), webhook_client=WebhookClient(secret=""), max_workers=1)
+
+        job = job_service.submit(JobRequest(user_prompt="안녕하세요"))
+        job = _wait_for_status(job_service, job.job_id, ("failed",))
+
+        self.assertEqual(job.error, "upstream failure")
+
+    def test_queue_full(self):
+        """대기열 한도 테스트"""
+        release = threading.Event()
+        job_service = JobService(
+            chat_service=FakeChatService(release=release),
+            webhook_client=WebhookClient(secret=""),
+            max_workers=1,
+            max_pending=1
+        )
+
+        job_service.submit(JobRequest(user_prompt="첫 번째"))
+        with self.assertRaises(ChatServiceException):
+            job_service.submit(JobRequest(user_prompt="두 번째"))
+        release.set()
+
+    def test_webhook_requires_secret(self):
+        """서명 키 없는 웹훅 요청 거부 테스트"""
+        job_service = JobService(chat_service=FakeChatService(), webhook_client=WebhookClient(secret=""), max_workers=1)
+
+        with self.assertRaises(ValidationException):
+            job_service.submit(JobRequest(user_prompt="안녕하세요", webhook_url="https://example.com/hook"))
+
+    def test_unknown_job(self):
+        """존재하지 않는 작업 조회 테스트"""
+        job_service = JobService(chat_service=FakeChatService(), webhook_client=WebhookClient(secret=""), max_workers=1)
+
+        with self.assertRaises(JobNotFoundException):
+            job_service.get_job("job_missing")
+
+
+class TestTTLStore(unittest.TestCase):
+    """TTL 저장소 테스트 클래스"""
+
+    def test_max_entries(self):
+        """최대 항목 수 초과 시 가장 오래된 항목 제거 테스트"""
+        store = TTLStore(max_entries=2, ttl=60)
+        store.put("a", 1)
+        store.put("b", 2)
+        store.put("a", 3)
+        store.put("c", 4)
+
+        self.assertIsNone(store.get("b"))
+        self.assertEqual(store.get("a"), 3)
+        self.assertEqual(len(store), 2)
+
+    def test_ttl_expiry(self):
+        """TTL 만료 테스트"""
+        store = TTLStore(max_entries=10, ttl=0.01)
+        store.put("a", 1)
+        time.sleep(0.02)
+
+        self.assertIsNone(store.get("a"))
+        self.assertEqual(len(store), 0)
+
+
+class TestJobFileStore(unittest.TestCase):
+    """공유 파일 작업 저장소 테스트 클래스"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_shared_between_workers(self):
+        """한 워커가 실행한 작업을 같은 경로를 쓰는 다른 워커에서 조회"""
+        running = JobService(
+            chat_service=FakeChatService(), webhook_client=WebhookClient(secret=""), max_workers=1,
+            store=JobFileStore(self.tmp.name, max_entries=10, ttl=60)
+        )
+        polling = JobService(
+            chat_service=FakeChatService(), webhook_client=WebhookClient(secret=""), max_workers=1,
+            store=JobFileStore(self.tmp.name, max_entries=10, ttl=60)
+        )
+
+        job = running.submit(JobRequest(user_prompt="안녕하세요", model="o3"))
+        self.assertIn(polling.get_job(job.job_id).status, ("queued", "in_progress", "completed"))
+        job = _wait_for_status(polling, job.job_id, ("completed",))
+        self.assertEqual(job.result.output_text, "ok")
+
+    def test_ttl_and_max_entries(self):
+        """만료된 작업은 조회되지 않고, 최대 항목 수를 넘으면 오래된 파일부터 정리"""
+        store = JobFileStore(self.tmp.name, max_entries=2, ttl=60)
+        job_ids = [f"job_{index:032x}" for index in range(3)]
+        for offset, job_id in enumerate(job_ids):
+            store.put(job_id, Job(job_id=job_id))
+            path = os.path.join(self.tmp.name, f"{job_id}.json")
+            os.utime(path, (time.time() - 10 + offset, time.time() - 10 + offset))
+        store._prune()
+
+        self.assertIsNone(store.get(job_ids[0]))
+        self.assertEqual(store.get(job_ids[2]).job_id, job_ids[2])
+        self.assertEqual(len(store), 2)
+
+        store.ttl = 5
+        self.assertIsNone(store.get(job_ids[1]))
+
+    def test_rejects_foreign_ids(self):
+        """서버가 만든 형식이 아닌 작업 ID는 파일 경로로 쓰지 않음"""
+        store = JobFileStore(self.tmp.name, max_entries=10, ttl=60)
+        self.assertIsNone(store.get("../etc/passwd"))
+        self.assertIsNone(store.get("job_missing"))
+
+
+class TestWebhookClient(unittest.TestCase):
+    """웹훅 클라이언트 테스트 클래스"""
+
+    def test_signed_delivery_with_retry(self):
+        """서명 포함 전송 및 5xx 재시도 테스트"""
+        received = []
+
+        def handler(request: httpx.Request):
+            received.append(request)
+            return httpx.Response(503 if len(received) == 1 else 200)
+
+        client = WebhookClient(secret="secret", max_retries=2, transport=httpx.MockTransport(handler), resolver=public_resolver)
+        client.RETRY_BACKOFF_BASE = 0
+
+        self.assertTrue(client.deliver("https://example.com/hook", {"job_id": "job_1"}))
+        self.assertEqual(len(received), 2)
+
+        request = received[-1]
+        timestamp = request.headers[WebhookClient.TIMESTAMP_HEADER]
+        expected = WebhookClient.sign("secret", timestamp, request.content)
+        self.assertEqual(request.headers[WebhookClient.SIGNATURE_HEADER], expected)
+        self.assertEqual(json.loads(request.content), {"job_id": "job_1"})
+
+    def test_client_error_not_retried(self):
+        """4xx 응답 재시도 안 함 테스트"""
+        calls = []
+
+        def handler(request: httpx.Request):
+            calls.append(request)
+            return httpx.Response(400)
+
+        client = WebhookClient(secret="secret", max_retries=3, transport=httpx.MockTransport(handler), resolver=public_resolver)
+
+        self.assertFalse(client.deliver("https://example.com/hook", {}))
+        self.assertEqual(len(calls), 1)
+
+
+    def test_rejects_internal_addresses(self):
+        """루프백/사설/링크 로컬/예약 주소로 해석되는 웹훅 URL 거부"""
+        addresses = {"internal.example": ["10.0.0.5"], "mixed.example": ["93.184.216.34", "127.0.0.1"]}
+        client = WebhookClient(secret="secret", allowed_hosts=[], resolver=lambda host: addresses.get(host, [host]))
+
+        self.assertIsNone(client.check_url("https://93.184.216.34/hook"))
+        for url in (
+            "http://127.0.0.1:8080/hook",
+            "http://169.254.169.254/latest/meta-data/",
+            "http://192.168.0.1/hook",
+            "http://[::1]/hook",
+            "http://[::ffff:127.0.0.1]/hook",
+            "http://0.0.0.0/hook",
+            "https://internal.example/hook",
+            "https://mixed.example/hook",
+            "ftp://93.184.216.34/hook",
+        ):
+            self.assertIsNotNone(client.check_url(url), url)
+
+        job_service = JobService(chat_service=FakeChatService(), webhook_client=client, max_workers=1)
+        with self.assertRaises(ValidationException):
+            job_service.submit(JobRequest(user_prompt="안녕하세요", webhook_url="http://169.254.169.254/latest"))
+
+    def test_rebind_blocked_at_delivery(self):
+        """제출 뒤 DNS가 내부 주소로 바뀌면 전송하지 않음"""
+        calls = []
+        addresses = ["93.184.216.34"]
+        client = WebhookClient(
+            secret="secret", allowed_hosts=[], resolver=lambda host: addresses,
+            transport=httpx.MockTransport(lambda request: calls.append(request) or httpx.Response(200))
+        )
+
+        self.assertIsNone(client.check_url("https://hooks.example.com/hook"))
+        addresses[:] = ["127.0.0.1"]
+        self.assertFalse(client.deliver("https://hooks.example.com/hook", {}))
+        self.assertEqual(calls, [])
+
+    def test_allowed_hosts(self):
+        """허용 목록이 있으면 목록의 호스트만 허용 (내부 주소여도)"""
+        client = WebhookClient(secret="secret", allowed_hosts=["Hooks.Internal"], resolver=lambda host: ["10.0.0.5"])
+
+        self.assertIsNone(client.check_url("https://hooks.internal/job"))
+        self.assertIsNotNone(client.check_url("https://other.example/job"))
+
+
+if __name__ == "__main__":
+    unittest.main()
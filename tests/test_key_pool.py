@@ -0,0 +1,170 @@
+"""
+서버 API Key 풀 테스트
+- 설정 파싱 테스트
+- 가중치/잔여 용량 기반 분산 테스트
+- 연속 실패 시 제외 및 fail-open 테스트
+- 키별 사용량 집계 테스트
+- 키별 SDK 클라이언트 캐시 테스트 (사용자 키 제외, 밀려난 클라이언트 닫기, 스트림 동안 사용 중 유지)
+"""
+
+import json
+import unittest
+import httpx
+from openai import OpenAI
+from src.external.key_pool import KeyPool, UpstreamKey
+from src.external.openai_client import OpenAIClient
+from src.utils.upstream_pacer import UpstreamPacer
+
+
+def _pool(*configs, pacer=None, eject_failures=2):
+    keys = [UpstreamKey.from_config(config) for config in configs]
+    return KeyPool(keys, pacer=pacer, eject_failures=eject_failures, eject_base_seconds=60, eject_max_seconds=600)
+
+
+def _fail(pool, key, count):
+    for _ in range(count):
+        key.in_flight += 1
+        pool.release(key, latency=0.1, success=False)
+
+
+def _responses_handler(request):
+    """Responses API 흉내 (stream이면 delta 이벤트 두 개)"""
+    body = json.loads(request.content)
+    if body.get("stream"):
+        events = "".join(
+            f"event: response.output_text.delta\ndata: {json.dumps({'type': 'response.output_text.delta', 'delta': delta})}\n\n"
+            for delta in ("안", "녕")
+        )
+        return httpx.Response(200, headers={"content-type": "text/event-stream"}, content=events.encode())
+    return httpx.Response(200, json={"id": "resp_1", "object": "response", "created_at": 0, "status": "completed", "model": body["model"], "output": []})
+
+
+def _distribution(pool, model="gpt-4o-mini", count=2000):
+    counts = {}
+    for _ in range(count):
+        key = pool.acquire(model)
+        pool.release(key, latency=0.1, success=True)
+        counts[key.api_key] = counts.get(key.api_key, 0) + 1
+    return counts
+
+
+class TestKeyPool(unittest.TestCase):
+    """서버 API Key 풀 테스트 클래스"""
+
+    def test_from_config(self):
+        """문자열/dict 설정 파싱 테스트"""
+        key = UpstreamKey.from_config({"api_key": "sk-a", "organization": "org-1", "weight": "2"})
+
+        self.assertEqual(key.organization, "org-1")
+        self.assertEqual(key.weight, 2.0)
+        self.assertEqual(UpstreamKey.from_config("sk-b").weight, 1.0)
+
+    def test_empty_pool(self):
+        """빈 풀 테스트"""
+        self.assertIsNone(KeyPool([]).acquire("gpt-4o-mini"))
+
+    def test_weighted_distribution(self):
+        """가중치 비례 분산 테스트"""
+        pool = _pool({"api_key": "sk-a", "weight": 3}, {"api_key": "sk-b", "weight": 1})
+
+        counts = _distribution(pool)
+
+        self.assertGreater(counts["sk-a"], counts["sk-b"] * 2)
+        self.assertGreater(counts["sk-b"], 0)
+
+    def test_prefers_key_with_headroom(self):
+        """업스트림 잔여 용량이 많은 키 선호 테스트"""
+        pacer = UpstreamPacer(threshold=0.2, max_delay=10)
+        pacer.observe("sk-a", "gpt-4o-mini", {
+            "x-ratelimit-limit-requests": "100",
+            "x-ratelimit-remaining-requests": "5",
+            "x-ratelimit-reset-requests": "60s"
+        })
+        pool = _pool("sk-a", "sk-b", pacer=pacer)
+
+        counts = _distribution(pool)
+
+        self.assertGreater(counts["sk-b"], counts.get("sk-a", 0) * 5)
+
+    def test_ejection_and_fail_open(self):
+        """연속 실패 시 제외 및 전체 제외 시 fail-open 테스트"""
+        pool = _pool("sk-a", "sk-b")
+        key_a, key_b = pool.keys
+
+        _fail(pool, key_a, 2)
+
+        counts = _distribution(pool, count=100)
+        self.assertEqual(counts, {"sk-b": 100})
+
+        _fail(pool, key_b, 2)
+
+        # 모두 제외되면 가장 먼저 재투입될 키 사용
+        self.assertIs(pool.acquire("gpt-4o-mini"), key_a)
+
+    def test_usage_stats(self):
+        """키별 사용량 집계 및 원본 키 비노출 테스트"""
+        pool = _pool("sk-secret")
+        key = pool.acquire("gpt-4o-mini")
+        pool.release(key, latency=0.5, success=True, input_tokens=10, output_tokens=20, cost=300)
+
+        stats = pool.stats()[0]
+
+        self.assertEqual((stats["requests"], stats["input_tokens"], stats["output_tokens"], stats["cost"]), (1, 10, 20, 300))
+        self.assertEqual(stats["in_flight"], 0)
+        self.assertNotIn("sk-secret", str(stats))
+
+
+
+class TestClientCache(unittest.TestCase):
+    """SDK 클라이언트 캐시 테스트 클래스"""
+
+    def test_user_key_not_cached(self):
+        """사용자 키 클라이언트는 캐시에 넣지 않고 사용 후 닫음, 서버 키 캐시는 원본 키 대신 지문으로 보관"""
+        openai_client = OpenAIClient()
+        with openai_client._client("sk-server") as server_client:
+            pass
+        with openai_client._client("sk-user-secret", cache=False) as user_client:
+            self.assertFalse(user_client.is_closed())
+
+        self.assertTrue(user_client.is_closed())
+        self.assertFalse(server_client.is_closed())
+        self.assertEqual(len(openai_client._clients), 1)
+        self.assertNotIn("sk-server", repr(list(openai_client._clients)))
+        with openai_client._client("sk-server") as again:
+            self.assertIs(again, server_client)
+
+    def test_evicted_clients_closed(self):
+        """캐시에서 밀려난 클라이언트는 닫고, 사용 중이면 사용이 끝난 뒤 닫음"""
+        openai_client = OpenAIClient()
+        openai_client.MAX_CACHED_CLIENTS = 1
+        with openai_client._client("sk-a") as idle_client:
+            pass
+        with openai_client._client("sk-b") as busy_client:
+            self.assertTrue(idle_client.is_closed())
+            with openai_client._client("sk-c"):
+                self.assertFalse(busy_client.is_closed())
+            self.assertFalse(busy_client.is_closed())
+        self.assertTrue(busy_client.is_closed())
+        self.assertEqual(len(openai_client._clients), 1)
+
+    def test_chat_completion_client(self):
+        """create_chat_completion도 사용자 키는 캐시하지 않고, 스트림은 끝날 때까지 클라이언트를 사용 중으로 유지"""
+        openai_client = OpenAIClient()
+        openai_client._new_client = lambda api_key, *args: OpenAI(
+            api_key=api_key, http_client=httpx.Client(transport=httpx.MockTransport(_responses_handler))
+        )
+        messages = [{"role": "user", "content": "안녕"}]
+
+        openai_client.create_chat_completion(messages, "sk-user-secret", cache_client=False)
+        self.assertEqual(len(openai_client._clients), 0)
+
+        stream = openai_client.create_chat_completion(messages, "sk-server", stream=True)
+        self.assertEqual(next(stream).delta, "안")
+        cached = next(iter(openai_client._clients.values()))
+        self.assertEqual(cached.users, 1)
+        self.assertEqual([event.delta for event in stream], ["녕"])
+        self.assertEqual(cached.users, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
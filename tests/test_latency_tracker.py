@@ -0,0 +1,89 @@
+"""
+업스트림 지연 백분위수 테스트
+- 링 버퍼 덮어쓰기 및 nearest-rank 백분위수 테스트
+- 창(최근 N초)별 표본 선택 테스트
+- 스트림 TTFT/생성 속도 계산 테스트
+- 표본 기록 시 메모리 증가 없음 테스트
+- /api/v1/upstream/latency 엔드포인트 테스트
+"""
+
+import tracemalloc
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+import httpx
+from fastapi import FastAPI
+from src.api.system_routes import system_router
+from src.external.openai_client import OpenAIClient
+from src.utils.latency_tracker import METRIC_LATENCY, METRIC_TPS, METRIC_TTFT, LatencyTracker, SampleRing, percentiles
+
+
+class TestLatencyTracker(unittest.IsolatedAsyncioTestCase):
+    """업스트림 지연 백분위수 테스트 클래스"""
+
+    def test_ring_and_percentiles(self):
+        """링 버퍼는 가장 오래된 표본부터 덮어쓰고 백분위수는 nearest-rank로 계산"""
+        ring = SampleRing(4)
+        for value in range(1, 7):
+            ring.add(float(value), now=float(value))
+
+        self.assertEqual(sorted(ring.since(0.0)), [3.0, 4.0, 5.0, 6.0])
+        self.assertEqual(sorted(ring.since(5.0)), [5.0, 6.0])
+        self.assertEqual(percentiles([float(value) for value in range(1, 101)]), {"p50": 50.0, "p90": 90.0, "p99": 99.0})
+        self.assertEqual(percentiles([]), {"p50": None, "p90": None, "p99": None})
+
+    def test_windows(self):
+        """창 밖의 오래된 표본은 해당 창 백분위수에서 제외"""
+        tracker = LatencyTracker(sample_size=16, windows=[60, 300])
+        with patch("src.utils.latency_tracker.time.monotonic", side_effect=[1000.0, 1200.0, 1250.0]):
+            tracker.record("gpt-4o-mini", 9.0)
+            tracker.record("gpt-4o-mini", 1.0)
+            snapshot = tracker.snapshot()
+
+        latency = snapshot["gpt-4o-mini"][METRIC_LATENCY]
+        self.assertEqual(latency["60s"], {"count": 1, "p50": 1.0, "p90": 1.0, "p99": 1.0})
+        self.assertEqual(latency["300s"]["count"], 2)
+        self.assertEqual(latency["300s"]["p99"], 9.0)
+
+    def test_stream_latency(self):
+        """스트림의 TTFT와 첫 토큰 이후 생성 속도 계산, 모델 이름 정규화"""
+        client = OpenAIClient()
+        response = SimpleNamespace(usage=SimpleNamespace(output_tokens=101))
+        client._record_stream_latency("made-up-model", response, started_at=10.0, first_token_at=10.5, completed_at=12.0)
+
+        snapshot = client.latency.snapshot()["other"]
+        self.assertEqual(snapshot[METRIC_TTFT]["60s"]["p50"], 0.5)
+        self.assertAlmostEqual(snapshot[METRIC_TPS]["60s"]["p50"], 100 / 1.5, places=3)
+        self.assertEqual(snapshot[METRIC_LATENCY]["60s"]["p50"], 2.0)
+
+    def test_constant_memory(self):
+        """링 버퍼가 찬 뒤에는 표본을 계속 기록해도 메모리가 늘지 않음"""
+        tracker = LatencyTracker(sample_size=256, windows=[60])
+        for _ in range(512):
+            tracker.record("gpt-4o", 1.5, ttft=0.2, output_tokens=50, generation_time=1.0)
+
+        tracemalloc.start()
+        try:
+            before = tracemalloc.take_snapshot()
+            for _ in range(10000):
+                tracker.record("gpt-4o", 1.5, ttft=0.2, output_tokens=50, generation_time=1.0)
+            growth = sum(stat.size_diff for stat in tracemalloc.take_snapshot().compare_to(before, "filename"))
+        finally:
+            tracemalloc.stop()
+        self.assertLess(growth, 4096)
+
+    async def test_latency_endpoint(self):
+        """/api/v1/upstream/latency 응답 형식 테스트"""
+        app = FastAPI()
+        app.include_router(system_router)
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/api/v1/upstream/latency")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("served_by", response.json())
+        self.assertIsInstance(response.json()["models"], dict)
+
+
+if __name__ == "__main__":
+    unittest.main()
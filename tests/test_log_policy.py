@@ -0,0 +1,147 @@
+"""
+로그 정책 테스트
+- 요청 단위 결정적 샘플링 테스트
+- 로거별 토큰 버킷 한도 및 억제 요약 테스트
+- 정책 변경의 워커 간 공유 테스트
+- PII 마스킹 (리스너 스레드) 테스트
+- 관리 API 인증 및 정책 조회/변경 테스트
+"""
+
+import logging
+import os
+import queue
+import unittest
+import uuid
+from unittest.mock import patch
+import httpx
+from fastapi import FastAPI
+from src.api.admin_routes import admin_router
+from src.api.exception_handlers import authorization_exception_handler
+from src.exceptions.chat_exceptions import AuthorizationException
+from src.utils.log_policy import LogPolicy, Redactor
+from src.utils.logger import LogQueueListener
+from src.utils.request_context import RequestContext, reset_request_context, start_request_context
+from src.config.config import settings
+
+
+def make_record(name: str = "test.policy", level: int = logging.INFO, message: str = "로그", args: tuple = ()) -> logging.LogRecord:
+    return logging.getLogger(name).makeRecord(name, level, __file__, 1, message, args, None)
+
+
+class CollectingHandler(logging.Handler):
+    """받은 레코드의 메시지를 모으는 핸들러"""
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+app = FastAPI()
+app.add_exception_handler(AuthorizationException, authorization_exception_handler)
+app.include_router(admin_router)
+
+
+class TestLogPolicy(unittest.IsolatedAsyncioTestCase):
+    """로그 정책 테스트 클래스"""
+
+    def test_request_sampling(self):
+        """같은 request_id는 항상 같은 결정, 전체 비율은 sample_rate에 근접, WARNING은 항상 기록"""
+        policy = LogPolicy(sample_rate=0.25, rate_per_logger=0)
+        contexts = [RequestContext(str(uuid.uuid4())) for _ in range(4000)]
+        decisions = [policy.sampled(context) for context in contexts]
+
+        self.assertEqual(decisions, [policy.sampled(RequestContext(context.request_id)) for context in contexts])
+        self.assertAlmostEqual(sum(decisions) / len(decisions), 0.25, delta=0.03)
+
+        # request_id가 없는 요청은 요청(컨텍스트) 안에서 한 번 결정한 값을 유지
+        anonymous = RequestContext()
+        self.assertEqual(len({policy.sampled(anonymous) for _ in range(20)}), 1)
+
+        dropped = next(context for context, sampled in zip(contexts, decisions) if not sampled)
+        token = start_request_context(dropped.request_id)
+        try:
+            self.assertFalse(policy.allow(make_record()))
+            self.assertTrue(policy.allow(make_record(level=logging.WARNING)))
+        finally:
+            reset_request_context(token)
+
+    def test_rate_limit_and_summary(self):
+        """로거별 토큰 버킷을 넘으면 버리고, 억제된 줄 수를 주기적으로 요약"""
+        with patch("src.utils.log_policy.time.monotonic", return_value=100.0):
+            policy = LogPolicy(sample_rate=1.0, rate_per_logger=10, burst=5, summary_interval=60)
+
+        with patch("src.utils.log_policy.time.monotonic", return_value=101.0):
+            allowed = [policy.allow(make_record("test.policy.a")) for _ in range(8)]
+            # 다른 로거는 별도 버킷
+            self.assertTrue(policy.allow(make_record("test.policy.b")))
+        self.assertEqual(allowed, [True] * 5 + [False] * 3)
+
+        with patch("src.utils.log_policy.time.monotonic", return_value=101.2):
+            self.assertEqual([policy.allow(make_record("test.policy.a")) for _ in range(3)], [True, True, False])
+
+        with patch("src.utils.log_policy.time.monotonic", return_value=161.0):
+            with self.assertLogs("src.utils.log_policy", level="WARNING") as captured:
+                self.assertTrue(policy.allow(make_record("test.policy.a")))
+        self.assertEqual(len(captured.output), 1)
+        self.assertIn("한도 초과 4건 (test.policy.a: 4)", captured.output[0])
+
+    def test_update_shared_across_workers(self):
+        """fork된 워커에서 바꾼 정책이 다른 프로세스에도 적용됨"""
+        policy = LogPolicy(sample_rate=1.0, rate_per_logger=50, burst=200, prompt_chars=0)
+        pid = os.fork()
+        if pid == 0:
+            try:
+                policy.update(sample_rate=0.1, prompt_chars=80)
+            finally:
+                os._exit(0)
+        os.waitpid(pid, 0)
+
+        snapshot = policy.snapshot()
+        self.assertEqual((snapshot["sample_rate"], snapshot["prompt_chars"]), (0.1, 80))
+        self.assertEqual((snapshot["rate_per_logger"], snapshot["burst"]), (50.0, 200.0))
+
+    def test_redaction_on_listener(self):
+        """기본/추가 패턴 마스킹은 리스너가 핸들러로 넘기기 전에 적용"""
+        redactor = Redactor([r"\bORDER-\d+\b"])
+        target = CollectingHandler()
+        log_queue = queue.Queue()
+        listener = LogQueueListener(log_queue, target, redactor=redactor)
+        listener.start()
+        log_queue.put(make_record(message="프롬프트: %s", args=("메일 kim@example.com, 전화 010-1234-5678, 주문 ORDER-42, 0.85s",)))
+        listener.stop()
+
+        self.assertEqual(target.messages, ["프롬프트: 메일 [EMAIL], 전화 [PHONE], 주문 [REDACTED], 0.85s"])
+        self.assertEqual(redactor.redact("주민 900101-1234567 카드 4111-1111-1111-1111 키 sk-abcdefghijklmnop1234"), "주민 [RRN] 카드 [CARD] 키 [API_KEY]")
+
+    async def test_admin_log_policy(self):
+        """토큰이 없거나 틀리면 401, 올바르면 정책 조회/변경"""
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            with patch.object(settings, "ADMIN_TOKEN", ""):
+                response = await client.get("/api/v1/admin/log-policy", headers={"Authorization": "Bearer "})
+                self.assertEqual(response.status_code, 401)
+
+            with patch.object(settings, "ADMIN_TOKEN", "secret"):
+                self.assertEqual((await client.get("/api/v1/admin/log-policy")).status_code, 401)
+                wrong = await client.get("/api/v1/admin/log-policy", headers={"Authorization": "Bearer wrong"})
+                self.assertEqual((wrong.status_code, wrong.headers["www-authenticate"]), (401, "Bearer"))
+
+                headers = {"Authorization": "Bearer secret"}
+                original = (await client.get("/api/v1/admin/log-policy", headers=headers)).json()
+                try:
+                    response = await client.put("/api/v1/admin/log-policy", json={"sample_rate": 0.5}, headers=headers)
+                    self.assertEqual(response.status_code, 200)
+                    self.assertEqual(response.json()["sample_rate"], 0.5)
+                    self.assertEqual(response.json()["rate_per_logger"], original["rate_per_logger"])
+                    invalid = await client.put("/api/v1/admin/log-policy", json={"sample_rate": 2}, headers=headers)
+                    self.assertEqual(invalid.status_code, 422)
+                finally:
+                    await client.put("/api/v1/admin/log-policy", json={
+                        key: original[key] for key in ("sample_rate", "rate_per_logger", "burst", "prompt_chars")
+                    }, headers=headers)
+
+
+if __name__ == "__main__":
+    unittest.main()
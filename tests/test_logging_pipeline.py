@@ -0,0 +1,164 @@
+"""
+비동기 로깅 파이프라인 테스트
+- JSON 포맷터 필드 (요청 컨텍스트/trace_id/예외) 테스트
+- 큐 핸들러: 느린 핸들러가 로그 호출을 막지 않음, 메시지는 리스너에서 조립, 큐가 가득 차면 버림 테스트
+- 크기 기준 교체 + gzip 압축 + 보관 개수 정리 테스트
+- 다른 워커가 교체한 파일 다시 열기 테스트
+"""
+
+import gzip
+import json
+import logging
+import os
+import queue
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from src.utils import tracing
+from src.utils.logger import CompressingRotatingFileHandler, ContextQueueHandler, JsonFormatter, LogQueueListener
+from src.utils.request_context import RequestContextFilter, reset_request_context, start_request_context
+from src.utils.tracing import Span
+
+
+class BlockingHandler(logging.Handler):
+    """unblocked 전까지 emit을 막는 핸들러 (느린 stdout/디스크 흉내)"""
+
+    def __init__(self):
+        super().__init__()
+        self.unblocked = threading.Event()
+        self.messages = []
+        self.threads = set()
+
+    def emit(self, record):
+        self.unblocked.wait(5)
+        self.threads.add(threading.current_thread().name)
+        self.messages.append(record.getMessage())
+
+
+def make_record(message: str, *args, exc_info=None) -> logging.LogRecord:
+    record = logging.getLogger("test.pipeline").makeRecord("test.pipeline", logging.INFO, __file__, 1, message, args, exc_info)
+    RequestContextFilter().filter(record)
+    return record
+
+
+class TestLoggingPipeline(unittest.TestCase):
+    """비동기 로깅 파이프라인 테스트 클래스"""
+
+    def test_json_formatter(self):
+        """요청 컨텍스트/샘플링된 trace_id를 필드로 포함하고, 요청 밖에서는 null"""
+        formatter = JsonFormatter()
+        token = start_request_context("req-1", "tenant-a")
+        span_token = tracing._current_span.set(Span("chat.process", "a" * 32, "b" * 16))
+        try:
+            entry = json.loads(formatter.format(make_record("응답 완료: %.2fs", 1.234)))
+        finally:
+            tracing._current_span.reset(span_token)
+            reset_request_context(token)
+
+        self.assertEqual(entry["message"], "응답 완료: 1.23s")
+        self.assertEqual((entry["request_id"], entry["tenant_id"], entry["trace_id"]), ("req-1", "tenant-a", "a" * 32))
+        self.assertEqual((entry["level"], entry["logger"], entry["pid"]), ("INFO", "test.pipeline", os.getpid()))
+        self.assertRegex(entry["ts"], r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z$")
+
+        try:
+            raise ValueError("잘못된 값")
+        except ValueError:
+            entry = json.loads(formatter.format(make_record("실패", exc_info=sys.exc_info())))
+        self.assertEqual((entry["request_id"], entry["tenant_id"], entry["trace_id"]), (None, None, None))
+        self.assertIn("ValueError: 잘못된 값", entry["exc_info"])
+
+    def test_queue_handler_does_not_block(self):
+        """핸들러가 막혀 있어도 로그 호출은 즉시 반환하고, 메시지 조립/출력은 리스너 스레드에서 실행"""
+        target = BlockingHandler()
+        handler = ContextQueueHandler(queue.Queue(3))
+        handler.addFilter(RequestContextFilter())
+        listener = LogQueueListener(handler.queue, target)
+        listener.start()
+        logger = logging.getLogger("test.pipeline.queue")
+        logger.handlers, logger.propagate = [handler], False
+
+        class Lazy:
+            """str() 호출 스레드를 기록하는 인자"""
+            thread = None
+
+            def __str__(self):
+                Lazy.thread = threading.current_thread().name
+                return "lazy"
+
+        try:
+            token = start_request_context("req-2")
+            started = time.perf_counter()
+            for _ in range(10):
+                logger.warning("값: %s", Lazy())
+            elapsed = time.perf_counter() - started
+            reset_request_context(token)
+
+            self.assertLess(elapsed, 0.5)
+            # 리스너가 1개를 꺼내 막혀 있고 큐(3) 이후는 버려짐
+            self.assertGreaterEqual(handler.dropped, 6)
+        finally:
+            target.unblocked.set()
+            listener.stop()
+
+        self.assertEqual(target.messages[0], "값: lazy")
+        self.assertNotEqual(Lazy.thread, threading.current_thread().name)
+        self.assertNotIn(threading.current_thread().name, target.threads)
+
+    def test_size_rotation_and_compression(self):
+        """크기를 넘으면 교체하고, 교체된 파일은 gzip으로 압축하며 보관 개수만 남김"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "app.log")
+            handler = CompressingRotatingFileHandler(path, max_bytes=200, interval=0, backup_count=2)
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            compressors = []
+            original_thread = threading.Thread
+
+            def tracked_thread(*args, **kwargs):
+                thread = original_thread(*args, **kwargs)
+                compressors.append(thread)
+                return thread
+
+            threading.Thread = tracked_thread
+            try:
+                for index in range(40):
+                    handler.handle(make_record(f"line-{index:02d} " + "x" * 40))
+                    for thread in compressors:
+                        thread.join()
+            finally:
+                threading.Thread = original_thread
+                handler.close()
+
+            backups = handler.backups()
+            self.assertEqual(len(backups), 2)
+            self.assertTrue(all(backup.endswith(".gz") for backup in backups))
+            with gzip.open(backups[-1], "rt", encoding="utf-8") as f:
+                rotated = f.read().splitlines()
+            with open(path, encoding="utf-8") as f:
+                current = f.read().splitlines()
+            # 가장 최근 백업의 마지막 줄 다음이 현재 파일의 첫 줄
+            self.assertEqual(int(rotated[-1][5:7]) + 1, int(current[0][5:7]))
+            self.assertEqual(current[-1][:7], "line-39")
+
+    def test_reopen_after_external_rotation(self):
+        """다른 워커가 파일을 교체하면 다시 열어 새 파일에 기록하고 중복 교체하지 않음"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "app.log")
+            handler = CompressingRotatingFileHandler(path, max_bytes=0, interval=0, compress=False)
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            try:
+                handler.handle(make_record("before"))
+                os.rename(path, path + ".other")
+                handler.handle(make_record("after"))
+            finally:
+                handler.close()
+
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(f.read(), "after\n")
+            with open(path + ".other", encoding="utf-8") as f:
+                self.assertEqual(f.read(), "before\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+"""
+메모리 할당 프로파일링 테스트
+- tracemalloc 시작/중지 및 기준점 대비 늘어난 할당 위치(파일:줄) 테스트
+- 추적 시간 초과 시 자동 중지 테스트
+- traceback 묶음 및 잘못된 요청 거부 테스트
+- 요청별 할당 표본: 최고/잔류 할당량 기록, 표본 제외, 동시 측정 제한, 요청 크기 구간별 요약 테스트
+- /api/v1/admin/memory 엔드포인트 테스트
+"""
+
+import time
+import tracemalloc
+import unittest
+from unittest.mock import patch
+import httpx
+from fastapi import FastAPI
+from src.api.admin_routes import admin_router
+from src.api.exception_handlers import authorization_exception_handler, validation_exception_handler
+from src.exceptions.chat_exceptions import AuthorizationException, ValidationException
+from src.utils.memory_profiler import MemoryProfiler, RequestAllocationSampler
+from src.config.config import settings
+
+app = FastAPI()
+app.add_exception_handler(AuthorizationException, authorization_exception_handler)
+app.add_exception_handler(ValidationException, validation_exception_handler)
+app.include_router(admin_router)
+
+retained = []
+
+
+def leak(count):
+    retained.extend(bytearray(1024) for _ in range(count))
+
+
+class TestMemoryProfiler(unittest.IsolatedAsyncioTestCase):
+    """메모리 할당 프로파일링 테스트 클래스"""
+
+    def tearDown(self):
+        retained.clear()
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def test_snapshot_diff(self):
+        """기준점 이후 늘어난 할당이 파일:줄 단위로 상위에 나오고, 중지하면 추적이 꺼짐"""
+        profiler = MemoryProfiler()
+        with self.assertRaises(ValidationException):
+            profiler.snapshot()
+
+        status = profiler.start()
+        self.assertTrue(status["tracing"])
+        leak(2000)
+        result = profiler.snapshot(limit=5)
+
+        self.assertIsNotNone(result["compared_to"])
+        top = result["top"][0]
+        self.assertTrue(top["site"].startswith("tests/test_memory_profiler.py:"), result["top"])
+        self.assertGreater(top["size_diff_bytes"], 2000 * 1024)
+        self.assertGreaterEqual(top["count_diff"], 2000)
+
+        # 새 기준점 이후에는 같은 할당이 늘어난 것으로 나오지 않음
+        profiler.snapshot(rebase=True)
+        after = profiler.snapshot(limit=5)
+        self.assertTrue(all(entry["size_diff_bytes"] < 1024 * 1024 for entry in after["top"]))
+
+        self.assertFalse(profiler.stop()["tracing"])
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_auto_stop(self):
+        """MEMORY_TRACE_MAX_SECONDS가 지나면 중지 요청 없이도 추적이 꺼지고, 다시 시작하면 시간을 새로 계산"""
+        profiler = MemoryProfiler(max_seconds=0.2)
+        status = profiler.start()
+        self.assertAlmostEqual(status["expires_at"] - status["started_at"], 0.2, delta=0.1)
+        time.sleep(0.1)
+        profiler.start()
+        time.sleep(0.15)
+        self.assertTrue(profiler.status()["tracing"])
+
+        deadline = time.monotonic() + 5
+        while tracemalloc.is_tracing() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertFalse(profiler.active)
+        self.assertIsNone(profiler.status()["expires_at"])
+
+    def test_traceback_group(self):
+        """traceback 묶음은 호출 경로를 함께 반환하고, 알 수 없는 묶음 기준은 거부"""
+        profiler = MemoryProfiler()
+        profiler.start(frames=5)
+        leak(500)
+        result = profiler.snapshot(limit=1, group_by="traceback", compare=False)
+        self.assertIsNone(result["compared_to"])
+        self.assertEqual(result["frames"], 5)
+        self.assertGreater(len(result["top"][0]["traceback"]), 1)
+        with self.assertRaises(ValidationException):
+            profiler.snapshot(group_by="module")
+        profiler.stop()
+
+    def test_request_sampling(self):
+        """표본 요청은 처리 중 최고/잔류 할당량을 요청 크기와 함께 기록하고, 끝나면 추적을 끔"""
+        sampler = RequestAllocationSampler(MemoryProfiler(), sample_rate=1.0, history_size=10)
+        with sampler.measure(request_bytes=2048, history_messages=3):
+            self.assertTrue(tracemalloc.is_tracing())
+            temporary = [bytearray(1024) for _ in range(2000)]
+            del temporary
+            leak(100)
+        self.assertFalse(tracemalloc.is_tracing())
+
+        record = sampler.records[0]
+        self.assertEqual((record["request_bytes"], record["history_messages"]), (2048, 3))
+        self.assertGreater(record["peak_bytes"], 2000 * 1024)
+        self.assertGreater(record["retained_bytes"], 100 * 1024)
+        self.assertLess(record["retained_bytes"], 1000 * 1024)
+
+        summary = sampler.summary()
+        self.assertEqual(summary["samples"], 1)
+        self.assertEqual(summary["by_request_size"][0]["request_bytes_min"], 1024)
+        self.assertGreater(summary["peak_bytes_per_request_byte"], 1000)
+
+    def test_request_sampling_bounds(self):
+        """표본 비율 0이면 측정하지 않고, 동시에 하나만 측정하며, 관리 API 추적 중에는 표본을 뽑지 않음"""
+        profiler = MemoryProfiler()
+        disabled = RequestAllocationSampler(profiler, sample_rate=0.0)
+        with disabled.measure(100):
+            self.assertFalse(tracemalloc.is_tracing())
+        self.assertEqual(len(disabled.records), 0)
+
+        sampler = RequestAllocationSampler(profiler, sample_rate=1.0)
+        with sampler.measure(100):
+            with sampler.measure(200):
+                pass
+        self.assertEqual([record["request_bytes"] for record in sampler.records], [100])
+
+        profiler.start()
+        temporary = bytearray(1024 * 1024)
+        del temporary
+        peak = profiler.status()["peak_bytes"]
+        with sampler.measure(300):
+            pass
+        self.assertTrue(tracemalloc.is_tracing())
+        self.assertGreaterEqual(profiler.status()["peak_bytes"], peak)
+        self.assertEqual(len(sampler.records), 1)
+        profiler.stop()
+
+    async def test_endpoints(self):
+        """관리 토큰으로 시작/상위 할당 위치/요청 표본/중지"""
+        headers = {"Authorization": "Bearer admin-secret"}
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            with patch.object(settings, "ADMIN_TOKEN", "admin-secret"):
+                unauthorized = await client.post("/api/v1/admin/memory/start")
+                stopped_top = await client.get("/api/v1/admin/memory/top", headers=headers)
+                negative_frames = await client.post("/api/v1/admin/memory/start", params={"frames": -1}, headers=headers)
+                started = await client.post("/api/v1/admin/memory/start", params={"frames": 2}, headers=headers)
+                top = await client.get("/api/v1/admin/memory/top", params={"limit": 3}, headers=headers)
+                negative_limit = await client.get("/api/v1/admin/memory/top", params={"limit": -5}, headers=headers)
+                requests = await client.get("/api/v1/admin/memory/requests", headers=headers)
+                stopped = await client.post("/api/v1/admin/memory/stop", headers=headers)
+
+        self.assertEqual(unauthorized.status_code, 401)
+        self.assertEqual(stopped_top.status_code, 400)
+        self.assertEqual(negative_frames.status_code, 422)
+        self.assertEqual((started.json()["tracing"], started.json()["frames"]), (True, 2))
+        self.assertLessEqual(len(top.json()["top"]), 3)
+        self.assertEqual(negative_limit.status_code, 422)
+        self.assertIn("by_request_size", requests.json())
+        self.assertFalse(stopped.json()["tracing"])
+
+
+if __name__ == "__main__":
+    unittest.main()
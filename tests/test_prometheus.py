@@ -0,0 +1,92 @@
+"""
+Prometheus 메트릭 테스트
+- 텍스트 형식 렌더링(패밀리/TYPE/히스토그램 정렬) 테스트
+- 라벨 값 정규화(모델/오류 분류) 테스트
+- 채팅 요청 결과/토큰/비용 기록 테스트
+- /metrics 엔드포인트 테스트
+"""
+
+import unittest
+import httpx
+from fastapi import FastAPI
+from src.api.system_routes import metrics_router
+from src.exceptions.chat_exceptions import OpenAIClientException, RateLimitException
+from src.models.request_dto import ChatRequest
+from src.services.chat_service import ChatService
+from src.utils.metric_labels import error_label, model_label, status_label
+from src.utils.prometheus import CONTENT_TYPE, render
+from src.utils.shared_metrics import SharedMetrics, metrics
+from tests.helpers import FakeClient, make_usage
+
+
+class TestPrometheus(unittest.IsolatedAsyncioTestCase):
+    """Prometheus 메트릭 테스트 클래스"""
+
+    def test_render(self):
+        """카운터/게이지/히스토그램 렌더링 테스트"""
+        shared = SharedMetrics(max_workers=1, slots_per_worker=64)
+        shared.inc("llm_requests_total", labels={"model": "gpt-4o", "status": "success"})
+        shared.gauge_add("ws_connections", 2)
+        shared.observe("latency_seconds", 3.0, labels={"model": "gpt-4o"}, buckets=(0.5, 10.0))
+
+        lines = render(shared).splitlines()
+
+        self.assertIn("# TYPE llm_requests_total counter", lines)
+        self.assertIn('llm_requests_total{model="gpt-4o",status="success"} 1', lines)
+        self.assertIn("# TYPE ws_connections gauge", lines)
+        histogram = lines[lines.index("# TYPE latency_seconds histogram") + 1:][:5]
+        self.assertEqual(histogram, [
+            'latency_seconds_bucket{le="0.5",model="gpt-4o"} 0',
+            'latency_seconds_bucket{le="10.0",model="gpt-4o"} 1',
+            'latency_seconds_bucket{le="+Inf",model="gpt-4o"} 1',
+            'latency_seconds_sum{model="gpt-4o"} 3',
+            'latency_seconds_count{model="gpt-4o"} 1',
+        ])
+
+    def test_labels_bounded(self):
+        """모델/오류 라벨 값 정규화 테스트"""
+        self.assertEqual(model_label("gpt-4o-mini"), "gpt-4o-mini")
+        self.assertEqual(model_label("made-up-model-123"), "other")
+        self.assertEqual(error_label(OpenAIClientException("x", "OPENAI_API_ERROR", {"status_code": 502})), "upstream_5xx")
+        self.assertEqual(error_label(OpenAIClientException("x", "OPENAI_API_ERROR")), "upstream_connection")
+        self.assertEqual(error_label(KeyError("x")), "internal")
+        self.assertEqual(status_label(RateLimitException("x", retry_after=1.0, scope="tenant")), "rejected")
+
+    def test_chat_request_recorded(self):
+        """채팅 요청 결과/종단 간 시간/토큰/비용 기록 테스트"""
+        chat_service = ChatService()
+        chat_service.openai_client = FakeClient(make_usage(100, 20, cached_tokens=40, reasoning_tokens=5))
+        request = ChatRequest(user_prompt="안녕", model="gpt-4o-mini", use_user_api_key=True, openai_api_key="sk-test")
+        labels = 'key_mode="user",model="gpt-4o-mini"'
+        before = metrics.snapshot()
+
+        chat_service.process_chat_request(request)
+
+        def delta(series: str) -> float:
+            return metrics.snapshot().get(series, 0) - before.get(series, 0)
+
+        self.assertEqual(delta(f'llm_requests_total{{error="none",{labels},status="success"}}'), 1)
+        self.assertEqual(delta(f'llm_request_duration_seconds_count{{{labels},status="success"}}'), 1)
+        self.assertEqual(delta(f'llm_upstream_latency_seconds_count{{{labels},status="success"}}'), 1)
+        self.assertEqual(delta(f'llm_tokens_total{{{labels},type="cached"}}'), 40)
+        self.assertEqual(delta(f'llm_tokens_total{{{labels},type="reasoning"}}'), 5)
+
+        with self.assertRaises(Exception):
+            chat_service.process_chat_request(ChatRequest(user_prompt="", use_user_api_key=True, openai_api_key="sk-test"))
+        self.assertEqual(delta(f'llm_requests_total{{error="validation",{labels},status="error"}}'), 1)
+
+    async def test_metrics_endpoint(self):
+        """/metrics 엔드포인트 응답 형식 테스트"""
+        app = FastAPI()
+        app.include_router(metrics_router)
+        metrics.inc("ws_connections_test_total")
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/metrics")
+
+        self.assertEqual(response.headers["content-type"], CONTENT_TYPE)
+        self.assertIn("# TYPE ws_connections_test_total counter", response.text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,187 @@
+"""
+레이트 리미터 테스트
+- 토큰 버킷 대기 시간 계산 테스트
+- RPM/TPM 한도 초과 거부 테스트
+- 대기 후 진행 테스트
+- 사용량 정산(반환) 테스트
+- 모델별 한도 테스트
+- 업스트림 레이트 리밋 헤더 페이싱 및 잔여 용량 메트릭 테스트
+"""
+
+import time
+import unittest
+from src.utils.rate_limiter import RateLimiter, TokenBucket, estimate_tokens
+from src.utils.shared_metrics import metrics
+from src.utils.upstream_pacer import UpstreamPacer, parse_reset_duration
+from src.exceptions.chat_exceptions import RateLimitException
+
+
+def _limits(**overrides):
+    limits = {"key_rpm": 0, "key_tpm": 0, "tenant_rpm": 0, "tenant_tpm": 0}
+    limits.update(overrides)
+    return limits
+
+
+class TestRateLimiter(unittest.TestCase):
+    """레이트 리미터 테스트 클래스"""
+
+    def test_token_bucket_wait_time(self):
+        """토큰 버킷 대기 시간 계산 테스트"""
+        bucket = TokenBucket(capacity=60, refill_rate=1.0)
+        now = time.monotonic()
+
+        self.assertEqual(bucket.wait_time(60, now), 0.0)
+        bucket.take(60)
+        self.assertAlmostEqual(bucket.wait_time(2, now), 2.0, places=1)
+
+    def test_unlimited_by_default(self):
+        """한도 미설정 시 무제한 테스트"""
+        limiter = RateLimiter(limits={"default": _limits()}, max_wait=0, max_queue=10)
+
+        for _ in range(100):
+            lease = limiter.acquire("sk-test", "tenant-a", "gpt-4o-mini", 10000)
+            self.assertEqual(lease.wait_time, 0.0)
+
+    def test_rpm_rejection_with_retry_after(self):
+        """RPM 초과 시 Retry-After 포함 거부 테스트"""
+        limiter = RateLimiter(limits={"default": _limits(key_rpm=2)}, max_wait=0, max_queue=10)
+
+        limiter.acquire("sk-test", "tenant-a", "gpt-4o-mini", 10)
+        limiter.acquire("sk-test", "tenant-b", "gpt-4o-mini", 10)
+
+        with self.assertRaises(RateLimitException) as context:
+            limiter.acquire("sk-test", "tenant-c", "gpt-4o-mini", 10)
+        self.assertEqual(context.exception.scope, "key_rpm")
+        self.assertGreater(context.exception.retry_after, 0)
+
+        # 다른 키는 영향 없음
+        limiter.acquire("sk-other", "tenant-a", "gpt-4o-mini", 10)
+
+    def test_tenant_isolation(self):
+        """테넌트별 한도 분리 테스트"""
+        limiter = RateLimiter(limits={"default": _limits(tenant_tpm=1000)}, max_wait=0, max_queue=10)
+
+        limiter.acquire("sk-test", "tenant-a", "gpt-4o-mini", 1000)
+        with self.assertRaises(RateLimitException):
+            limiter.acquire("sk-test", "tenant-a", "gpt-4o-mini", 100)
+
+        limiter.acquire("sk-test", "tenant-b", "gpt-4o-mini", 1000)
+
+    def test_wait_in_queue(self):
+        """대기 가능 시간 내 요청 대기 후 진행 테스트"""
+        limiter = RateLimiter(limits={"default": _limits(key_rpm=600)}, max_wait=1.0, max_queue=10)
+
+        for _ in range(600):
+            limiter.acquire("sk-test", "tenant-a", "gpt-4o-mini", 1)
+        lease = limiter.acquire("sk-test", "tenant-a", "gpt-4o-mini", 1)
+
+        self.assertGreater(lease.wait_time, 0)
+        self.assertLessEqual(lease.wait_time, 1.0)
+
+    def test_queue_full(self):
+        """대기열 가득 찼을 때 즉시 거부 테스트"""
+        limiter = RateLimiter(limits={"default": _limits(key_rpm=60)}, max_wait=10.0, max_queue=0)
+
+        for _ in range(60):
+            limiter.acquire("sk-test", "tenant-a", "gpt-4o-mini", 1)
+        with self.assertRaises(RateLimitException):
+            limiter.acquire("sk-test", "tenant-a", "gpt-4o-mini", 1)
+
+    def test_settle_refunds_unused_tokens(self):
+        """실제 사용량 정산 후 남은 토큰 반환 테스트"""
+        limiter = RateLimiter(limits={"default": _limits(key_tpm=1000)}, max_wait=0, max_queue=10)
+
+        lease = limiter.acquire("sk-test", "tenant-a", "gpt-4o-mini", 900)
+        with self.assertRaises(RateLimitException):
+            limiter.acquire("sk-test", "tenant-a", "gpt-4o-mini", 900)
+
+        lease.settle(100)
+        lease.settle(100)  # 중복 정산은 무시
+        limiter.acquire("sk-test", "tenant-a", "gpt-4o-mini", 800)
+
+    def test_model_specific_limits(self):
+        """모델별 한도 덮어쓰기 테스트"""
+        limiter = RateLimiter(
+            limits={"default": _limits(key_rpm=100), "o3": {"key_rpm": 1}},
+            max_wait=0,
+            max_queue=10
+        )
+
+        self.assertEqual(limiter.get_limits("o3")["key_rpm"], 1)
+        limiter.acquire("sk-test", "tenant-a", "o3", 1)
+        with self.assertRaises(RateLimitException):
+            limiter.acquire("sk-test", "tenant-a", "o3", 1)
+        limiter.acquire("sk-test", "tenant-a", "gpt-4o-mini", 1)
+
+    def test_estimate_tokens(self):
+        """입력 토큰 추정 테스트"""
+        messages = [{"role": "system", "content": ""}, {"role": "user", "content": "a" * 400}]
+
+        self.assertEqual(estimate_tokens(messages), 100 + 8)
+
+
+class TestUpstreamPacer(unittest.TestCase):
+    """업스트림 페이서 테스트 클래스"""
+
+    @staticmethod
+    def _headers(remaining_requests, limit_requests=100, reset="10s"):
+        return {
+            "x-ratelimit-limit-requests": str(limit_requests),
+            "x-ratelimit-remaining-requests": str(remaining_requests),
+            "x-ratelimit-reset-requests": reset
+        }
+
+    def test_parse_reset_duration(self):
+        """리셋 시간 헤더 파싱 테스트"""
+        self.assertEqual(parse_reset_duration("6m0s"), 360.0)
+        self.assertAlmostEqual(parse_reset_duration("20ms"), 0.02)
+        self.assertEqual(parse_reset_duration("1h2m3.5s"), 3723.5)
+        self.assertIsNone(parse_reset_duration(""))
+
+    def test_no_pacing_with_headroom(self):
+        """잔여 용량이 충분하면 대기 없음 테스트"""
+        pacer = UpstreamPacer(threshold=0.2, max_delay=10)
+        pacer.observe("sk-test", "gpt-4o-mini", self._headers(50))
+
+        self.assertEqual(pacer.delay_for("sk-test", "gpt-4o-mini", 10), 0.0)
+        self.assertEqual(pacer.delay_for("sk-unknown", "gpt-4o-mini", 10), 0.0)
+
+    def test_pacing_spreads_remaining_budget(self):
+        """잔여 용량이 임계치 미만이면 리셋까지 요청 분산 테스트"""
+        pacer = UpstreamPacer(threshold=0.2, max_delay=10)
+        pacer.observe("sk-test", "gpt-4o-mini", self._headers(4))
+
+        delays = [pacer.delay_for("sk-test", "gpt-4o-mini", 10) for _ in range(4)]
+
+        self.assertEqual(delays[0], 0.0)
+        self.assertEqual(delays, sorted(delays))
+        self.assertGreater(delays[1], 0.0)
+        self.assertLessEqual(delays[-1], 10)
+
+    def test_snapshot_headroom(self):
+        """잔여 용량 스냅샷 테스트"""
+        pacer = UpstreamPacer(threshold=0.2, max_delay=10)
+        pacer.observe("sk-test", "gpt-4o-mini", self._headers(25))
+
+        snapshot = pacer.snapshot()
+
+        self.assertEqual(len(snapshot), 1)
+        self.assertEqual(snapshot[0]["headroom"]["requests"], 0.25)
+        self.assertNotIn("sk-test", snapshot[0]["key_id"])
+
+    def test_remaining_gauges(self):
+        """관측한 잔여 요청 수를 가장 최근 값 게이지로 기록하고, 사용자 키는 제외하는지 테스트"""
+        pacer = UpstreamPacer(threshold=0.2, max_delay=10)
+        pacer.observe("sk-gauge", "gpt-4o-mini", self._headers(40))
+        pacer.observe("sk-gauge", "gpt-4o-mini", self._headers(25))
+        pacer.observe("sk-user-gauge", "gpt-4o-mini", self._headers(10), export_metrics=False)
+
+        key_id = pacer.snapshot()[0]["key_id"]
+        snapshot = metrics.snapshot()
+
+        self.assertEqual(snapshot[f'llm_upstream_remaining_requests{{key_id="{key_id}",model="gpt-4o-mini"}}'], 25)
+        self.assertFalse(any(pacer.snapshot()[1]["key_id"] in series for series in snapshot))
+
+
+if __name__ == "__main__":
+    unittest.main()
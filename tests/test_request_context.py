@@ -0,0 +1,106 @@
+"""
+요청 컨텍스트 전파 테스트
+- 예외 응답의 request_id 귀속 테스트 (본문 / X-Request-ID 헤더)
+- 처리되지 않은 예외의 일반 핸들러 귀속 테스트
+- 스레드풀 전파 및 로그 필터 테스트
+"""
+
+import logging
+import unittest
+import httpx
+from fastapi import APIRouter, FastAPI, Header
+from starlette.concurrency import run_in_threadpool
+from typing import Optional
+from src.api.exception_handlers import generic_exception_handler, validation_exception_handler
+from src.api.request_context_middleware import RequestContextMiddleware
+from src.exceptions.chat_exceptions import ValidationException
+from src.models.request_dto import ChatRequest
+from src.utils.request_context import (
+    RequestContextFilter,
+    bind_request,
+    get_request_context,
+    reset_request_context,
+    start_request_context
+)
+
+router = APIRouter()
+
+
+@router.post("/fail")
+async def fail(request: ChatRequest, x_tenant_id: Optional[str] = Header(default=None)):
+    bind_request(request, x_tenant_id)
+
+    def work():
+        # 스레드풀에서도 같은 컨텍스트를 봄
+        context = get_request_context()
+        raise ValidationException(f"{context.tenant_id}/{context.model}", field="user_prompt")
+
+    await run_in_threadpool(work)
+
+
+@router.get("/crash")
+async def crash():
+    raise RuntimeError("boom")
+
+
+app = FastAPI()
+app.add_middleware(RequestContextMiddleware)
+app.add_exception_handler(ValidationException, validation_exception_handler)
+app.add_exception_handler(Exception, generic_exception_handler)
+app.include_router(router)
+
+
+class TestRequestContext(unittest.IsolatedAsyncioTestCase):
+    """요청 컨텍스트 전파 테스트 클래스"""
+
+    async def asyncSetUp(self):
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        self.client = httpx.AsyncClient(transport=transport, base_url="http://test")
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+
+    async def test_error_attributed_to_body_request_id(self):
+        """본문 request_id/테넌트/모델이 예외 응답까지 전달되는지 테스트"""
+        response = await self.client.post(
+            "/fail",
+            json={"request_id": "req-1", "user_prompt": "hi", "model": "gpt-4o"},
+            headers={"X-Request-ID": "hdr-1", "X-Tenant-ID": "acme"}
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["request_id"], "req-1")
+        self.assertIn("acme/gpt-4o", response.json()["error"])
+        self.assertEqual(response.headers["x-request-id"], "req-1")
+
+    async def test_header_request_id_fallback(self):
+        """본문에 request_id가 없으면 X-Request-ID 헤더 사용 테스트"""
+        response = await self.client.post("/fail", json={"user_prompt": "hi"}, headers={"X-Request-ID": "hdr-1"})
+
+        self.assertEqual(response.json()["request_id"], "hdr-1")
+
+    async def test_unhandled_error(self):
+        """처리되지 않은 예외도 요청 컨텍스트로 귀속되는지 테스트"""
+        response = await self.client.get("/crash", headers={"X-Request-ID": "hdr-2"})
+
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(response.json()["request_id"], "hdr-2")
+
+    def test_log_filter(self):
+        """로그 레코드에 request_id/tenant_id 속성 추가 테스트"""
+        context_filter = RequestContextFilter()
+        record = logging.LogRecord("test", logging.INFO, __file__, 1, "msg", None, None)
+
+        context_filter.filter(record)
+        self.assertEqual((record.request_id, record.tenant_id), ("-", "-"))
+
+        token = start_request_context("req-3", "acme")
+        try:
+            context_filter.filter(record)
+        finally:
+            reset_request_context(token)
+        self.assertEqual((record.request_id, record.tenant_id), ("req-3", "acme"))
+
+
+if __name__ == "__main__":
+    unittest.main()
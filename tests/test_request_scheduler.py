@@ -0,0 +1,168 @@
+"""
+요청 스케줄러 테스트
+- 여유 슬롯 즉시 배정 테스트
+- 우선순위 클래스 테스트
+- 테넌트 가중 공정 큐 테스트 (대기열이 비었다 다시 도착하는 테넌트 포함)
+- 플로우 내부 EDF 테스트
+- 마감 시각/대기열 한도 거부 테스트
+"""
+
+import threading
+import time
+import unittest
+from src.utils.request_scheduler import RequestScheduler
+from src.exceptions.chat_exceptions import RateLimitException
+
+
+def _grant_order(scheduler, requests):
+    """슬롯 1개를 점유한 상태에서 요청들을 대기시킨 뒤, 배정 순서를 반환"""
+    holder = scheduler.acquire("holder", "key", "interactive")
+    order = []
+
+    def worker(name, kwargs):
+        ticket = scheduler.acquire(**kwargs)
+        order.append(name)
+        scheduler.release(ticket)
+
+    threads = []
+    for name, kwargs in requests:
+        thread = threading.Thread(target=worker, args=(name, kwargs))
+        thread.start()
+        threads.append(thread)
+        # 도착 순서를 고정
+        deadline = time.monotonic() + 2
+        while scheduler.stats()["queued"] < len(threads) and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+    scheduler.release(holder)
+    for thread in threads:
+        thread.join(5)
+    return order
+
+
+def _enqueue(scheduler, granted, name, **kwargs):
+    """요청 하나를 대기시키고 배정되면 (이름, 티켓)을 granted에 추가"""
+    queued = scheduler.stats()["queued"]
+    thread = threading.Thread(target=lambda: granted.append((name, scheduler.acquire(**kwargs))), daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 2
+    while scheduler.stats()["queued"] <= queued and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def _release_next(scheduler, granted, index):
+    """index번째로 배정된 요청이 나올 때까지 기다린 뒤 반환"""
+    deadline = time.monotonic() + 2
+    while len(granted) <= index and time.monotonic() < deadline:
+        time.sleep(0.001)
+    scheduler.release(granted[index][1])
+
+
+class TestRequestScheduler(unittest.TestCase):
+    """요청 스케줄러 테스트 클래스"""
+
+    def test_immediate_grant(self):
+        """여유 슬롯이 있으면 즉시 배정 테스트"""
+        scheduler = RequestScheduler(max_concurrency=2, max_queue=10, tenant_weights={}, deadlines={})
+
+        ticket = scheduler.acquire("tenant-a", "key", "interactive")
+        scheduler.release(ticket)
+
+        stats = scheduler.stats()
+        self.assertEqual(stats["active"], 0)
+        self.assertEqual(stats["classes"]["interactive"]["queue_wait"]["count"], 1)
+        self.assertEqual(stats["classes"]["interactive"]["upstream_time"]["count"], 1)
+
+    def test_interactive_before_background(self):
+        """interactive 클래스 우선 배정 테스트"""
+        scheduler = RequestScheduler(max_concurrency=1, max_queue=10, tenant_weights={}, deadlines={})
+
+        order = _grant_order(scheduler, [
+            ("bg-1", {"tenant_id": "a", "key_id": "key", "priority": "background"}),
+            ("bg-2", {"tenant_id": "a", "key_id": "key", "priority": "background"}),
+            ("int-1", {"tenant_id": "b", "key_id": "key", "priority": "interactive"})
+        ])
+
+        self.assertEqual(order, ["int-1", "bg-1", "bg-2"])
+
+    def test_fair_queuing_across_tenants(self):
+        """대량 요청 테넌트와 소량 요청 테넌트 간 공정 배정 테스트"""
+        scheduler = RequestScheduler(max_concurrency=1, max_queue=20, tenant_weights={}, deadlines={})
+
+        requests = [(f"flood-{i}", {"tenant_id": "flood", "key_id": "key", "cost": 100}) for i in range(5)]
+        requests.append(("small", {"tenant_id": "small", "key_id": "key", "cost": 100}))
+        order = _grant_order(scheduler, requests)
+
+        # 늦게 도착했어도 대량 요청 뒤에 밀리지 않음
+        self.assertLessEqual(order.index("small"), 1)
+
+    def test_tenant_weights(self):
+        """테넌트 가중치 비례 배정 테스트"""
+        scheduler = RequestScheduler(max_concurrency=1, max_queue=20, tenant_weights={"gold": 3}, deadlines={})
+
+        requests = []
+        for i in range(4):
+            requests.append((f"basic-{i}", {"tenant_id": "basic", "key_id": "key", "cost": 100}))
+            requests.append((f"gold-{i}", {"tenant_id": "gold", "key_id": "key", "cost": 100}))
+        order = _grant_order(scheduler, requests)
+
+        # 가중치 3:1 - gold 요청 4건이 basic 요청 2건보다 먼저 모두 처리됨
+        self.assertEqual(sum(name.startswith("gold") for name in order[:6]), 4)
+
+    def test_returning_flow_keeps_finish_tag(self):
+        """요청을 하나씩 보내는 고비용 테넌트도 직전 요청 비용만큼 뒤로 밀리는지 테스트"""
+        scheduler = RequestScheduler(max_concurrency=1, max_queue=20, tenant_weights={}, deadlines={})
+        holder = scheduler.acquire("holder", "key")
+        granted = []
+        for i in range(5):
+            _enqueue(scheduler, granted, f"light-{i}", tenant_id="light", key_id="key", cost=100)
+        _enqueue(scheduler, granted, "heavy-0", tenant_id="heavy", key_id="key", cost=1000)
+
+        scheduler.release(holder)
+        for index in range(2):
+            _release_next(scheduler, granted, index)
+        # heavy 대기열이 비어 있는 동안 다음 요청 도착
+        _enqueue(scheduler, granted, "heavy-1", tenant_id="heavy", key_id="key", cost=1000)
+        for index in range(2, 7):
+            _release_next(scheduler, granted, index)
+
+        order = [name for name, _ in granted]
+        self.assertEqual(order[:3], ["light-0", "heavy-0", "light-1"])
+        self.assertEqual(order[-1], "heavy-1")
+
+    def test_earliest_deadline_first_within_flow(self):
+        """같은 플로우 내 마감 시각 우선 배정 테스트"""
+        scheduler = RequestScheduler(max_concurrency=1, max_queue=10, tenant_weights={}, deadlines={})
+
+        order = _grant_order(scheduler, [
+            ("late", {"tenant_id": "a", "key_id": "key", "deadline": 20}),
+            ("early", {"tenant_id": "a", "key_id": "key", "deadline": 5})
+        ])
+
+        self.assertEqual(order, ["early", "late"])
+
+    def test_deadline_exceeded(self):
+        """마감 시각까지 슬롯을 받지 못하면 거부 테스트"""
+        scheduler = RequestScheduler(max_concurrency=1, max_queue=10, tenant_weights={}, deadlines={})
+        holder = scheduler.acquire("a", "key")
+
+        with self.assertRaises(RateLimitException) as context:
+            scheduler.acquire("b", "key", deadline=0.05)
+        self.assertEqual(context.exception.scope, "scheduler_deadline")
+
+        scheduler.release(holder)
+        self.assertEqual(scheduler.stats()["active"], 0)
+        self.assertEqual(scheduler.stats()["queued"], 0)
+
+    def test_queue_full(self):
+        """대기열 가득 찼을 때 즉시 거부 테스트"""
+        scheduler = RequestScheduler(max_concurrency=1, max_queue=0, tenant_weights={}, deadlines={})
+        scheduler.acquire("a", "key")
+
+        with self.assertRaises(RateLimitException) as context:
+            scheduler.acquire("b", "key")
+        self.assertEqual(context.exception.scope, "scheduler_queue")
+
+
+if __name__ == "__main__":
+    unittest.main()
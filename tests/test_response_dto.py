@@ -0,0 +1,79 @@
+"""
+응답 생성/직렬화 빠른 경로 테스트
+- SDK usage → TokenUsage 변환 테스트
+- 검증 생략(model_construct) 응답이 검증한 응답과 같은지 테스트
+- orjson 응답 인코딩 테스트
+"""
+
+import json
+import unittest
+from openai.types.responses import Response
+from src.api.content_negotiation import dump_json
+from src.models.response_dto import ChatResponse, TokenUsage
+
+RESPONSE_BODY = {
+    "id": "resp_1",
+    "object": "response",
+    "created_at": 1741476542.0,
+    "status": "completed",
+    "model": "gpt-4o-mini",
+    "output": [{
+        "type": "message",
+        "id": "msg_1",
+        "status": "completed",
+        "role": "assistant",
+        "content": [{"type": "output_text", "text": "안녕하세요", "annotations": []}]
+    }],
+    "parallel_tool_calls": True,
+    "tool_choice": "auto",
+    "tools": [],
+    "text": {"format": {"type": "text"}},
+    "usage": {
+        "input_tokens": 100,
+        "input_tokens_details": {"cached_tokens": 40, "cache_write_tokens": 0},
+        "output_tokens": 20,
+        "output_tokens_details": {"reasoning_tokens": 5},
+        "total_tokens": 120
+    }
+}
+
+
+class TestResponseDto(unittest.TestCase):
+    """응답 생성/직렬화 테스트 클래스"""
+
+    def setUp(self):
+        self.openai_response = Response.model_validate(RESPONSE_BODY)
+
+    def test_token_usage_from_sdk(self):
+        """SDK usage 객체에서 토큰 수 추출 테스트"""
+        usage = TokenUsage.from_openai_usage(self.openai_response.usage)
+
+        self.assertEqual(
+            (usage.input_tokens, usage.output_tokens, usage.total_tokens, usage.cached_tokens, usage.reasoning_tokens),
+            (100, 20, 120, 40, 5)
+        )
+        self.assertEqual(TokenUsage.from_openai_usage(None).total_tokens, 0)
+        self.assertFalse(hasattr(usage, "__dict__"))
+
+    def test_constructed_matches_validated(self):
+        """검증을 생략한 응답이 검증한 응답과 같은지 테스트"""
+        response = ChatResponse.from_openai_response(self.openai_response, request_id="r1", response_time=0.5, cost=42, queue_time=0.1)
+        validated = ChatResponse.model_validate(response.model_dump())
+
+        self.assertEqual(response.model_dump(), validated.model_dump())
+        self.assertEqual(list(response.__dict__), list(ChatResponse.model_fields))
+        self.assertEqual((response.output_text, response.cached_tokens, response.created_at), ("안녕하세요", 40, 1741476542))
+
+        user_key_response = ChatResponse.from_openai_response(self.openai_response, use_user_api_key=True)
+        self.assertEqual(user_key_response.total_tokens, 0)
+
+    def test_dump_json(self):
+        """orjson 인코딩 결과가 model_dump와 같은지 테스트"""
+        error_response = ChatResponse.create_error_response(request_id="r1", error_message="오류")
+
+        self.assertEqual(json.loads(dump_json(error_response)), error_response.model_dump())
+        self.assertEqual(json.loads(dump_json({"items": [error_response]}))["items"][0]["error"], "오류")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+공유 메모리 메트릭 테스트
+- 카운터/히스토그램 기록 테스트
+- fork된 워커 간 합산 테스트
+- 워커 재시작 시 카운터 유지/게이지 초기화 테스트
+- 영역 초과 시 기록 생략 테스트
+- 가장 최근 값 게이지 테스트
+"""
+
+import os
+import unittest
+from src.utils.shared_metrics import KIND_GAUGE_LATEST, SharedMetrics, series_name
+
+
+class TestSharedMetrics(unittest.TestCase):
+    """공유 메모리 메트릭 테스트 클래스"""
+
+    def test_counter_and_histogram(self):
+        """카운터/히스토그램 기록 테스트"""
+        metrics = SharedMetrics(max_workers=1, slots_per_worker=64)
+
+        metrics.inc("requests_total", labels={"model": "gpt-4o-mini"})
+        metrics.inc("requests_total", 2, labels={"model": "gpt-4o-mini"})
+        metrics.observe("latency_seconds", 0.3, buckets=(0.1, 0.5))
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot['requests_total{model="gpt-4o-mini"}'], 3)
+        self.assertEqual(snapshot['latency_seconds_bucket{le="0.1"}'], 0)
+        self.assertEqual(snapshot['latency_seconds_bucket{le="0.5"}'], 1)
+        self.assertEqual(snapshot['latency_seconds_bucket{le="+Inf"}'], 1)
+        self.assertAlmostEqual(snapshot["latency_seconds_sum"], 0.3)
+
+    @unittest.skipUnless(hasattr(os, "fork"), "fork 미지원 플랫폼")
+    def test_aggregate_across_forked_workers(self):
+        """fork된 워커 프로세스 간 합산 테스트"""
+        metrics = SharedMetrics(max_workers=3, slots_per_worker=64)
+
+        pids = []
+        for index in (1, 2):
+            pid = os.fork()
+            if pid == 0:
+                metrics.bind_worker(index)
+                metrics.inc("requests_total", 10 * index)
+                os._exit(0)
+            pids.append(pid)
+        for pid in pids:
+            os.waitpid(pid, 0)
+
+        metrics.inc("requests_total", 1)
+
+        self.assertEqual(metrics.snapshot()["requests_total"], 31)
+        self.assertEqual(len(metrics.workers()), 3)
+
+    def test_rebind_keeps_counters_and_resets_gauges(self):
+        """워커 재시작 시 카운터 유지 및 게이지 초기화 테스트"""
+        metrics = SharedMetrics(max_workers=1, slots_per_worker=64)
+        metrics.inc("requests_total", 5)
+        metrics.gauge_add("in_flight", 3)
+
+        metrics.bind_worker(0)
+        metrics.inc("requests_total")
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot["requests_total"], 6)
+        self.assertEqual(snapshot["in_flight"], 0)
+
+    def test_region_full(self):
+        """영역이 가득 차면 새 시리즈 생략 테스트"""
+        metrics = SharedMetrics(max_workers=1, slots_per_worker=2)
+
+        for index in range(3):
+            metrics.inc(series_name("requests_total", {"n": str(index)}))
+
+        self.assertEqual(len(metrics.snapshot()), 2)
+        self.assertEqual(metrics.dropped, 1)
+
+    def test_latest_gauge(self):
+        """가장 최근 값 게이지는 워커 합산 대신 마지막으로 설정한 워커의 값 테스트"""
+        metrics = SharedMetrics(max_workers=2, slots_per_worker=64)
+        metrics.gauge_set("remaining", 40, labels={"model": "gpt-4o"})
+        metrics.bind_worker(1)
+        metrics.gauge_set("remaining", 25, labels={"model": "gpt-4o"})
+
+        collected = metrics.collect()
+
+        self.assertEqual(collected['remaining{model="gpt-4o"}'], (KIND_GAUGE_LATEST, 25))
+        self.assertEqual(len(collected), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
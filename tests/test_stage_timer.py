@@ -0,0 +1,68 @@
+"""
+단계별 처리 시간 테스트
+- StageTimer 누적/헤더 형식 테스트
+- /chat 응답의 Server-Timing 헤더 및 ChatResponse.timings 테스트
+- 단계별 히스토그램 기록 테스트
+"""
+
+import unittest
+from unittest.mock import patch
+from src.config.config import settings
+from src.utils.shared_metrics import metrics
+from src.utils.stage_timer import STAGE_METRIC, StageTimer
+from tests.helpers import CHAT_BODY, ChatAppTestCase, build_chat_app
+
+PIPELINE_STAGES = ["parse", "validate", "messages", "key_select", "admit", "upstream", "settle", "build"]
+
+
+class TestStageTimer(ChatAppTestCase):
+    """단계별 처리 시간 테스트 클래스"""
+
+    app = build_chat_app()
+
+    def test_timer(self):
+        """같은 단계 합산 및 Server-Timing 값 형식 테스트"""
+        timer = StageTimer(started_at=0.0)
+        timer.stages = {"validate": 0.001}
+        timer.mark("validate")
+
+        self.assertGreater(timer.stages["validate"], 0.001)
+        timer.stages = {"validate": 0.0012, "upstream": 0.8}
+        self.assertEqual(timer.header_value(total=0.9), "validate;dur=1.200, upstream;dur=800.000, total;dur=900.000")
+        self.assertEqual(timer.as_millis(), {"validate": 1.2, "upstream": 800.0})
+
+    async def test_server_timing_header(self):
+        """채팅 응답의 Server-Timing 헤더에 모든 단계와 total이 순서대로 포함되는지 테스트"""
+        response = await self.client.post("/api/v1/chat", json=CHAT_BODY)
+
+        self.assertEqual(response.status_code, 200)
+        entries = [entry.split(";")[0] for entry in response.headers["server-timing"].split(", ")]
+        self.assertEqual(entries, PIPELINE_STAGES + ["serialize", "total"])
+        self.assertIsNone(response.json()["timings"])
+
+    async def test_timings_in_body(self):
+        """STAGE_TIMINGS_IN_RESPONSE 설정 시 ChatResponse.timings 포함 테스트"""
+        with patch.object(settings, "STAGE_TIMINGS_IN_RESPONSE", True):
+            response = await self.client.post("/api/v1/chat", json=CHAT_BODY)
+
+        self.assertEqual(list(response.json()["timings"]), PIPELINE_STAGES)
+
+    async def test_stage_metrics(self):
+        """단계별 히스토그램 기록 테스트"""
+        before = metrics.snapshot()
+
+        await self.client.post("/api/v1/chat", json=CHAT_BODY)
+
+        for stage in PIPELINE_STAGES + ["serialize"]:
+            series = f'{STAGE_METRIC}_count{{stage="{stage}"}}'
+            self.assertEqual(metrics.snapshot().get(series, 0) - before.get(series, 0), 1, stage)
+
+    async def test_total_only_outside_chat(self):
+        """단계를 기록하지 않는 엔드포인트는 total만 포함 테스트"""
+        response = await self.client.get("/api/v1/")
+
+        self.assertTrue(response.headers["server-timing"].startswith("total;dur="))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+이벤트 루프 멈춤 감지 테스트
+- 루프를 막는 블로킹 코드의 호출 위치와 멈춘 시간 기록 테스트
+- 같은 위치는 횟수로 합산, 짧은 지연은 무시 테스트
+- 보관하는 호출 위치 수 제한 테스트
+- /api/v1/admin/stalls 엔드포인트 테스트
+"""
+
+import asyncio
+import time
+import unittest
+from unittest.mock import patch
+import httpx
+from fastapi import FastAPI
+from src.api.admin_routes import admin_router
+from src.api.exception_handlers import authorization_exception_handler
+from src.exceptions.chat_exceptions import AuthorizationException
+from src.utils.loop_monitor import LoopLagMonitor
+from src.config.config import settings
+
+app = FastAPI()
+app.add_exception_handler(AuthorizationException, authorization_exception_handler)
+app.include_router(admin_router)
+
+
+def blocking_call(seconds):
+    time.sleep(seconds)
+
+
+async def run_with_monitor(monitor, *durations):
+    """모니터를 돌리면서 이벤트 루프를 주어진 시간만큼씩 막음"""
+    await monitor.start()
+    try:
+        for seconds in durations:
+            await asyncio.sleep(0.05)
+            blocking_call(seconds)
+            await asyncio.sleep(0.05)
+    finally:
+        await monitor.stop()
+
+
+class TestStallDetector(unittest.IsolatedAsyncioTestCase):
+    """이벤트 루프 멈춤 감지 테스트 클래스"""
+
+    async def test_captures_blocking_site(self):
+        """멈춘 동안 루프 스레드의 스택을 잡아 블로킹 호출 위치와 멈춘 시간을 기록"""
+        monitor = LoopLagMonitor(interval=0.01, stall_threshold=0.05)
+        await run_with_monitor(monitor, 0.3)
+
+        stalls = monitor.stalls()
+        self.assertEqual(len(stalls), 1, stalls)
+        self.assertTrue(stalls[0]["site"].startswith("tests/test_stall_detector.py:"), stalls[0]["site"])
+        self.assertTrue(stalls[0]["site"].endswith("(blocking_call)"))
+        self.assertEqual(stalls[0]["count"], 1)
+        self.assertGreaterEqual(stalls[0]["max_seconds"], 0.2)
+        self.assertIn("time.sleep(seconds)", stalls[0]["stack"][-1])
+
+    async def test_aggregates_and_ignores_short_lag(self):
+        """같은 위치의 멈춤은 횟수로 합산하고, 기준보다 짧은 지연은 기록하지 않음"""
+        monitor = LoopLagMonitor(interval=0.01, stall_threshold=0.1)
+        await run_with_monitor(monitor, 0.3, 0.01, 0.3)
+
+        stalls = monitor.stalls()
+        self.assertEqual(len(stalls), 1, stalls)
+        self.assertEqual(stalls[0]["count"], 2)
+        self.assertGreaterEqual(stalls[0]["total_seconds"], 0.4)
+
+        monitor.reset_stalls()
+        self.assertEqual(monitor.stalls(), [])
+
+    async def test_max_sites(self):
+        """호출 위치 수가 한도를 넘으면 새 위치는 버리고 개수만 셈"""
+        monitor = LoopLagMonitor(interval=0.01, stall_threshold=0.05, max_sites=1)
+        await monitor.start()
+        try:
+            await asyncio.sleep(0.05)
+            blocking_call(0.2)
+            await asyncio.sleep(0.05)
+            time.sleep(0.2)
+            await asyncio.sleep(0.05)
+        finally:
+            await monitor.stop()
+
+        self.assertEqual(len(monitor.stalls()), 1)
+        self.assertEqual(monitor.dropped_sites, 1)
+
+    async def test_endpoints(self):
+        """관리 토큰으로 조회/초기화"""
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            with patch.object(settings, "ADMIN_TOKEN", "admin-secret"):
+                unauthorized = await client.get("/api/v1/admin/stalls")
+                headers = {"Authorization": "Bearer admin-secret"}
+                listed = await client.get("/api/v1/admin/stalls", headers=headers)
+                reset = await client.delete("/api/v1/admin/stalls", headers=headers)
+
+        self.assertEqual(unauthorized.status_code, 401)
+        self.assertEqual(listed.status_code, 200)
+        self.assertIn("stalls", listed.json())
+        self.assertEqual(reset.json()["reset"], True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+"""
+시스템 지표 샘플러 테스트
+- 스냅샷 구성 및 추이 보관 개수 테스트
+- 수집 시 기다리는 psutil 호출/소켓 순회 없음 테스트
+- 백그라운드 스레드 갱신 테스트
+- cgroup v2 컨테이너 한도 파싱 테스트
+- /api/v1/system/* 엔드포인트가 수집 없이 스냅샷을 반환하는지 테스트
+"""
+
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+import httpx
+import psutil
+from fastapi import FastAPI
+from src.api.system_routes import system_router
+from src.utils import system_info
+from src.utils.system_info import SystemInfoCollector
+from src.utils.system_sampler import SystemSampler, system_sampler
+
+app = FastAPI()
+app.include_router(system_router)
+
+
+class TestSystemSampler(unittest.IsolatedAsyncioTestCase):
+    """시스템 지표 샘플러 테스트 클래스"""
+
+    def test_snapshot_and_history(self):
+        """스냅샷은 미리 인코딩된 본문을 갖고, 추이는 최근 history_size개만 보관"""
+        sampler = SystemSampler(interval=1.0, history_size=3, include_connections=False)
+        for _ in range(5):
+            snapshot = sampler.sample()
+
+        info = json.loads(snapshot.info_body)
+        self.assertLessEqual({"cpu", "memory", "disk", "network", "process", "container", "docker", "system"}, set(info))
+        self.assertEqual(info["process"]["pid"], os.getpid())
+        self.assertIsNone(info["network"]["active_connections"])
+        self.assertEqual(json.loads(snapshot.status_body)["pid"], os.getpid())
+        self.assertEqual(len(sampler.history_points()), 3)
+        self.assertIs(sampler.snapshot(), snapshot)
+
+    def test_sampling_does_not_wait(self):
+        """CPU 사용률은 interval 없이 계산하고, 연결 수 집계를 끄면 소켓을 순회하지 않음"""
+        intervals = []
+        original = psutil.cpu_percent
+
+        def cpu_percent(interval=None, percpu=False):
+            intervals.append(interval)
+            return original(interval=None, percpu=percpu)
+
+        sampler = SystemSampler(interval=1.0, include_connections=False)
+        with patch("psutil.cpu_percent", side_effect=cpu_percent), \
+                patch("psutil.net_connections", side_effect=AssertionError("소켓 순회")):
+            started = time.perf_counter()
+            sampler.sample()
+            sampler.sample()
+            elapsed = time.perf_counter() - started
+
+        self.assertTrue(intervals)
+        self.assertTrue(all(not interval for interval in intervals))
+        self.assertLess(elapsed, 0.5)
+
+    def test_background_refresh(self):
+        """시작하면 백그라운드 스레드가 주기적으로 스냅샷을 교체하고, stop 후 멈춤"""
+        sampler = SystemSampler(interval=0.01, history_size=100)
+        sampler.start()
+        try:
+            deadline = time.monotonic() + 5
+            while len(sampler.history_points()) < 3 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            sampler.stop()
+        sampler._worker.join(1)
+
+        self.assertGreaterEqual(len(sampler.history_points()), 3)
+        self.assertFalse(sampler._worker.is_alive())
+
+    def test_cgroup_v2_limits(self):
+        """cgroup v2 메모리/CPU 한도와 스로틀링 통계 파싱"""
+        with tempfile.TemporaryDirectory() as directory:
+            files = {
+                "memory.max": "1073741824\n",
+                "memory.current": "536870912\n",
+                "cpu.max": "150000 100000\n",
+                "cpu.stat": "usage_usec 100\nnr_throttled 7\nthrottled_usec 2500000\n"
+            }
+            for name, content in files.items():
+                with open(os.path.join(directory, name), "w") as f:
+                    f.write(content)
+            with patch.object(system_info, "_CGROUP_ROOT", directory):
+                limits = SystemInfoCollector._get_container_limits()
+
+        self.assertEqual(limits, {
+            "cgroup_version": 2,
+            "memory_limit_mb": 1024.0,
+            "memory_usage_mb": 512.0,
+            "memory_usage_percent": 50.0,
+            "cpu_limit_cores": 1.5,
+            "cpu_throttled_periods": 7,
+            "cpu_throttled_seconds": 2.5
+        })
+
+    async def test_endpoints_serve_snapshot(self):
+        """엔드포인트는 수집하지 않고 최신 스냅샷 본문을 그대로 반환"""
+        snapshot = system_sampler.snapshot()
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            with patch.object(system_sampler, "sample", side_effect=AssertionError("요청 중 수집")):
+                info = await client.get("/api/v1/system/info")
+                status = await client.get("/api/v1/system/status")
+                history = await client.get("/api/v1/system/history")
+
+        self.assertEqual(info.status_code, 200)
+        self.assertEqual(info.headers["content-type"], "application/json")
+        self.assertEqual(info.content, snapshot.info_body)
+        self.assertEqual(status.json()["status"], "healthy")
+        self.assertIsInstance(history.json()["points"], list)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+"""
+분산 추적 테스트
+- traceparent 파싱 테스트
+- 채팅 요청 스팬 트리 및 traceparent 이어받기/샘플링 결정 테스트
+- 업스트림 HTTP 시도(재시도) 스팬 테스트
+- 배치 내보내기(JSONL 파일 / OTLP, 실패 시 파일 대체) 테스트
+"""
+
+import json
+import os
+import tempfile
+import unittest
+import httpx
+from src.api.tracing_middleware import TracingMiddleware
+from src.external.openai_client import OpenAIClient
+from src.external.trace_exporter import BatchSpanExporter, JsonlFileSink, OTLPHttpSink
+from src.utils import tracing
+from src.utils.tracing import Span, parse_traceparent, trace_span
+from tests.helpers import CHAT_BODY, ChatAppTestCase, build_chat_app
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+PARENT_ID = "00f067aa0ba902b7"
+
+
+class CollectingExporter:
+    """끝난 스팬을 메모리에 모으는 내보내기"""
+
+    def __init__(self):
+        self.spans = []
+
+    def export(self, span):
+        self.spans.append(span)
+
+    def flush(self):
+        pass
+
+
+class TestTracing(ChatAppTestCase):
+    """분산 추적 테스트 클래스"""
+
+    app = build_chat_app(TracingMiddleware)
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.exporter = CollectingExporter()
+        self.original_exporter, tracing._exporter = tracing._exporter, self.exporter
+
+    async def asyncTearDown(self):
+        tracing._exporter = self.original_exporter
+        await super().asyncTearDown()
+
+    def test_parse_traceparent(self):
+        """traceparent 형식 검증 테스트"""
+        self.assertEqual(parse_traceparent(f"00-{TRACE_ID}-{PARENT_ID}-01"), (TRACE_ID, PARENT_ID, True))
+        self.assertEqual(parse_traceparent(f"00-{TRACE_ID}-{PARENT_ID}-00"), (TRACE_ID, PARENT_ID, False))
+        # 이후 버전은 추가 필드를 무시하고 앞 4개 필드만 해석
+        self.assertEqual(parse_traceparent(f"01-{TRACE_ID}-{PARENT_ID}-01-extra"), (TRACE_ID, PARENT_ID, True))
+        for invalid in (
+            f"00-{TRACE_ID}-{PARENT_ID}-01-extra",
+            f"ff-{TRACE_ID}-{PARENT_ID}-01",
+            f"00-{'0' * 32}-{PARENT_ID}-01",
+            f"00-{TRACE_ID}-{'0' * 16}-01",
+            "garbage",
+            ""
+        ):
+            self.assertIsNone(parse_traceparent(invalid), invalid)
+
+    async def test_chat_span_tree(self):
+        """traceparent를 이어받은 채팅 요청의 스팬 트리 테스트"""
+        response = await self.client.post("/api/v1/chat", json=CHAT_BODY, headers={"traceparent": f"00-{TRACE_ID}-{PARENT_ID}-01"})
+
+        spans = {span.name: span for span in self.exporter.spans}
+        self.assertEqual(set(spans), {
+            "POST /api/v1/chat", "chat.process", "chat.prepare", "chat.admit",
+            "openai.responses.create", "chat.settle", "chat.serialize"
+        })
+        self.assertTrue(all(span.trace_id == TRACE_ID for span in spans.values()))
+
+        server = spans["POST /api/v1/chat"]
+        self.assertEqual(server.parent_span_id, PARENT_ID)
+        self.assertEqual(server.attributes["http.status_code"], 200)
+        self.assertEqual(response.headers["traceresponse"], f"00-{TRACE_ID}-{server.span_id}-01")
+        for name in ("chat.process", "chat.serialize"):
+            self.assertEqual(spans[name].parent_span_id, server.span_id, name)
+        for name in ("chat.prepare", "chat.admit", "openai.responses.create", "chat.settle"):
+            self.assertEqual(spans[name].parent_span_id, spans["chat.process"].span_id, name)
+        self.assertEqual(spans["chat.process"].attributes["llm.response_id"], "resp_1")
+        self.assertEqual(spans["chat.process"].attributes["llm.key_mode"], "user")
+
+    async def test_unsampled_parent(self):
+        """호출자가 샘플링하지 않은 트레이스는 스팬을 내보내지 않음 테스트"""
+        response = await self.client.post("/api/v1/chat", json=CHAT_BODY, headers={"traceparent": f"00-{TRACE_ID}-{PARENT_ID}-00"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.exporter.spans, [])
+        self.assertNotIn("traceresponse", response.headers)
+
+    def test_http_attempt_spans(self):
+        """SDK HTTP 시도(재시도 포함)마다 업스트림 스팬의 자식 스팬 기록 테스트"""
+        statuses = iter([429, 200, 200])
+        transport = httpx.MockTransport(lambda request: httpx.Response(next(statuses), json={}))
+        hooks = {"request": [OpenAIClient._on_request], "response": [OpenAIClient._on_response]}
+
+        with httpx.Client(transport=transport, event_hooks=hooks) as client:
+            with trace_span("openai.responses.create", traceparent=f"00-{TRACE_ID}-{PARENT_ID}-01") as upstream:
+                for retry_count in range(2):
+                    client.post("http://upstream.test/v1/responses", headers={"x-stainless-retry-count": str(retry_count)})
+            # 부모 스팬이 없으면 HTTP 시도 스팬을 만들지 않음
+            client.post("http://upstream.test/v1/responses")
+
+        attempts = [span for span in self.exporter.spans if span.name == "HTTP POST"]
+        self.assertEqual([span.attributes["http.resend_count"] for span in attempts], [0, 1])
+        self.assertEqual([span.status for span in attempts], ["error", "unset"])
+        self.assertTrue(all(span.parent_span_id == upstream.span_id for span in attempts))
+
+    def test_batch_export(self):
+        """JSONL 파일 배치 기록 및 OTLP 전송 실패 시 파일 대체 테스트"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "traces.jsonl")
+            span = Span("chat.process", TRACE_ID, PARENT_ID)
+            span.set_attribute("llm.model", "gpt-4o-mini")
+            span.end_ns = span.start_ns + 2_000_000
+
+            exporter = BatchSpanExporter(JsonlFileSink(path), batch_size=2, interval=60.0)
+            for _ in range(3):
+                exporter.export(span)
+            exporter.flush()
+            with open(path, encoding="utf-8") as f:
+                lines = [json.loads(line) for line in f]
+            self.assertEqual(len(lines), 3)
+            self.assertEqual((lines[0]["trace_id"], lines[0]["duration_ms"], lines[0]["attributes"]), (TRACE_ID, 2.0, {"llm.model": "gpt-4o-mini"}))
+
+            payloads = []
+
+            def collector(request):
+                payloads.append(json.loads(request.content))
+                return httpx.Response(200 if len(payloads) == 1 else 503)
+
+            sink = OTLPHttpSink("http://collector:4318", "llm-server", fallback=JsonlFileSink(path), transport=httpx.MockTransport(collector))
+            sink.write([span])
+            otlp_span = payloads[0]["resourceSpans"][0]["scopeSpans"][0]["spans"][0]
+            self.assertEqual((otlp_span["traceId"], otlp_span["kind"]), (TRACE_ID, 1))
+            self.assertEqual(otlp_span["attributes"], [{"key": "llm.model", "value": {"stringValue": "gpt-4o-mini"}}])
+
+            sink.write([span])
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(len(f.readlines()), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()